@@ -6,25 +6,17 @@ from triton import *
 
 class ThreadContext(object):
     def __init__(self, tid):
-        self.cregs  = dict() # context of concrete registers
-        self.sregs  = dict() # context of symbolic registers
+        self.state  = None   # context of concrete, symbolic and tainted registers
         self.tid    = tid    # The thread id
 
     def save(self, ctx):
-        # Save symbolic registers
-        self.sregs = ctx.getSymbolicRegisters()
-        # Save concrete registers
-        for r in ctx.getParentRegisters():
-            self.cregs.update({r.getId(): ctx.getConcreteRegisterValue(r)})
+        # Save concrete, symbolic and tainted registers in one call
+        self.state = ctx.saveRegisterState()
 
 
     def restore(self, ctx):
-        # Restore concrete registers
-        for rid, v in self.cregs.items():
-            ctx.setConcreteRegisterValue(ctx.getRegister(rid), v)
-        # Restore symbolic registers
-        for rid, e in self.sregs.items():
-            ctx.assignSymbolicExpressionToRegister(e, ctx.getRegister(rid))
+        # Restore concrete, symbolic and tainted registers in one call
+        ctx.restoreRegisterState(self.state)
 
 
 if __name__ == "__main__":
@@ -60,7 +52,7 @@ if __name__ == "__main__":
     th1.save(ctx)
     th0.restore(ctx)
 
-    print(f"Thread {th0.tid}: eax = {th0.cregs[REG.X86.EAX]}")
-    print(f"Thread {th0.tid}: ebx = {th0.cregs[REG.X86.EBX]}")
-    print(f"Thread {th1.tid}: eax = {th1.cregs[REG.X86.EAX]}")
-    print(f"Thread {th1.tid}: ebx = {th1.cregs[REG.X86.EBX]}")
+    for th in (th0, th1):
+        th.restore(ctx)
+        print(f"Thread {th.tid}: eax = {ctx.getConcreteRegisterValue(ctx.registers.eax)}")
+        print(f"Thread {th.tid}: ebx = {ctx.getConcreteRegisterValue(ctx.registers.ebx)}")
@@ -434,7 +434,7 @@ def loadBinary(ctx, path):
         size   = phdr.physical_size
         vaddr  = phdr.virtual_address
         debug('Loading 0x%06x - 0x%06x' %(vaddr, vaddr+size))
-        ctx.setConcreteMemoryAreaValue(vaddr, list(phdr.content))
+        ctx.mapConcreteMemoryFile(path, phdr.file_offset, vaddr, size)
     return binary
 
 
@@ -13,6 +13,8 @@
 #include <triton/arm32Cpu.hpp>
 #include <triton/arm32Specifications.hpp>
 #include <triton/exceptions.hpp>
+#include <triton/registerState.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/x8664Cpu.hpp>
 #include <triton/x86Cpu.hpp>
 #include <triton/x86Specifications.hpp>
@@ -64,6 +66,7 @@ namespace triton {
 
       /* Setup global variables */
       this->arch = arch;
+      this->cache.clear();
     }
 
 
@@ -71,6 +74,7 @@ namespace triton {
       if (!this->cpu)
         throw triton::exceptions::Architecture("Architecture::clearArchitecture(): You must define an architecture.");
       this->cpu->clear();
+      this->cache.clear();
     }
 
 
@@ -222,10 +226,49 @@ namespace triton {
     }
 
 
+    triton::usize Architecture::getDisassemblyCacheSize(void) const {
+      return this->cache.getCapacity();
+    }
+
+
+    void Architecture::setDisassemblyCacheSize(triton::usize size) {
+      this->cache.setCapacity(size);
+    }
+
+
+    triton::arch::DisassemblyCacheStats Architecture::getDisassemblyCacheStats(void) const {
+      return this->cache.getStats();
+    }
+
+
+    void Architecture::clearDisassemblyCache(void) {
+      this->cache.clear();
+    }
+
+
     void Architecture::disassembly(triton::arch::Instruction& inst) const {
       if (!this->cpu)
         throw triton::exceptions::Architecture("Architecture::disassembly(): You must define an architecture.");
+
+      /*
+       * The Arm32 decoding depends on the state of IT blocks, which is updated at each
+       * disassembly. So, its instructions are always decoded by the CPU.
+       */
+      if (!this->cache.isEnabled() || this->arch == triton::arch::ARCH_ARM32) {
+        this->cpu->disassembly(inst);
+        return;
+      }
+
+      /* Update instruction address if undefined */
+      if (!inst.getAddress()) {
+        inst.setAddress(static_cast<triton::uint64>(this->getConcreteRegisterValue(this->getProgramCounter())));
+      }
+
+      if (this->cache.lookup(inst))
+        return;
+
       this->cpu->disassembly(inst);
+      this->cache.insert(inst);
     }
 
 
@@ -235,7 +278,7 @@ namespace triton {
 
       for (auto& inst : block.getInstructions()) {
         inst.setAddress(addr);
-        this->cpu->disassembly(inst);
+        this->disassembly(inst);
         addr += inst.getSize();
       }
     }
@@ -249,8 +292,9 @@ namespace triton {
         if (!this->isConcreteMemoryValueDefined(addr)) {
           break;
         }
-        auto opcodes = this->getConcreteMemoryAreaValue(addr, 16);
-        auto inst = triton::arch::Instruction(addr, reinterpret_cast<triton::uint8*>(opcodes.data()), opcodes.size());
+        triton::uint8 opcodes[16];
+        this->getConcreteMemoryAreaValue(addr, opcodes, sizeof(opcodes));
+        auto inst = triton::arch::Instruction(addr, opcodes, sizeof(opcodes));
         this->disassembly(inst);
         ret.push_back(inst);
         addr += inst.getSize();
@@ -267,8 +311,9 @@ namespace triton {
         if (!this->isConcreteMemoryValueDefined(addr)) {
           break;
         }
-        auto opcodes = this->getConcreteMemoryAreaValue(addr, 16);
-        auto inst = triton::arch::Instruction(addr, reinterpret_cast<triton::uint8*>(opcodes.data()), opcodes.size());
+        triton::uint8 opcodes[16];
+        this->getConcreteMemoryAreaValue(addr, opcodes, sizeof(opcodes));
+        auto inst = triton::arch::Instruction(addr, opcodes, sizeof(opcodes));
         this->disassembly(inst);
         ret.push_back(inst);
         addr += inst.getSize();
@@ -299,6 +344,13 @@ namespace triton {
     }
 
 
+    void Architecture::getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks) const {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::getConcreteMemoryAreaValue(): You must define an architecture.");
+      this->cpu->getConcreteMemoryAreaValue(baseAddr, area, size, execCallbacks);
+    }
+
+
     triton::uint512 Architecture::getConcreteRegisterValue(const triton::arch::Register& reg, bool execCallbacks) const {
       if (!this->cpu)
         throw triton::exceptions::Architecture("Architecture::getConcreteRegisterValue(): You must define an architecture.");
@@ -369,6 +421,94 @@ namespace triton {
     }
 
 
+    triton::arch::memory_backend_e Architecture::getConcreteMemoryBackend(void) const {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::getConcreteMemoryBackend(): You must define an architecture.");
+      return this->cpu->getConcreteMemoryBackend();
+    }
+
+
+    void Architecture::setConcreteMemoryBackend(triton::arch::memory_backend_e backend) {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::setConcreteMemoryBackend(): You must define an architecture.");
+      this->cpu->setConcreteMemoryBackend(backend);
+    }
+
+
+    void Architecture::mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable) {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::mapConcreteMemoryFile(): You must define an architecture.");
+      this->cpu->mapConcreteMemoryFile(path, offset, baseAddr, size, writable);
+    }
+
+
+    void Architecture::snapshot(triton::Snapshot& snap) const {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::snapshot(): You must define an architecture.");
+
+      switch (this->arch) {
+        case triton::arch::ARCH_X86_64:  snap.cpu = std::make_shared<triton::arch::x86::x8664Cpu>(*static_cast<const triton::arch::x86::x8664Cpu*>(this->cpu.get()));                     break;
+        case triton::arch::ARCH_X86:     snap.cpu = std::make_shared<triton::arch::x86::x86Cpu>(*static_cast<const triton::arch::x86::x86Cpu*>(this->cpu.get()));                         break;
+        case triton::arch::ARCH_AARCH64: snap.cpu = std::make_shared<triton::arch::arm::aarch64::AArch64Cpu>(*static_cast<const triton::arch::arm::aarch64::AArch64Cpu*>(this->cpu.get())); break;
+        case triton::arch::ARCH_ARM32:   snap.cpu = std::make_shared<triton::arch::arm::arm32::Arm32Cpu>(*static_cast<const triton::arch::arm::arm32::Arm32Cpu*>(this->cpu.get()));       break;
+        default:
+          throw triton::exceptions::Architecture("Architecture::snapshot(): Architecture not supported.");
+      }
+
+      snap.arch = this->arch;
+    }
+
+
+    void Architecture::restore(const triton::Snapshot& snap) {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::restore(): You must define an architecture.");
+
+      if (snap.arch != this->arch || snap.cpu == nullptr)
+        throw triton::exceptions::Architecture("Architecture::restore(): The snapshot does not match the architecture.");
+
+      switch (this->arch) {
+        case triton::arch::ARCH_X86_64:  *static_cast<triton::arch::x86::x8664Cpu*>(this->cpu.get())               = *static_cast<const triton::arch::x86::x8664Cpu*>(snap.cpu.get());               break;
+        case triton::arch::ARCH_X86:     *static_cast<triton::arch::x86::x86Cpu*>(this->cpu.get())                 = *static_cast<const triton::arch::x86::x86Cpu*>(snap.cpu.get());                 break;
+        case triton::arch::ARCH_AARCH64: *static_cast<triton::arch::arm::aarch64::AArch64Cpu*>(this->cpu.get())    = *static_cast<const triton::arch::arm::aarch64::AArch64Cpu*>(snap.cpu.get());    break;
+        case triton::arch::ARCH_ARM32:   *static_cast<triton::arch::arm::arm32::Arm32Cpu*>(this->cpu.get())        = *static_cast<const triton::arch::arm::arm32::Arm32Cpu*>(snap.cpu.get());        break;
+        default:
+          throw triton::exceptions::Architecture("Architecture::restore(): Architecture not supported.");
+      }
+    }
+
+
+    void Architecture::snapshot(triton::RegisterState& state) const {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::snapshot(): You must define an architecture.");
+
+      auto regs = this->cpu->getParentRegisters();
+
+      state.concreteRegisters.clear();
+      state.concreteRegisters.reserve(regs.size());
+      for (const auto* reg : regs) {
+        state.concreteRegisters.push_back({reg->getId(), this->cpu->getConcreteRegisterValue(*reg, false)});
+      }
+
+      state.thumb = this->cpu->isThumb();
+      state.arch  = this->arch;
+    }
+
+
+    void Architecture::restore(const triton::RegisterState& state) {
+      if (!this->cpu)
+        throw triton::exceptions::Architecture("Architecture::restore(): You must define an architecture.");
+
+      if (state.arch != this->arch)
+        throw triton::exceptions::Architecture("Architecture::restore(): The register state does not match the architecture.");
+
+      for (const auto& item : state.concreteRegisters) {
+        this->cpu->setConcreteRegisterValue(this->cpu->getRegister(item.first), item.second);
+      }
+
+      this->cpu->setThumb(state.thumb);
+    }
+
+
     const triton::arch::Instruction Architecture::getNopInstruction(void) const {
       if (!this->cpu)
         throw triton::exceptions::Architecture("Architecture::getNopInstruction(): You must define an architecture.");
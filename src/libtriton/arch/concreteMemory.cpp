@@ -0,0 +1,501 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <algorithm>
+#include <bitset>
+#include <cstring>
+#include <fstream>
+
+#if defined(__unix__) || defined(__APPLE__)
+  #include <fcntl.h>
+  #include <sys/mman.h>
+  #include <sys/stat.h>
+  #include <unistd.h>
+#endif
+
+#include <triton/concreteMemory.hpp>
+#include <triton/exceptions.hpp>
+
+
+
+namespace triton {
+  namespace arch {
+
+    /* Returns the page number of an address */
+    static inline triton::uint64 pageNumber(triton::uint64 addr) {
+      return addr / MEMORY_PAGE_SIZE;
+    }
+
+
+    /* Returns the offset of an address in its page */
+    static inline triton::usize pageOffset(triton::uint64 addr) {
+      return static_cast<triton::usize>(addr % MEMORY_PAGE_SIZE);
+    }
+
+
+    /* Returns the mask of the bits [offset, offset+size) of a bitmap word */
+    static inline triton::uint64 bitmapMask(triton::usize offset, triton::usize size) {
+      if (size == 64)
+        return ~0ULL;
+      return ((1ULL << size) - 1) << offset;
+    }
+
+
+    /* Calls func(word index, mask) for each word of the bitmap which covers [offset, offset+size) */
+    template <typename F>
+    static inline void forEachBitmapWord(triton::usize offset, triton::usize size, F func) {
+      while (size) {
+        triton::usize bit   = offset % 64;
+        triton::usize chunk = std::min(size, 64 - bit);
+        if (!func(offset / 64, bitmapMask(bit, chunk)))
+          return;
+        offset += chunk;
+        size   -= chunk;
+      }
+    }
+
+
+    MappedFile::MappedFile(const std::string& path, triton::uint64 offset, triton::usize size, bool writable) {
+      this->base     = nullptr;
+      this->length   = 0;
+      this->delta    = 0;
+      this->writable = writable;
+
+      #if defined(__unix__) || defined(__APPLE__)
+      int fd = open(path.c_str(), O_RDONLY);
+      if (fd < 0)
+        throw triton::exceptions::Cpu("MappedFile::MappedFile(): Cannot open the file.");
+
+      struct stat st;
+      if (fstat(fd, &st) != 0 || offset + size > static_cast<triton::uint64>(st.st_size)) {
+        close(fd);
+        throw triton::exceptions::Cpu("MappedFile::MappedFile(): The area is out of the file.");
+      }
+
+      /* The offset of a mapping must be aligned on a system page */
+      triton::uint64 alignment = static_cast<triton::uint64>(sysconf(_SC_PAGESIZE));
+      this->delta  = static_cast<triton::usize>(offset % alignment);
+      this->length = size + this->delta;
+
+      void* area = mmap(nullptr, this->length, PROT_READ | (writable ? PROT_WRITE : 0), MAP_PRIVATE, fd, offset - this->delta);
+      close(fd);
+
+      if (area == MAP_FAILED)
+        throw triton::exceptions::Cpu("MappedFile::MappedFile(): Cannot map the file.");
+
+      this->base = static_cast<triton::uint8*>(area);
+      #else
+      std::ifstream file(path, std::ios::binary);
+      if (!file)
+        throw triton::exceptions::Cpu("MappedFile::MappedFile(): Cannot open the file.");
+
+      this->base   = new triton::uint8[size];
+      this->length = size;
+
+      file.seekg(offset);
+      file.read(reinterpret_cast<char*>(this->base), size);
+      if (static_cast<triton::usize>(file.gcount()) != size) {
+        delete[] this->base;
+        throw triton::exceptions::Cpu("MappedFile::MappedFile(): The area is out of the file.");
+      }
+      #endif
+    }
+
+
+    MappedFile::~MappedFile() {
+      #if defined(__unix__) || defined(__APPLE__)
+      munmap(this->base, this->length);
+      #else
+      delete[] this->base;
+      #endif
+    }
+
+
+    triton::uint8* MappedFile::getData(void) const {
+      return this->base + this->delta;
+    }
+
+
+    bool MappedFile::isWritable(void) const {
+      return this->writable;
+    }
+
+
+    MemoryPage::MemoryPage()
+      : storage(new triton::uint8[MEMORY_PAGE_SIZE]()) {
+      this->data  = this->storage.get();
+      this->count = 0;
+      std::memset(this->defined, 0x00, sizeof(this->defined));
+    }
+
+
+    MemoryPage::MemoryPage(const MemoryPage& other)
+      : storage(new triton::uint8[MEMORY_PAGE_SIZE]) {
+      this->data  = this->storage.get();
+      this->count = other.count;
+      std::memcpy(this->data, other.data, MEMORY_PAGE_SIZE);
+      std::memcpy(this->defined, other.defined, sizeof(this->defined));
+    }
+
+
+    MemoryPage::MemoryPage(const triton::arch::SharedMappedFile& file, triton::uint8* data)
+      : file(file) {
+      this->data  = data;
+      this->count = MEMORY_PAGE_SIZE;
+      std::memset(this->defined, 0xff, sizeof(this->defined));
+    }
+
+
+    ConcreteMemory::ConcreteMemory(triton::arch::memory_backend_e backend) {
+      this->backend        = backend;
+      this->lastPageNumber = 0;
+      this->lastPage       = nullptr;
+    }
+
+
+    ConcreteMemory::ConcreteMemory(const ConcreteMemory& other) {
+      this->copy(other);
+    }
+
+
+    ConcreteMemory& ConcreteMemory::operator=(const ConcreteMemory& other) {
+      this->copy(other);
+      return *this;
+    }
+
+
+    void ConcreteMemory::copy(const ConcreteMemory& other) {
+      /* Pages are shared and duplicated on the first write */
+      this->backend        = other.backend;
+      this->map            = other.map;
+      this->pages          = other.pages;
+      this->lastPageNumber = 0;
+      this->lastPage       = nullptr;
+    }
+
+
+    triton::arch::MemoryPage* ConcreteMemory::findPage(triton::uint64 addr) const {
+      triton::uint64 number = pageNumber(addr);
+
+      if (this->lastPage && this->lastPageNumber == number)
+        return this->lastPage;
+
+      auto it = this->pages.find(number);
+      if (it == this->pages.end())
+        return nullptr;
+
+      this->lastPageNumber = number;
+      this->lastPage       = it->second.get();
+
+      return this->lastPage;
+    }
+
+
+    triton::arch::MemoryPage* ConcreteMemory::getWritablePage(triton::uint64 addr) {
+      triton::uint64 number = pageNumber(addr);
+      auto it = this->pages.find(number);
+
+      if (it == this->pages.end()) {
+        /* A new page is zero-initialized */
+        it = this->pages.emplace(number, std::make_shared<MemoryPage>()).first;
+      }
+      else if (it->second.use_count() > 1 || (it->second->file && !it->second->file->isWritable())) {
+        /* The page is shared with another memory or backed by a read-only file, duplicate it */
+        it->second = std::make_shared<MemoryPage>(*it->second);
+      }
+
+      this->lastPageNumber = number;
+      this->lastPage       = it->second.get();
+
+      return this->lastPage;
+    }
+
+
+    triton::arch::memory_backend_e ConcreteMemory::getBackend(void) const {
+      return this->backend;
+    }
+
+
+    void ConcreteMemory::setBackend(triton::arch::memory_backend_e backend) {
+      if (this->backend == backend)
+        return;
+
+      switch (backend) {
+        case triton::arch::MEMORY_BACKEND_MAP: {
+          for (const auto& item : this->pages) {
+            triton::uint64 base = item.first * MEMORY_PAGE_SIZE;
+            const auto& page = item.second;
+            for (triton::usize offset = 0; offset < MEMORY_PAGE_SIZE; offset++) {
+              if ((page->defined[offset / 64] >> (offset % 64)) & 1)
+                this->map[base + offset] = page->data[offset];
+            }
+          }
+          this->pages.clear();
+          this->lastPage = nullptr;
+          break;
+        }
+
+        case triton::arch::MEMORY_BACKEND_PAGED: {
+          this->backend = backend;
+          for (const auto& item : this->map)
+            this->write(item.first, item.second);
+          this->map.clear();
+          break;
+        }
+
+        default:
+          throw triton::exceptions::Cpu("ConcreteMemory::setBackend(): Invalid kind of backend.");
+      }
+
+      this->backend = backend;
+    }
+
+
+    bool ConcreteMemory::isDefined(triton::uint64 addr, triton::usize size) const {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        for (triton::usize index = 0; index < size; index++) {
+          if (this->map.find(addr + index) == this->map.end())
+            return false;
+        }
+        return true;
+      }
+
+      while (size) {
+        triton::usize offset = pageOffset(addr);
+        triton::usize chunk  = std::min(size, MEMORY_PAGE_SIZE - offset);
+        const MemoryPage* page = this->findPage(addr);
+
+        if (page == nullptr)
+          return false;
+
+        if (page->count != MEMORY_PAGE_SIZE) {
+          bool defined = true;
+          forEachBitmapWord(offset, chunk, [&](triton::usize word, triton::uint64 mask) {
+            defined = ((page->defined[word] & mask) == mask);
+            return defined;
+          });
+          if (!defined)
+            return false;
+        }
+
+        addr += chunk;
+        size -= chunk;
+      }
+
+      return true;
+    }
+
+
+    std::vector<std::pair<triton::uint64, triton::usize>> ConcreteMemory::getUndefinedAreas(triton::uint64 addr, triton::usize size) const {
+      std::vector<std::pair<triton::uint64, triton::usize>> areas;
+
+      /* Merges contiguous areas */
+      auto add = [&areas](triton::uint64 base, triton::usize length) {
+        if (!areas.empty() && areas.back().first + areas.back().second == base)
+          areas.back().second += length;
+        else
+          areas.emplace_back(base, length);
+      };
+
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        for (triton::usize index = 0; index < size; index++) {
+          if (this->map.find(addr + index) == this->map.end())
+            add(addr + index, 1);
+        }
+        return areas;
+      }
+
+      while (size) {
+        triton::usize offset = pageOffset(addr);
+        triton::usize chunk  = std::min(size, MEMORY_PAGE_SIZE - offset);
+        const MemoryPage* page = this->findPage(addr);
+
+        if (page == nullptr) {
+          add(addr, chunk);
+        }
+        else if (page->count != MEMORY_PAGE_SIZE) {
+          for (triton::usize index = offset; index < offset + chunk; index++) {
+            if (((page->defined[index / 64] >> (index % 64)) & 1) == 0)
+              add(addr + (index - offset), 1);
+          }
+        }
+
+        addr += chunk;
+        size -= chunk;
+      }
+
+      return areas;
+    }
+
+
+    triton::uint8 ConcreteMemory::read(triton::uint64 addr) const {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        auto it = this->map.find(addr);
+        if (it == this->map.end())
+          return 0x00;
+        return it->second;
+      }
+
+      /* Undefined bytes of a page are always zero */
+      const MemoryPage* page = this->findPage(addr);
+      if (page == nullptr)
+        return 0x00;
+
+      return page->data[pageOffset(addr)];
+    }
+
+
+    void ConcreteMemory::read(triton::uint64 addr, triton::uint8* out, triton::usize size) const {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        for (triton::usize index = 0; index < size; index++)
+          out[index] = this->read(addr + index);
+        return;
+      }
+
+      while (size) {
+        triton::usize offset = pageOffset(addr);
+        triton::usize chunk  = std::min(size, MEMORY_PAGE_SIZE - offset);
+        const MemoryPage* page = this->findPage(addr);
+
+        if (page == nullptr)
+          std::memset(out, 0x00, chunk);
+        else
+          std::memcpy(out, page->data + offset, chunk);
+
+        out  += chunk;
+        addr += chunk;
+        size -= chunk;
+      }
+    }
+
+
+    void ConcreteMemory::write(triton::uint64 addr, triton::uint8 value) {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        this->map[addr] = value;
+        return;
+      }
+      this->write(addr, &value, 1);
+    }
+
+
+    void ConcreteMemory::write(triton::uint64 addr, const triton::uint8* in, triton::usize size) {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        this->map.reserve(this->map.size() + size);
+        for (triton::usize index = 0; index < size; index++)
+          this->map[addr + index] = in[index];
+        return;
+      }
+
+      while (size) {
+        triton::usize offset = pageOffset(addr);
+        triton::usize chunk  = std::min(size, MEMORY_PAGE_SIZE - offset);
+        MemoryPage* page = this->getWritablePage(addr);
+
+        std::memcpy(page->data + offset, in, chunk);
+
+        if (page->count != MEMORY_PAGE_SIZE) {
+          forEachBitmapWord(offset, chunk, [&](triton::usize word, triton::uint64 mask) {
+            page->count += std::bitset<64>(mask & ~page->defined[word]).count();
+            page->defined[word] |= mask;
+            return true;
+          });
+        }
+
+        in   += chunk;
+        addr += chunk;
+        size -= chunk;
+      }
+    }
+
+
+    void ConcreteMemory::mapFile(const std::string& path, triton::uint64 offset, triton::uint64 addr, triton::usize size, bool writable) {
+      if (size == 0)
+        return;
+
+      triton::arch::SharedMappedFile file = std::make_shared<MappedFile>(path, offset, size, writable);
+      triton::uint8* in = file->getData();
+
+      /* The map backend has no page to share, the file is copied */
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        this->write(addr, in, size);
+        return;
+      }
+
+      while (size) {
+        triton::usize pageoff = pageOffset(addr);
+        triton::usize chunk   = std::min(size, MEMORY_PAGE_SIZE - pageoff);
+
+        /* Only whole pages are backed by the file */
+        if (chunk == MEMORY_PAGE_SIZE)
+          this->pages[pageNumber(addr)] = std::make_shared<MemoryPage>(file, in);
+        else
+          this->write(addr, in, chunk);
+
+        in   += chunk;
+        addr += chunk;
+        size -= chunk;
+      }
+
+      this->lastPage = nullptr;
+    }
+
+
+    void ConcreteMemory::clear(triton::uint64 addr, triton::usize size) {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP) {
+        for (triton::usize index = 0; index < size; index++)
+          this->map.erase(addr + index);
+        return;
+      }
+
+      while (size) {
+        triton::usize offset = pageOffset(addr);
+        triton::usize chunk  = std::min(size, MEMORY_PAGE_SIZE - offset);
+
+        if (this->findPage(addr)) {
+          MemoryPage* page = this->getWritablePage(addr);
+
+          /* Keep undefined bytes to zero */
+          std::memset(page->data + offset, 0x00, chunk);
+          forEachBitmapWord(offset, chunk, [&](triton::usize word, triton::uint64 mask) {
+            page->count -= std::bitset<64>(mask & page->defined[word]).count();
+            page->defined[word] &= ~mask;
+            return true;
+          });
+
+          /* Release empty pages */
+          if (page->count == 0) {
+            this->pages.erase(pageNumber(addr));
+            this->lastPage = nullptr;
+          }
+        }
+
+        addr += chunk;
+        size -= chunk;
+      }
+    }
+
+
+    void ConcreteMemory::clear(void) {
+      this->map.clear();
+      this->pages.clear();
+      this->lastPage = nullptr;
+    }
+
+
+    triton::usize ConcreteMemory::size(void) const {
+      if (this->backend == triton::arch::MEMORY_BACKEND_MAP)
+        return this->map.size();
+
+      triton::usize count = 0;
+      for (const auto& item : this->pages)
+        count += item.second->count;
+
+      return count;
+    }
+
+  }; /* arch namespace */
+}; /* triton namespace */
@@ -0,0 +1,136 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <cstring>
+#include <iterator>
+#include <utility>
+
+#include <triton/disassemblyCache.hpp>
+
+
+
+namespace triton {
+  namespace arch {
+
+    DisassemblyCache::DisassemblyCache() {
+      this->capacity = 0;
+      this->stats    = {0, 0, 0, 0, 0};
+    }
+
+
+    bool DisassemblyCache::isEnabled(void) const {
+      return this->capacity != 0;
+    }
+
+
+    triton::usize DisassemblyCache::getCapacity(void) const {
+      return this->capacity;
+    }
+
+
+    void DisassemblyCache::setCapacity(triton::usize capacity) {
+      this->capacity = capacity;
+      this->shrink();
+    }
+
+
+    DisassemblyCacheStats DisassemblyCache::getStats(void) const {
+      DisassemblyCacheStats ret = this->stats;
+      ret.entries = this->entries.size();
+      return ret;
+    }
+
+
+    void DisassemblyCache::clear(void) {
+      this->entries.clear();
+      this->index.clear();
+      this->stats = {0, 0, 0, 0, 0};
+    }
+
+
+    void DisassemblyCache::shrink(void) {
+      while (this->entries.size() > this->capacity) {
+        this->index.erase(this->entries.back().address);
+        this->entries.pop_back();
+        this->stats.evictions++;
+      }
+    }
+
+
+    bool DisassemblyCache::lookup(triton::arch::Instruction& inst) {
+      auto it = this->index.find(inst.getAddress());
+
+      if (it == this->index.end()) {
+        this->stats.misses++;
+        return false;
+      }
+
+      const Entry& entry = *(it->second);
+
+      /* The code at this address has been rewritten */
+      if (inst.getOpcode() == nullptr || inst.getSize() < entry.size || std::memcmp(inst.getOpcode(), entry.opcode, entry.size) != 0) {
+        this->entries.erase(it->second);
+        this->index.erase(it);
+        this->stats.invalidations++;
+        this->stats.misses++;
+        return false;
+      }
+
+      inst.operands = entry.operands;
+      inst.setSize(entry.size);
+      inst.setArchitecture(entry.arch);
+      inst.setType(entry.type);
+      inst.setPrefix(entry.prefix);
+      inst.setCodeCondition(entry.codeCondition);
+      inst.setDisassembly(entry.disassembly);
+      inst.setBranch(entry.branch);
+      inst.setControlFlow(entry.controlFlow);
+      inst.setWriteBack(entry.writeBack);
+      inst.setUpdateFlag(entry.updateFlag);
+      inst.setThumb(entry.thumb);
+
+      /* Most recently used first */
+      this->entries.splice(this->entries.begin(), this->entries, it->second);
+      this->stats.hits++;
+
+      return true;
+    }
+
+
+    void DisassemblyCache::insert(const triton::arch::Instruction& inst) {
+      if (this->capacity == 0 || inst.getSize() > sizeof(Entry::opcode))
+        return;
+
+      auto it = this->index.find(inst.getAddress());
+      if (it != this->index.end()) {
+        this->entries.erase(it->second);
+        this->index.erase(it);
+      }
+
+      Entry entry;
+      entry.address       = inst.getAddress();
+      entry.size          = inst.getSize();
+      entry.arch          = inst.getArchitecture();
+      entry.type          = inst.getType();
+      entry.prefix        = inst.getPrefix();
+      entry.codeCondition = inst.getCodeCondition();
+      entry.disassembly   = inst.getDisassembly();
+      entry.operands      = inst.operands;
+      entry.branch        = inst.isBranch();
+      entry.controlFlow   = inst.isControlFlow();
+      entry.writeBack     = inst.isWriteBack();
+      entry.updateFlag    = inst.isUpdateFlag();
+      entry.thumb         = inst.isThumb();
+      std::memcpy(entry.opcode, inst.getOpcode(), entry.size);
+
+      this->entries.push_front(std::move(entry));
+      this->index[inst.getAddress()] = this->entries.begin();
+      this->shrink();
+    }
+
+  }; /* arch namespace */
+}; /* triton namespace */
@@ -33,6 +33,7 @@ namespace triton {
 
 
       x8664Cpu::x8664Cpu(const x8664Cpu& other) : x86Specifications(ARCH_X86_64) {
+        this->handle = 0;
         this->copy(other);
       }
 
@@ -491,6 +492,10 @@ namespace triton {
         if (inst.getOpcode() == nullptr || inst.getSize() == 0)
           throw triton::exceptions::Disassembly("x8664Cpu::disassembly(): Opcode and opcodeSize must be definied.");
 
+        /* A copy of a CPU opens the disassembler on its first use */
+        if (!this->handle)
+          this->disassInit();
+
         /* Clear instructicon's operands if alredy defined */
         inst.operands.clear();
 
@@ -599,46 +604,63 @@ namespace triton {
 
 
       triton::uint8 x8664Cpu::getConcreteMemoryValue(triton::uint64 addr, bool execCallbacks) const {
-        if (execCallbacks && this->callbacks)
-          this->callbacks->processCallbacks(triton::callbacks::GET_CONCRETE_MEMORY_VALUE, MemoryAccess(addr, triton::size::byte));
-
-        auto it = this->memory.find(addr);
-        if (it == this->memory.end()) {
-          return 0x00;
-        }
-
-        return it->second;
+        triton::uint8 value = 0;
+        this->getConcreteMemoryAreaValue(addr, &value, triton::size::byte, execCallbacks);
+        return value;
       }
 
 
       triton::uint512 x8664Cpu::getConcreteMemoryValue(const triton::arch::MemoryAccess& mem, bool execCallbacks) const {
+        triton::uint8 buffer[triton::size::dqqword];
         triton::uint512 ret = 0;
         triton::uint64 addr = 0;
         triton::uint32 size = 0;
 
-        if (execCallbacks && this->callbacks)
-          this->callbacks->processCallbacks(triton::callbacks::GET_CONCRETE_MEMORY_VALUE, mem);
-
         addr = mem.getAddress();
         size = mem.getSize();
 
         if (size == 0 || size > triton::size::dqqword)
           throw triton::exceptions::Cpu("x8664Cpu::getConcreteMemoryValue(): Invalid size memory.");
 
+        if (execCallbacks && this->callbacks) {
+          this->processAreaCallbacks(addr, size);
+          this->callbacks->processCallbacks(triton::callbacks::GET_CONCRETE_MEMORY_VALUE, mem);
+        }
+
+        this->memory.read(addr, buffer, size);
         for (triton::sint32 i = size-1; i >= 0; i--)
-          ret = ((ret << triton::bitsize::byte) | this->getConcreteMemoryValue(addr+i, false));
+          ret = ((ret << triton::bitsize::byte) | buffer[i]);
 
         return ret;
       }
 
 
       std::vector<triton::uint8> x8664Cpu::getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::usize size, bool execCallbacks) const {
-        std::vector<triton::uint8> area;
+        std::vector<triton::uint8> area(size);
+        this->getConcreteMemoryAreaValue(baseAddr, area.data(), size, execCallbacks);
+        return area;
+      }
 
-        for (triton::usize index = 0; index < size; index++)
-          area.push_back(this->getConcreteMemoryValue(baseAddr+index));
 
-        return area;
+      void x8664Cpu::getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks) const {
+        if (execCallbacks && this->callbacks) {
+          this->processAreaCallbacks(baseAddr, size);
+          if (this->callbacks->isDefined(triton::callbacks::GET_CONCRETE_MEMORY_VALUE)) {
+            for (triton::usize index = 0; index < size; index++)
+              this->callbacks->processCallbacks(triton::callbacks::GET_CONCRETE_MEMORY_VALUE, MemoryAccess(baseAddr+index, triton::size::byte));
+          }
+        }
+
+        this->memory.read(baseAddr, area, size);
+      }
+
+
+      void x8664Cpu::processAreaCallbacks(triton::uint64 baseAddr, triton::usize size) const {
+        /* Only the undefined parts of the area are reported */
+        if (this->callbacks->isDefined(triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE)) {
+          for (const auto& undefined : this->memory.getUndefinedAreas(baseAddr, size))
+            this->callbacks->processCallbacks(triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE, undefined.first, undefined.second);
+        }
       }
 
 
@@ -935,7 +957,7 @@ namespace triton {
       void x8664Cpu::setConcreteMemoryValue(triton::uint64 addr, triton::uint8 value) {
         if (this->callbacks)
           this->callbacks->processCallbacks(triton::callbacks::SET_CONCRETE_MEMORY_VALUE, MemoryAccess(addr, triton::size::byte), value);
-        this->memory[addr] = value;
+        this->memory.write(addr, value);
       }
 
 
@@ -953,28 +975,29 @@ namespace triton {
         if (this->callbacks)
           this->callbacks->processCallbacks(triton::callbacks::SET_CONCRETE_MEMORY_VALUE, mem, value);
 
+        triton::uint8 buffer[triton::size::dqqword];
         for (triton::uint32 i = 0; i < size; i++) {
-          this->memory[addr+i] = static_cast<triton::uint8>((cv & 0xff));
+          buffer[i] = static_cast<triton::uint8>((cv & 0xff));
           cv >>= 8;
         }
+        this->memory.write(addr, buffer, size);
       }
 
 
       void x8664Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const std::vector<triton::uint8>& values) {
-        // Pre-reserving the memory. We modified the original robin_map to not force rehash on reserve.
-        this->memory.reserve(values.size() + this->memory.size());
-        for (triton::usize index = 0; index < values.size(); index++) {
-          this->setConcreteMemoryValue(baseAddr+index, values[index]);
-        }
+        this->setConcreteMemoryAreaValue(baseAddr, values.data(), values.size());
       }
 
 
       void x8664Cpu::setConcreteMemoryAreaValue(triton::uint64 baseAddr, const triton::uint8* area, triton::usize size) {
-        // Pre-reserving the memory. We modified the original robin_map to not force rehash on every reserve if not needed.
-        this->memory.reserve(size + this->memory.size());
-        for (triton::usize index = 0; index < size; index++) {
-          this->setConcreteMemoryValue(baseAddr+index, area[index]);
+        /* Callbacks are executed byte per byte to keep their semantics */
+        if (this->callbacks && this->callbacks->isDefined(triton::callbacks::SET_CONCRETE_MEMORY_VALUE)) {
+          for (triton::usize index = 0; index < size; index++)
+            this->setConcreteMemoryValue(baseAddr+index, area[index]);
+          return;
         }
+
+        this->memory.write(baseAddr, area, size);
       }
 
 
@@ -1788,12 +1811,7 @@ namespace triton {
 
 
       bool x8664Cpu::isConcreteMemoryValueDefined(triton::uint64 baseAddr, triton::usize size) const {
-        for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) == this->memory.end()) {
-            return false;
-          }
-        }
-        return true;
+        return this->memory.isDefined(baseAddr, size);
       }
 
 
@@ -1803,11 +1821,22 @@ namespace triton {
 
 
       void x8664Cpu::clearConcreteMemoryValue(triton::uint64 baseAddr, triton::usize size) {
-        for (triton::usize index = 0; index < size; index++) {
-          if (this->memory.find(baseAddr + index) != this->memory.end()) {
-            this->memory.erase(baseAddr + index);
-          }
-        }
+        this->memory.clear(baseAddr, size);
+      }
+
+
+      triton::arch::memory_backend_e x8664Cpu::getConcreteMemoryBackend(void) const {
+        return this->memory.getBackend();
+      }
+
+
+      void x8664Cpu::setConcreteMemoryBackend(triton::arch::memory_backend_e backend) {
+        this->memory.setBackend(backend);
+      }
+
+
+      void x8664Cpu::mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable) {
+        this->memory.mapFile(path, offset, baseAddr, size, writable);
       }
 
     }; /* x86 namespace */
@@ -26,12 +26,36 @@
 namespace triton {
   namespace ast {
 
+    /* ====== Evaluation helpers */
+
+
+    /* Returns the mask of a bitvector of at most 64 bits */
+    static inline triton::uint64 mask64(triton::uint32 size) {
+      return (size >= triton::bitsize::qword) ? 0xffffffffffffffff : ((static_cast<triton::uint64>(1) << size) - 1);
+    }
+
+
+    /* Returns the concrete value of a node of at most 64 bits */
+    static inline triton::uint64 value64(const SharedAbstractNode& node) {
+      return static_cast<triton::uint64>(node->evaluate());
+    }
+
+
+    /* Sign extends a value of at most 64 bits */
+    static inline triton::sint64 signed64(triton::uint64 value, triton::uint32 size) {
+      if (size < triton::bitsize::qword && ((value >> (size - 1)) & 1))
+        value |= ~mask64(size);
+      return static_cast<triton::sint64>(value);
+    }
+
+
     /* ====== Abstract node */
 
     AbstractNode::AbstractNode(triton::ast::ast_e type, const SharedAstContext& ctxt) {
       this->array       = false;
       this->ctxt        = ctxt;
       this->eval        = 0;
+      this->evaluated   = true;
       this->hash        = 0;
       this->logical     = false;
       this->level       = 1;
@@ -70,7 +94,7 @@ namespace triton {
 
 
     bool AbstractNode::isSigned(void) const {
-      if ((this->eval >> (this->size-1)) & 1)
+      if ((this->evaluate() >> (this->size-1)) & 1)
         return true;
       return false;
     }
@@ -157,10 +181,61 @@ namespace triton {
 
 
     triton::uint512 AbstractNode::evaluate(void) const {
+      if (this->evaluated == false) {
+        const_cast<AbstractNode*>(this)->evaluateDeferred();
+      }
       return this->eval;
     }
 
 
+    void AbstractNode::updateEval(void) {
+      if (this->ctxt->isEvaluationDeferred()) {
+        this->evaluated = false;
+        return;
+      }
+      this->initEval();
+      this->evaluated = true;
+    }
+
+
+    void AbstractNode::evaluateDeferred(void) {
+      /* Post-order traversal of the nodes which are not evaluated yet (second is true once the children are pushed) */
+      std::vector<std::pair<AbstractNode*, bool>> worklist;
+
+      worklist.push_back({this, false});
+      while (!worklist.empty()) {
+        AbstractNode* node = worklist.back().first;
+        bool visited = worklist.back().second;
+        worklist.pop_back();
+
+        if (node->evaluated) {
+          continue;
+        }
+
+        if (visited) {
+          node->initEval();
+          node->evaluated = true;
+          continue;
+        }
+
+        worklist.push_back({node, true});
+        for (const auto& child : node->children) {
+          if (child->evaluated == false) {
+            worklist.push_back({child.get(), false});
+          }
+        }
+
+        /* A reference is evaluated from the AST of its symbolic expression */
+        if (node->type == REFERENCE_NODE) {
+          AbstractNode* ast = reinterpret_cast<ReferenceNode*>(node)->getSymbolicExpression()->getAst().get();
+          if (ast->evaluated == false) {
+            worklist.push_back({ast, false});
+          }
+        }
+      }
+    }
+
+
     triton::uint512 AbstractNode::getHash(void) const {
       return this->hash;
     }
@@ -255,6 +330,9 @@ namespace triton {
         throw triton::exceptions::Ast("AbstractNode::setChild(): child cannot be null.");
 
       if (this->children[index] != child) {
+        /* The node is about to change, it cannot be shared anymore (see AST_HASH_CONSING) */
+        this->ctxt->unshare(this);
+
         /* Remove the parent of the old child */
         this->children[index]->removeParent(this);
 
@@ -296,7 +374,6 @@ namespace triton {
     void ArrayNode::init(bool withParents) {
       /* Init attributes. */
       this->size       = 0; // Array do not have size.
-      this->eval       = 0; // Array cannot be evaluated.
       this->level      = 1;
       this->symbolized = false;
 
@@ -307,6 +384,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -316,6 +396,11 @@ namespace triton {
     }
 
 
+    void ArrayNode::initEval(void) {
+      this->eval = 0; // Array cannot be evaluated.
+    }
+
+
     void ArrayNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -379,7 +464,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = ((this->children[0]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -390,6 +474,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -399,6 +486,11 @@ namespace triton {
     }
 
 
+    void AssertNode::initEval(void) {
+      this->eval = ((this->children[0]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void AssertNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -432,16 +524,9 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = this->children[0]->evaluate() & 0xff;
       this->level      = 1;
       this->symbolized = false;
 
-      /* Init eval */
-      for (triton::uint32 index = 8 ; index != this->size ; index += triton::bitsize::byte) {
-        this->eval <<= triton::bitsize::byte;
-        this->eval |= ((this->children[0]->evaluate() >> index) & 0xff);
-      }
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -449,6 +534,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -458,6 +546,27 @@ namespace triton {
     }
 
 
+    void BswapNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 value  = value64(this->children[0]);
+        triton::uint64 result = value & 0xff;
+        for (triton::uint32 index = 8 ; index != this->size ; index += triton::bitsize::byte) {
+          result <<= triton::bitsize::byte;
+          result |= ((value >> index) & 0xff);
+        }
+        this->eval = result;
+      }
+      else {
+        triton::uint512 value = this->children[0]->evaluate();
+        this->eval = value & 0xff;
+        for (triton::uint32 index = 8 ; index != this->size ; index += triton::bitsize::byte) {
+          this->eval <<= triton::bitsize::byte;
+          this->eval |= ((value >> index) & 0xff);
+        }
+      }
+    }
+
+
     void BswapNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -492,7 +601,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = ((this->children[0]->evaluate() + this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -503,6 +611,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -512,6 +623,14 @@ namespace triton {
     }
 
 
+    void BvaddNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = ((value64(this->children[0]) + value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = ((this->children[0]->evaluate() + this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvaddNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -546,7 +665,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (this->children[0]->evaluate() & this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -557,6 +675,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -566,6 +687,14 @@ namespace triton {
     }
 
 
+    void BvandNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) & value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() & this->children[1]->evaluate());
+    }
+
+
     void BvandNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -589,10 +718,6 @@ namespace triton {
 
 
     void BvashrNode::init(bool withParents) {
-      triton::uint32 shift  = 0;
-      triton::uint512 mask  = 0;
-      triton::uint512 value = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvashrNode::init(): Must take at least two children.");
 
@@ -602,14 +727,46 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvashrNode::init(): Cannot take an array as argument.");
 
-      value = this->children[0]->evaluate();
-      shift = static_cast<triton::uint32>(this->children[1]->evaluate());
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
       this->level      = 1;
       this->symbolized = false;
 
+      /* Init children and spread information */
+      for (triton::uint32 index = 0; index < this->children.size(); index++) {
+        this->children[index]->setParent(this);
+        this->symbolized |= this->children[index]->isSymbolized();
+        this->level = std::max(this->children[index]->getLevel() + 1, this->level);
+      }
+
+      /* Init eval */
+      this->updateEval();
+
+      /* Init parents if needed */
+      if (withParents) {
+        this->initParents();
+      }
+
+      this->initHash();
+    }
+
+
+    void BvashrNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 value = value64(this->children[0]);
+        triton::uint64 shift = value64(this->children[1]);
+
+        if (shift >= this->size)
+          this->eval = (this->children[0]->isSigned() ? mask64(this->size) : 0);
+        else
+          this->eval = (static_cast<triton::uint64>(signed64(value, this->size) >> shift) & mask64(this->size));
+        return;
+      }
+
+      triton::uint512 value = this->children[0]->evaluate();
+      triton::uint512 shift = this->children[1]->evaluate();
+      triton::uint512 mask  = 0;
+
       /* Mask based on the sign */
       if (this->children[0]->isSigned()) {
         mask = 1;
@@ -631,24 +788,10 @@ namespace triton {
 
       else {
         this->eval = value & this->getBitvectorMask();
-        for (triton::uint32 index = 0; index < shift; index++) {
+        for (triton::uint32 index = 0; index < static_cast<triton::uint32>(shift); index++) {
           this->eval = (((this->eval >> 1) | mask) & this->getBitvectorMask());
         }
       }
-
-      /* Init children and spread information */
-      for (triton::uint32 index = 0; index < this->children.size(); index++) {
-        this->children[index]->setParent(this);
-        this->symbolized |= this->children[index]->isSymbolized();
-        this->level = std::max(this->children[index]->getLevel() + 1, this->level);
-      }
-
-      /* Init parents if needed */
-      if (withParents) {
-        this->initParents();
-      }
-
-      this->initHash();
     }
 
 
@@ -686,7 +829,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (this->children[0]->evaluate() >> static_cast<triton::uint32>(this->children[1]->evaluate()));
       this->level      = 1;
       this->symbolized = false;
 
@@ -697,6 +839,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -706,6 +851,18 @@ namespace triton {
     }
 
 
+    void BvlshrNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 shift = value64(this->children[1]);
+        this->eval = (shift >= this->size ? 0 : (value64(this->children[0]) >> shift));
+      }
+      else if (this->children[1]->evaluate() >= this->size)
+        this->eval = 0;
+      else
+        this->eval = (this->children[0]->evaluate() >> static_cast<triton::uint32>(this->children[1]->evaluate()));
+    }
+
+
     void BvlshrNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -740,7 +897,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = ((this->children[0]->evaluate() * this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -751,6 +907,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -760,6 +919,14 @@ namespace triton {
     }
 
 
+    void BvmulNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = ((value64(this->children[0]) * value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = ((this->children[0]->evaluate() * this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvmulNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -794,7 +961,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (~(this->children[0]->evaluate() & this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -805,6 +971,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -814,6 +983,14 @@ namespace triton {
     }
 
 
+    void BvnandNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (~(value64(this->children[0]) & value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = (~(this->children[0]->evaluate() & this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvnandNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -844,7 +1021,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (static_cast<triton::uint512>((-(static_cast<triton::sint512>(this->children[0]->evaluate())))) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -855,6 +1031,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -864,6 +1043,14 @@ namespace triton {
     }
 
 
+    void BvnegNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = ((0 - value64(this->children[0])) & mask64(this->size));
+      else
+        this->eval = (static_cast<triton::uint512>((-(static_cast<triton::sint512>(this->children[0]->evaluate())))) & this->getBitvectorMask());
+    }
+
+
     void BvnegNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -898,7 +1085,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (~(this->children[0]->evaluate() | this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -909,6 +1095,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -918,6 +1107,14 @@ namespace triton {
     }
 
 
+    void BvnorNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (~(value64(this->children[0]) | value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = (~(this->children[0]->evaluate() | this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvnorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -948,7 +1145,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (~this->children[0]->evaluate() & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -959,6 +1155,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -968,6 +1167,14 @@ namespace triton {
     }
 
 
+    void BvnotNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (~value64(this->children[0]) & mask64(this->size));
+      else
+        this->eval = (~this->children[0]->evaluate() & this->getBitvectorMask());
+    }
+
+
     void BvnotNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1002,7 +1209,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (this->children[0]->evaluate() | this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1013,6 +1219,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1022,6 +1231,14 @@ namespace triton {
     }
 
 
+    void BvorNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) | value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() | this->children[1]->evaluate());
+    }
+
+
     void BvorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1049,22 +1266,14 @@ namespace triton {
 
 
     void BvrolNode::init(bool withParents) {
-      triton::uint32 rot    = 0;
-      triton::uint512 value = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvrolNode::init(): Must take at least two children.");
 
       if (this->children[0]->isArray())
         throw triton::exceptions::Ast("BvrolNode::init(): Cannot take an array as argument.");
 
-      rot   = triton::ast::getInteger<triton::uint32>(this->children[1]);
-      value = this->children[0]->evaluate();
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      rot             %= this->size;
-      this->eval       = (((value << rot) | (value >> (this->size - rot))) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1075,6 +1284,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1084,6 +1296,20 @@ namespace triton {
     }
 
 
+    void BvrolNode::initEval(void) {
+      triton::uint32 rot = triton::ast::getInteger<triton::uint32>(this->children[1]) % this->size;
+
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 value = value64(this->children[0]);
+        this->eval = (rot == 0 ? value : (((value << rot) | (value >> (this->size - rot))) & mask64(this->size)));
+      }
+      else {
+        triton::uint512 value = this->children[0]->evaluate();
+        this->eval = (((value << rot) | (value >> (this->size - rot))) & this->getBitvectorMask());
+      }
+    }
+
+
     void BvrolNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1111,22 +1337,14 @@ namespace triton {
 
 
     void BvrorNode::init(bool withParents) {
-      triton::uint32 rot    = 0;
-      triton::uint512 value = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvrorNode::init(): Must take at least two children.");
 
       if (this->children[0]->isArray())
         throw triton::exceptions::Ast("BvrorNode::init(): Cannot take an array as argument.");
 
-      rot   = triton::ast::getInteger<triton::uint32>(this->children[1]);
-      value = this->children[0]->evaluate();
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      rot             %= this->size;
-      this->eval       = (((value >> rot) | (value << (this->size - rot))) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1137,6 +1355,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1146,6 +1367,20 @@ namespace triton {
     }
 
 
+    void BvrorNode::initEval(void) {
+      triton::uint32 rot = triton::ast::getInteger<triton::uint32>(this->children[1]) % this->size;
+
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 value = value64(this->children[0]);
+        this->eval = (rot == 0 ? value : (((value >> rot) | (value << (this->size - rot))) & mask64(this->size)));
+      }
+      else {
+        triton::uint512 value = this->children[0]->evaluate();
+        this->eval = (((value >> rot) | (value << (this->size - rot))) & this->getBitvectorMask());
+      }
+    }
+
+
     void BvrorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1169,9 +1404,6 @@ namespace triton {
 
 
     void BvsdivNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsdivNode::init(): Must take at least two children.");
 
@@ -1181,22 +1413,11 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsdivNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
       this->level      = 1;
       this->symbolized = false;
 
-      if (op2Signed == 0) {
-        this->eval = (op1Signed < 0 ? 1 : -1);
-        this->eval &= this->getBitvectorMask();
-      }
-      else
-        this->eval = (static_cast<triton::uint512>((op1Signed / op2Signed)) & this->getBitvectorMask());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -1204,6 +1425,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1213,6 +1437,34 @@ namespace triton {
     }
 
 
+    void BvsdivNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        if (op2Signed == 0)
+          this->eval = (op1Signed < 0 ? 1 : mask64(this->size));
+        /* The only overflow of the signed division (INT64_MIN / -1) wraps around */
+        else if (op2Signed == -1)
+          this->eval = ((0 - static_cast<triton::uint64>(op1Signed)) & mask64(this->size));
+        else
+          this->eval = (static_cast<triton::uint64>(op1Signed / op2Signed) & mask64(this->size));
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        if (op2Signed == 0) {
+          this->eval = (op1Signed < 0 ? 1 : -1);
+          this->eval &= this->getBitvectorMask();
+        }
+        else
+          this->eval = (static_cast<triton::uint512>((op1Signed / op2Signed)) & this->getBitvectorMask());
+      }
+    }
+
+
     void BvsdivNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1236,9 +1488,6 @@ namespace triton {
 
 
     void BvsgeNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsgeNode::init(): Must take at least two children.");
 
@@ -1248,13 +1497,8 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsgeNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (op1Signed >= op2Signed);
       this->level      = 1;
       this->symbolized = false;
 
@@ -1265,6 +1509,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1274,6 +1521,23 @@ namespace triton {
     }
 
 
+    void BvsgeNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        this->eval = (op1Signed >= op2Signed);
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        this->eval = (op1Signed >= op2Signed);
+      }
+    }
+
+
     void BvsgeNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1297,9 +1561,6 @@ namespace triton {
 
 
     void BvsgtNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsgtNode::init(): Must take at least two children.");
 
@@ -1309,13 +1570,8 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsgtNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (op1Signed > op2Signed);
       this->level      = 1;
       this->symbolized = false;
 
@@ -1326,6 +1582,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1335,6 +1594,23 @@ namespace triton {
     }
 
 
+    void BvsgtNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        this->eval = (op1Signed > op2Signed);
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        this->eval = (op1Signed > op2Signed);
+      }
+    }
+
+
     void BvsgtNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1369,7 +1645,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = ((this->children[0]->evaluate() << static_cast<triton::uint32>(this->children[1]->evaluate())) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1380,6 +1655,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1389,6 +1667,18 @@ namespace triton {
     }
 
 
+    void BvshlNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 shift = value64(this->children[1]);
+        this->eval = (shift >= this->size ? 0 : ((value64(this->children[0]) << shift) & mask64(this->size)));
+      }
+      else if (this->children[1]->evaluate() >= this->size)
+        this->eval = 0;
+      else
+        this->eval = ((this->children[0]->evaluate() << static_cast<triton::uint32>(this->children[1]->evaluate())) & this->getBitvectorMask());
+    }
+
+
     void BvshlNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1412,9 +1702,6 @@ namespace triton {
 
 
     void BvsleNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsleNode::init(): Must take at least two children.");
 
@@ -1424,13 +1711,8 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsleNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (op1Signed <= op2Signed);
       this->level      = 1;
       this->symbolized = false;
 
@@ -1441,6 +1723,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1450,6 +1735,23 @@ namespace triton {
     }
 
 
+    void BvsleNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        this->eval = (op1Signed <= op2Signed);
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        this->eval = (op1Signed <= op2Signed);
+      }
+    }
+
+
     void BvsleNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1473,9 +1775,6 @@ namespace triton {
 
 
     void BvsltNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsltNode::init(): Must take at least two children.");
 
@@ -1485,13 +1784,8 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsltNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (op1Signed < op2Signed);
       this->level      = 1;
       this->symbolized = false;
 
@@ -1502,6 +1796,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1511,6 +1808,23 @@ namespace triton {
     }
 
 
+    void BvsltNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        this->eval = (op1Signed < op2Signed);
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        this->eval = (op1Signed < op2Signed);
+      }
+    }
+
+
     void BvsltNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1534,9 +1848,6 @@ namespace triton {
 
 
     void BvsmodNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsmodNode::init(): Must take at least two children.");
 
@@ -1546,20 +1857,11 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsmodNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
       this->level      = 1;
       this->symbolized = false;
 
-      if (this->children[1]->evaluate() == 0)
-        this->eval = this->children[0]->evaluate();
-      else
-        this->eval = (static_cast<triton::uint512>((((op1Signed % op2Signed) + op2Signed) % op2Signed)) & this->getBitvectorMask());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -1567,12 +1869,44 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
       }
 
-      this->initHash();
+      this->initHash();
+    }
+
+
+    void BvsmodNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        if (op2Signed == 0)
+          this->eval = value64(this->children[0]);
+        else {
+          /* The remainder takes the sign of the divisor, computed without overflow */
+          triton::sint64 rem = (op2Signed == -1 ? 0 : op1Signed % op2Signed);
+          triton::uint64 res = static_cast<triton::uint64>(rem);
+          if (rem != 0 && ((rem < 0) != (op2Signed < 0)))
+            res += static_cast<triton::uint64>(op2Signed);
+          this->eval = (res & mask64(this->size));
+        }
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        if (this->children[1]->evaluate() == 0)
+          this->eval = this->children[0]->evaluate();
+        else
+          this->eval = (static_cast<triton::uint512>((((op1Signed % op2Signed) + op2Signed) % op2Signed)) & this->getBitvectorMask());
+      }
     }
 
 
@@ -1599,9 +1933,6 @@ namespace triton {
 
 
     void BvsremNode::init(bool withParents) {
-      triton::sint512 op1Signed = 0;
-      triton::sint512 op2Signed = 0;
-
       if (this->children.size() < 2)
         throw triton::exceptions::Ast("BvsremNode::init(): Must take at least two children.");
 
@@ -1611,20 +1942,11 @@ namespace triton {
       if (this->children[0]->isArray() || this->children[1]->isArray())
         throw triton::exceptions::Ast("BvsremNode::init(): Cannot take an array as argument.");
 
-      /* Sign extend */
-      op1Signed = triton::ast::modularSignExtend(this->children[0].get());
-      op2Signed = triton::ast::modularSignExtend(this->children[1].get());
-
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
       this->level      = 1;
       this->symbolized = false;
 
-      if (this->children[1]->evaluate() == 0)
-        this->eval = this->children[0]->evaluate();
-      else
-        this->eval = (static_cast<triton::uint512>((op1Signed - ((op1Signed / op2Signed) * op2Signed))) & this->getBitvectorMask());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -1632,6 +1954,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1641,6 +1966,31 @@ namespace triton {
     }
 
 
+    void BvsremNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::sint64 op1Signed = signed64(value64(this->children[0]), this->children[0]->getBitvectorSize());
+        triton::sint64 op2Signed = signed64(value64(this->children[1]), this->children[1]->getBitvectorSize());
+
+        if (op2Signed == 0)
+          this->eval = value64(this->children[0]);
+        else if (op2Signed == -1)
+          this->eval = 0;
+        else
+          this->eval = (static_cast<triton::uint64>(op1Signed % op2Signed) & mask64(this->size));
+      }
+      else {
+        /* Sign extend */
+        triton::sint512 op1Signed = triton::ast::modularSignExtend(this->children[0].get());
+        triton::sint512 op2Signed = triton::ast::modularSignExtend(this->children[1].get());
+
+        if (this->children[1]->evaluate() == 0)
+          this->eval = this->children[0]->evaluate();
+        else
+          this->eval = (static_cast<triton::uint512>((op1Signed - ((op1Signed / op2Signed) * op2Signed))) & this->getBitvectorMask());
+      }
+    }
+
+
     void BvsremNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1675,7 +2025,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = ((this->children[0]->evaluate() - this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1686,6 +2035,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1695,6 +2047,14 @@ namespace triton {
     }
 
 
+    void BvsubNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = ((value64(this->children[0]) - value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = ((this->children[0]->evaluate() - this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvsubNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1732,11 +2092,6 @@ namespace triton {
       this->level      = 1;
       this->symbolized = false;
 
-      if (this->children[1]->evaluate() == 0)
-        this->eval = (-1 & this->getBitvectorMask());
-      else
-        this->eval = (this->children[0]->evaluate() / this->children[1]->evaluate());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -1744,6 +2099,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1753,6 +2111,18 @@ namespace triton {
     }
 
 
+    void BvudivNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 op2 = value64(this->children[1]);
+        this->eval = (op2 == 0 ? mask64(this->size) : (value64(this->children[0]) / op2));
+      }
+      else if (this->children[1]->evaluate() == 0)
+        this->eval = (-1 & this->getBitvectorMask());
+      else
+        this->eval = (this->children[0]->evaluate() / this->children[1]->evaluate());
+    }
+
+
     void BvudivNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1787,7 +2157,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() >= this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1798,6 +2167,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1807,6 +2179,14 @@ namespace triton {
     }
 
 
+    void BvugeNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) >= value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() >= this->children[1]->evaluate());
+    }
+
+
     void BvugeNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1841,7 +2221,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() > this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1852,6 +2231,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1861,6 +2243,14 @@ namespace triton {
     }
 
 
+    void BvugtNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) > value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() > this->children[1]->evaluate());
+    }
+
+
     void BvugtNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1895,7 +2285,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() <= this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1906,6 +2295,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1915,6 +2307,14 @@ namespace triton {
     }
 
 
+    void BvuleNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) <= value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() <= this->children[1]->evaluate());
+    }
+
+
     void BvuleNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -1949,7 +2349,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() < this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -1960,6 +2359,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -1969,6 +2371,14 @@ namespace triton {
     }
 
 
+    void BvultNode::initEval(void) {
+      if (this->children[0]->getBitvectorSize() <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) < value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() < this->children[1]->evaluate());
+    }
+
+
     void BvultNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2006,11 +2416,6 @@ namespace triton {
       this->level      = 1;
       this->symbolized = false;
 
-      if (this->children[1]->evaluate() == 0)
-        this->eval = this->children[0]->evaluate();
-      else
-        this->eval = (this->children[0]->evaluate() % this->children[1]->evaluate());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         this->children[index]->setParent(this);
@@ -2018,6 +2423,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2027,6 +2435,19 @@ namespace triton {
     }
 
 
+    void BvuremNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 op1 = value64(this->children[0]);
+        triton::uint64 op2 = value64(this->children[1]);
+        this->eval = (op2 == 0 ? op1 : (op1 % op2));
+      }
+      else if (this->children[1]->evaluate() == 0)
+        this->eval = this->children[0]->evaluate();
+      else
+        this->eval = (this->children[0]->evaluate() % this->children[1]->evaluate());
+    }
+
+
     void BvuremNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2061,7 +2482,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (~(this->children[0]->evaluate() ^ this->children[1]->evaluate()) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2072,6 +2492,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2081,6 +2504,14 @@ namespace triton {
     }
 
 
+    void BvxnorNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (~(value64(this->children[0]) ^ value64(this->children[1])) & mask64(this->size));
+      else
+        this->eval = (~(this->children[0]->evaluate() ^ this->children[1]->evaluate()) & this->getBitvectorMask());
+    }
+
+
     void BvxnorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2115,7 +2546,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = (this->children[0]->evaluate() ^ this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2126,6 +2556,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2135,6 +2568,14 @@ namespace triton {
     }
 
 
+    void BvxorNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (value64(this->children[0]) ^ value64(this->children[1]));
+      else
+        this->eval = (this->children[0]->evaluate() ^ this->children[1]->evaluate());
+    }
+
+
     void BvxorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2176,7 +2617,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = size;
-      this->eval       = (value & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2187,6 +2627,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2196,6 +2639,16 @@ namespace triton {
     }
 
 
+    void BvNode::initEval(void) {
+      triton::uint512 value = triton::ast::getInteger<triton::uint512>(this->children[0]);
+
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (static_cast<triton::uint64>(value) & mask64(this->size));
+      else
+        this->eval = (value & this->getBitvectorMask());
+    }
+
+
     void BvNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2217,7 +2670,6 @@ namespace triton {
         throw triton::exceptions::Ast("CompoundNode::init(): Must take at least one child.");
 
       /* Init attributes */
-      this->eval       = 0;
       this->size       = 0;
       this->level      = 1;
       this->symbolized = false;
@@ -2229,6 +2681,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2238,6 +2693,11 @@ namespace triton {
     }
 
 
+    void CompoundNode::initEval(void) {
+      this->eval = 0;
+    }
+
+
     void CompoundNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2275,10 +2735,6 @@ namespace triton {
       if (this->size > triton::bitsize::max_supported)
         throw triton::exceptions::Ast("ConcatNode::init(): Size cannot be greater than triton::bitsize::max_supported.");
 
-      this->eval = this->children[0]->evaluate();
-      for (triton::uint32 index = 0; index < this->children.size()-1; index++)
-        this->eval = ((this->eval << this->children[index+1]->getBitvectorSize()) | this->children[index+1]->evaluate());
-
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
         if (this->children[index]->isArray()) {
@@ -2289,6 +2745,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2298,6 +2757,21 @@ namespace triton {
     }
 
 
+    void ConcatNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword) {
+        triton::uint64 value = value64(this->children[0]);
+        for (triton::uint32 index = 0; index < this->children.size()-1; index++)
+          value = ((value << this->children[index+1]->getBitvectorSize()) | value64(this->children[index+1]));
+        this->eval = value;
+      }
+      else {
+        this->eval = this->children[0]->evaluate();
+        for (triton::uint32 index = 0; index < this->children.size()-1; index++)
+          this->eval = ((this->eval << this->children[index+1]->getBitvectorSize()) | this->children[index+1]->evaluate());
+      }
+    }
+
+
     void ConcatNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2328,7 +2802,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[0]->getBitvectorSize();
-      this->eval       = this->children[0]->evaluate();
       this->level      = 1;
       this->symbolized = false;
 
@@ -2339,6 +2812,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2348,6 +2824,11 @@ namespace triton {
     }
 
 
+    void DeclareNode::initEval(void) {
+      this->eval = this->children[0]->evaluate();
+    }
+
+
     void DeclareNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2382,7 +2863,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() != this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2393,6 +2873,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2402,6 +2885,11 @@ namespace triton {
     }
 
 
+    void DistinctNode::initEval(void) {
+      this->eval = (this->children[0]->evaluate() != this->children[1]->evaluate());
+    }
+
+
     void DistinctNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2436,7 +2924,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = (this->children[0]->evaluate() == this->children[1]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2447,6 +2934,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2456,6 +2946,11 @@ namespace triton {
     }
 
 
+    void EqualNode::initEval(void) {
+      this->eval = (this->children[0]->evaluate() == this->children[1]->evaluate());
+    }
+
+
     void EqualNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2497,7 +2992,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = ((high - low) + 1);
-      this->eval       = ((this->children[2]->evaluate() >> low) & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2511,6 +3005,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2520,6 +3017,16 @@ namespace triton {
     }
 
 
+    void ExtractNode::initEval(void) {
+      triton::uint32 low = triton::ast::getInteger<triton::uint32>(this->children[1]);
+
+      if (this->children[2]->getBitvectorSize() <= triton::bitsize::qword)
+        this->eval = ((value64(this->children[2]) >> low) & mask64(this->size));
+      else
+        this->eval = ((this->children[2]->evaluate() >> low) & this->getBitvectorMask());
+    }
+
+
     void ExtractNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2551,7 +3058,6 @@ namespace triton {
         throw triton::exceptions::Ast("ForallNode::init(): Must take a logical node as body.");
 
       this->size       = 1;
-      this->eval       = 0;
       this->level      = 1;
       this->symbolized = false;
 
@@ -2562,6 +3068,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2571,6 +3080,11 @@ namespace triton {
     }
 
 
+    void ForallNode::initEval(void) {
+      this->eval = 0;
+    }
+
+
     void ForallNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2604,11 +3118,7 @@ namespace triton {
         throw triton::exceptions::Ast("IffNode::init(): Must take a logical node as second argument.");
 
       /* Init attributes */
-      triton::uint512 P = this->children[0]->evaluate();
-      triton::uint512 Q = this->children[1]->evaluate();
-
       this->size       = 1;
-      this->eval       = (P && Q) || (!P && !Q);
       this->level      = 1;
       this->symbolized = false;
 
@@ -2619,6 +3129,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2628,6 +3141,14 @@ namespace triton {
     }
 
 
+    void IffNode::initEval(void) {
+      triton::uint512 P = this->children[0]->evaluate();
+      triton::uint512 Q = this->children[1]->evaluate();
+
+      this->eval = (P && Q) || (!P && !Q);
+    }
+
+
     void IffNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2651,11 +3172,13 @@ namespace triton {
 
     void IntegerNode::init(bool withParents) {
       /* Init attributes */
-      this->eval        = 0;
       this->size        = 0;
       this->level       = 1;
       this->symbolized  = false;
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2665,6 +3188,11 @@ namespace triton {
     }
 
 
+    void IntegerNode::initEval(void) {
+      this->eval = 0;
+    }
+
+
     triton::uint512 IntegerNode::getInteger(void) {
       return this->value;
     }
@@ -2703,7 +3231,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[1]->getBitvectorSize();
-      this->eval       = this->children[0]->evaluate() ? this->children[1]->evaluate() : this->children[2]->evaluate();
       this->logical    = this->children[1]->isLogical();
       this->level      = 1;
       this->symbolized = false;
@@ -2715,6 +3242,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2724,6 +3254,11 @@ namespace triton {
     }
 
 
+    void IteNode::initEval(void) {
+      this->eval = this->children[0]->evaluate() ? this->children[1]->evaluate() : this->children[2]->evaluate();
+    }
+
+
     void IteNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2752,7 +3287,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = 1;
       this->level      = 1;
       this->symbolized = false;
 
@@ -2763,10 +3297,12 @@ namespace triton {
         }
         this->children[index]->setParent(this);
         this->symbolized |= this->children[index]->isSymbolized();
-        this->eval = this->eval && this->children[index]->evaluate();
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2776,6 +3312,14 @@ namespace triton {
     }
 
 
+    void LandNode::initEval(void) {
+      this->eval = 1;
+      for (triton::uint32 index = 0; index < this->children.size(); index++) {
+        this->eval = this->eval && this->children[index]->evaluate();
+      }
+    }
+
+
     void LandNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2808,7 +3352,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = this->children[2]->getBitvectorSize();
-      this->eval       = this->children[2]->evaluate();
       this->level      = 1;
       this->symbolized = false;
 
@@ -2819,6 +3362,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2828,6 +3374,11 @@ namespace triton {
     }
 
 
+    void LetNode::initEval(void) {
+      this->eval = this->children[2]->evaluate();
+    }
+
+
     void LetNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2855,7 +3406,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = !(this->children[0]->evaluate());
       this->level      = 1;
       this->symbolized = false;
 
@@ -2869,6 +3419,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2878,6 +3431,11 @@ namespace triton {
     }
 
 
+    void LnotNode::initEval(void) {
+      this->eval = !(this->children[0]->evaluate());
+    }
+
+
     void LnotNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2906,7 +3464,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = 0;
       this->level      = 1;
       this->symbolized = false;
 
@@ -2917,10 +3474,12 @@ namespace triton {
         }
         this->children[index]->setParent(this);
         this->symbolized |= this->children[index]->isSymbolized();
-        this->eval = this->eval || this->children[index]->evaluate();
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2930,6 +3489,14 @@ namespace triton {
     }
 
 
+    void LorNode::initEval(void) {
+      this->eval = 0;
+      for (triton::uint32 index = 0; index < this->children.size(); index++) {
+        this->eval = this->eval || this->children[index]->evaluate();
+      }
+    }
+
+
     void LorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -2958,7 +3525,6 @@ namespace triton {
 
       /* Init attributes */
       this->size       = 1;
-      this->eval       = 0;
       this->level      = 1;
       this->symbolized = false;
 
@@ -2969,10 +3535,12 @@ namespace triton {
         }
         this->children[index]->setParent(this);
         this->symbolized |= this->children[index]->isSymbolized();
-        this->eval = !this->eval != !this->children[index]->evaluate();
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -2982,6 +3550,14 @@ namespace triton {
     }
 
 
+    void LxorNode::initEval(void) {
+      this->eval = 0;
+      for (triton::uint32 index = 0; index < this->children.size(); index++) {
+        this->eval = !this->eval != !this->children[index]->evaluate();
+      }
+    }
+
+
     void LxorNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -3007,7 +3583,6 @@ namespace triton {
     void ReferenceNode::init(bool withParents) {
       /* Init attributes */
       this->array       = this->expr->getAst()->isArray();
-      this->eval        = this->expr->getAst()->evaluate();
       this->logical     = this->expr->getAst()->isLogical();
       this->size        = this->expr->getAst()->getBitvectorSize();
       this->symbolized  = this->expr->getAst()->isSymbolized();
@@ -3015,6 +3590,9 @@ namespace triton {
 
       this->expr->getAst()->setParent(this);
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3024,6 +3602,11 @@ namespace triton {
     }
 
 
+    void ReferenceNode::initEval(void) {
+      this->eval = this->expr->getAst()->evaluate();
+    }
+
+
     void ReferenceNode::initHash(void) {
       this->hash = this->expr->getAst()->getHash();
     }
@@ -3063,16 +3646,8 @@ namespace triton {
       this->level      = 1;
       this->symbolized = false;
 
-      switch(this->children[0]->getType()) {
-        case ARRAY_NODE:
-          this->eval = reinterpret_cast<ArrayNode*>(this->children[0].get())->select(this->children[1]);
-          break;
-        case STORE_NODE:
-          this->eval = reinterpret_cast<StoreNode*>(this->children[0].get())->select(this->children[1]);
-          break;
-        default:
-          throw triton::exceptions::Ast("SelectNode::init(): Invalid sort");
-      }
+      if (this->children[0]->getType() != ARRAY_NODE && this->children[0]->getType() != STORE_NODE)
+        throw triton::exceptions::Ast("SelectNode::init(): Invalid sort");
 
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
@@ -3081,6 +3656,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3090,6 +3668,20 @@ namespace triton {
     }
 
 
+    void SelectNode::initEval(void) {
+      switch(this->children[0]->getType()) {
+        case ARRAY_NODE:
+          this->eval = reinterpret_cast<ArrayNode*>(this->children[0].get())->select(this->children[1]);
+          break;
+        case STORE_NODE:
+          this->eval = reinterpret_cast<StoreNode*>(this->children[0].get())->select(this->children[1]);
+          break;
+        default:
+          throw triton::exceptions::Ast("SelectNode::initEval(): Invalid sort");
+      }
+    }
+
+
     void  SelectNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -3134,7 +3726,6 @@ namespace triton {
         throw triton::exceptions::Ast("StoreNode::init(): The stored node must be 8-bit long");
 
       /* Init attributes */
-      this->eval       = this->children[2]->evaluate();
       this->size       = 0; // Array do not have size.
       this->level      = 1;
       this->symbolized = false;
@@ -3154,6 +3745,7 @@ namespace triton {
       }
 
       /* Store the value to the memory array */
+      this->initEval();
       this->memory[static_cast<triton::uint64>(this->children[1]->evaluate())] = static_cast<triton::uint8>(this->eval);
 
       /* Init children and spread information */
@@ -3172,6 +3764,11 @@ namespace triton {
     }
 
 
+    void StoreNode::initEval(void) {
+      this->eval = this->children[2]->evaluate();
+    }
+
+
     void StoreNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -3223,11 +3820,13 @@ namespace triton {
 
     void StringNode::init(bool withParents) {
       /* Init attributes */
-      this->eval        = 0;
       this->size        = 0;
       this->level       = 1;
       this->symbolized  = false;
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3237,6 +3836,11 @@ namespace triton {
     }
 
 
+    void StringNode::initEval(void) {
+      this->eval = 0;
+    }
+
+
     std::string StringNode::getString(void) {
       return this->value;
     }
@@ -3281,8 +3885,6 @@ namespace triton {
 
       this->level      = 1;
       this->symbolized = false;
-      this->eval       = ((((this->children[1]->evaluate() >> (this->children[1]->getBitvectorSize()-1)) == 0) ?
-                          this->children[1]->evaluate() : (this->children[1]->evaluate() | ~(this->children[1]->getBitvectorMask()))) & this->getBitvectorMask());
 
       /* Init children and spread information */
       for (triton::uint32 index = 0; index < this->children.size(); index++) {
@@ -3291,6 +3893,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3300,6 +3905,15 @@ namespace triton {
     }
 
 
+    void SxNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (static_cast<triton::uint64>(signed64(value64(this->children[1]), this->children[1]->getBitvectorSize())) & mask64(this->size));
+      else
+        this->eval = ((((this->children[1]->evaluate() >> (this->children[1]->getBitvectorSize()-1)) == 0) ?
+                      this->children[1]->evaluate() : (this->children[1]->evaluate() | ~(this->children[1]->getBitvectorMask()))) & this->getBitvectorMask());
+    }
+
+
     void SxNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -3324,10 +3938,12 @@ namespace triton {
 
     void VariableNode::init(bool withParents) {
       this->size        = this->symVar->getSize();
-      this->eval        = this->ctxt->getVariableValue(this->symVar->getName()) & this->getBitvectorMask();
       this->symbolized  = true;
       this->level       = 1;
 
+      /* Init eval */
+      this->initEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3337,6 +3953,11 @@ namespace triton {
     }
 
 
+    void VariableNode::initEval(void) {
+      this->eval = this->ctxt->getVariableValue(this->symVar->getName()) & this->getBitvectorMask();
+    }
+
+
     const triton::engines::symbolic::SharedSymbolicVariable& VariableNode::getSymbolicVariable() {
       return this->symVar;
     }
@@ -3380,7 +4001,6 @@ namespace triton {
       if (size > triton::bitsize::max_supported)
         throw triton::exceptions::Ast("ZxNode::init(): Size cannot be greater than triton::bitsize::max_supported.");
 
-      this->eval       = (this->children[1]->evaluate() & this->getBitvectorMask());
       this->level      = 1;
       this->symbolized = false;
 
@@ -3391,6 +4011,9 @@ namespace triton {
         this->level = std::max(this->children[index]->getLevel() + 1, this->level);
       }
 
+      /* Init eval */
+      this->updateEval();
+
       /* Init parents if needed */
       if (withParents) {
         this->initParents();
@@ -3400,6 +4023,14 @@ namespace triton {
     }
 
 
+    void ZxNode::initEval(void) {
+      if (this->size <= triton::bitsize::qword)
+        this->eval = (value64(this->children[1]) & mask64(this->size));
+      else
+        this->eval = (this->children[1]->evaluate() & this->getBitvectorMask());
+    }
+
+
     void ZxNode::initHash(void) {
       triton::uint512 s = this->children.size();
 
@@ -3584,7 +4215,8 @@ namespace triton {
         }
       }
 
-      return node->getContext()->collect(newNode);
+      /* A copy may be mutated, so it must not be shared (see AST_HASH_CONSING) */
+      return node->getContext()->collect(newNode, false);
     }
 
 
@@ -5,6 +5,8 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
+#include <chrono>
 #include <list>
 #include <memory>
 #include <vector>
@@ -12,6 +14,7 @@
 #include <triton/ast.hpp>
 #include <triton/astContext.hpp>
 #include <triton/exceptions.hpp>
+#include <triton/smtToTriton.hpp>
 #include <triton/symbolicExpression.hpp>
 #include <triton/symbolicVariable.hpp>
 
@@ -20,30 +23,60 @@
 namespace triton {
   namespace ast {
 
+    /*! The minimum number of entries in the unique table before expired entries are purged. */
+    static const triton::usize UNIQUE_TABLE_MIN_THRESHOLD = 4096;
+
+    /*! The number of nodes examined per sweep when the budget of the garbage collector is 0. */
+    static const triton::usize GC_DEFAULT_BUDGET = 1024;
+
+
     AstContext::AstContext(const triton::modes::SharedModes& modes)
       : modes(modes) {
+      this->uniqueTableThreshold = UNIQUE_TABLE_MIN_THRESHOLD;
+      this->tenuredCursor        = 0;
+      this->gcBudget             = 0;
+      this->gcPeriod             = 1;
+      this->gcCalls              = 0;
+      this->gcStats              = {0, 0, 0, 0};
     }
 
 
     AstContext::~AstContext() {
       this->valueMapping.clear();
-      this->nodes.clear();
+      this->uniqueTable.clear();
+      this->releaseNodes();
     }
 
 
     AstContext& AstContext::operator=(const AstContext& other) {
       std::enable_shared_from_this<AstContext>::operator=(other);
 
-      this->astRepresentation = other.astRepresentation;
-      this->modes             = other.modes;
-      this->nodes             = other.nodes;
-      this->valueMapping      = other.valueMapping;
+      this->astRepresentation    = other.astRepresentation;
+      this->modes                = other.modes;
+      this->nodes                = other.nodes;
+      this->tenuredNodes         = other.tenuredNodes;
+      this->tenuredCursor        = other.tenuredCursor;
+      this->gcBudget             = other.gcBudget;
+      this->gcPeriod             = other.gcPeriod;
+      this->gcCalls              = other.gcCalls;
+      this->gcStats              = other.gcStats;
+      this->uniqueTable          = other.uniqueTable;
+      this->uniqueTableThreshold = other.uniqueTableThreshold;
+      this->valueMapping         = other.valueMapping;
 
       return *this;
     }
 
 
-    SharedAbstractNode AstContext::collect(const SharedAbstractNode& node) {
+    SharedAbstractNode AstContext::collect(const SharedAbstractNode& node, bool share) {
+      /* If the node already exists, share it instead of keeping a duplicate */
+      if (share && this->modes->isModeEnabled(triton::modes::AST_HASH_CONSING)) {
+        SharedAbstractNode unique = this->hashCons(node);
+        if (unique != node) {
+          return unique;
+        }
+      }
+
       /*
        * We keep references to nodes which belong to a depth in the AST which is
        * a multiple of 10000. Thus, when the root node is destroyed, the stack recursivity
@@ -63,11 +96,202 @@ namespace triton {
 
 
     void AstContext::garbage(void) {
-      this->nodes.erase(std::remove_if(this->nodes.begin(), this->nodes.end(),
-        [](const SharedAbstractNode& n) {
-          return (n.use_count() == 1 ? true : false);
-        }), this->nodes.end()
+      /* Only sweep once every gcPeriod calls */
+      this->gcCalls++;
+      if (this->gcCalls % this->gcPeriod) {
+        return;
+      }
+
+      /*
+       * The budget is split between the two generations. When it is odd, the
+       * extra node alternates between them so that none of them is starved.
+       */
+      triton::usize budget = this->gcBudget ? this->gcBudget : GC_DEFAULT_BUDGET;
+      triton::usize young  = budget / 2 + ((budget % 2) && (this->gcStats.sweeps % 2) == 0);
+      this->sweep(young, budget - young);
+    }
+
+
+    void AstContext::fullGarbage(void) {
+      this->sweep(this->nodes.size(), this->nodes.size() + this->tenuredNodes.size());
+    }
+
+
+    void AstContext::sweep(triton::usize youngBudget, triton::usize tenuredBudget) {
+      auto start = std::chrono::steady_clock::now();
+
+      /*
+       * Young generation: the oldest young nodes are examined first. Nodes only
+       * referenced by the collector are released, others are promoted.
+       */
+      while (youngBudget && !this->nodes.empty()) {
+        SharedAbstractNode node = std::move(this->nodes.back());
+        this->nodes.pop_back();
+        youngBudget--;
+
+        if (node.use_count() == 1)
+          this->gcStats.freed++;
+        else
+          this->tenuredNodes.push_back(std::move(node));
+      }
+
+      /*
+       * Old generation: examined incrementally from where the previous sweep
+       * stopped, with the budget left by the young generation. A released node
+       * is replaced by the last one of the list.
+       */
+      triton::usize remaining = std::min(tenuredBudget + youngBudget, this->tenuredNodes.size());
+      while (remaining--) {
+        if (this->tenuredCursor >= this->tenuredNodes.size())
+          this->tenuredCursor = 0;
+
+        if (this->tenuredNodes[this->tenuredCursor].use_count() == 1) {
+          std::swap(this->tenuredNodes[this->tenuredCursor], this->tenuredNodes.back());
+          this->tenuredNodes.pop_back();
+          this->gcStats.freed++;
+        }
+        else {
+          this->tenuredCursor++;
+        }
+      }
+
+      this->gcStats.sweeps++;
+      this->gcStats.time += std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::steady_clock::now() - start).count();
+    }
+
+
+    void AstContext::releaseNodes(void) {
+      /*
+       * Release the deepest nodes first, so that the destruction of a node
+       * always stops at the next collected node (see #753).
+       */
+      for (auto& node : this->nodes)
+        this->tenuredNodes.push_back(std::move(node));
+      this->nodes.clear();
+
+      std::sort(this->tenuredNodes.begin(), this->tenuredNodes.end(),
+        [](const SharedAbstractNode& a, const SharedAbstractNode& b) {
+          return a->getLevel() < b->getLevel();
+        }
       );
+
+      while (!this->tenuredNodes.empty())
+        this->tenuredNodes.pop_back();
+
+      this->tenuredCursor = 0;
+    }
+
+
+    void AstContext::setGarbageCollectorBudget(triton::usize budget) {
+      this->gcBudget = budget;
+    }
+
+
+    void AstContext::setGarbageCollectorPeriod(triton::usize period) {
+      if (period == 0)
+        throw triton::exceptions::Ast("AstContext::setGarbageCollectorPeriod(): The period must be greater than zero.");
+      this->gcPeriod = period;
+    }
+
+
+    GarbageCollectorStats AstContext::getGarbageCollectorStats(void) const {
+      GarbageCollectorStats stats = this->gcStats;
+      stats.kept = this->nodes.size() + this->tenuredNodes.size();
+      return stats;
+    }
+
+
+    /* Returns true if both nodes have the same type, the same payload and the same children (by identity) */
+    static bool isStructurallyIdentical(const SharedAbstractNode& a, const SharedAbstractNode& b) {
+      if (a->getType() != b->getType() || a->getBitvectorSize() != b->getBitvectorSize())
+        return false;
+
+      switch (a->getType()) {
+        case INTEGER_NODE:
+          return reinterpret_cast<IntegerNode*>(a.get())->getInteger() == reinterpret_cast<IntegerNode*>(b.get())->getInteger();
+        case STRING_NODE:
+          return reinterpret_cast<StringNode*>(a.get())->getString() == reinterpret_cast<StringNode*>(b.get())->getString();
+        default:
+          break;
+      }
+
+      const auto& c1 = a->getChildren();
+      const auto& c2 = b->getChildren();
+      if (c1.size() != c2.size())
+        return false;
+
+      /* Children are already unique, so comparing their identity is enough */
+      for (triton::usize index = 0; index < c1.size(); index++) {
+        if (c1[index] != c2[index])
+          return false;
+      }
+
+      return true;
+    }
+
+
+    SharedAbstractNode AstContext::hashCons(const SharedAbstractNode& node) {
+      switch (node->getType()) {
+        /*
+         * These nodes are bound to a mutable state (memory array, symbolic expression
+         * or symbolic variable) and must keep their own identity.
+         */
+        case ARRAY_NODE:
+        case REFERENCE_NODE:
+        case SELECT_NODE:
+        case STORE_NODE:
+        case VARIABLE_NODE:
+          return node;
+        default:
+          break;
+      }
+
+      triton::usize key = static_cast<triton::usize>(node->getHash());
+      auto range = this->uniqueTable.equal_range(key);
+
+      for (auto it = range.first; it != range.second;) {
+        if (auto other = it->second.lock()) {
+          if (isStructurallyIdentical(node, other))
+            return other;
+          ++it;
+        }
+        else {
+          it = this->uniqueTable.erase(it);
+        }
+      }
+
+      if (this->uniqueTable.size() >= this->uniqueTableThreshold) {
+        this->purgeUniqueTable();
+        this->uniqueTableThreshold = std::max(UNIQUE_TABLE_MIN_THRESHOLD, this->uniqueTable.size() * 2);
+      }
+
+      this->uniqueTable.emplace(key, node);
+      return node;
+    }
+
+
+    void AstContext::unshare(AbstractNode* node) {
+      if (this->uniqueTable.empty())
+        return;
+
+      auto range = this->uniqueTable.equal_range(static_cast<triton::usize>(node->getHash()));
+      for (auto it = range.first; it != range.second;) {
+        auto other = it->second.lock();
+        if (other == nullptr || other.get() == node)
+          it = this->uniqueTable.erase(it);
+        else
+          ++it;
+      }
+    }
+
+
+    void AstContext::purgeUniqueTable(void) {
+      for (auto it = this->uniqueTable.begin(); it != this->uniqueTable.end();) {
+        if (it->second.expired())
+          it = this->uniqueTable.erase(it);
+        else
+          ++it;
+      }
     }
 
 
@@ -1019,7 +1243,14 @@ namespace triton {
           // This node already exist, just return it
           return node;
         }
-        throw triton::exceptions::Ast("AstContext::variable(): This symbolic variable is dead.");
+        // The node has been released, rebuild it with the same concrete value
+        SharedAbstractNode node = std::make_shared<VariableNode>(symVar, this->shared_from_this());
+        if (node == nullptr) {
+          throw triton::exceptions::Ast("AstContext::variable(): Not enough memory");
+        }
+        it->second.first = node;
+        node->init();
+        return this->collect(node);
       }
       else {
         // if not found, create a new variable node
@@ -1095,6 +1326,33 @@ namespace triton {
     }
 
 
+    std::vector<SharedAbstractNode> AstContext::parseSmt(std::istream& stream, const triton::ast::SmtResolver& resolver) {
+      triton::ast::SmtToTriton parser(this->shared_from_this(), resolver);
+
+      /* The resolver finds the aliases itself */
+      if (resolver != nullptr)
+        return parser.convert(stream);
+
+      /* The SMT representation prints the alias of the variables which have one */
+      for (const auto& item : this->valueMapping) {
+        auto node = item.second.first.lock();
+        if (node == nullptr || node->getType() != VARIABLE_NODE)
+          continue;
+
+        const auto& alias = reinterpret_cast<VariableNode*>(node.get())->getSymbolicVariable()->getAlias();
+        if (!alias.empty())
+          parser.declare(alias, node);
+      }
+
+      return parser.convert(stream);
+    }
+
+
+    bool AstContext::isEvaluationDeferred(void) const {
+      return this->modes->isModeEnabled(triton::modes::AST_LAZY_EVALUATION);
+    }
+
+
     const triton::uint512& AstContext::getVariableValue(const std::string& name) const {
       auto it = this->valueMapping.find(name);
       if (it != this->valueMapping.end()) {
@@ -1123,6 +1381,11 @@ namespace triton {
     }
 
 
+    std::ostream& AstContext::printShared(std::ostream& stream, AbstractNode* node) {
+      return this->astRepresentation.printShared(stream, node);
+    }
+
+
     SharedAbstractNode AstContext::simplify_concat(std::vector<SharedAbstractNode> exprs) {
       /*
        * Optimization: concatenate extractions in one if possible. We are
@@ -0,0 +1,531 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <algorithm>
+#include <limits>
+#include <utility>
+
+#include <triton/batchEvaluator.hpp>
+#include <triton/cpuSize.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/symbolicExpression.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    /* Returns the mask of a bitvector of `size` bits */
+    template <typename T>
+    static inline T laneMask(triton::uint32 size) {
+      if (size >= static_cast<triton::uint32>(std::numeric_limits<T>::digits))
+        return ~static_cast<T>(0);
+      return ((static_cast<T>(1) << size) - 1);
+    }
+
+
+    /* Returns true if the sign bit of a bitvector of `size` bits is set */
+    template <typename T>
+    static inline bool laneSign(const T& value, triton::uint32 size) {
+      return (((value >> (size - 1)) & 1) != 0);
+    }
+
+
+    /* Returns the absolute value of a signed bitvector of `size` bits */
+    template <typename T>
+    static inline T laneAbs(const T& value, triton::uint32 size, const T& mask) {
+      return (laneSign(value, size) ? ((~value + 1) & mask) : value);
+    }
+
+
+    BatchEvaluator::BatchEvaluator(const triton::ast::SharedAbstractNode& node) {
+      if (node == nullptr)
+        throw triton::exceptions::Ast("BatchEvaluator::BatchEvaluator(): node cannot be null.");
+
+      this->narrow = true;
+      this->compile(node);
+    }
+
+
+    void BatchEvaluator::compile(const triton::ast::SharedAbstractNode& root) {
+      std::unordered_map<const triton::ast::AbstractNode*, triton::usize> slots;
+      std::unordered_map<triton::usize, triton::uint32> inputs;
+      std::vector<std::pair<triton::ast::SharedAbstractNode, bool>> worklist;
+
+      worklist.push_back({root, false});
+      while (!worklist.empty()) {
+        triton::ast::SharedAbstractNode node = worklist.back().first;
+        bool visited = worklist.back().second;
+        worklist.pop_back();
+
+        if (slots.find(node.get()) != slots.end())
+          continue;
+
+        Instruction inst;
+        inst.type   = node->getType();
+        inst.size   = node->getBitvectorSize();
+        inst.opSize = inst.size;
+        inst.imm    = 0;
+        inst.value  = 0;
+
+        /* A sub-tree which does not depend on a variable is folded into a constant */
+        if (!node->isSymbolized()) {
+          inst.type  = triton::ast::INVALID_NODE;
+          inst.value = node->evaluate();
+        }
+
+        else if (inst.type == triton::ast::VARIABLE_NODE) {
+          const auto& var = reinterpret_cast<triton::ast::VariableNode*>(node.get())->getSymbolicVariable();
+          auto it = inputs.find(var->getId());
+          if (it == inputs.end()) {
+            it = inputs.insert({var->getId(), static_cast<triton::uint32>(this->variables.size())}).first;
+            this->variables.push_back(var);
+            this->defaults.push_back(node->evaluate());
+          }
+          inst.imm = it->second;
+        }
+
+        else {
+          std::vector<triton::ast::SharedAbstractNode> operands;
+
+          switch (inst.type) {
+            case triton::ast::REFERENCE_NODE:
+              operands.push_back(reinterpret_cast<triton::ast::ReferenceNode*>(node.get())->getSymbolicExpression()->getAst());
+              break;
+
+            case triton::ast::LET_NODE:
+              operands.push_back(node->getChildren()[2]);
+              break;
+
+            case triton::ast::EXTRACT_NODE:
+              inst.imm = triton::ast::getInteger<triton::uint32>(node->getChildren()[1]);
+              operands.push_back(node->getChildren()[2]);
+              break;
+
+            case triton::ast::SX_NODE:
+            case triton::ast::ZX_NODE:
+              operands.push_back(node->getChildren()[1]);
+              break;
+
+            case triton::ast::BVROL_NODE:
+            case triton::ast::BVROR_NODE:
+              inst.imm = triton::ast::getInteger<triton::uint32>(node->getChildren()[1]) % inst.size;
+              operands.push_back(node->getChildren()[0]);
+              break;
+
+            case triton::ast::ARRAY_NODE:
+            case triton::ast::COMPOUND_NODE:
+            case triton::ast::DECLARE_NODE:
+            case triton::ast::FORALL_NODE:
+            case triton::ast::SELECT_NODE:
+            case triton::ast::STORE_NODE:
+            case triton::ast::STRING_NODE:
+              throw triton::exceptions::Ast("BatchEvaluator::compile(): Unsupported kind of node.");
+
+            default:
+              operands = node->getChildren();
+              break;
+          }
+
+          /* Operands first */
+          if (!visited) {
+            worklist.push_back({node, true});
+            for (auto it = operands.rbegin(); it != operands.rend(); it++)
+              worklist.push_back({*it, false});
+            continue;
+          }
+
+          /* References and lets are aliases of their operand */
+          if (inst.type == triton::ast::REFERENCE_NODE || inst.type == triton::ast::LET_NODE) {
+            slots[node.get()] = slots.at(operands[0].get());
+            continue;
+          }
+
+          for (const auto& operand : operands)
+            inst.operands.push_back(slots.at(operand.get()));
+          inst.opSize = operands[0]->getBitvectorSize();
+        }
+
+        if (inst.size > triton::bitsize::qword || inst.opSize > triton::bitsize::qword)
+          this->narrow = false;
+
+        slots[node.get()] = this->tape.size();
+        this->tape.push_back(std::move(inst));
+      }
+    }
+
+
+    const std::vector<triton::engines::symbolic::SharedSymbolicVariable>& BatchEvaluator::getVariables(void) const {
+      return this->variables;
+    }
+
+
+    const std::vector<triton::uint512>& BatchEvaluator::getDefaultValues(void) const {
+      return this->defaults;
+    }
+
+
+    triton::usize BatchEvaluator::getTapeSize(void) const {
+      return this->tape.size();
+    }
+
+
+    std::vector<triton::uint512> BatchEvaluator::evaluate(const std::unordered_map<triton::usize, Column>& inputs) const {
+      std::vector<const Column*> columns(this->variables.size(), nullptr);
+      triton::usize lanes = 1;
+
+      /* Without any input column, the batch is made of a single lane */
+      for (auto it = inputs.begin(); it != inputs.end(); it++) {
+        if (it != inputs.begin() && it->second.size() != lanes)
+          throw triton::exceptions::Ast("BatchEvaluator::evaluate(): All the columns must have the same size.");
+        lanes = it->second.size();
+      }
+
+      for (triton::usize index = 0; index < this->variables.size(); index++) {
+        auto it = inputs.find(this->variables[index]->getId());
+        if (it != inputs.end())
+          columns[index] = &it->second;
+      }
+
+      std::vector<triton::uint512> results(lanes);
+      if (lanes == 0)
+        return results;
+
+      if (this->narrow)
+        this->run<triton::uint64>(columns, results);
+      else
+        this->run<triton::uint512>(columns, results);
+
+      return results;
+    }
+
+
+    template <typename T>
+    void BatchEvaluator::run(const std::vector<const Column*>& columns, std::vector<triton::uint512>& results) const {
+      const triton::usize chunk = (sizeof(T) <= sizeof(triton::uint64) ? 512 : 64);
+      const triton::usize lanes = results.size();
+      std::vector<T> regs(this->tape.size() * chunk);
+
+      /* Constants and variables without column never change, they are broadcast once */
+      for (triton::usize index = 0; index < this->tape.size(); index++) {
+        const Instruction& inst = this->tape[index];
+        if (inst.type == triton::ast::INVALID_NODE)
+          std::fill_n(&regs[index * chunk], chunk, static_cast<T>(inst.value));
+        else if (inst.type == triton::ast::VARIABLE_NODE && columns[inst.imm] == nullptr)
+          std::fill_n(&regs[index * chunk], chunk, static_cast<T>(this->defaults[inst.imm]));
+      }
+
+      for (triton::usize base = 0; base < lanes; base += chunk) {
+        const triton::usize n = std::min(chunk, lanes - base);
+
+        for (triton::usize index = 0; index < this->tape.size(); index++) {
+          const Instruction& inst = this->tape[index];
+          const triton::uint32 size = inst.size;
+          const triton::uint32 opSize = inst.opSize;
+          const T mask = laneMask<T>(size);
+          const T opMask = laneMask<T>(opSize);
+          const T* a = (inst.operands.size() > 0 ? &regs[inst.operands[0] * chunk] : nullptr);
+          const T* b = (inst.operands.size() > 1 ? &regs[inst.operands[1] * chunk] : nullptr);
+          T* dst = &regs[index * chunk];
+
+          switch (inst.type) {
+            case triton::ast::INVALID_NODE:
+              break;
+
+            case triton::ast::VARIABLE_NODE: {
+              const Column* column = columns[inst.imm];
+              if (column != nullptr) {
+                triton::uint512 wide = laneMask<triton::uint512>(size);
+                for (triton::usize k = 0; k < n; k++)
+                  dst[k] = static_cast<T>((*column)[base + k] & wide);
+              }
+              break;
+            }
+
+            case triton::ast::ASSERT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] & mask);
+              break;
+
+            case triton::ast::LET_NODE:
+            case triton::ast::ZX_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = a[k];
+              break;
+
+            case triton::ast::SX_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (laneSign(a[k], opSize) ? ((a[k] | ~opMask) & mask) : a[k]);
+              break;
+
+            case triton::ast::EXTRACT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((a[k] >> inst.imm) & mask);
+              break;
+
+            case triton::ast::CONCAT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = a[k];
+              for (triton::usize op = 1; op < inst.operands.size(); op++) {
+                const T* c = &regs[inst.operands[op] * chunk];
+                const triton::uint32 shift = this->tape[inst.operands[op]].size;
+                for (triton::usize k = 0; k < n; k++)
+                  dst[k] = ((dst[k] << shift) | c[k]);
+              }
+              break;
+
+            case triton::ast::BSWAP_NODE:
+              for (triton::usize k = 0; k < n; k++) {
+                T value = a[k];
+                T result = (value & 0xff);
+                for (triton::uint32 bit = triton::bitsize::byte; bit != size; bit += triton::bitsize::byte) {
+                  result <<= triton::bitsize::byte;
+                  result |= ((value >> bit) & 0xff);
+                }
+                dst[k] = result;
+              }
+              break;
+
+            case triton::ast::BVADD_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((a[k] + b[k]) & mask);
+              break;
+
+            case triton::ast::BVSUB_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((a[k] - b[k]) & mask);
+              break;
+
+            case triton::ast::BVMUL_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((a[k] * b[k]) & mask);
+              break;
+
+            case triton::ast::BVNEG_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((~a[k] + 1) & mask);
+              break;
+
+            case triton::ast::BVNOT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (~a[k] & mask);
+              break;
+
+            case triton::ast::BVAND_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] & b[k]);
+              break;
+
+            case triton::ast::BVOR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] | b[k]);
+              break;
+
+            case triton::ast::BVXOR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] ^ b[k]);
+              break;
+
+            case triton::ast::BVNAND_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (~(a[k] & b[k]) & mask);
+              break;
+
+            case triton::ast::BVNOR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (~(a[k] | b[k]) & mask);
+              break;
+
+            case triton::ast::BVXNOR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (~(a[k] ^ b[k]) & mask);
+              break;
+
+            case triton::ast::BVSHL_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (b[k] >= size ? 0 : ((a[k] << static_cast<triton::uint32>(b[k])) & mask));
+              break;
+
+            case triton::ast::BVLSHR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (b[k] >= size ? 0 : (a[k] >> static_cast<triton::uint32>(b[k])));
+              break;
+
+            case triton::ast::BVASHR_NODE:
+              for (triton::usize k = 0; k < n; k++) {
+                bool sign = laneSign(a[k], size);
+                if (b[k] >= size)
+                  dst[k] = (sign ? mask : 0);
+                else if (b[k] == 0)
+                  dst[k] = a[k];
+                else {
+                  triton::uint32 shift = static_cast<triton::uint32>(b[k]);
+                  dst[k] = ((a[k] >> shift) | (sign ? ((mask << (size - shift)) & mask) : 0));
+                }
+              }
+              break;
+
+            case triton::ast::BVROL_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (inst.imm == 0 ? a[k] : (((a[k] << inst.imm) | (a[k] >> (size - inst.imm))) & mask));
+              break;
+
+            case triton::ast::BVROR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (inst.imm == 0 ? a[k] : (((a[k] >> inst.imm) | (a[k] << (size - inst.imm))) & mask));
+              break;
+
+            case triton::ast::BVUDIV_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (b[k] == 0 ? mask : (a[k] / b[k]));
+              break;
+
+            case triton::ast::BVUREM_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (b[k] == 0 ? a[k] : (a[k] % b[k]));
+              break;
+
+            case triton::ast::BVSDIV_NODE:
+              for (triton::usize k = 0; k < n; k++) {
+                bool signA = laneSign(a[k], size);
+                bool signB = laneSign(b[k], size);
+                if (b[k] == 0)
+                  dst[k] = (signA ? 1 : mask);
+                else {
+                  T quotient = (laneAbs(a[k], size, mask) / laneAbs(b[k], size, mask));
+                  dst[k] = (signA != signB ? ((~quotient + 1) & mask) : quotient);
+                }
+              }
+              break;
+
+            case triton::ast::BVSREM_NODE:
+              for (triton::usize k = 0; k < n; k++) {
+                if (b[k] == 0)
+                  dst[k] = a[k];
+                else {
+                  T remainder = (laneAbs(a[k], size, mask) % laneAbs(b[k], size, mask));
+                  dst[k] = (laneSign(a[k], size) ? ((~remainder + 1) & mask) : remainder);
+                }
+              }
+              break;
+
+            case triton::ast::BVSMOD_NODE:
+              for (triton::usize k = 0; k < n; k++) {
+                bool signA = laneSign(a[k], size);
+                bool signB = laneSign(b[k], size);
+                if (b[k] == 0)
+                  dst[k] = a[k];
+                else {
+                  /* The remainder takes the sign of the divisor */
+                  T remainder = (laneAbs(a[k], size, mask) % laneAbs(b[k], size, mask));
+                  if (remainder == 0)
+                    dst[k] = 0;
+                  else if (signA == signB)
+                    dst[k] = (signA ? ((~remainder + 1) & mask) : remainder);
+                  else
+                    dst[k] = ((signA ? (b[k] - remainder) : (remainder + b[k])) & mask);
+                }
+              }
+              break;
+
+            case triton::ast::BVUGE_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] >= b[k]);
+              break;
+
+            case triton::ast::BVUGT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] > b[k]);
+              break;
+
+            case triton::ast::BVULE_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] <= b[k]);
+              break;
+
+            case triton::ast::BVULT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] < b[k]);
+              break;
+
+            /* Signed comparisons flip the sign bits and compare unsigned */
+            case triton::ast::BVSGE_NODE:
+            case triton::ast::BVSGT_NODE:
+            case triton::ast::BVSLE_NODE:
+            case triton::ast::BVSLT_NODE: {
+              const T sign = (static_cast<T>(1) << (opSize - 1));
+              for (triton::usize k = 0; k < n; k++) {
+                T x = (a[k] ^ sign);
+                T y = (b[k] ^ sign);
+                switch (inst.type) {
+                  case triton::ast::BVSGE_NODE: dst[k] = (x >= y); break;
+                  case triton::ast::BVSGT_NODE: dst[k] = (x > y);  break;
+                  case triton::ast::BVSLE_NODE: dst[k] = (x <= y); break;
+                  default:                      dst[k] = (x < y);  break;
+                }
+              }
+              break;
+            }
+
+            case triton::ast::EQUAL_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] == b[k]);
+              break;
+
+            case triton::ast::DISTINCT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] != b[k]);
+              break;
+
+            case triton::ast::IFF_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = ((a[k] != 0) == (b[k] != 0));
+              break;
+
+            case triton::ast::LNOT_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] == 0);
+              break;
+
+            case triton::ast::LAND_NODE:
+            case triton::ast::LOR_NODE:
+            case triton::ast::LXOR_NODE:
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (inst.type == triton::ast::LAND_NODE);
+              for (triton::usize op = 0; op < inst.operands.size(); op++) {
+                const T* c = &regs[inst.operands[op] * chunk];
+                for (triton::usize k = 0; k < n; k++) {
+                  if (inst.type == triton::ast::LAND_NODE)
+                    dst[k] = (dst[k] != 0 && c[k] != 0);
+                  else if (inst.type == triton::ast::LOR_NODE)
+                    dst[k] = (dst[k] != 0 || c[k] != 0);
+                  else
+                    dst[k] = ((dst[k] != 0) != (c[k] != 0));
+                }
+              }
+              break;
+
+            case triton::ast::ITE_NODE: {
+              const T* c = &regs[inst.operands[2] * chunk];
+              for (triton::usize k = 0; k < n; k++)
+                dst[k] = (a[k] != 0 ? b[k] : c[k]);
+              break;
+            }
+
+            default:
+              throw triton::exceptions::Ast("BatchEvaluator::run(): Unsupported kind of node.");
+          }
+        }
+
+        const T* result = &regs[(this->tape.size() - 1) * chunk];
+        for (triton::usize k = 0; k < n; k++)
+          results[base + k] = static_cast<triton::uint512>(result[k]);
+      }
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
@@ -5,6 +5,9 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <stack>
+#include <tuple>
+#include <utility>
 #include <vector>
 
 #include <triton/coreUtils.hpp>
@@ -26,6 +29,7 @@ namespace triton {
 
     TritonToBitwuzla::~TritonToBitwuzla() {
       this->translatedNodes.clear();
+      this->constants.clear();
       this->variables.clear();
       this->symbols.clear();
     }
@@ -42,10 +46,41 @@ namespace triton {
 
 
     const BitwuzlaTerm* TritonToBitwuzla::convert(const SharedAbstractNode& node, Bitwuzla* bzla) {
-      auto nodes = childrenExtraction(node, true /* unroll*/, true /* revert */);
+      std::stack<std::pair<SharedAbstractNode, bool>> worklist;
 
-      for (auto&& n : nodes) {
-        this->translatedNodes[n] = translate(n, bzla);
+      if (node == nullptr)
+        throw triton::exceptions::AstLifting("TritonToBitwuzla::convert(): node cannot be null.");
+
+      /* Post-order traversal which does not go through already translated nodes */
+      worklist.push({node, false});
+      while (!worklist.empty()) {
+        SharedAbstractNode n;
+        bool postOrder;
+        std::tie(n, postOrder) = worklist.top();
+        worklist.pop();
+
+        if (this->translatedNodes.find(n) != this->translatedNodes.end())
+          continue;
+
+        if (postOrder) {
+          this->translatedNodes[n] = this->translate(n, bzla);
+          continue;
+        }
+
+        worklist.push({n, true});
+
+        /* Children are pushed in reverse order, so they are translated from left to right (e.g. let bindings before their uses) */
+        const auto& children = n->getChildren();
+        for (auto it = children.rbegin(); it != children.rend(); it++) {
+          if (this->translatedNodes.find(*it) == this->translatedNodes.end())
+            worklist.push({*it, false});
+        }
+
+        if (n->getType() == REFERENCE_NODE) {
+          const auto& ref = reinterpret_cast<ReferenceNode*>(n.get())->getSymbolicExpression()->getAst();
+          if (this->translatedNodes.find(ref) == this->translatedNodes.end())
+            worklist.push({ref, false});
+        }
       }
 
       return this->translatedNodes.at(node);
@@ -289,7 +324,14 @@ namespace triton {
             return bitwuzla_mk_bv_value(bzla, sort->second, triton::utils::toString(value).c_str(), BITWUZLA_BV_BASE_DEC);
           }
 
+          // A symbolic variable is a single constant, even if it is referenced by several nodes.
+          auto constant = this->constants.find(symVar->getId());
+          if (constant != this->constants.end()) {
+            return constant->second;
+          }
+
           auto n = bitwuzla_mk_const(bzla, sort->second, symVar->getName().c_str());
+          this->constants[symVar->getId()] = n;
           variables[n] = symVar;
           return n;
         }
@@ -5,8 +5,12 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
 #include <new>
 #include <memory>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 #include <triton/astRepresentation.hpp>
 #include <triton/exceptions.hpp>
@@ -17,6 +21,41 @@ namespace triton {
   namespace ast {
     namespace representations {
 
+      /* Returns true if both nodes have the same type, the same payload and the same canonical children */
+      static bool isStructurallyIdentical(AbstractNode* a, AbstractNode* b, const std::unordered_map<AbstractNode*, AbstractNode*>& canonical) {
+        if (a->getType() != b->getType() || a->getBitvectorSize() != b->getBitvectorSize())
+          return false;
+
+        switch (a->getType()) {
+          /* An array is bound to a memory state */
+          case ARRAY_NODE:
+            return a == b;
+          case INTEGER_NODE:
+            return reinterpret_cast<IntegerNode*>(a)->getInteger() == reinterpret_cast<IntegerNode*>(b)->getInteger();
+          case REFERENCE_NODE:
+            return reinterpret_cast<ReferenceNode*>(a)->getSymbolicExpression() == reinterpret_cast<ReferenceNode*>(b)->getSymbolicExpression();
+          case STRING_NODE:
+            return reinterpret_cast<StringNode*>(a)->getString() == reinterpret_cast<StringNode*>(b)->getString();
+          case VARIABLE_NODE:
+            return reinterpret_cast<VariableNode*>(a)->getSymbolicVariable() == reinterpret_cast<VariableNode*>(b)->getSymbolicVariable();
+          default:
+            break;
+        }
+
+        const auto& c1 = a->getChildren();
+        const auto& c2 = b->getChildren();
+        if (c1.size() != c2.size())
+          return false;
+
+        for (triton::usize index = 0; index < c1.size(); index++) {
+          if (canonical.at(c1[index].get()) != canonical.at(c2[index].get()))
+            return false;
+        }
+
+        return true;
+      }
+
+
       AstRepresentation::AstRepresentation() {
         /* Set the default representation */
         this->mode = triton::ast::representations::SMT_REPRESENTATION;
@@ -58,9 +97,120 @@ namespace triton {
 
 
       std::ostream& AstRepresentation::print(std::ostream& stream, AbstractNode* node) {
+        if (!this->names.empty()) {
+          auto it = this->names.find(node);
+          if (it != this->names.end())
+            return stream << it->second;
+        }
         return this->representations[this->mode]->print(stream, node);
       }
 
+
+      std::ostream& AstRepresentation::printShared(std::ostream& stream, AbstractNode* node) {
+        std::unordered_map<AbstractNode*, AbstractNode*> canonical;     /* node -> first structurally identical node */
+        std::unordered_multimap<triton::usize, AbstractNode*> unique;   /* hash -> canonical nodes */
+        std::unordered_map<AbstractNode*, triton::usize> uses;          /* canonical node -> number of canonical parents */
+        std::vector<AbstractNode*> order;                               /* canonical nodes in post-order */
+
+        if (node == nullptr)
+          throw triton::exceptions::AstRepresentation("AstRepresentation::printShared(): node cannot be null.");
+
+        /* Walk the DAG in post-order and merge the structurally identical nodes */
+        std::vector<std::pair<AbstractNode*, bool>> worklist = {{node, false}};
+        while (!worklist.empty()) {
+          AbstractNode* n = worklist.back().first;
+          bool expanded   = worklist.back().second;
+          worklist.pop_back();
+
+          if (canonical.find(n) != canonical.end())
+            continue;
+
+          if (!expanded) {
+            worklist.push_back({n, true});
+            for (auto it = n->getChildren().rbegin(); it != n->getChildren().rend(); it++) {
+              if (canonical.find(it->get()) == canonical.end())
+                worklist.push_back({it->get(), false});
+            }
+            continue;
+          }
+
+          triton::usize key = static_cast<triton::usize>(n->getHash());
+          AbstractNode* canon = n;
+          auto range = unique.equal_range(key);
+          for (auto it = range.first; it != range.second; it++) {
+            if (isStructurallyIdentical(n, it->second, canonical)) {
+              canon = it->second;
+              break;
+            }
+          }
+
+          canonical[n] = canon;
+          if (canon == n) {
+            unique.emplace(key, n);
+            order.push_back(n);
+            for (const auto& child : n->getChildren())
+              uses[canonical.at(child.get())]++;
+          }
+        }
+
+        /*
+         * Bind the nodes used several times, and the nodes too high to be printed inline
+         * so that the recursion of the printers is bounded. Literals are never bound.
+         */
+        std::unordered_map<AbstractNode*, triton::uint32> heights;
+        std::vector<AbstractNode*> bound;
+        for (AbstractNode* n : order) {
+          triton::uint32 height = 1;
+          for (const auto& child : n->getChildren())
+            height = std::max(height, heights.at(canonical.at(child.get())) + 1);
+
+          bool atomic = n->getChildren().empty() || n->getType() == BV_NODE || n->getType() == ARRAY_NODE;
+          if (!atomic && n != node && (uses[n] > 1 || height >= MAX_INLINE_HEIGHT)) {
+            bound.push_back(n);
+            height = 0;
+          }
+          heights[n] = height;
+        }
+
+        std::unordered_map<AbstractNode*, std::string> bindings;
+        for (triton::usize index = 0; index < bound.size(); index++)
+          bindings[bound[index]] = (this->mode == PYTHON_REPRESENTATION ? "tmp_" : "tmp!") + std::to_string(index);
+
+        for (const auto& item : canonical) {
+          auto it = bindings.find(item.second);
+          if (it != bindings.end())
+            this->names[item.first] = it->second;
+        }
+
+        /* The bound nodes are printed by their own printer, the others print their names */
+        auto& printer = this->representations[this->mode];
+        try {
+          for (AbstractNode* n : bound) {
+            if (this->mode == PYTHON_REPRESENTATION) {
+              stream << bindings[n] << " = ";
+              printer->print(stream, n);
+              stream << "\n";
+            }
+            else {
+              stream << "(let ((" << bindings[n] << " ";
+              printer->print(stream, n);
+              stream << ")) ";
+            }
+          }
+
+          printer->print(stream, node);
+          if (this->mode != PYTHON_REPRESENTATION)
+            stream << std::string(bound.size(), ')');
+        }
+        catch (...) {
+          this->names.clear();
+          throw;
+        }
+
+        this->names.clear();
+        return stream;
+      }
+
     };
   };
 };
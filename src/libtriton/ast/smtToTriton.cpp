@@ -0,0 +1,762 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <cctype>
+#include <limits>
+
+#include <triton/astContext.hpp>
+#include <triton/cpuSize.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/smtToTriton.hpp>
+
+
+
+namespace triton {
+  namespace ast {
+
+    SmtToTriton::SmtToTriton(const triton::ast::SharedAstContext& ctxt, const SmtResolver& resolver)
+      : astCtxt(ctxt),
+        resolver(resolver) {
+    }
+
+
+    void SmtToTriton::declare(const std::string& name, const SharedAbstractNode& node) {
+      if (node == nullptr)
+        throw triton::exceptions::AstLifting("SmtToTriton::declare(): node cannot be null.");
+
+      this->symbols[name] = node;
+    }
+
+
+    std::vector<SharedAbstractNode> SmtToTriton::convert(std::istream& stream) {
+      std::vector<SharedAbstractNode> ret;
+      std::vector<Frame> stack;
+      std::string atom;
+      char token;
+
+      /* Lists are parsed with an explicit stack, so deep terms do not overflow the native one */
+      while ((token = this->nextToken(stream, atom)) != 0) {
+        Item item;
+        if (!this->step(stack, COMMAND_FRAME, token, atom, item))
+          continue;
+
+        /* Asserted nodes and top-level terms are returned */
+        if (item.node)
+          ret.push_back(item.node);
+        else if (token == 'a')
+          ret.push_back(this->resolve(item.atom));
+      }
+
+      if (!stack.empty())
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unexpected end of stream.");
+
+      return ret;
+    }
+
+
+    bool SmtToTriton::step(std::vector<Frame>& stack, frame_e top, char token, const std::string& atom, Item& item) {
+      if (token == '(') {
+        frame_e kind = stack.empty() ? top : this->childKind(stack.back());
+        stack.push_back({kind, {}, {}});
+        return false;
+      }
+
+      item = Item();
+      if (token == ')') {
+        if (stack.empty())
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unexpected ')'.");
+        Frame frame = std::move(stack.back());
+        stack.pop_back();
+        item = this->reduce(frame);
+      }
+      else {
+        item.atom = atom;
+      }
+
+      if (stack.empty())
+        return true;
+
+      this->append(stack.back(), std::move(item));
+      return false;
+    }
+
+
+    char SmtToTriton::nextToken(std::istream& stream, std::string& atom) {
+      int c;
+
+      /* Skip blanks and comments */
+      while ((c = stream.get()) != EOF) {
+        if (c == ';') {
+          while ((c = stream.get()) != EOF && c != '\n');
+          continue;
+        }
+        if (!std::isspace(c))
+          break;
+      }
+
+      if (c == EOF)
+        return 0;
+
+      if (c == '(' || c == ')')
+        return static_cast<char>(c);
+
+      atom.clear();
+
+      /* Quoted symbol, e.g. |x y| */
+      if (c == '|') {
+        while ((c = stream.get()) != EOF && c != '|')
+          atom += static_cast<char>(c);
+        if (c == EOF)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unterminated quoted symbol.");
+        return 'a';
+      }
+
+      /* String literal, "" stands for a quote */
+      if (c == '"') {
+        atom += '"';
+        while (true) {
+          if ((c = stream.get()) == EOF)
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unterminated string literal.");
+          atom += static_cast<char>(c);
+          if (c == '"') {
+            if (stream.peek() != '"')
+              break;
+            stream.get();
+          }
+        }
+        return 'a';
+      }
+
+      /* Simple symbol, numeral or keyword */
+      atom += static_cast<char>(c);
+      while ((c = stream.peek()) != EOF && !std::isspace(c) && c != '(' && c != ')' && c != ';' && c != '"' && c != '|')
+        atom += static_cast<char>(stream.get());
+
+      return 'a';
+    }
+
+
+    SmtToTriton::frame_e SmtToTriton::childKind(Frame& frame) {
+      triton::usize pos = frame.items.size();
+
+      switch (frame.kind) {
+        case COMMAND_FRAME:
+          /* A top-level term applying an indexed operator, e.g. ((_ extract 7 0) x) */
+          if (pos == 0) {
+            frame.kind = TERM_FRAME;
+            return RAW_FRAME;
+          }
+          if (frame.items[0].atom == "assert" && pos == 1)
+            return TERM_FRAME;
+          /* The body of a function with parameters is built at each application (see expand()) */
+          if (frame.items[0].atom == "define-fun" && pos == 4)
+            return (frame.items[2].isList && frame.items[2].list.empty()) ? TERM_FRAME : RAW_FRAME;
+          return RAW_FRAME;
+
+        case TERM_FRAME:
+          return (pos == 0) ? RAW_FRAME : TERM_FRAME;
+
+        case LET_FRAME:
+          if (pos == 1)
+            return BINDINGS_FRAME;
+          if (pos == 2)
+            return TERM_FRAME;
+          break;
+
+        case BINDINGS_FRAME:
+          return BINDING_FRAME;
+
+        case BINDING_FRAME:
+          if (pos == 1)
+            return TERM_FRAME;
+          break;
+
+        case RAW_FRAME:
+          return RAW_FRAME;
+      }
+
+      throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid let term.");
+    }
+
+
+    void SmtToTriton::append(Frame& frame, Item&& item) {
+      static const std::unordered_set<std::string> commands = {
+        "assert", "check-sat", "check-sat-assuming", "declare-const", "declare-fun", "define-fun", "echo", "exit",
+        "get-assertions", "get-info", "get-model", "get-option", "get-value", "pop", "push", "reset", "set-info",
+        "set-logic", "set-option",
+      };
+
+      /* The kind of a list may depend on its first atom */
+      if (frame.items.empty() && !item.isList && item.node == nullptr) {
+        if (frame.kind == COMMAND_FRAME && commands.find(item.atom) == commands.end())
+          frame.kind = TERM_FRAME;
+        if (frame.kind == TERM_FRAME && item.atom == "let")
+          frame.kind = LET_FRAME;
+      }
+
+      /* The bindings of a let are parallel, they are visible in its body only */
+      if (frame.kind == LET_FRAME && frame.items.size() == 1) {
+        if (!item.isList)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid let term.");
+        for (const auto& binding : item.list) {
+          this->scopes[binding.list[0].atom].push_back(binding.list[1].node);
+          frame.bound.push_back(binding.list[0].atom);
+        }
+        item.list.clear();
+      }
+
+      frame.items.push_back(std::move(item));
+    }
+
+
+    SmtToTriton::Item SmtToTriton::reduce(Frame& frame) {
+      Item ret;
+
+      switch (frame.kind) {
+        case COMMAND_FRAME:
+          return this->command(frame.items);
+
+        case TERM_FRAME:
+          ret.node = this->application(frame.items);
+          return ret;
+
+        case LET_FRAME:
+          if (frame.items.size() != 3)
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid let term.");
+          ret.node = this->term(frame.items[2]);
+          for (const auto& name : frame.bound) {
+            auto scope = this->scopes.find(name);
+            scope->second.pop_back();
+            if (scope->second.empty())
+              this->scopes.erase(scope);
+          }
+          return ret;
+
+        case BINDING_FRAME:
+          if (frame.items.size() != 2 || frame.items[0].isList || frame.items[0].node)
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid let binding.");
+          frame.items[1].node = this->term(frame.items[1]);
+          break;
+
+        case BINDINGS_FRAME:
+          for (const auto& item : frame.items) {
+            if (!item.isList)
+              throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid let binding.");
+          }
+          break;
+
+        case RAW_FRAME:
+          break;
+      }
+
+      ret.isList = true;
+      ret.list = std::move(frame.items);
+      return ret;
+    }
+
+
+    SmtToTriton::Item SmtToTriton::command(const std::vector<Item>& items) {
+      static const std::unordered_set<std::string> bswaps = {"bswap8", "bswap16", "bswap32", "bswap64"};
+      Item ret;
+
+      if (items.empty())
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Empty command.");
+
+      const std::string& name = items[0].atom;
+
+      if (name == "assert") {
+        if (items.size() != 2)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): assert expects one term.");
+        ret.node = this->term(items[1]);
+        if (ret.node->isLogical() == false)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): assert expects a logical term.");
+      }
+
+      else if (name == "declare-fun") {
+        if (items.size() != 4 || items[1].isList || !items[2].isList)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid declare-fun.");
+        if (!items[2].list.empty())
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Functions with parameters are not supported (" + items[1].atom + ").");
+        this->declareSymbol(items[1].atom, items[3]);
+      }
+
+      else if (name == "declare-const") {
+        if (items.size() != 3 || items[1].isList)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid declare-const.");
+        this->declareSymbol(items[1].atom, items[2]);
+      }
+
+      else if (name == "define-fun") {
+        if (items.size() != 5 || items[1].isList || !items[2].isList)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid define-fun.");
+        if (!items[2].list.empty()) {
+          /* The bswap functions of LiftingToSMT are parsed as bswap nodes */
+          if (bswaps.find(items[1].atom) != bswaps.end())
+            return ret;
+          for (const auto& param : items[2].list) {
+            if (!param.isList || param.list.size() != 2 || param.list[0].isList)
+              throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid parameter of '" + items[1].atom + "'.");
+          }
+          this->functions[items[1].atom] = {items[2].list, items[3], items[4]};
+          return ret;
+        }
+        auto node = this->term(items[4]);
+        this->checkSort(items[1].atom, node, items[3]);
+        this->symbols[items[1].atom] = node;
+      }
+
+      /* Other commands do not change the ASTs */
+      return ret;
+    }
+
+
+    SharedAbstractNode SmtToTriton::application(const std::vector<Item>& items) {
+      static const std::unordered_map<std::string, triton::ast::ast_e> operators = {
+        {"=",         EQUAL_NODE},
+        {"and",       LAND_NODE},
+        {"bswap16",   BSWAP_NODE},
+        {"bswap32",   BSWAP_NODE},
+        {"bswap64",   BSWAP_NODE},
+        {"bswap8",    BSWAP_NODE},
+        {"bvadd",     BVADD_NODE},
+        {"bvand",     BVAND_NODE},
+        {"bvashr",    BVASHR_NODE},
+        {"bvlshr",    BVLSHR_NODE},
+        {"bvmul",     BVMUL_NODE},
+        {"bvnand",    BVNAND_NODE},
+        {"bvneg",     BVNEG_NODE},
+        {"bvnor",     BVNOR_NODE},
+        {"bvnot",     BVNOT_NODE},
+        {"bvor",      BVOR_NODE},
+        {"bvsdiv",    BVSDIV_NODE},
+        {"bvsge",     BVSGE_NODE},
+        {"bvsgt",     BVSGT_NODE},
+        {"bvshl",     BVSHL_NODE},
+        {"bvsle",     BVSLE_NODE},
+        {"bvslt",     BVSLT_NODE},
+        {"bvsmod",    BVSMOD_NODE},
+        {"bvsrem",    BVSREM_NODE},
+        {"bvsub",     BVSUB_NODE},
+        {"bvudiv",    BVUDIV_NODE},
+        {"bvuge",     BVUGE_NODE},
+        {"bvugt",     BVUGT_NODE},
+        {"bvule",     BVULE_NODE},
+        {"bvult",     BVULT_NODE},
+        {"bvurem",    BVUREM_NODE},
+        {"bvxnor",    BVXNOR_NODE},
+        {"bvxor",     BVXOR_NODE},
+        {"concat",    CONCAT_NODE},
+        {"distinct",  DISTINCT_NODE},
+        {"iff",       IFF_NODE},
+        {"ite",       ITE_NODE},
+        {"not",       LNOT_NODE},
+        {"or",        LOR_NODE},
+        {"select",    SELECT_NODE},
+        {"store",     STORE_NODE},
+        {"xor",       LXOR_NODE},
+      };
+
+      if (items.empty() || items[0].node)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid term.");
+
+      const Item& head = items[0];
+
+      /* Bit-vector literal, e.g. (_ bv10 32) */
+      if (head.atom == "_") {
+        if (items.size() != 3 || items[1].isList || items[1].atom.size() < 3 || items[1].atom.compare(0, 2, "bv") != 0)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid indexed identifier.");
+        std::string digits = items[1].atom.substr(2);
+        for (char c : digits) {
+          if (!std::isdigit(static_cast<unsigned char>(c)))
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid bit-vector literal (" + items[1].atom + ").");
+        }
+        return this->astCtxt->bv(triton::uint512(digits.c_str()), this->numeral(items[2]));
+      }
+
+      std::vector<SharedAbstractNode> args;
+      args.reserve(items.size() - 1);
+      for (triton::usize i = 1; i < items.size(); i++)
+        args.push_back(this->term(items[i]));
+
+      if (head.isList)
+        return this->indexed(head.list, args);
+
+      const std::string& name = head.atom;
+
+      auto arity = [&](triton::usize min, triton::usize max) {
+        if (args.size() < min || args.size() > max)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid number of arguments for '" + name + "'.");
+      };
+
+      /* Left associative operators */
+      auto fold = [&](SharedAbstractNode (AstContext::*builder)(const SharedAbstractNode&, const SharedAbstractNode&)) {
+        arity(2, args.size());
+        SharedAbstractNode node = args[0];
+        for (triton::usize i = 1; i < args.size(); i++)
+          node = ((*this->astCtxt).*builder)(node, args[i]);
+        return node;
+      };
+
+      if (name == "=>") {
+        arity(2, 2);
+        return this->astCtxt->lor(this->astCtxt->lnot(args[0]), args[1]);
+      }
+
+      if (this->functions.find(name) != this->functions.end())
+        return this->expand(name, args);
+
+      auto op = operators.find(name);
+      if (op == operators.end())
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): '" + name + "' is not supported.");
+
+      switch (op->second) {
+        case BVADD_NODE:    return fold(&AstContext::bvadd);
+        case BVAND_NODE:    return fold(&AstContext::bvand);
+        case BVMUL_NODE:    return fold(&AstContext::bvmul);
+        case BVOR_NODE:     return fold(&AstContext::bvor);
+        case BVXOR_NODE:    return fold(&AstContext::bvxor);
+
+        case LAND_NODE:
+        case LOR_NODE:
+        case LXOR_NODE:
+          arity(1, args.size());
+          if (args.size() == 1)
+            return args[0];
+          if (op->second == LAND_NODE)
+            return this->astCtxt->land(args);
+          if (op->second == LOR_NODE)
+            return this->astCtxt->lor(args);
+          return this->astCtxt->lxor(args);
+
+        case CONCAT_NODE:
+          arity(2, args.size());
+          return this->astCtxt->concat(args);
+
+        case EQUAL_NODE: {
+          arity(2, args.size());
+          /* Equality of booleans is an equivalence */
+          auto equal = [&](const SharedAbstractNode& a, const SharedAbstractNode& b) {
+            return a->isLogical() ? this->astCtxt->iff(a, b) : this->astCtxt->equal(a, b);
+          };
+          if (args.size() == 2)
+            return equal(args[0], args[1]);
+          /* Chainable, (= a b c) is (and (= a b) (= b c)) */
+          std::vector<SharedAbstractNode> equalities;
+          for (triton::usize i = 1; i < args.size(); i++)
+            equalities.push_back(equal(args[i - 1], args[i]));
+          return this->astCtxt->land(equalities);
+        }
+
+        case BSWAP_NODE:
+          arity(1, 1);
+          if (std::to_string(args[0]->getBitvectorSize()) != name.substr(5))
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid size for '" + name + "'.");
+          return this->astCtxt->bswap(args[0]);
+
+        case BVNEG_NODE:    arity(1, 1); return this->astCtxt->bvneg(args[0]);
+        case BVNOT_NODE:    arity(1, 1); return this->astCtxt->bvnot(args[0]);
+        case LNOT_NODE:     arity(1, 1); return this->astCtxt->lnot(args[0]);
+
+        case ITE_NODE:      arity(3, 3); return this->astCtxt->ite(args[0], args[1], args[2]);
+        case STORE_NODE:    arity(3, 3); return this->astCtxt->store(args[0], args[1], args[2]);
+
+        default:
+          break;
+      }
+
+      arity(2, 2);
+      switch (op->second) {
+        case BVASHR_NODE:   return this->astCtxt->bvashr(args[0], args[1]);
+        case BVLSHR_NODE:   return this->astCtxt->bvlshr(args[0], args[1]);
+        case BVNAND_NODE:   return this->astCtxt->bvnand(args[0], args[1]);
+        case BVNOR_NODE:    return this->astCtxt->bvnor(args[0], args[1]);
+        case BVSDIV_NODE:   return this->astCtxt->bvsdiv(args[0], args[1]);
+        case BVSGE_NODE:    return this->astCtxt->bvsge(args[0], args[1]);
+        case BVSGT_NODE:    return this->astCtxt->bvsgt(args[0], args[1]);
+        case BVSHL_NODE:    return this->astCtxt->bvshl(args[0], args[1]);
+        case BVSLE_NODE:    return this->astCtxt->bvsle(args[0], args[1]);
+        case BVSLT_NODE:    return this->astCtxt->bvslt(args[0], args[1]);
+        case BVSMOD_NODE:   return this->astCtxt->bvsmod(args[0], args[1]);
+        case BVSREM_NODE:   return this->astCtxt->bvsrem(args[0], args[1]);
+        case BVSUB_NODE:    return this->astCtxt->bvsub(args[0], args[1]);
+        case BVUDIV_NODE:   return this->astCtxt->bvudiv(args[0], args[1]);
+        case BVUGE_NODE:    return this->astCtxt->bvuge(args[0], args[1]);
+        case BVUGT_NODE:    return this->astCtxt->bvugt(args[0], args[1]);
+        case BVULE_NODE:    return this->astCtxt->bvule(args[0], args[1]);
+        case BVULT_NODE:    return this->astCtxt->bvult(args[0], args[1]);
+        case BVUREM_NODE:   return this->astCtxt->bvurem(args[0], args[1]);
+        case BVXNOR_NODE:   return this->astCtxt->bvxnor(args[0], args[1]);
+        case DISTINCT_NODE: return args[0]->isLogical() ? this->astCtxt->lnot(this->astCtxt->iff(args[0], args[1])) : this->astCtxt->distinct(args[0], args[1]);
+        case IFF_NODE:      return this->astCtxt->iff(args[0], args[1]);
+        case SELECT_NODE:   return this->astCtxt->select(args[0], args[1]);
+        default:
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): '" + name + "' is not supported.");
+      }
+    }
+
+
+    SharedAbstractNode SmtToTriton::expand(const std::string& name, const std::vector<SharedAbstractNode>& args) {
+      const Function& function = this->functions.at(name);
+
+      if (args.size() != function.params.size())
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid number of arguments for '" + name + "'.");
+
+      if (!this->expanding.insert(name).second)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Recursive function '" + name + "'.");
+
+      /* The body only sees the parameters and the global symbols */
+      auto scopes = std::move(this->scopes);
+      this->scopes.clear();
+
+      SharedAbstractNode node;
+      try {
+        for (triton::usize i = 0; i < args.size(); i++) {
+          const std::string& param = function.params[i].list[0].atom;
+          this->checkSort(param, args[i], function.params[i].list[1]);
+          this->scopes[param].push_back(args[i]);
+        }
+
+        if (!function.body.isList) {
+          node = this->term(function.body);
+        }
+        else {
+          /* The body is replayed as tokens, walking its lists with an explicit stack too */
+          std::vector<Frame> stack;
+          std::vector<std::pair<const Item*, triton::usize>> lists = {{&function.body, 0}};
+          Item item;
+
+          this->step(stack, TERM_FRAME, '(', "", item);
+          while (!lists.empty()) {
+            const Item* list = lists.back().first;
+            triton::usize pos = lists.back().second++;
+
+            if (pos == list->list.size()) {
+              lists.pop_back();
+              this->step(stack, TERM_FRAME, ')', "", item);
+            }
+            else if (list->list[pos].isList) {
+              lists.push_back({&list->list[pos], 0});
+              this->step(stack, TERM_FRAME, '(', "", item);
+            }
+            else {
+              this->step(stack, TERM_FRAME, 'a', list->list[pos].atom, item);
+            }
+          }
+          node = this->term(item);
+        }
+
+        this->checkSort(name, node, function.sort);
+      }
+      catch (...) {
+        this->scopes = std::move(scopes);
+        this->expanding.erase(name);
+        throw;
+      }
+
+      this->scopes = std::move(scopes);
+      this->expanding.erase(name);
+
+      return node;
+    }
+
+
+    SharedAbstractNode SmtToTriton::indexed(const std::vector<Item>& head, const std::vector<SharedAbstractNode>& args) {
+      /* Indexed operators, e.g. ((_ extract 7 0) x) */
+      if (head.size() >= 3 && head[0].atom == "_" && !head[1].isList && args.size() == 1) {
+        const std::string& name = head[1].atom;
+
+        if (name == "extract" && head.size() == 4)
+          return this->astCtxt->extract(this->numeral(head[2]), this->numeral(head[3]), args[0]);
+
+        if (head.size() == 3) {
+          triton::uint32 index = this->numeral(head[2]);
+
+          if (name == "zero_extend")
+            return this->astCtxt->zx(index, args[0]);
+
+          if (name == "sign_extend")
+            return this->astCtxt->sx(index, args[0]);
+
+          if (name == "rotate_left")
+            return this->astCtxt->bvrol(args[0], index);
+
+          if (name == "rotate_right")
+            return this->astCtxt->bvror(args[0], index);
+
+          if (name == "repeat" && index != 0)
+            return (index == 1) ? args[0] : this->astCtxt->concat(std::vector<SharedAbstractNode>(index, args[0]));
+        }
+      }
+
+      /* Constant arrays, e.g. ((as const (Array (_ BitVec 64) (_ BitVec 8))) (_ bv0 8)) */
+      if (head.size() == 3 && head[0].atom == "as" && head[1].atom == "const" && args.size() == 1) {
+        triton::uint32 size = this->arraySort(head[2]);
+        /* Triton's arrays are initialized to zero */
+        if (args[0]->getType() != BV_NODE || args[0]->evaluate() != 0)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Only arrays initialized to zero are supported.");
+        return this->astCtxt->array(size);
+      }
+
+      throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid indexed operator.");
+    }
+
+
+    SharedAbstractNode SmtToTriton::term(const Item& item) {
+      if (item.node)
+        return item.node;
+
+      if (item.isList)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid term.");
+
+      return this->resolve(item.atom);
+    }
+
+
+    SharedAbstractNode SmtToTriton::resolve(const std::string& name) {
+      auto scope = this->scopes.find(name);
+      if (scope != this->scopes.end())
+        return scope->second.back();
+
+      auto symbol = this->symbols.find(name);
+      if (symbol != this->symbols.end())
+        return symbol->second;
+
+      /* Binary and hexadecimal literals, e.g. #b0101 or #x0f */
+      if (name.size() > 2 && name[0] == '#' && (name[1] == 'b' || name[1] == 'x')) {
+        triton::uint32 width = (name[1] == 'b') ? 1 : 4;
+        triton::uint32 size  = (name.size() - 2) * width;
+        triton::uint512 value = 0;
+
+        if (size > triton::bitsize::max_supported)
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Bit-vector literal too large (" + name + ").");
+
+        for (triton::usize i = 2; i < name.size(); i++) {
+          char c = static_cast<char>(std::tolower(static_cast<unsigned char>(name[i])));
+          triton::uint32 digit;
+          if (c >= '0' && c <= '9')
+            digit = c - '0';
+          else if (c >= 'a' && c <= 'f')
+            digit = c - 'a' + 10;
+          else
+            digit = 16;
+          if (digit >= (1u << width))
+            throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid bit-vector literal (" + name + ").");
+          value = (value << width) | digit;
+        }
+
+        return this->astCtxt->bv(value, size);
+      }
+
+      if (name == "true")
+        return this->astCtxt->equal(this->astCtxt->bvtrue(), this->astCtxt->bvtrue());
+
+      if (name == "false")
+        return this->astCtxt->equal(this->astCtxt->bvtrue(), this->astCtxt->bvfalse());
+
+      /* Symbolic variables can be used without being declared */
+      auto node = this->resolveVariable(name, 0);
+      if (node == nullptr)
+        node = this->astCtxt->getVariableNode(name);
+      if (node != nullptr)
+        return node;
+
+      throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unknown symbol '" + name + "'.");
+    }
+
+
+    triton::uint32 SmtToTriton::numeral(const Item& item) {
+      if (item.isList || item.node || item.atom.empty() || item.atom.size() > 10)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid numeral.");
+
+      triton::uint64 value = 0;
+      for (char c : item.atom) {
+        if (!std::isdigit(static_cast<unsigned char>(c)))
+          throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid numeral (" + item.atom + ").");
+        value = value * 10 + (c - '0');
+      }
+
+      if (value > std::numeric_limits<triton::uint32>::max())
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Numeral too large (" + item.atom + ").");
+
+      return static_cast<triton::uint32>(value);
+    }
+
+
+    void SmtToTriton::declareSymbol(const std::string& name, const Item& sort) {
+      SharedAbstractNode node;
+
+      auto symbol = this->symbols.find(name);
+      if (symbol != this->symbols.end())
+        node = symbol->second;
+      else if (sort.isList && !sort.list.empty() && sort.list[0].atom == "Array")
+        node = this->astCtxt->array(this->arraySort(sort));
+      /* The resolver may create the bit-vectors which do not exist yet */
+      else if (sort.isList && sort.list.size() == 3 && sort.list[0].atom == "_" && sort.list[1].atom == "BitVec")
+        node = this->resolveVariable(name, this->numeral(sort.list[2]));
+
+      if (node == nullptr)
+        node = this->astCtxt->getVariableNode(name);
+
+      if (node == nullptr)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Unknown symbolic variable '" + name + "', it must be created before being parsed.");
+
+      this->checkSort(name, node, sort);
+      this->symbols[name] = node;
+    }
+
+
+    SharedAbstractNode SmtToTriton::resolveVariable(const std::string& name, triton::uint32 size) {
+      if (this->resolver == nullptr)
+        return nullptr;
+
+      auto symVar = this->resolver(name, size);
+      if (symVar == nullptr)
+        return nullptr;
+
+      /* Later uses of the symbol do not call the resolver again */
+      auto node = this->astCtxt->variable(symVar);
+      this->symbols[name] = node;
+
+      return node;
+    }
+
+
+    void SmtToTriton::checkSort(const std::string& name, const SharedAbstractNode& node, const Item& sort) {
+      bool valid = false;
+
+      if (!sort.isList) {
+        valid = (sort.atom == "Bool" && node->isLogical());
+      }
+      else if (sort.list.size() == 3 && sort.list[0].atom == "_" && sort.list[1].atom == "BitVec") {
+        valid = (!node->isLogical() && !node->isArray() && node->getBitvectorSize() == this->numeral(sort.list[2]));
+      }
+      else {
+        triton::uint32 size = this->arraySort(sort);
+        valid = node->isArray() && (node->getType() != ARRAY_NODE || triton::ast::getInteger<triton::uint32>(node->getChildren()[0]) == size);
+      }
+
+      if (!valid)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): '" + name + "' does not have the declared sort.");
+    }
+
+
+    triton::uint32 SmtToTriton::arraySort(const Item& sort) {
+      auto isBitvector = [](const Item& item) {
+        return item.isList && item.list.size() == 3 && item.list[0].atom == "_" && item.list[1].atom == "BitVec";
+      };
+
+      if (!sort.isList || sort.list.size() != 3 || sort.list[0].atom != "Array" || !isBitvector(sort.list[1]) || !isBitvector(sort.list[2]))
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Invalid sort.");
+
+      if (this->numeral(sort.list[2].list[2]) != 8)
+        throw triton::exceptions::AstLifting("SmtToTriton::convert(): Only arrays of bytes are supported.");
+
+      return this->numeral(sort.list[1].list[2]);
+    }
+
+  }; /* ast namespace */
+}; /* triton namespace */
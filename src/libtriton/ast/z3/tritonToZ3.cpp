@@ -5,6 +5,8 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <stack>
+#include <tuple>
 #include <vector>
 
 #include <triton/coreUtils.hpp>
@@ -50,6 +52,51 @@ namespace triton {
     }
 
 
+    z3::expr TritonToZ3::convert(const triton::ast::SharedAbstractNode& node, std::unordered_map<triton::ast::SharedAbstractNode, z3::expr>& cache) {
+      std::stack<std::pair<triton::ast::SharedAbstractNode, bool>> worklist;
+
+      if (node == nullptr)
+        throw triton::exceptions::AstLifting("TritonToZ3::convert(): node cannot be null.");
+
+      /* Post-order traversal which does not go through already converted nodes */
+      worklist.push({node, false});
+      while (!worklist.empty()) {
+        triton::ast::SharedAbstractNode n;
+        bool postOrder;
+        std::tie(n, postOrder) = worklist.top();
+        worklist.pop();
+
+        if (cache.find(n) != cache.end())
+          continue;
+
+        if (postOrder) {
+          cache.insert(std::make_pair(n, this->do_convert(n, &cache)));
+          continue;
+        }
+
+        worklist.push({n, true});
+
+        for (auto&& child : n->getChildren()) {
+          if (cache.find(child) == cache.end())
+            worklist.push({child, false});
+        }
+
+        if (n->getType() == REFERENCE_NODE) {
+          const auto& ref = reinterpret_cast<triton::ast::ReferenceNode*>(n.get())->getSymbolicExpression()->getAst();
+          if (cache.find(ref) == cache.end())
+            worklist.push({ref, false});
+        }
+      }
+
+      return cache.at(node);
+    }
+
+
+    z3::context& TritonToZ3::getContext(void) {
+      return this->context;
+    }
+
+
     z3::expr TritonToZ3::do_convert(const triton::ast::SharedAbstractNode& node, std::unordered_map<triton::ast::SharedAbstractNode, z3::expr>* results) {
       if (node == nullptr)
         throw triton::exceptions::AstLifting("TritonToZ3::do_convert(): node cannot be null.");
@@ -47,6 +47,11 @@ namespace triton {
         /* Init python */
         Py_Initialize();
 
+        /* Some bindings release the GIL (only needed before Python 3.7) */
+        #if PY_VERSION_HEX < 0x03070000
+        PyEval_InitThreads();
+        #endif
+
         /* Create the triton module ================================================================== */
 
         triton::bindings::python::tritonModule = PyModule_Create(&tritonModuleDef);
@@ -104,6 +109,12 @@ namespace triton {
         initExtendNamespace(extendDict);
         PyObject* idExtendClass = xPyClass_New(nullptr, extendDict, xPyString_FromString("EXTEND"));
 
+        /* Create the MEMORY_BACKEND namespace ======================================================= */
+
+        PyObject* memoryBackendDict = xPyDict_New();
+        initMemoryBackendNamespace(memoryBackendDict);
+        PyObject* idMemoryBackendClass = xPyClass_New(nullptr, memoryBackendDict, xPyString_FromString("MEMORY_BACKEND"));
+
         /* Create the OPCODE namespace =============================================================== */
 
         PyObject* opcodesDict = xPyDict_New();
@@ -152,6 +163,18 @@ namespace triton {
         initSolverStateNamespace(solverStateDict);
         PyObject* idSolverStateClass = xPyClass_New(nullptr, solverStateDict, xPyString_FromString("SOLVER_STATE"));
 
+        /* Create the STOP namespace ================================================================= */
+
+        PyObject* stopDict = xPyDict_New();
+        initStopNamespace(stopDict);
+        PyObject* idStopClass = xPyClass_New(nullptr, stopDict, xPyString_FromString("STOP"));
+
+        /* Create the SUMMARY namespace ============================================================== */
+
+        PyObject* summaryDict = xPyDict_New();
+        initSummaryNamespace(summaryDict);
+        PyObject* idSummaryClass = xPyClass_New(nullptr, summaryDict, xPyString_FromString("SUMMARY"));
+
         /* Create the SYMBOLIC namespace ============================================================= */
 
         PyObject* symbolicDict = xPyDict_New();
@@ -176,6 +199,7 @@ namespace triton {
         PyModule_AddObject(triton::bindings::python::tritonModule, "CPUSIZE",             idCpuSizeClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "EXCEPTION",           idExceptionClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "EXTEND",              idExtendClass);
+        PyModule_AddObject(triton::bindings::python::tritonModule, "MEMORY_BACKEND",      idMemoryBackendClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "MODE",                idModeClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "OPCODE",              idOpcodesClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "OPERAND",             idOperandClass);
@@ -184,6 +208,8 @@ namespace triton {
         PyModule_AddObject(triton::bindings::python::tritonModule, "SHIFT",               idShiftsClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "SOLVER",              idSolverClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "SOLVER_STATE",        idSolverStateClass);
+        PyModule_AddObject(triton::bindings::python::tritonModule, "STOP",                idStopClass);
+        PyModule_AddObject(triton::bindings::python::tritonModule, "SUMMARY",             idSummaryClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "SYMBOLIC",            idSymbolicClass);
         PyModule_AddObject(triton::bindings::python::tritonModule, "VERSION",             idVersionClass);
 
@@ -40,6 +40,8 @@ to wrap more generic concepts.
 - \ref py_MemoryAccess_page
 - \ref py_PathConstraint_page
 - \ref py_Register_page
+- \ref py_RegisterState_page
+- \ref py_Snapshot_page
 - \ref py_SolverModel_page
 - \ref py_SymbolicExpression_page
 - \ref py_SymbolicVariable_page
@@ -56,6 +58,7 @@ to wrap more generic concepts.
 - \ref py_CPUSIZE_page
 - \ref py_EXCEPTION_page
 - \ref py_EXTEND_page
+- \ref py_MEMORY_BACKEND_page
 - \ref py_MODE_page
 - \ref py_OPCODE_page
 - \ref py_OPERAND_page
@@ -64,6 +67,8 @@ to wrap more generic concepts.
 - \ref py_SHIFT_page
 - \ref py_SOLVER_page
 - \ref py_SOLVER_STATE_page
+- \ref py_STOP_page
+- \ref py_SUMMARY_page
 - \ref py_SYMBOLIC_page
 - \ref py_VERSION_page
 
@@ -31,6 +31,12 @@ The CALLBACK namespace contains all kinds of callbacks.
 \section CALLBACK_py_api Python API - Items of the CALLBACK namespace
 <hr>
 
+- **CALLBACK.GET_CONCRETE_MEMORY_AREA_VALUE**<br>
+The callback takes as arguments a \ref py_TritonContext_page, a base address and a size. Callbacks will be called once per contiguous
+area of undefined concrete memory that the Triton library will need to LOAD, which makes it suitable to lazily load memory (e.g. by
+calling `setConcreteMemoryAreaValue()` on the area). Once an area is defined, the callback is not called again for it. The callback
+must return nothing.
+
 - **CALLBACK.GET_CONCRETE_MEMORY_VALUE**<br>
 The callback takes as arguments a \ref py_TritonContext_page and a \ref py_MemoryAccess_page. Callbacks will be called each time that the
 Triton library will need to LOAD a concrete memory value. The callback must return nothing.
@@ -61,6 +67,7 @@ namespace triton {
     namespace python {
 
       void initCallbackNamespace(PyObject* callbackDict) {
+        xPyDict_SetItemString(callbackDict, "GET_CONCRETE_MEMORY_AREA_VALUE", PyLong_FromUint32(triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE));
         xPyDict_SetItemString(callbackDict, "GET_CONCRETE_MEMORY_VALUE",   PyLong_FromUint32(triton::callbacks::GET_CONCRETE_MEMORY_VALUE));
         xPyDict_SetItemString(callbackDict, "GET_CONCRETE_REGISTER_VALUE", PyLong_FromUint32(triton::callbacks::GET_CONCRETE_REGISTER_VALUE));
         xPyDict_SetItemString(callbackDict, "SET_CONCRETE_MEMORY_VALUE",   PyLong_FromUint32(triton::callbacks::SET_CONCRETE_MEMORY_VALUE));
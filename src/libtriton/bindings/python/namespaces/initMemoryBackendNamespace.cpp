@@ -0,0 +1,58 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/pythonBindings.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+#include <triton/archEnums.hpp>
+
+
+
+/*! \page py_MEMORY_BACKEND_page MEMORY_BACKEND
+    \brief [**python api**] All information about the MEMORY_BACKEND Python namespace.
+
+\tableofcontents
+
+\section MEMORY_BACKEND_py_description Description
+<hr>
+
+The MEMORY_BACKEND namespace contains all kinds of backend used to store the concrete memory.
+
+\subsection MEMORY_BACKEND_py_example Example
+
+~~~~~~~~~~~~~{.py}
+>>> ctx.setConcreteMemoryBackend(MEMORY_BACKEND.MAP)
+
+~~~~~~~~~~~~~
+
+\section MEMORY_BACKEND_py_api Python API - Items of the MEMORY_BACKEND namespace
+<hr>
+
+- **MEMORY_BACKEND.MAP**<br>
+One hash map entry per byte.
+
+- **MEMORY_BACKEND.PAGED**<br>
+Pages of 4 KiB with a bitmap of defined bytes. This is the default backend.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      void initMemoryBackendNamespace(PyObject* memoryBackendDict) {
+        PyDict_Clear(memoryBackendDict);
+
+        xPyDict_SetItemString(memoryBackendDict, "MAP",   PyLong_FromUint32(triton::arch::MEMORY_BACKEND_MAP));
+        xPyDict_SetItemString(memoryBackendDict, "PAGED", PyLong_FromUint32(triton::arch::MEMORY_BACKEND_PAGED));
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
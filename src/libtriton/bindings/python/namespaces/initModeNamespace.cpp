@@ -34,6 +34,17 @@ The MODE namespace contains all kinds of modes.
 - **MODE.ALIGNED_MEMORY**<br>
 Enabled, Triton will keep a map of aligned memory to reduce the symbolic memory explosion of `LOAD` and `STORE` accesses.
 
+- **MODE.AST_HASH_CONSING**<br>
+Enabled, the AST context returns an already existing node when a structurally identical node is built again
+(hash-consing). This reduces the memory used by ASTs which contain many identical sub-trees. Note that nodes
+are then shared, so modifying a node in place (e.g. via `setChild()`) affects every AST which contains it.
+
+- **MODE.AST_LAZY_EVALUATION**<br>
+Enabled, the concrete value of a new node is only computed when it is requested (e.g. via `evaluate()`), and the
+values of the nodes which depend on an updated symbolic variable are recomputed on demand. This speeds up the
+construction of ASTs whose concrete values are rarely used. A lazily evaluated AST must not be evaluated from
+several threads at the same time.
+
 - **MODE.AST_OPTIMIZATIONS**<br>
 Enabled, Triton will reduces the depth of the trees using classical arithmetic optimisations.
 
@@ -67,6 +78,8 @@ namespace triton {
 
       void initModeNamespace(PyObject* modeDict) {
         xPyDict_SetItemString(modeDict, "ALIGNED_MEMORY",                 PyLong_FromUint32(triton::modes::ALIGNED_MEMORY));
+        xPyDict_SetItemString(modeDict, "AST_HASH_CONSING",               PyLong_FromUint32(triton::modes::AST_HASH_CONSING));
+        xPyDict_SetItemString(modeDict, "AST_LAZY_EVALUATION",            PyLong_FromUint32(triton::modes::AST_LAZY_EVALUATION));
         xPyDict_SetItemString(modeDict, "AST_OPTIMIZATIONS",              PyLong_FromUint32(triton::modes::AST_OPTIMIZATIONS));
         xPyDict_SetItemString(modeDict, "CONCRETIZE_UNDEFINED_REGISTERS", PyLong_FromUint32(triton::modes::CONCRETIZE_UNDEFINED_REGISTERS));
         xPyDict_SetItemString(modeDict, "CONSTANT_FOLDING",               PyLong_FromUint32(triton::modes::CONSTANT_FOLDING));
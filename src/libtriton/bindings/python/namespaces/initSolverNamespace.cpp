@@ -27,6 +27,7 @@ The SOLVER namespace contains all kinds of solver status.
 
 - **SOLVER.Z3**
 - **SOLVER.BITWUZLA**
+- **SOLVER.PORTFOLIO**: races all the available solvers on each query and returns the first definitive answer.
 
 */
 
@@ -45,6 +46,9 @@ namespace triton {
         #if defined(TRITON_BITWUZLA_INTERFACE)
         xPyDict_SetItemString(solverDict, "BITWUZLA", PyLong_FromUint32(triton::engines::solver::SOLVER_BITWUZLA));
         #endif
+        #if defined(TRITON_Z3_INTERFACE) || defined(TRITON_BITWUZLA_INTERFACE)
+        xPyDict_SetItemString(solverDict, "PORTFOLIO", PyLong_FromUint32(triton::engines::solver::SOLVER_PORTFOLIO));
+        #endif
       }
 
     }; /* python namespace */
@@ -0,0 +1,80 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/pythonBindings.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+#include <triton/archEnums.hpp>
+
+
+
+/*! \page py_STOP_page STOP
+    \brief [**python api**] All information about the STOP Python namespace.
+
+\tableofcontents
+
+\section STOP_py_description Description
+<hr>
+
+The STOP namespace contains all reasons why an emulation stops.
+
+\subsection STOP_py_example Example
+
+~~~~~~~~~~~~~{.py}
+>>> reason, count, fault = ctx.emulate(0x400000, stops=[0x400010])
+>>> reason == STOP.ADDRESS
+True
+
+~~~~~~~~~~~~~
+
+\section STOP_py_api Python API - Items of the STOP namespace
+<hr>
+
+- **STOP.ADDRESS**<br>
+A stop address has been reached.
+
+- **STOP.COUNT**<br>
+The maximum number of instructions ran.
+
+- **STOP.FAULT**<br>
+An instruction raised a fault (see \ref py_EXCEPTION_page).
+
+- **STOP.HOOK**<br>
+A hook returned `False`.
+
+- **STOP.NO_CODE**<br>
+The program counter points to an undefined memory.
+
+- **STOP.TIMEOUT**<br>
+The maximum time elapsed.
+
+- **STOP.INTERRUPTED**<br>
+The emulation has been interrupted. From Python, a pending signal (e.g. Ctrl-C) raises its exception instead.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      void initStopNamespace(PyObject* stopDict) {
+        PyDict_Clear(stopDict);
+
+        xPyDict_SetItemString(stopDict, "ADDRESS",     PyLong_FromUint32(triton::arch::STOP_ADDRESS));
+        xPyDict_SetItemString(stopDict, "COUNT",       PyLong_FromUint32(triton::arch::STOP_COUNT));
+        xPyDict_SetItemString(stopDict, "FAULT",       PyLong_FromUint32(triton::arch::STOP_FAULT));
+        xPyDict_SetItemString(stopDict, "HOOK",        PyLong_FromUint32(triton::arch::STOP_HOOK));
+        xPyDict_SetItemString(stopDict, "NO_CODE",     PyLong_FromUint32(triton::arch::STOP_NO_CODE));
+        xPyDict_SetItemString(stopDict, "TIMEOUT",     PyLong_FromUint32(triton::arch::STOP_TIMEOUT));
+        xPyDict_SetItemString(stopDict, "INTERRUPTED", PyLong_FromUint32(triton::arch::STOP_INTERRUPTED));
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
@@ -0,0 +1,69 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/pythonBindings.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+#include <triton/callbacksEnums.hpp>
+
+
+
+/*! \page py_SUMMARY_page SUMMARY
+    \brief [**python api**] All information about the SUMMARY Python namespace.
+
+\tableofcontents
+
+\section SUMMARY_py_description Description
+<hr>
+
+The SUMMARY namespace contains all built-in summaries of libc routines, which can be used as hooks during an emulation.
+A summary reads its arguments according to the calling convention of the architecture, applies the routine on the
+concrete memory in a single call, keeps the symbolic expressions and the taint of the bytes involved, sets the return
+value and returns to the caller. The results of `strcmp` and `strlen` are symbolic if the strings are.
+
+\subsection SUMMARY_py_example Example
+
+~~~~~~~~~~~~~{.py}
+>>> ctx.addHook(0x401030, SUMMARY.STRLEN)
+
+~~~~~~~~~~~~~
+
+\section SUMMARY_py_api Python API - Items of the SUMMARY namespace
+<hr>
+
+- **SUMMARY.MEMCPY**<br>
+`void* memcpy(void* dst, const void* src, size_t n)`
+
+- **SUMMARY.MEMSET**<br>
+`void* memset(void* dst, int c, size_t n)`
+
+- **SUMMARY.STRCMP**<br>
+`int strcmp(const char* s1, const char* s2)`
+
+- **SUMMARY.STRLEN**<br>
+`size_t strlen(const char* s)`
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      void initSummaryNamespace(PyObject* summaryDict) {
+        PyDict_Clear(summaryDict);
+
+        xPyDict_SetItemString(summaryDict, "MEMCPY", PyLong_FromUint32(triton::callbacks::SUMMARY_MEMCPY));
+        xPyDict_SetItemString(summaryDict, "MEMSET", PyLong_FromUint32(triton::callbacks::SUMMARY_MEMSET));
+        xPyDict_SetItemString(summaryDict, "STRCMP", PyLong_FromUint32(triton::callbacks::SUMMARY_STRCMP));
+        xPyDict_SetItemString(summaryDict, "STRLEN", PyLong_FromUint32(triton::callbacks::SUMMARY_STRLEN));
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
@@ -18,6 +18,8 @@
 #endif
 
 #include <cstring>
+#include <mutex>
+#include <sstream>
 
 
 
@@ -283,9 +285,35 @@ Returns the first non referene node encountered.
 - <b>\ref py_AstNode_page duplicate(\ref py_AstNode_page node)</b><br>
 Duplicates the node and returns a new instance as \ref py_AstNode_page.
 
+- <b>dict getGarbageCollectorStats(void)</b><br>
+Returns the counters of the AST garbage collector as a dictionary with the following keys: `kept` (nodes currently
+held by the collector), `freed` (nodes released so far), `sweeps` (number of sweeps) and `time` (time spent in sweeps
+in microseconds).
+
+- <b>[\ref py_AstNode_page, ...] parseSmt(string script, function resolver=None)</b><br>
+Parses a SMT-LIB2 script (QF_ABV, as printed by the SMT representation or by `TritonContext.liftToSMT()`) and
+returns the asserted nodes and the top-level terms. `let` and `define-fun` bindings are shared, so the size of the AST is
+linear in the size of the script, while functions with parameters are expanded at each application. Without a resolver,
+the symbolic variables must have a variable node, they are found by name or by alias. The `resolver(name, size)` callback
+is called for the other symbols and returns a \ref py_SymbolicVariable_page or None: `size` is zero for a symbol which
+is used, and the size of the sort for a bit-vector which is declared (the resolver may then create it). See also
+`TritonContext.parseSmt()`.
+
+- <b>string printShared(\ref py_AstNode_page node)</b><br>
+Returns the representation of the node (see `TritonContext.setAstRepresentationMode()`) where each sub-expression used
+several times is printed once: as a `let` binding in SMT and as a temporary variable in Python. The size of the output is
+linear in the size of the AST, which is useful to print unrolled expressions.
+
 - <b>[\ref py_AstNode_page, ...] search(\ref py_AstNode_page node, \ref py_AST_NODE_page match)</b><br>
 Returns a list of collected matched nodes via a depth-first pre order traversal.
 
+- <b>void setGarbageCollectorBudget(integer budget)</b><br>
+Sets the maximum number of nodes examined by the garbage collector per sweep. The budget is split between the young and
+the old generations. A budget of `0` means a default slice of `1024` nodes (default).
+
+- <b>void setGarbageCollectorPeriod(integer period)</b><br>
+Sets the number of instructions processed between two sweeps of the garbage collector. The default period is `1`.
+
 - <b>z3::expr tritonToZ3(\ref py_AstNode_page node)</b><br>
 Convert a Triton AST to a Z3 AST.
 
@@ -370,6 +398,16 @@ namespace triton {
       }
 
 
+      /* Calls a binding with the AST context locked, see TritonContext_locked() */
+      template <PyObject* (*binding)(PyObject*, PyObject*)>
+      static PyObject* AstContext_locked(PyObject* self, PyObject* args) {
+        std::unique_lock<std::recursive_mutex> lock(PyObjectMutex(PyAstContext_AsAstContext(self).get()), std::try_to_lock);
+        if (!lock.owns_lock())
+          return PyErr_Format(PyExc_RuntimeError, "AstContext: context busy, it is used by another thread.");
+        return binding(self, args);
+      }
+
+
       static PyObject* AstContext_array(PyObject* self, PyObject* op1) {
         if (!PyLong_Check(op1) && !PyInt_Check(op1))
           return PyErr_Format(PyExc_TypeError, "array(): expected an integer as first argument");
@@ -1328,6 +1366,22 @@ namespace triton {
       }
 
 
+      static PyObject* AstContext_getGarbageCollectorStats(PyObject* self, PyObject* noarg) {
+        try {
+          auto stats = PyAstContext_AsAstContext(self)->getGarbageCollectorStats();
+          PyObject* dict = xPyDict_New();
+          xPyDict_SetItemString(dict, "kept",   PyLong_FromUsize(stats.kept));
+          xPyDict_SetItemString(dict, "freed",  PyLong_FromUsize(stats.freed));
+          xPyDict_SetItemString(dict, "sweeps", PyLong_FromUsize(stats.sweeps));
+          xPyDict_SetItemString(dict, "time",   PyLong_FromUint64(stats.time));
+          return dict;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* AstContext_iff(PyObject* self, PyObject* args) {
         PyObject* op1 = nullptr;
         PyObject* op2 = nullptr;
@@ -1528,6 +1582,87 @@ namespace triton {
       }
 
 
+      static PyObject* AstContext_parseSmt(PyObject* self, PyObject* args) {
+        PyObject* script   = nullptr;
+        PyObject* resolver = nullptr;
+        PyObject* ret      = nullptr;
+
+        /* Extract arguments */
+        if (PyArg_ParseTuple(args, "|OO", &script, &resolver) == false) {
+          return PyErr_Format(PyExc_TypeError, "parseSmt(): Invalid number of arguments");
+        }
+
+        if (script == nullptr || !PyStr_Check(script))
+          return PyErr_Format(PyExc_TypeError, "parseSmt(): expected a string as first argument");
+
+        if (resolver != nullptr && resolver != Py_None && !PyCallable_Check(resolver))
+          return PyErr_Format(PyExc_TypeError, "parseSmt(): expected a function as second argument");
+
+        triton::ast::SmtResolver cb = nullptr;
+        if (resolver != nullptr && resolver != Py_None) {
+          cb = [resolver](const std::string& name, triton::uint32 size) -> triton::engines::symbolic::SharedSymbolicVariable {
+            /********* Lambda *********/
+            PyObject* args = triton::bindings::python::xPyTuple_New(2);
+            PyTuple_SetItem(args, 0, triton::bindings::python::xPyString_FromString(name.c_str()));
+            PyTuple_SetItem(args, 1, triton::bindings::python::PyLong_FromUint32(size));
+
+            /* Call the resolver */
+            PyObject* ret = PyObject_CallObject(resolver, args);
+            Py_DECREF(args);
+
+            /* Check the call */
+            if (ret == nullptr)
+              throw triton::exceptions::PyCallbacks();
+
+            triton::engines::symbolic::SharedSymbolicVariable symVar = nullptr;
+            if (PySymbolicVariable_Check(ret))
+              symVar = PySymbolicVariable_AsSymbolicVariable(ret);
+            else if (ret != Py_None) {
+              Py_DECREF(ret);
+              throw triton::exceptions::Callbacks("AstContext::parseSmt(): The resolver must return a SymbolicVariable or None.");
+            }
+
+            Py_DECREF(ret);
+            return symVar;
+            /********* End of lambda *********/
+          };
+        }
+
+        try {
+          std::istringstream stream(PyStr_AsString(script));
+          auto nodes = PyAstContext_AsAstContext(self)->parseSmt(stream, cb);
+          ret = xPyList_New(nodes.size());
+
+          triton::uint32 index = 0;
+          for (auto&& node : nodes)
+            PyList_SetItem(ret, index++, PyAstNode(node));
+
+          return ret;
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* AstContext_printShared(PyObject* self, PyObject* node) {
+        if (!PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "printShared(): expected a AstNode as argument");
+
+        try {
+          std::ostringstream stream;
+          PyAstContext_AsAstContext(self)->printShared(stream, PyAstNode_AsAstNode(node).get());
+          return PyStr_FromFormat("%s", stream.str().c_str());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* AstContext_reference(PyObject* self, PyObject* symExpr) {
         if (!PySymbolicExpression_Check(symExpr))
           return PyErr_Format(PyExc_TypeError, "reference(): expected a symbolic expression as argument");
@@ -1595,6 +1730,38 @@ namespace triton {
       }
 
 
+      static PyObject* AstContext_setGarbageCollectorBudget(PyObject* self, PyObject* budget) {
+        if (!PyLong_Check(budget) && !PyInt_Check(budget))
+          return PyErr_Format(PyExc_TypeError, "setGarbageCollectorBudget(): Expects an integer as argument.");
+
+        try {
+          PyAstContext_AsAstContext(self)->setGarbageCollectorBudget(PyLong_AsUsize(budget));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* AstContext_setGarbageCollectorPeriod(PyObject* self, PyObject* period) {
+        if (!PyLong_Check(period) && !PyInt_Check(period))
+          return PyErr_Format(PyExc_TypeError, "setGarbageCollectorPeriod(): Expects an integer as argument.");
+
+        try {
+          PyAstContext_AsAstContext(self)->setGarbageCollectorPeriod(PyLong_AsUsize(period));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* AstContext_string(PyObject* self, PyObject* expr) {
         if (!PyStr_Check(expr))
           return PyErr_Format(PyExc_TypeError, "string(): expected a string as first argument");
@@ -1775,71 +1942,76 @@ namespace triton {
 
       //! AstContext methods.
       PyMethodDef AstContext_callbacks[] = {
-        {"array",           AstContext_array,           METH_O,           ""},
-        {"assert_",         AstContext_assert,          METH_O,           ""},
-        {"bswap",           AstContext_bswap,           METH_O,           ""},
-        {"bv",              AstContext_bv,              METH_VARARGS,     ""},
-        {"bvadd",           AstContext_bvadd,           METH_VARARGS,     ""},
-        {"bvand",           AstContext_bvand,           METH_VARARGS,     ""},
-        {"bvashr",          AstContext_bvashr,          METH_VARARGS,     ""},
-        {"bvfalse",         AstContext_bvfalse,         METH_NOARGS,      ""},
-        {"bvlshr",          AstContext_bvlshr,          METH_VARARGS,     ""},
-        {"bvmul",           AstContext_bvmul,           METH_VARARGS,     ""},
-        {"bvnand",          AstContext_bvnand,          METH_VARARGS,     ""},
-        {"bvneg",           AstContext_bvneg,           METH_O,           ""},
-        {"bvnor",           AstContext_bvnor,           METH_VARARGS,     ""},
-        {"bvnot",           AstContext_bvnot,           METH_O,           ""},
-        {"bvor",            AstContext_bvor,            METH_VARARGS,     ""},
-        {"bvrol",           AstContext_bvrol,           METH_VARARGS,     ""},
-        {"bvror",           AstContext_bvror,           METH_VARARGS,     ""},
-        {"bvsdiv",          AstContext_bvsdiv,          METH_VARARGS,     ""},
-        {"bvsge",           AstContext_bvsge,           METH_VARARGS,     ""},
-        {"bvsgt",           AstContext_bvsgt,           METH_VARARGS,     ""},
-        {"bvshl",           AstContext_bvshl,           METH_VARARGS,     ""},
-        {"bvsle",           AstContext_bvsle,           METH_VARARGS,     ""},
-        {"bvslt",           AstContext_bvslt,           METH_VARARGS,     ""},
-        {"bvsmod",          AstContext_bvsmod,          METH_VARARGS,     ""},
-        {"bvsrem",          AstContext_bvsrem,          METH_VARARGS,     ""},
-        {"bvsub",           AstContext_bvsub,           METH_VARARGS,     ""},
-        {"bvtrue",          AstContext_bvtrue,          METH_NOARGS,      ""},
-        {"bvudiv",          AstContext_bvudiv,          METH_VARARGS,     ""},
-        {"bvuge",           AstContext_bvuge,           METH_VARARGS,     ""},
-        {"bvugt",           AstContext_bvugt,           METH_VARARGS,     ""},
-        {"bvule",           AstContext_bvule,           METH_VARARGS,     ""},
-        {"bvult",           AstContext_bvult,           METH_VARARGS,     ""},
-        {"bvurem",          AstContext_bvurem,          METH_VARARGS,     ""},
-        {"bvxnor",          AstContext_bvxnor ,         METH_VARARGS,     ""},
-        {"bvxor",           AstContext_bvxor,           METH_VARARGS,     ""},
-        {"compound",        AstContext_compound,        METH_O,           ""},
-        {"concat",          AstContext_concat,          METH_O,           ""},
-        {"declare",         AstContext_declare,         METH_O,           ""},
-        {"dereference",     AstContext_dereference,     METH_O,           ""},
-        {"distinct",        AstContext_distinct,        METH_VARARGS,     ""},
-        {"duplicate",       AstContext_duplicate,       METH_O,           ""},
-        {"equal",           AstContext_equal,           METH_VARARGS,     ""},
-        {"extract",         AstContext_extract,         METH_VARARGS,     ""},
-        {"forall",          AstContext_forall,          METH_VARARGS,     ""},
-        {"iff",             AstContext_iff,             METH_VARARGS,     ""},
-        {"ite",             AstContext_ite,             METH_VARARGS,     ""},
-        {"land",            AstContext_land,            METH_O,           ""},
-        {"let",             AstContext_let,             METH_VARARGS,     ""},
-        {"lnot",            AstContext_lnot,            METH_O,           ""},
-        {"lor",             AstContext_lor,             METH_O,           ""},
-        {"lxor",            AstContext_lxor,            METH_O,           ""},
-        {"reference",       AstContext_reference,       METH_O,           ""},
-        {"select",          AstContext_select,          METH_VARARGS,     ""},
-        {"store",           AstContext_store,           METH_VARARGS,     ""},
-        {"search",          AstContext_search,          METH_VARARGS,     ""},
-        {"string",          AstContext_string,          METH_O,           ""},
-        {"sx",              AstContext_sx,              METH_VARARGS,     ""},
-        {"unroll",          AstContext_unroll,          METH_O,           ""},
-        {"variable",        AstContext_variable,        METH_O,           ""},
-        {"zx",              AstContext_zx,              METH_VARARGS,     ""},
+        {"array",                     AstContext_locked<AstContext_array>,                      METH_O,           ""},
+        {"assert_",                   AstContext_locked<AstContext_assert>,                     METH_O,           ""},
+        {"bswap",                     AstContext_locked<AstContext_bswap>,                      METH_O,           ""},
+        {"bv",                        AstContext_locked<AstContext_bv>,                         METH_VARARGS,     ""},
+        {"bvadd",                     AstContext_locked<AstContext_bvadd>,                      METH_VARARGS,     ""},
+        {"bvand",                     AstContext_locked<AstContext_bvand>,                      METH_VARARGS,     ""},
+        {"bvashr",                    AstContext_locked<AstContext_bvashr>,                     METH_VARARGS,     ""},
+        {"bvfalse",                   AstContext_locked<AstContext_bvfalse>,                    METH_NOARGS,      ""},
+        {"bvlshr",                    AstContext_locked<AstContext_bvlshr>,                     METH_VARARGS,     ""},
+        {"bvmul",                     AstContext_locked<AstContext_bvmul>,                      METH_VARARGS,     ""},
+        {"bvnand",                    AstContext_locked<AstContext_bvnand>,                     METH_VARARGS,     ""},
+        {"bvneg",                     AstContext_locked<AstContext_bvneg>,                      METH_O,           ""},
+        {"bvnor",                     AstContext_locked<AstContext_bvnor>,                      METH_VARARGS,     ""},
+        {"bvnot",                     AstContext_locked<AstContext_bvnot>,                      METH_O,           ""},
+        {"bvor",                      AstContext_locked<AstContext_bvor>,                       METH_VARARGS,     ""},
+        {"bvrol",                     AstContext_locked<AstContext_bvrol>,                      METH_VARARGS,     ""},
+        {"bvror",                     AstContext_locked<AstContext_bvror>,                      METH_VARARGS,     ""},
+        {"bvsdiv",                    AstContext_locked<AstContext_bvsdiv>,                     METH_VARARGS,     ""},
+        {"bvsge",                     AstContext_locked<AstContext_bvsge>,                      METH_VARARGS,     ""},
+        {"bvsgt",                     AstContext_locked<AstContext_bvsgt>,                      METH_VARARGS,     ""},
+        {"bvshl",                     AstContext_locked<AstContext_bvshl>,                      METH_VARARGS,     ""},
+        {"bvsle",                     AstContext_locked<AstContext_bvsle>,                      METH_VARARGS,     ""},
+        {"bvslt",                     AstContext_locked<AstContext_bvslt>,                      METH_VARARGS,     ""},
+        {"bvsmod",                    AstContext_locked<AstContext_bvsmod>,                     METH_VARARGS,     ""},
+        {"bvsrem",                    AstContext_locked<AstContext_bvsrem>,                     METH_VARARGS,     ""},
+        {"bvsub",                     AstContext_locked<AstContext_bvsub>,                      METH_VARARGS,     ""},
+        {"bvtrue",                    AstContext_locked<AstContext_bvtrue>,                     METH_NOARGS,      ""},
+        {"bvudiv",                    AstContext_locked<AstContext_bvudiv>,                     METH_VARARGS,     ""},
+        {"bvuge",                     AstContext_locked<AstContext_bvuge>,                      METH_VARARGS,     ""},
+        {"bvugt",                     AstContext_locked<AstContext_bvugt>,                      METH_VARARGS,     ""},
+        {"bvule",                     AstContext_locked<AstContext_bvule>,                      METH_VARARGS,     ""},
+        {"bvult",                     AstContext_locked<AstContext_bvult>,                      METH_VARARGS,     ""},
+        {"bvurem",                    AstContext_locked<AstContext_bvurem>,                     METH_VARARGS,     ""},
+        {"bvxnor",                    AstContext_locked<AstContext_bvxnor>,                     METH_VARARGS,     ""},
+        {"bvxor",                     AstContext_locked<AstContext_bvxor>,                      METH_VARARGS,     ""},
+        {"compound",                  AstContext_locked<AstContext_compound>,                   METH_O,           ""},
+        {"concat",                    AstContext_locked<AstContext_concat>,                     METH_O,           ""},
+        {"declare",                   AstContext_locked<AstContext_declare>,                    METH_O,           ""},
+        {"dereference",               AstContext_locked<AstContext_dereference>,                METH_O,           ""},
+        {"distinct",                  AstContext_locked<AstContext_distinct>,                   METH_VARARGS,     ""},
+        {"duplicate",                 AstContext_locked<AstContext_duplicate>,                  METH_O,           ""},
+        {"equal",                     AstContext_locked<AstContext_equal>,                      METH_VARARGS,     ""},
+        {"extract",                   AstContext_locked<AstContext_extract>,                    METH_VARARGS,     ""},
+        {"forall",                    AstContext_locked<AstContext_forall>,                     METH_VARARGS,     ""},
+        {"getGarbageCollectorStats",  AstContext_locked<AstContext_getGarbageCollectorStats>,   METH_NOARGS,      ""},
+        {"iff",                       AstContext_locked<AstContext_iff>,                        METH_VARARGS,     ""},
+        {"ite",                       AstContext_locked<AstContext_ite>,                        METH_VARARGS,     ""},
+        {"land",                      AstContext_locked<AstContext_land>,                       METH_O,           ""},
+        {"let",                       AstContext_locked<AstContext_let>,                        METH_VARARGS,     ""},
+        {"lnot",                      AstContext_locked<AstContext_lnot>,                       METH_O,           ""},
+        {"lor",                       AstContext_locked<AstContext_lor>,                        METH_O,           ""},
+        {"lxor",                      AstContext_locked<AstContext_lxor>,                       METH_O,           ""},
+        {"parseSmt",                  AstContext_locked<AstContext_parseSmt>,                   METH_VARARGS,     ""},
+        {"printShared",               AstContext_locked<AstContext_printShared>,                METH_O,           ""},
+        {"reference",                 AstContext_locked<AstContext_reference>,                  METH_O,           ""},
+        {"select",                    AstContext_locked<AstContext_select>,                     METH_VARARGS,     ""},
+        {"store",                     AstContext_locked<AstContext_store>,                      METH_VARARGS,     ""},
+        {"search",                    AstContext_locked<AstContext_search>,                     METH_VARARGS,     ""},
+        {"setGarbageCollectorBudget", AstContext_locked<AstContext_setGarbageCollectorBudget>,  METH_O,           ""},
+        {"setGarbageCollectorPeriod", AstContext_locked<AstContext_setGarbageCollectorPeriod>,  METH_O,           ""},
+        {"string",                    AstContext_locked<AstContext_string>,                     METH_O,           ""},
+        {"sx",                        AstContext_locked<AstContext_sx>,                         METH_VARARGS,     ""},
+        {"unroll",                    AstContext_locked<AstContext_unroll>,                     METH_O,           ""},
+        {"variable",                  AstContext_locked<AstContext_variable>,                   METH_O,           ""},
+        {"zx",                        AstContext_locked<AstContext_zx>,                         METH_VARARGS,     ""},
         #ifdef TRITON_Z3_INTERFACE
-        {"tritonToZ3",      AstContext_tritonToZ3,      METH_O,           ""},
-        {"z3ToTriton",      AstContext_z3ToTriton,      METH_O,           ""},
+        {"tritonToZ3",                AstContext_locked<AstContext_tritonToZ3>,                 METH_O,           ""},
+        {"z3ToTriton",                AstContext_locked<AstContext_z3ToTriton>,                 METH_O,           ""},
         #endif
-        {nullptr,           nullptr,                    0,                nullptr}
+        {nullptr,                     nullptr,                                                  0,                nullptr}
       };
 
 
@@ -0,0 +1,171 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/pythonObjects.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/registerState.hpp>
+
+#include <iostream>
+
+
+
+/*! \page py_RegisterState_page RegisterState
+    \brief [**python api**] All information about the RegisterState Python object.
+
+\tableofcontents
+
+\section py_RegisterState_description Description
+<hr>
+
+This object is used to represent the registers of a context at a given time: the concrete values of the parent
+registers, the symbolic registers and the tainted registers. A register state is returned by
+\ref tritonContext_py_api "TritonContext.saveRegisterState()" and restored by
+\ref tritonContext_py_api "TritonContext.restoreRegisterState()". It is mainly used to switch between the threads of
+a guest, the memory and the path constraints being shared by all the threads.
+
+~~~~~~~~~~~~~{.py}
+>>> from triton import TritonContext, ARCH, Instruction
+
+>>> ctxt = TritonContext()
+>>> ctxt.setArchitecture(ARCH.X86)
+>>> thread0 = ctxt.saveRegisterState()
+>>> thread1 = ctxt.saveRegisterState()
+
+>>> ctxt.processing(Instruction(b"\xb8\x03\x00\x00\x00")) # mov eax, 3
+0
+>>> thread0 = ctxt.saveRegisterState()
+>>> ctxt.restoreRegisterState(thread1)
+>>> ctxt.getConcreteRegisterValue(ctxt.registers.eax)
+0
+
+>>> ctxt.restoreRegisterState(thread0)
+>>> ctxt.getConcreteRegisterValue(ctxt.registers.eax)
+3
+
+~~~~~~~~~~~~~
+
+\section RegisterState_py_api Python API - Methods of the RegisterState class
+<hr>
+
+- <b>\ref py_ARCH_page getArchitecture(void)</b><br>
+Returns the architecture of the register state.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      //! RegisterState destructor.
+      void RegisterState_dealloc(PyObject* self) {
+        std::cout << std::flush;
+        delete PyRegisterState_AsRegisterState(self);
+        Py_TYPE(self)->tp_free((PyObject*)self);
+      }
+
+
+      static PyObject* RegisterState_getArchitecture(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUint32(PyRegisterState_AsRegisterState(self)->getArchitecture());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      //! RegisterState methods.
+      PyMethodDef RegisterState_callbacks[] = {
+        {"getArchitecture", RegisterState_getArchitecture,  METH_NOARGS,    ""},
+        {nullptr,           nullptr,                        0,              nullptr}
+      };
+
+
+      PyTypeObject RegisterState_Type = {
+        PyVarObject_HEAD_INIT(&PyType_Type, 0)
+        "RegisterState",                            /* tp_name */
+        sizeof(RegisterState_Object),               /* tp_basicsize */
+        0,                                          /* tp_itemsize */
+        (destructor)RegisterState_dealloc,          /* tp_dealloc */
+        #if IS_PY3_8
+        0,                                          /* tp_vectorcall_offset */
+        #else
+        0,                                          /* tp_print */
+        #endif
+        0,                                          /* tp_getattr */
+        0,                                          /* tp_setattr */
+        0,                                          /* tp_compare */
+        0,                                          /* tp_repr */
+        0,                                          /* tp_as_number */
+        0,                                          /* tp_as_sequence */
+        0,                                          /* tp_as_mapping */
+        0,                                          /* tp_hash */
+        0,                                          /* tp_call */
+        0,                                          /* tp_str */
+        0,                                          /* tp_getattro */
+        0,                                          /* tp_setattro */
+        0,                                          /* tp_as_buffer */
+        Py_TPFLAGS_DEFAULT,                         /* tp_flags */
+        "RegisterState objects",                    /* tp_doc */
+        0,                                          /* tp_traverse */
+        0,                                          /* tp_clear */
+        0,                                          /* tp_richcompare */
+        0,                                          /* tp_weaklistoffset */
+        0,                                          /* tp_iter */
+        0,                                          /* tp_iternext */
+        RegisterState_callbacks,                    /* tp_methods */
+        0,                                          /* tp_members */
+        0,                                          /* tp_getset */
+        0,                                          /* tp_base */
+        0,                                          /* tp_dict */
+        0,                                          /* tp_descr_get */
+        0,                                          /* tp_descr_set */
+        0,                                          /* tp_dictoffset */
+        0,                                          /* tp_init */
+        0,                                          /* tp_alloc */
+        0,                                          /* tp_new */
+        0,                                          /* tp_free */
+        0,                                          /* tp_is_gc */
+        0,                                          /* tp_bases */
+        0,                                          /* tp_mro */
+        0,                                          /* tp_cache */
+        0,                                          /* tp_subclasses */
+        0,                                          /* tp_weaklist */
+        0,                                          /* tp_del */
+        #if IS_PY3
+          0,                                        /* tp_version_tag */
+          0,                                        /* tp_finalize */
+          #if IS_PY3_8
+            0,                                      /* tp_vectorcall */
+            #if !IS_PY3_9
+              0,                                    /* bpo-37250: kept for backwards compatibility in CPython 3.8 only */
+            #endif
+          #endif
+        #else
+          0                                         /* tp_version_tag */
+        #endif
+      };
+
+
+      PyObject* PyRegisterState(const triton::RegisterState& state) {
+        RegisterState_Object* object;
+
+        PyType_Ready(&RegisterState_Type);
+        object = PyObject_NEW(RegisterState_Object, &RegisterState_Type);
+        if (object != NULL)
+          object->state = new triton::RegisterState(state);
+
+        return (PyObject*)object;
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
@@ -0,0 +1,184 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/pythonObjects.hpp>
+#include <triton/pythonUtils.hpp>
+#include <triton/pythonXFunctions.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/snapshot.hpp>
+
+#include <iostream>
+
+
+
+/*! \page py_Snapshot_page Snapshot
+    \brief [**python api**] All information about the Snapshot Python object.
+
+\tableofcontents
+
+\section py_Snapshot_description Description
+<hr>
+
+This object is used to represent the state of a context at a given time: the concrete registers and memory, the
+symbolic registers and memory, the taint and the path constraints. A snapshot is returned by
+\ref tritonContext_py_api "TritonContext.snapshot()" and restored by
+\ref tritonContext_py_api "TritonContext.restore()". The states are shared between the context and its snapshots
+and copied on write, so a snapshot is cheap to take and may be restored any number of times. The symbolic
+expressions and variables are shared by all the snapshots of a context.
+
+~~~~~~~~~~~~~{.py}
+>>> from triton import TritonContext, ARCH, Instruction
+
+>>> ctxt = TritonContext()
+>>> ctxt.setArchitecture(ARCH.X86_64)
+>>> ctxt.setConcreteRegisterValue(ctxt.registers.rax, 1)
+>>> snap = ctxt.snapshot()
+
+>>> ctxt.processing(Instruction(b"\x48\xff\xc0")) # inc rax
+0
+>>> ctxt.getConcreteRegisterValue(ctxt.registers.rax)
+2
+
+>>> ctxt.restore(snap)
+>>> ctxt.getConcreteRegisterValue(ctxt.registers.rax)
+1
+
+~~~~~~~~~~~~~
+
+\section Snapshot_py_api Python API - Methods of the Snapshot class
+<hr>
+
+- <b>\ref py_ARCH_page getArchitecture(void)</b><br>
+Returns the architecture of the snapshot.
+
+- <b>integer getSizeOfPathConstraints(void)</b><br>
+Returns the number of path constraints of the snapshot.
+
+*/
+
+
+
+namespace triton {
+  namespace bindings {
+    namespace python {
+
+      //! Snapshot destructor.
+      void Snapshot_dealloc(PyObject* self) {
+        std::cout << std::flush;
+        delete PySnapshot_AsSnapshot(self);
+        Py_TYPE(self)->tp_free((PyObject*)self);
+      }
+
+
+      static PyObject* Snapshot_getArchitecture(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUint32(PySnapshot_AsSnapshot(self)->getArchitecture());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* Snapshot_getSizeOfPathConstraints(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUsize(PySnapshot_AsSnapshot(self)->getSizeOfPathConstraints());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      //! Snapshot methods.
+      PyMethodDef Snapshot_callbacks[] = {
+        {"getArchitecture",           Snapshot_getArchitecture,           METH_NOARGS,    ""},
+        {"getSizeOfPathConstraints",  Snapshot_getSizeOfPathConstraints,  METH_NOARGS,    ""},
+        {nullptr,                     nullptr,                            0,              nullptr}
+      };
+
+
+      PyTypeObject Snapshot_Type = {
+        PyVarObject_HEAD_INIT(&PyType_Type, 0)
+        "Snapshot",                                 /* tp_name */
+        sizeof(Snapshot_Object),                    /* tp_basicsize */
+        0,                                          /* tp_itemsize */
+        (destructor)Snapshot_dealloc,               /* tp_dealloc */
+        #if IS_PY3_8
+        0,                                          /* tp_vectorcall_offset */
+        #else
+        0,                                          /* tp_print */
+        #endif
+        0,                                          /* tp_getattr */
+        0,                                          /* tp_setattr */
+        0,                                          /* tp_compare */
+        0,                                          /* tp_repr */
+        0,                                          /* tp_as_number */
+        0,                                          /* tp_as_sequence */
+        0,                                          /* tp_as_mapping */
+        0,                                          /* tp_hash */
+        0,                                          /* tp_call */
+        0,                                          /* tp_str */
+        0,                                          /* tp_getattro */
+        0,                                          /* tp_setattro */
+        0,                                          /* tp_as_buffer */
+        Py_TPFLAGS_DEFAULT,                         /* tp_flags */
+        "Snapshot objects",                         /* tp_doc */
+        0,                                          /* tp_traverse */
+        0,                                          /* tp_clear */
+        0,                                          /* tp_richcompare */
+        0,                                          /* tp_weaklistoffset */
+        0,                                          /* tp_iter */
+        0,                                          /* tp_iternext */
+        Snapshot_callbacks,                         /* tp_methods */
+        0,                                          /* tp_members */
+        0,                                          /* tp_getset */
+        0,                                          /* tp_base */
+        0,                                          /* tp_dict */
+        0,                                          /* tp_descr_get */
+        0,                                          /* tp_descr_set */
+        0,                                          /* tp_dictoffset */
+        0,                                          /* tp_init */
+        0,                                          /* tp_alloc */
+        0,                                          /* tp_new */
+        0,                                          /* tp_free */
+        0,                                          /* tp_is_gc */
+        0,                                          /* tp_bases */
+        0,                                          /* tp_mro */
+        0,                                          /* tp_cache */
+        0,                                          /* tp_subclasses */
+        0,                                          /* tp_weaklist */
+        0,                                          /* tp_del */
+        #if IS_PY3
+          0,                                        /* tp_version_tag */
+          0,                                        /* tp_finalize */
+          #if IS_PY3_8
+            0,                                      /* tp_vectorcall */
+            #if !IS_PY3_9
+              0,                                    /* bpo-37250: kept for backwards compatibility in CPython 3.8 only */
+            #endif
+          #endif
+        #else
+          0                                         /* tp_version_tag */
+        #endif
+      };
+
+
+      PyObject* PySnapshot(const triton::Snapshot& snap) {
+        Snapshot_Object* object;
+
+        PyType_Ready(&Snapshot_Type);
+        object = PyObject_NEW(Snapshot_Object, &Snapshot_Type);
+        if (object != NULL)
+          object->snapshot = new triton::Snapshot(snap);
+
+        return (PyObject*)object;
+      }
+
+    }; /* python namespace */
+  }; /* bindings namespace */
+}; /* triton namespace */
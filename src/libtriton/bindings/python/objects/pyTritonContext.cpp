@@ -13,6 +13,12 @@
 #include <triton/exceptions.hpp>
 #include <triton/register.hpp>
 
+#include <memory>
+#include <mutex>
+#include <sstream>
+#include <unordered_map>
+#include <unordered_set>
+
 
 
 /*! \page py_TritonContext_page TritonContext
@@ -34,6 +40,17 @@ libTriton offers Python bindings on top of its C++ API which allow you to build
 
 ~~~~~~~~~~~~~
 
+\section tritonContext_py_threads Threads
+<hr>
+
+The calls which may run for a long time release the GIL, so other Python threads keep running meanwhile: the solver
+queries (`getModel()`, `getModels()`, `isSat()`, `evaluateAstViaSolver()` and the incremental session API), the
+simplifications via a solver or LLVM, `emulate()`, `evaluateAstBatch()`, `liftToLLVM()` and `synthesize()`. Several contexts may thus be used at the same time
+from several threads. These calls are serialized on a same context. While a method of a context runs in a thread, the
+other methods of this context and of its \ref py_AstContext_page raise a `RuntimeError` (context busy) when they are
+called from another thread. AST nodes must not be used from another thread meanwhile. Callbacks are always called with
+the GIL held.
+
 \section tritonContext_py_api Python API - Methods of the TritonContext class
 <hr>
 
@@ -42,6 +59,15 @@ libTriton offers Python bindings on top of its C++ API which allow you to build
 - <b>void addCallback(\ref py_CALLBACK_page kind, function cb)</b><br>
 Adds a callback at specific internal points. Your callback will be called each time the point is reached.
 
+- <b>void addHook(integer addr, function hook)</b><br>
+Hooks an address for the emulation (see `emulate()`). When the program counter reaches `addr`, the emulation calls
+`hook(ctx, addr)` instead of processing the instruction, the hook must thus update the program counter (e.g. to the return
+address of a summarized function). The emulation stops with `STOP.HOOK` if the hook returns `False`. An address has at
+most one hook, the lookup is done in C++ so Python is only entered when a hooked address is reached.
+
+- <b>void addHook(integer addr, \ref py_SUMMARY_page kind)</b><br>
+Hooks an address with a built-in summary of a libc routine, which runs entirely in C++.
+
 - <b>void assignSymbolicExpressionToMemory(\ref py_SymbolicExpression_page symExpr, \ref py_MemoryAccess_page mem)</b><br>
 Assigns a \ref py_SymbolicExpression_page to a \ref py_MemoryAccess_page area. **Be careful**, use this function only if you know what you are doing.
 The symbolic expression (`symExpr`) must be aligned to the memory access.
@@ -65,9 +91,21 @@ Clears concrete values assigned to the memory cells.
 - <b>void clearConcreteMemoryValue(integer addr, integer size)</b><br>
 Clears concrete values assigned to the memory cells from `addr` to `addr + size`.
 
+- <b>void clearHooks(void)</b><br>
+Removes all hooks.
+
+- <b>void clearDisassemblyCache(void)</b><br>
+Clears the disassembly cache and its statistics.
+
 - <b>void clearPathConstraints(void)</b><br>
 Clears the current path predicate.
 
+- <b>void clearSessionConstraints(void)</b><br>
+Clears the incremental solver session and its translation cache.
+
+- <b>void clearSolverQueryCache(void)</b><br>
+Clears the solver query cache and its statistics.
+
 - <b>void concretizeAllMemory(void)</b><br>
 Concretizes all symbolic memory references.
 
@@ -104,6 +142,24 @@ Disassembles a concrete memory area from `addr` and returns a list of at most `c
 - <b>\ref py_BasicBlock_page disassembly(integer addr)</b><br>
 Disassembles a concrete memory area from `addr` to control flow instruction and returns a \ref py_BasicBlock_page.
 
+- <b>(\ref py_STOP_page, integer, \ref py_EXCEPTION_page) emulate(integer addr, stops=[], count=0, timeout=0)</b><br>
+Emulates the code from `addr` without going back to Python between instructions. The opcodes are fetched from the
+concrete memory (through the memory callbacks, thus a `CALLBACK.GET_CONCRETE_MEMORY_AREA_VALUE` callback may supply the
+code lazily) and processed until the program counter reaches one of the `stops` addresses, `count` instructions ran or
+`timeout` milliseconds elapsed (`0` means no limit). The emulation also stops on a fault or when the program counter
+points to an undefined memory. Hooked addresses (see `addHook()`) call their hook instead of being processed and each
+hook call counts as an instruction. Callbacks are still called during the emulation. Pending signals are checked
+periodically, thus a Ctrl-C interrupts an emulation which never stops and raises `KeyboardInterrupt`. Returns a tuple with
+the reason of the stop, the number of processed instructions and the fault (`EXCEPTION.NO_FAULT` unless the reason is
+`STOP.FAULT`).
+
+- <b>[integer, ...] evaluateAstBatch(\ref py_AstNode_page node, dict inputs)</b><br>
+Evaluates an AST under many assignments in a single pass and returns the list of results, one per lane. `inputs` maps
+\ref py_SymbolicVariable_page (or their id) to sequences of integers of the same size (e.g. a `list`, an `array` or a NumPy
+array), the i-th result is the value of the AST with each variable set to the i-th item of its sequence. Variables
+without sequence keep their current concrete value. The AST is compiled once, which is much faster than calling
+`setConcreteVariableValue()` and `evaluate()` for each assignment.
+
 - <b>integer evaluateAstViaSolver(\ref py_AstNode_page node)</b><br>
 Evaluates an AST via the solver and returns the concrete value.
 
@@ -122,6 +178,13 @@ Returns the current AST representation mode.
 - <b>bytes getConcreteMemoryAreaValue(integer baseAddr, integer size)</b><br>
 Returns the concrete value of a memory area.
 
+- <b>void getConcreteMemoryAreaValueInto(integer baseAddr, buffer area)</b><br>
+Copies the concrete value of a memory area into a writable bytes-like object (e.g. a `bytearray`, a `memoryview` or
+an `array`). The size of the area is the size of the buffer.
+
+- <b>\ref py_MEMORY_BACKEND_page getConcreteMemoryBackend(void)</b><br>
+Returns the kind of backend used to store the concrete memory.
+
 - <b>integer getConcreteMemoryValue(integer addr)</b><br>
 Returns the concrete value of a memory cell.
 
@@ -134,6 +197,14 @@ Returns the concrete value of a register.
 - <b>integer getConcreteVariableValue(\ref py_SymbolicVariable_page symVar)</b><br>
 Returns the concrete value of a symbolic variable.
 
+- <b>integer getDisassemblyCacheSize(void)</b><br>
+Returns the maximum number of instructions kept in the disassembly cache (0 if the cache is disabled).
+
+- <b>dict getDisassemblyCacheStats(void)</b><br>
+Returns the counters of the disassembly cache as a dictionary with the following keys: `hits` (instructions decoded
+from the cache), `misses` (instructions decoded by the disassembler), `invalidations` (entries dropped because the
+code at their address changed), `entries` (cached instructions) and `evictions` (instructions evicted from the cache).
+
 - <b>integer getGprBitSize(void)</b><br>
 Returns the size in bits of the General Purpose Registers.
 
@@ -181,9 +252,35 @@ Returns the \ref py_Register_page class corresponding to a string.
 - <b>\ref py_AstNode_page getRegisterAst(\ref py_Register_page reg)</b><br>
 Returns the AST corresponding to the \ref py_Register_page with the SSA form.
 
+- <b>dict getSessionModel(\ref py_AstNode_page node=None, status=False, timeout=0)</b><br>
+Computes and returns a model as a dictionary of {integer symVarId : \ref py_SolverModel_page model} of the constraints of
+the incremental solver session, and of `node` if defined (`node` is not kept in the session).
+If status is True, returns a tuple of (dict model, \ref py_SOLVER_STATE_page status, integer solvingTime).
+
+- <b>integer getSizeOfSessionConstraints(void)</b><br>
+Returns the number of constraints of the incremental solver session.
+
 - <b>\ref py_SOLVER_page getSolver(void)</b><br>
 Returns the SMT solver engine currently used.
 
+- <b>dict getSolverPortfolioStats(void)</b><br>
+Returns the statistics of the solvers of the portfolio as a dictionary of {\ref py_SOLVER_page solver : dict stats}, where
+the stats have the following keys: `wins` (queries answered first by the solver) and `time` (total solving time of these
+queries in milliseconds). The dictionary is empty if the current solver is not `SOLVER.PORTFOLIO`.
+
+- <b>integer getSolverQueryCacheSize(void)</b><br>
+Returns the maximum number of queries kept in the solver query cache (0 if the cache is disabled).
+
+- <b>dict getSolverQueryCacheStats(void)</b><br>
+Returns the counters of the solver query cache as a dictionary with the following keys: `hits` (queries answered by
+a cached query), `misses` (queries which reached the solver), `subsumed` (queries answered unsat because they contain
+all the constraints of a cached unsat query), `counterexamples` (queries answered sat by the model of a cached query
+which contains all their constraints, or whose constraints they contain and which satisfies them), `entries` (cached
+queries) and `evictions` (queries evicted from the cache).
+
+- <b>integer getSolverWorkers(void)</b><br>
+Returns the number of threads used by getModels().
+
 - <b>\ref py_SymbolicExpression_page getSymbolicExpression(integer symExprId)</b><br>
 Returns the symbolic expression corresponding to an id.
 
@@ -215,7 +312,8 @@ Returns the symbolic register value.
 Returns the symbolic variable corresponding to a symbolic variable id.
 
 - <b>\ref py_SymbolicVariable_page getSymbolicVariable(string symVarName)</b><br>
-Returns the symbolic variable corresponding to a symbolic variable name.
+Returns the symbolic variable corresponding to a symbolic variable name or alias. If several variables have the same alias,
+the first created is returned.
 
 - <b>dict getSymbolicVariables(void)</b><br>
 Returns all symbolic variables as a dictionary of {integer SymVarId : \ref py_SymbolicVariable_page var}.
@@ -241,6 +339,9 @@ Returns true if memory cells have a defined concrete value.
 - <b>bool isFlag(\ref py_Register_page reg)</b><br>
 Returns true if the register is a flag.
 
+- <b>bool isHooked(integer addr)</b><br>
+Returns true if the address is hooked.
+
 - <b>bool isMemorySymbolized(integer addr)</b><br>
 Returns true if the memory cell expression contains a symbolic variable.
 
@@ -271,6 +372,13 @@ Returns true if the register is valid.
 - <b>bool isSat(\ref py_AstNode_page node)</b><br>
 Returns true if an expression is satisfiable.
 
+- <b>bool isSessionSat(\ref py_AstNode_page node=None, status=False, timeout=0)</b><br>
+Returns true if the constraints of the incremental solver session, and `node` if defined, are satisfiable. `node` is not
+kept in the session. If status is True, returns a tuple of (bool sat, \ref py_SOLVER_STATE_page status, integer solvingTime).
+
+- <b>bool isSolverIndependenceEnabled(void)</b><br>
+Returns true if the solver queries are split into independent groups of constraints.
+
 - <b>bool isSymbolicExpressionExists(integer symExprId)</b><br>
 Returns true if the symbolic expression id exists.
 
@@ -295,15 +403,28 @@ Lifts a symbolic expression and all its references to Python format. If `icommen
 - <b>string liftToSMT(\ref py_SymbolicExpression_page expr, bool assert_=False, bool icomment=False)</b><br>
 Lifts a symbolic expression and all its references to SMT format. If `assert_` is true, then (assert <expr>). If `icomment` is true, then print instructions assembly in expression comments.
 
+- <b>void mapConcreteMemoryFile(string path, integer offset, integer addr, integer size, bool writable=False)</b><br>
+Maps `size` bytes of the file `path` from `offset` into the concrete memory at `addr`. With the paged memory backend,
+the file is not read: whole pages are backed by a private mapping of the file and are only copied on their first write
+(or written in place in the private mapping if `writable` is true). The SET_CONCRETE_MEMORY_VALUE callbacks are not called.
+
 - <b>\ref py_SymbolicExpression_page newSymbolicExpression(\ref py_AstNode_page node, string comment)</b><br>
 Returns a new symbolic expression. Note that if there are simplification passes recorded, simplifications will be applied.
 
 - <b>\ref py_SymbolicVariable_page newSymbolicVariable(integer varSize, string alias)</b><br>
 Returns a new symbolic variable.
 
+- <b>[\ref py_AstNode_page, ...] parseSmt(string script)</b><br>
+Parses a SMT-LIB2 script (see `AstContext.parseSmt()`) and returns the asserted nodes and the top-level terms. The symbolic
+variables are found by name or by alias, even if no AST has been built for them yet. A bit-vector declared with `declare-fun`
+which does not exist is created, with the declared symbol as alias.
+
 - <b>void popPathConstraint(void)</b><br>
 Pops the last constraints added to the path predicate.
 
+- <b>void popSessionConstraint(void)</b><br>
+Pops the last constraint of the incremental solver session, and its solver scope.
+
 - <b>\ref py_EXCEPTION_page processing(\ref py_Instruction_page inst)</b><br>
 Processes an instruction and updates engines according to the instruction semantics. Returns `EXCEPTION.NO_FAULT` if the instruction is supported.
 
@@ -313,12 +434,29 @@ Processes a basic block with a potential given base address and updates engines
 - <b>void pushPathConstraint(\ref py_AstNode_page node, string comment="")</b><br>
 Pushs constraints to the current path predicate.
 
+- <b>void pushSessionConstraint(\ref py_AstNode_page node)</b><br>
+Pushes a new scope in the incremental solver session and asserts `node` in it. The solver session is persistent and the
+translation of AST nodes to the solver is cached by node, so only nodes which have not been seen yet are translated.
+Sessions are available with the Z3 and Bitwuzla solvers.
+
 - <b>void removeCallback(\ref py_CALLBACK_page kind, function cb)</b><br>
 Removes a recorded callback.
 
+- <b>void removeHook(integer addr)</b><br>
+Removes the hook of an address.
+
 - <b>void reset(void)</b><br>
 Resets everything.
 
+- <b>void restoreRegisterState(\ref py_RegisterState_page state)</b><br>
+Restores a register state saved by this context: the concrete values, the symbolic expressions and the taint of the registers. The memory and the path constraints are left untouched.
+
+- <b>void restore(\ref py_Snapshot_page snapshot)</b><br>
+Restores a snapshot taken by this context: the concrete registers and memory, the symbolic registers and memory, the taint and the path constraints. The callbacks are not called.
+
+- <b>\ref py_RegisterState_page saveRegisterState(void)</b><br>
+Returns the concrete values, the symbolic expressions and the taint of the registers in one call. This is meant to switch between the threads of a guest, see \ref py_RegisterState_page.
+
 - <b>void setArchitecture(\ref py_ARCH_page arch)</b><br>
 Initializes an architecture. This function must be called before any call to the rest of the API.
 
@@ -329,10 +467,13 @@ Sets the AST representation.
 Sets the concrete value of a memory area. Note that setting a concrete value will probably imply a desynchronization with
 the symbolic state (if it exists). You should probably use the concretize functions after this.
 
-- <b>void setConcreteMemoryAreaValue(integer baseAddr, bytes opcodes)</b><br>
+- <b>void setConcreteMemoryAreaValue(integer baseAddr, bytes-like opcodes)</b><br>
 Sets the concrete value of a memory area. Note that setting a concrete value will probably imply a desynchronization with
 the symbolic state (if it exists). You should probably use the concretize functions after this.
 
+- <b>void setConcreteMemoryBackend(\ref py_MEMORY_BACKEND_page backend)</b><br>
+Sets the kind of backend used to store the concrete memory. The current concrete memory is kept.
+
 - <b>void setConcreteMemoryValue(integer addr, integer value)</b><br>
 Sets the concrete value of a memory cell. Note that setting a concrete value will probably imply a desynchronization with
 the symbolic state (if it exists). You should probably use the concretize functions after this.
@@ -348,18 +489,40 @@ the symbolic state (if it exists). You should probably use the concretize functi
 - <b>void setConcreteVariableValue(\ref py_SymbolicVariable_page symVar, integer value)</b><br>
 Sets the concrete value of a symbolic variable.
 
+- <b>void setDisassemblyCacheSize(integer size)</b><br>
+Sets the maximum number of decoded instructions kept in a LRU cache, so the instructions of a loop are decoded once by
+`disassembly()` and `processing()`. Entries are keyed by address and are checked against the opcode, thus a code
+rewritten at runtime is decoded again. Arm32 instructions are never cached. `0` disables and clears the cache (the default).
+
 - <b>void setMode(\ref py_MODE_page mode, bool flag)</b><br>
 Enables or disables a specific mode.
 
 - <b>void setSolver(\ref py_SOLVER_page solver)</b><br>
 Defines an SMT solver
 
+- <b>void setSolverIndependence(bool flag)</b><br>
+Enables or disables the constraint independence optimization (disabled by default). The constraints of the queries
+sent to getModel() and isSat() are partitioned into groups which share no symbolic variable, and each group is solved
+on its own. With the query cache enabled (see setSolverQueryCacheSize()), the groups which did not change since a
+previous query are answered from the cache, so flipping a branch only sends the constraints related to this branch to
+the solver.
+
 - <b>void setSolverMemoryLimit(integer megabytes)</b><br>
 Defines a solver memory consumption limit (in megabytes)
 
+- <b>void setSolverQueryCacheSize(integer size)</b><br>
+Sets the maximum number of queries kept in the solver query cache. The cache is disabled by default (size `0`).
+Queries which only differ by the names of their symbolic variables share the same entry, and cached models are renamed
+accordingly. A query which contains all the constraints of a cached unsat query is answered unsat without calling the solver.
+
 - <b>void setSolverTimeout(integer ms)</b><br>
 Defines a solver timeout (in milliseconds)
 
+- <b>void setSolverWorkers(integer workers)</b><br>
+Defines the number of threads used by getModels() (`1` by default). With several threads, z3 splits the search space into
+cubes over some bits of the symbolic variables and enumerates the models of the cubes in parallel. The `timeout` of
+getModels() then applies to the whole enumeration, and the order of the models is not deterministic.
+
 - <b>bool setTaintMemory(\ref py_MemoryAccess_page mem, bool flag)</b><br>
 Sets the targeted memory as tainted or not. Returns true if the memory is still tainted.
 
@@ -380,6 +543,9 @@ Performs a dead store elimination simplification on a given block. If `padding`
 - <b>dict sliceExpressions(\ref py_SymbolicExpression_page expr)</b><br>
 Slices expressions from a given one (backward slicing) and returns all symbolic expressions as a dictionary of {integer SymExprId : \ref py_SymbolicExpression_page expr}.
 
+- <b>\ref py_Snapshot_page snapshot(void)</b><br>
+Returns a snapshot of the current state. The states are shared with the context and copied on write, thus forking a path costs what the path writes afterwards, not the size of the states.
+
 - <b>\ref py_SymbolicVariable_page symbolizeExpression(integer symExprId, integer symVarSize, string symVarAlias)</b><br>
 Converts a symbolic expression to a symbolic variable. `symVarSize` must be in bits. This function returns the new symbolic variable created.
 
@@ -389,6 +555,11 @@ Converts a symbolic memory expression to a symbolic variable. This function retu
 - <b>\ref py_SymbolicVariable_page symbolizeRegister(\ref py_Register_page reg, string symVarAlias)</b><br>
 Converts a symbolic register expression to a symbolic variable. This function returns the new symbolic variable created.
 
+- <b>void syncSessionConstraints(void)</b><br>
+Makes the constraints of the incremental solver session equal to the taken predicates of the path constraints. Only the
+constraints which differ from the path constraints are popped and the new ones pushed, so calling it at each branch only
+costs the translation of the new path constraints.
+
 - <b>\ref py_AstNode_page synthesize(\ref py_AstNode_page node, bool constant=True, bool subexpr=True, bool opaque=False)</b><br>
 Synthesizes a given node. If `constant` is defined to True, performs a constant synthesis. If `opaque` is true, perform opaque constant synthesis. If `subexpr` is defined to True, performs synthesis on sub-expressions.
 
@@ -462,9 +633,83 @@ namespace triton {
   namespace bindings {
     namespace python {
 
+      /*! Releases the GIL and locks the context and its AST context for the lifetime of the object. */
+      class TritonContext_NoGil {
+        private:
+          //! The mutex of the context.
+          std::recursive_mutex& ctxMutex;
+
+          //! The mutex of the AST context.
+          std::recursive_mutex& astMutex;
+
+          //! Released GIL. The context is locked once the GIL is released, so a thread waiting for the context never holds the GIL.
+          triton::bindings::python::PyReleaseGil gil;
+
+        public:
+          TritonContext_NoGil(PyObject* self)
+            : ctxMutex(PyObjectMutex(PyTritonContext_AsTritonContext(self))),
+              astMutex(PyObjectMutex(PyTritonContext_AsTritonContext(self)->getAstContext().get())) {
+            std::lock(this->ctxMutex, this->astMutex);
+          }
+
+          ~TritonContext_NoGil() {
+            this->astMutex.unlock();
+            this->ctxMutex.unlock();
+          }
+      };
+
+
+      /*
+       * Calls a binding with the context locked. The GIL is held, so the binding cannot wait for
+       * a call of another thread which released the GIL: the context is reported as busy instead.
+       */
+      template <PyObject* (*binding)(PyObject*, PyObject*)>
+      static PyObject* TritonContext_locked(PyObject* self, PyObject* args) {
+        std::unique_lock<std::recursive_mutex> lock(PyObjectMutex(PyTritonContext_AsTritonContext(self)), std::try_to_lock);
+        if (!lock.owns_lock())
+          return PyErr_Format(PyExc_RuntimeError, "TritonContext: context busy, it is used by another thread.");
+        return binding(self, args);
+      }
+
+
+      template <PyObject* (*binding)(PyObject*, PyObject*, PyObject*)>
+      static PyObject* TritonContext_locked(PyObject* self, PyObject* args, PyObject* kwargs) {
+        std::unique_lock<std::recursive_mutex> lock(PyObjectMutex(PyTritonContext_AsTritonContext(self)), std::try_to_lock);
+        if (!lock.owns_lock())
+          return PyErr_Format(PyExc_RuntimeError, "TritonContext: context busy, it is used by another thread.");
+        return binding(self, args, kwargs);
+      }
+
+
+      /*! Holds the references of a Python hook, released once the hook is removed, replaced or cleared. */
+      class TritonContext_HookReferences {
+        public:
+          //! The hook function.
+          PyObject* cb;
+
+          //! The instance of a bound method, or nullptr.
+          PyObject* cb_self;
+
+          TritonContext_HookReferences(PyObject* cb, PyObject* cb_self)
+            : cb(cb), cb_self(cb_self) {
+            Py_INCREF(this->cb);
+            Py_XINCREF(this->cb_self);
+          }
+
+          ~TritonContext_HookReferences() {
+            triton::bindings::python::PyAcquireGil gil; /* The last copy of the hook may be released without the GIL */
+            Py_DECREF(this->cb);
+            Py_XDECREF(this->cb_self);
+          }
+      };
+
+
       static void TritonContext_dealloc(PyObject* self) {
-        if (((TritonContext_Object*)self)->ref == false)
+        if (((TritonContext_Object*)self)->ref == false) {
+          PyObjectMutex_Erase(PyTritonContext_AsTritonContext(self)->getAstContext().get());
+          PyObjectMutex_Erase(PyTritonContext_AsTritonContext(self));
           delete PyTritonContext_AsTritonContext(self);
+        }
         Py_XDECREF(((TritonContext_Object*)self)->regAttr);
         Py_TYPE(self)->tp_free((PyObject*)self);
       }
@@ -514,9 +759,46 @@ namespace triton {
         try {
           switch (static_cast<triton::callbacks::callback_e>(PyLong_AsUint32(mode))) {
 
+            case callbacks::GET_CONCRETE_MEMORY_AREA_VALUE:
+              PyTritonContext_AsTritonContext(self)->addCallback(callbacks::GET_CONCRETE_MEMORY_AREA_VALUE, callbacks::getConcreteMemoryAreaValueCallback([cb_self, cb](triton::Context& ctx, triton::uint64 baseAddr, triton::usize size) {
+                /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
+                PyObject* args = nullptr;
+
+                /* Create function args */
+                if (cb_self) {
+                  args = triton::bindings::python::xPyTuple_New(4);
+                  PyTuple_SetItem(args, 0, cb_self);
+                  PyTuple_SetItem(args, 1, triton::bindings::python::PyTritonContextRef(ctx));
+                  PyTuple_SetItem(args, 2, triton::bindings::python::PyLong_FromUint64(baseAddr));
+                  PyTuple_SetItem(args, 3, triton::bindings::python::PyLong_FromUsize(size));
+                  Py_INCREF(cb_self);
+                }
+                else {
+                  args = triton::bindings::python::xPyTuple_New(3);
+                  PyTuple_SetItem(args, 0, triton::bindings::python::PyTritonContextRef(ctx));
+                  PyTuple_SetItem(args, 1, triton::bindings::python::PyLong_FromUint64(baseAddr));
+                  PyTuple_SetItem(args, 2, triton::bindings::python::PyLong_FromUsize(size));
+                }
+
+                /* Call the callback */
+                PyObject* ret = PyObject_CallObject(cb, args);
+
+                /* Check the call */
+                if (ret == nullptr) {
+                  throw triton::exceptions::PyCallbacks();
+                }
+
+                Py_DECREF(ret);
+                Py_DECREF(args);
+                /********* End of lambda *********/
+              }, cb));
+              break;
+
             case callbacks::GET_CONCRETE_MEMORY_VALUE:
               PyTritonContext_AsTritonContext(self)->addCallback(callbacks::GET_CONCRETE_MEMORY_VALUE, callbacks::getConcreteMemoryValueCallback([cb_self, cb](triton::Context& ctx, const triton::arch::MemoryAccess& mem) {
                 /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
                 PyObject* args = nullptr;
 
                 /* Create function args */
@@ -549,6 +831,7 @@ namespace triton {
             case callbacks::GET_CONCRETE_REGISTER_VALUE:
               PyTritonContext_AsTritonContext(self)->addCallback(callbacks::GET_CONCRETE_REGISTER_VALUE, callbacks::getConcreteRegisterValueCallback([cb_self, cb](triton::Context& ctx, const triton::arch::Register& reg){
                 /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
                 PyObject* args = nullptr;
 
                 /* Create function args */
@@ -581,6 +864,7 @@ namespace triton {
             case callbacks::SET_CONCRETE_MEMORY_VALUE:
               PyTritonContext_AsTritonContext(self)->addCallback(callbacks::SET_CONCRETE_MEMORY_VALUE, callbacks::setConcreteMemoryValueCallback([cb_self, cb](triton::Context& ctx, const triton::arch::MemoryAccess& mem, const triton::uint512& value) {
                 /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
                 PyObject* args = nullptr;
 
                 /* Create function args */
@@ -615,6 +899,7 @@ namespace triton {
             case callbacks::SET_CONCRETE_REGISTER_VALUE:
               PyTritonContext_AsTritonContext(self)->addCallback(callbacks::SET_CONCRETE_REGISTER_VALUE, callbacks::setConcreteRegisterValueCallback([cb_self, cb](triton::Context& ctx, const triton::arch::Register& reg, const triton::uint512& value){
                 /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
                 PyObject* args = nullptr;
 
                 /* Create function args */
@@ -649,6 +934,7 @@ namespace triton {
             case callbacks::SYMBOLIC_SIMPLIFICATION:
               PyTritonContext_AsTritonContext(self)->addCallback(callbacks::SYMBOLIC_SIMPLIFICATION, callbacks::symbolicSimplificationCallback([cb_self, cb](triton::Context& ctx, triton::ast::SharedAbstractNode node) {
                 /********* Lambda *********/
+                triton::bindings::python::PyAcquireGil gil; /* The callback may be called while the GIL is released */
                 PyObject* args = nullptr;
 
                 /* Create function args */
@@ -701,6 +987,92 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_addHook(PyObject* self, PyObject* args) {
+        PyObject* addr     = nullptr;
+        PyObject* function = nullptr;
+        PyObject* cb       = nullptr;
+        PyObject* cb_self  = nullptr;
+
+        /* Extract arguments */
+        if (PyArg_ParseTuple(args, "|OO", &addr, &function) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::addHook(): Invalid number of arguments");
+        }
+
+        if (addr == nullptr || (!PyLong_Check(addr) && !PyInt_Check(addr)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::addHook(): Expects an integer as first argument.");
+
+        if (function == nullptr || (!PyCallable_Check(function) && !PyLong_Check(function) && !PyInt_Check(function)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::addHook(): Expects a function or a SUMMARY as second argument.");
+
+        try {
+          /* Built-in summary */
+          if (!PyCallable_Check(function)) {
+            PyTritonContext_AsTritonContext(self)->addHook(PyLong_AsUint64(addr), static_cast<triton::callbacks::summary_e>(PyLong_AsUint32(function)));
+            Py_INCREF(Py_None);
+            return Py_None;
+          }
+
+          if (PyMethod_Check(function)) {
+            cb_self = PyMethod_GET_SELF(function);
+            cb = PyMethod_GET_FUNCTION(function);
+          }
+          else {
+            cb = function;
+          }
+
+          /* The references are shared by the copies of the hook and released with the last one */
+          auto refs = std::make_shared<TritonContext_HookReferences>(cb, cb_self);
+
+          PyTritonContext_AsTritonContext(self)->addHook(PyLong_AsUint64(addr), callbacks::hookCallback([refs](triton::Context& ctx, triton::uint64 address) {
+            /********* Lambda *********/
+            triton::bindings::python::PyAcquireGil gil; /* The hook may be called while the GIL is released */
+            PyObject* cb_self = refs->cb_self;
+            PyObject* cb      = refs->cb;
+            PyObject* args    = nullptr;
+
+            /* Create function args */
+            if (cb_self) {
+              args = triton::bindings::python::xPyTuple_New(3);
+              PyTuple_SetItem(args, 0, cb_self);
+              PyTuple_SetItem(args, 1, triton::bindings::python::PyTritonContextRef(ctx));
+              PyTuple_SetItem(args, 2, triton::bindings::python::PyLong_FromUint64(address));
+              Py_INCREF(cb_self);
+            }
+            else {
+              args = triton::bindings::python::xPyTuple_New(2);
+              PyTuple_SetItem(args, 0, triton::bindings::python::PyTritonContextRef(ctx));
+              PyTuple_SetItem(args, 1, triton::bindings::python::PyLong_FromUint64(address));
+            }
+
+            /* Call the hook */
+            PyObject* ret = PyObject_CallObject(cb, args);
+
+            /* Check the call */
+            if (ret == nullptr) {
+              throw triton::exceptions::PyCallbacks();
+            }
+
+            /* Only an explicit False stops the emulation */
+            bool cont = (ret != Py_False);
+
+            Py_DECREF(ret);
+            Py_DECREF(args);
+            return cont;
+            /********* End of lambda *********/
+          }, cb));
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_assignSymbolicExpressionToMemory(PyObject* self, PyObject* args) {
         PyObject* se  = nullptr;
         PyObject* mem = nullptr;
@@ -799,6 +1171,32 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_clearDisassemblyCache(PyObject* self, PyObject* noarg) {
+        try {
+          PyTritonContext_AsTritonContext(self)->clearDisassemblyCache();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* TritonContext_clearHooks(PyObject* self, PyObject* noarg) {
+        try {
+          PyTritonContext_AsTritonContext(self)->clearHooks();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_clearModes(PyObject* self, PyObject* noarg) {
         try {
           PyTritonContext_AsTritonContext(self)->clearModes();
@@ -865,6 +1263,35 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_clearSessionConstraints(PyObject* self, PyObject* noarg) {
+        try {
+          PyTritonContext_AsTritonContext(self)->clearSessionConstraints();
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* TritonContext_clearSolverQueryCache(PyObject* self, PyObject* noarg) {
+        try {
+          PyTritonContext_AsTritonContext(self)->clearSolverQueryCache();
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_concretizeAllMemory(PyObject* self, PyObject* noarg) {
         try {
           PyTritonContext_AsTritonContext(self)->concretizeAllMemory();
@@ -1130,12 +1557,182 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_emulate(PyObject* self, PyObject* args, PyObject* kwargs) {
+        std::unordered_set<triton::uint64> cstops;
+        triton::arch::exception_e fault = triton::arch::NO_FAULT;
+        triton::arch::stop_e reason = triton::arch::STOP_ADDRESS;
+        triton::usize processed = 0;
+        triton::usize climit = 0;
+        triton::uint32 ctimeout = 0;
+
+        PyObject* addr    = nullptr;
+        PyObject* stops   = nullptr;
+        PyObject* limit   = nullptr;
+        PyObject* timeout = nullptr;
+
+        static char* keywords[] = {
+          (char*)"addr",
+          (char*)"stops",
+          (char*)"count",
+          (char*)"timeout",
+          nullptr
+        };
+
+        /* Extract Keywords */
+        if (PyArg_ParseTupleAndKeywords(args, kwargs, "|OOOO", keywords, &addr, &stops, &limit, &timeout) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::emulate(): Invalid keyword argument.");
+        }
+
+        if (addr == nullptr || (!PyLong_Check(addr) && !PyInt_Check(addr))) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::emulate(): Expects an integer as addr argument.");
+        }
+
+        if (limit != nullptr && (!PyLong_Check(limit) && !PyInt_Check(limit))) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::emulate(): Expects an integer as count keyword.");
+        }
+
+        if (timeout != nullptr && (!PyLong_Check(timeout) && !PyInt_Check(timeout))) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::emulate(): Expects an integer as timeout keyword.");
+        }
+
+        if (stops != nullptr) {
+          PyObject* seq = PySequence_Fast(stops, "TritonContext::emulate(): Expects a sequence of integers as stops keyword.");
+          if (seq == nullptr)
+            return nullptr;
+
+          for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(seq); i++) {
+            PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+            if (!PyLong_Check(item) && !PyInt_Check(item)) {
+              Py_DECREF(seq);
+              return PyErr_Format(PyExc_TypeError, "TritonContext::emulate(): Expects a sequence of integers as stops keyword.");
+            }
+            cstops.insert(PyLong_AsUint64(item));
+          }
+          Py_DECREF(seq);
+        }
+
+        if (limit != nullptr) {
+          climit = PyLong_AsUsize(limit);
+        }
+
+        if (timeout != nullptr) {
+          ctimeout = PyLong_AsUint32(timeout);
+        }
+
+        try {
+          triton::uint64 caddr = PyLong_AsUint64(addr);
+          {
+            TritonContext_NoGil nogil(self);
+            reason = PyTritonContext_AsTritonContext(self)->emulate(caddr, cstops, climit, ctimeout, &processed, &fault, []() {
+              /* Signal handlers run with the GIL, e.g. Ctrl-C raises KeyboardInterrupt */
+              triton::bindings::python::PyAcquireGil gil;
+              return PyErr_CheckSignals() != 0;
+            });
+          }
+
+          /* The exception raised by the signal handler is propagated */
+          if (reason == triton::arch::STOP_INTERRUPTED && PyErr_Occurred())
+            return nullptr;
+
+          PyObject* ret = triton::bindings::python::xPyTuple_New(3);
+          PyTuple_SetItem(ret, 0, PyLong_FromUint32(reason));
+          PyTuple_SetItem(ret, 1, PyLong_FromUsize(processed));
+          PyTuple_SetItem(ret, 2, PyLong_FromUint32(fault));
+          return ret;
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_evaluateAstBatch(PyObject* self, PyObject* args) {
+        std::unordered_map<triton::usize, std::vector<triton::uint512>> inputs;
+        std::vector<triton::uint512> results;
+        PyObject* node    = nullptr;
+        PyObject* columns = nullptr;
+        PyObject* key     = nullptr;
+        PyObject* value   = nullptr;
+        PyObject* ret     = nullptr;
+        Py_ssize_t pos    = 0;
+
+        /* Extract arguments */
+        if (PyArg_ParseTuple(args, "|OO", &node, &columns) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::evaluateAstBatch(): Invalid number of arguments");
+        }
+
+        if (node == nullptr || !PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::evaluateAstBatch(): Expects a AstNode as first argument.");
+
+        if (columns == nullptr || !PyDict_Check(columns))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::evaluateAstBatch(): Expects a dict as second argument.");
+
+        try {
+          while (PyDict_Next(columns, &pos, &key, &value)) {
+            triton::usize id = 0;
+
+            if (PySymbolicVariable_Check(key))
+              id = PySymbolicVariable_AsSymbolicVariable(key)->getId();
+            else if (PyLong_Check(key) || PyInt_Check(key))
+              id = PyLong_AsUsize(key);
+            else
+              return PyErr_Format(PyExc_TypeError, "TritonContext::evaluateAstBatch(): Each key must be a SymbolicVariable or an integer.");
+
+            /* Any iterable (list, tuple, array, NumPy array, ...) */
+            PyObject* seq = PySequence_Fast(value, "TritonContext::evaluateAstBatch(): Each value must be a sequence of integers.");
+            if (seq == nullptr)
+              return nullptr;
+
+            std::vector<triton::uint512>& column = inputs[id];
+            column.reserve(PySequence_Fast_GET_SIZE(seq));
+            for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(seq); i++) {
+              PyObject* item = PyNumber_Index(PySequence_Fast_GET_ITEM(seq, i));
+              if (item == nullptr) {
+                Py_DECREF(seq);
+                return nullptr;
+              }
+              column.push_back(PyLong_AsUint512(item));
+              Py_DECREF(item);
+            }
+            Py_DECREF(seq);
+          }
+
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          {
+            TritonContext_NoGil nogil(self);
+            results = PyTritonContext_AsTritonContext(self)->evaluateAstBatch(cnode, inputs);
+          }
+
+          ret = xPyList_New(results.size());
+          for (triton::usize index = 0; index < results.size(); index++)
+            PyList_SetItem(ret, index, PyLong_FromUint512(results[index]));
+
+          return ret;
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_evaluateAstViaSolver(PyObject* self, PyObject* node) {
         if (!PyAstNode_Check(node))
           return PyErr_Format(PyExc_TypeError, "TritonContext::evaluateAstViaSolver(): Expects a AstNode as argument.");
 
         try {
-          return PyLong_FromUint512(PyTritonContext_AsTritonContext(self)->evaluateAstViaSolver(PyAstNode_AsAstNode(node)));
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          triton::uint512 value = 0;
+          {
+            TritonContext_NoGil nogil(self);
+            value = PyTritonContext_AsTritonContext(self)->evaluateAstViaSolver(cnode);
+          }
+          return PyLong_FromUint512(value);
         }
         catch (const triton::exceptions::PyCallbacks&) {
           return nullptr;
@@ -1210,37 +1807,88 @@ namespace triton {
       }
 
 
-      static PyObject* TritonContext_getConcreteMemoryAreaValue(PyObject* self, PyObject* args) {
-        triton::uint8*  area = nullptr;
-        PyObject*       ret  = nullptr;
-        PyObject*       addr = nullptr;
-        PyObject*       size = nullptr;
-
-        /* Extract arguments */
+      static PyObject* TritonContext_getConcreteMemoryBackend(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUint32(PyTritonContext_AsTritonContext(self)->getConcreteMemoryBackend());
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getConcreteMemoryAreaValue(PyObject* self, PyObject* args) {
+        PyObject* ret   = nullptr;
+        PyObject* addr  = nullptr;
+        PyObject* size  = nullptr;
+
+        /* Extract arguments */
         if (PyArg_ParseTuple(args, "|OO", &addr, &size) == false) {
           return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValue(): Invalid number of arguments");
         }
 
-        try {
-          std::vector<triton::uint8> vv = PyTritonContext_AsTritonContext(self)->getConcreteMemoryAreaValue(PyLong_AsUint64(addr), PyLong_AsUsize(size));
-          area = new triton::uint8[vv.size()];
+        if (addr == nullptr || (!PyLong_Check(addr) && !PyInt_Check(addr)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValue(): Expects an integer as first argument.");
+
+        if (size == nullptr || (!PyLong_Check(size) && !PyInt_Check(size)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValue(): Expects an integer as second argument.");
 
-          for (triton::usize index = 0; index < vv.size(); index++)
-            area[index] = vv[index];
+        /* The memory is directly copied into the bytes object */
+        ret = PyBytes_FromStringAndSize(nullptr, PyLong_AsUsize(size));
+        if (ret == nullptr)
+          return nullptr;
 
-          ret = PyBytes_FromStringAndSize(reinterpret_cast<const char*>(area), vv.size());
-          delete[] area;
+        try {
+          PyTritonContext_AsTritonContext(self)->getConcreteMemoryAreaValue(PyLong_AsUint64(addr), reinterpret_cast<triton::uint8*>(PyBytes_AS_STRING(ret)), PyLong_AsUsize(size));
           return ret;
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          Py_DECREF(ret);
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          Py_DECREF(ret);
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getConcreteMemoryAreaValueInto(PyObject* self, PyObject* args) {
+        PyObject* addr  = nullptr;
+        PyObject* area  = nullptr;
+        Py_buffer view;
 
+        /* Extract arguments */
+        if (PyArg_ParseTuple(args, "|OO", &addr, &area) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValueInto(): Invalid number of arguments");
+        }
+
+        if (addr == nullptr || (!PyLong_Check(addr) && !PyInt_Check(addr)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValueInto(): Expects an integer as first argument.");
+
+        if (area == nullptr || PyObject_GetBuffer(area, &view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS) != 0) {
+          PyErr_Clear();
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getConcreteMemoryAreaValueInto(): Expects a writable and contiguous bytes-like object as second argument.");
+        }
+
+        try {
+          PyTritonContext_AsTritonContext(self)->getConcreteMemoryAreaValue(PyLong_AsUint64(addr), static_cast<triton::uint8*>(view.buf), static_cast<triton::usize>(view.len));
         }
         catch (const triton::exceptions::PyCallbacks&) {
+          PyBuffer_Release(&view);
           return nullptr;
         }
         catch (const triton::exceptions::Exception& e) {
+          PyBuffer_Release(&view);
           return PyErr_Format(PyExc_TypeError, "%s", e.what());
         }
 
-        return ret;
+        PyBuffer_Release(&view);
+        Py_INCREF(Py_None);
+        return Py_None;
       }
 
 
@@ -1294,6 +1942,33 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_getDisassemblyCacheSize(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUsize(PyTritonContext_AsTritonContext(self)->getDisassemblyCacheSize());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getDisassemblyCacheStats(PyObject* self, PyObject* noarg) {
+        try {
+          auto stats = PyTritonContext_AsTritonContext(self)->getDisassemblyCacheStats();
+          PyObject* dict = xPyDict_New();
+          xPyDict_SetItemString(dict, "hits",          PyLong_FromUsize(stats.hits));
+          xPyDict_SetItemString(dict, "misses",        PyLong_FromUsize(stats.misses));
+          xPyDict_SetItemString(dict, "invalidations", PyLong_FromUsize(stats.invalidations));
+          xPyDict_SetItemString(dict, "entries",       PyLong_FromUsize(stats.entries));
+          xPyDict_SetItemString(dict, "evictions",     PyLong_FromUsize(stats.evictions));
+          return dict;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_getGprBitSize(PyObject* self, PyObject* noarg) {
         try {
           return PyLong_FromUint32(PyTritonContext_AsTritonContext(self)->getGprBitSize());
@@ -1391,8 +2066,13 @@ namespace triton {
         }
 
         try {
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          std::unordered_map<triton::usize, triton::engines::solver::SolverModel> model;
+          {
+            TritonContext_NoGil nogil(self);
+            model = PyTritonContext_AsTritonContext(self)->getModel(cnode, &status, timeout_c, &solvingTime);
+          }
           dict = triton::bindings::python::xPyDict_New();
-          auto model = PyTritonContext_AsTritonContext(self)->getModel(PyAstNode_AsAstNode(node), &status, timeout_c, &solvingTime);
           for (auto it = model.begin(); it != model.end(); it++) {
             xPyDict_SetItem(dict, PyLong_FromUsize(it->first), PySolverModel(it->second));
           }
@@ -1461,8 +2141,14 @@ namespace triton {
         }
 
         try {
-          auto models = PyTritonContext_AsTritonContext(self)->getModels(PyAstNode_AsAstNode(node), PyLong_AsUint32(limit), &status, timeout_c, &solvingTime);
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          triton::uint32 climit = PyLong_AsUint32(limit);
+          std::vector<std::unordered_map<triton::usize, triton::engines::solver::SolverModel>> models;
           triton::uint32 index = 0;
+          {
+            TritonContext_NoGil nogil(self);
+            models = PyTritonContext_AsTritonContext(self)->getModels(cnode, climit, &status, timeout_c, &solvingTime);
+          }
 
           ret = xPyList_New(models.size());
           for (auto it = models.begin(); it != models.end(); it++) {
@@ -1637,6 +2323,89 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_getSessionModel(PyObject* self, PyObject* args, PyObject* kwargs) {
+        triton::engines::solver::status_e status;
+        triton::ast::SharedAbstractNode cnode = nullptr;
+        triton::uint32 solvingTime = 0;
+        triton::uint32 timeout_c = 0;
+
+        PyObject* dict    = nullptr;
+        PyObject* node    = nullptr;
+        PyObject* wb      = nullptr;
+        PyObject* timeout = nullptr;
+
+        static char* keywords[] = {
+          (char*)"node",
+          (char*)"status",
+          (char*)"timeout",
+          nullptr
+        };
+
+        /* Extract Keywords */
+        if (PyArg_ParseTupleAndKeywords(args, kwargs, "|OOO", keywords, &node, &wb, &timeout) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getSessionModel(): Invalid keyword argument.");
+        }
+
+        if (node != nullptr && node != Py_None && !PyAstNode_Check(node)) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getSessionModel(): Expects a AstNode or None as node argument.");
+        }
+
+        if (wb != nullptr && !PyBool_Check(wb)) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getSessionModel(): Expects a boolean as status keyword.");
+        }
+
+        if (timeout != nullptr && (!PyLong_Check(timeout) && !PyInt_Check(timeout))) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::getSessionModel(): Expects a integer as timeout keyword.");
+        }
+
+        if (node != nullptr && node != Py_None) {
+          cnode = PyAstNode_AsAstNode(node);
+        }
+
+        if (timeout != nullptr) {
+          timeout_c = PyLong_AsUint32(timeout);
+        }
+
+        try {
+          std::unordered_map<triton::usize, triton::engines::solver::SolverModel> model;
+          {
+            TritonContext_NoGil nogil(self);
+            model = PyTritonContext_AsTritonContext(self)->getSessionModel(cnode, &status, timeout_c, &solvingTime);
+          }
+          dict = triton::bindings::python::xPyDict_New();
+          for (auto it = model.begin(); it != model.end(); it++) {
+            xPyDict_SetItem(dict, PyLong_FromUsize(it->first), PySolverModel(it->second));
+          }
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        if (wb != nullptr && PyLong_AsBool(wb) == true) {
+          PyObject* tuple = triton::bindings::python::xPyTuple_New(3);
+          PyTuple_SetItem(tuple, 0, dict);
+          PyTuple_SetItem(tuple, 1, PyLong_FromUint32(status));
+          PyTuple_SetItem(tuple, 2, PyLong_FromUint32(solvingTime));
+          return tuple;
+        }
+
+        return dict;
+      }
+
+
+      static PyObject* TritonContext_getSizeOfSessionConstraints(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUsize(PyTritonContext_AsTritonContext(self)->getSizeOfSessionConstraints());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_getSolver(PyObject* self, PyObject* noarg) {
         try {
           return PyLong_FromUint32(PyTritonContext_AsTritonContext(self)->getSolver());
@@ -1650,6 +2419,61 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_getSolverPortfolioStats(PyObject* self, PyObject* noarg) {
+        try {
+          PyObject* ret = xPyDict_New();
+          for (const auto& item : PyTritonContext_AsTritonContext(self)->getSolverPortfolioStats()) {
+            PyObject* stats = xPyDict_New();
+            xPyDict_SetItemString(stats, "wins", PyLong_FromUsize(item.second.wins));
+            xPyDict_SetItemString(stats, "time", PyLong_FromUsize(item.second.time));
+            xPyDict_SetItem(ret, PyLong_FromUint32(item.first), stats);
+          }
+          return ret;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getSolverQueryCacheSize(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUsize(PyTritonContext_AsTritonContext(self)->getSolverQueryCacheSize());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getSolverQueryCacheStats(PyObject* self, PyObject* noarg) {
+        try {
+          auto stats = PyTritonContext_AsTritonContext(self)->getSolverQueryCacheStats();
+          PyObject* dict = xPyDict_New();
+          xPyDict_SetItemString(dict, "hits",            PyLong_FromUsize(stats.hits));
+          xPyDict_SetItemString(dict, "misses",          PyLong_FromUsize(stats.misses));
+          xPyDict_SetItemString(dict, "subsumed",        PyLong_FromUsize(stats.subsumed));
+          xPyDict_SetItemString(dict, "counterexamples", PyLong_FromUsize(stats.counterexamples));
+          xPyDict_SetItemString(dict, "entries",         PyLong_FromUsize(stats.entries));
+          xPyDict_SetItemString(dict, "evictions",       PyLong_FromUsize(stats.evictions));
+          return dict;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
+      static PyObject* TritonContext_getSolverWorkers(PyObject* self, PyObject* noarg) {
+        try {
+          return PyLong_FromUint32(PyTritonContext_AsTritonContext(self)->getSolverWorkers());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_getSymbolicExpression(PyObject* self, PyObject* symExprId) {
         if (!PyLong_Check(symExprId) && !PyInt_Check(symExprId))
           return PyErr_Format(PyExc_TypeError, "TritonContext::getSymbolicExpression(): Expects an integer as argument.");
@@ -1698,7 +2522,7 @@ namespace triton {
 
         try {
           if (addr == nullptr) {
-            auto regs = PyTritonContext_AsTritonContext(self)->getSymbolicMemory();
+            const auto& regs = PyTritonContext_AsTritonContext(self)->getSymbolicMemory();
 
             ret = xPyDict_New();
             for (auto it = regs.begin(); it != regs.end(); it++) {
@@ -1840,7 +2664,7 @@ namespace triton {
         triton::usize size = 0, index = 0;
 
         try {
-          std::unordered_set<triton::uint64> addresses = PyTritonContext_AsTritonContext(self)->getTaintedMemory();
+          const std::unordered_set<triton::uint64>& addresses = PyTritonContext_AsTritonContext(self)->getTaintedMemory();
 
           size = addresses.size();
           ret = xPyList_New(size);
@@ -1981,6 +2805,21 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_isHooked(PyObject* self, PyObject* addr) {
+        if (!PyLong_Check(addr) && !PyInt_Check(addr))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::isHooked(): Expects an integer as argument.");
+
+        try {
+          if (PyTritonContext_AsTritonContext(self)->isHooked(PyLong_AsUint64(addr)) == true)
+            Py_RETURN_TRUE;
+          Py_RETURN_FALSE;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_isMemorySymbolized(PyObject* self, PyObject* mem) {
         try {
           if (PyMemoryAccess_Check(mem)) {
@@ -2110,7 +2949,13 @@ namespace triton {
           return PyErr_Format(PyExc_TypeError, "TritonContext::isSat(): Expects a AstNode as argument.");
 
         try {
-          if (PyTritonContext_AsTritonContext(self)->isSat(PyAstNode_AsAstNode(node)) == true)
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          bool sat = false;
+          {
+            TritonContext_NoGil nogil(self);
+            sat = PyTritonContext_AsTritonContext(self)->isSat(cnode);
+          }
+          if (sat == true)
             Py_RETURN_TRUE;
           Py_RETURN_FALSE;
         }
@@ -2123,6 +2968,88 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_isSessionSat(PyObject* self, PyObject* args, PyObject* kwargs) {
+        triton::engines::solver::status_e status;
+        triton::ast::SharedAbstractNode cnode = nullptr;
+        triton::uint32 solvingTime = 0;
+        triton::uint32 timeout_c = 0;
+
+        PyObject* sat     = nullptr;
+        PyObject* node    = nullptr;
+        PyObject* wb      = nullptr;
+        PyObject* timeout = nullptr;
+
+        static char* keywords[] = {
+          (char*)"node",
+          (char*)"status",
+          (char*)"timeout",
+          nullptr
+        };
+
+        /* Extract Keywords */
+        if (PyArg_ParseTupleAndKeywords(args, kwargs, "|OOO", keywords, &node, &wb, &timeout) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::isSessionSat(): Invalid keyword argument.");
+        }
+
+        if (node != nullptr && node != Py_None && !PyAstNode_Check(node)) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::isSessionSat(): Expects a AstNode or None as node argument.");
+        }
+
+        if (wb != nullptr && !PyBool_Check(wb)) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::isSessionSat(): Expects a boolean as status keyword.");
+        }
+
+        if (timeout != nullptr && (!PyLong_Check(timeout) && !PyInt_Check(timeout))) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::isSessionSat(): Expects a integer as timeout keyword.");
+        }
+
+        if (node != nullptr && node != Py_None) {
+          cnode = PyAstNode_AsAstNode(node);
+        }
+
+        if (timeout != nullptr) {
+          timeout_c = PyLong_AsUint32(timeout);
+        }
+
+        try {
+          bool csat = false;
+          {
+            TritonContext_NoGil nogil(self);
+            csat = PyTritonContext_AsTritonContext(self)->isSessionSat(cnode, &status, timeout_c, &solvingTime);
+          }
+          sat = PyBool_FromLong(csat);
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        if (wb != nullptr && PyLong_AsBool(wb) == true) {
+          PyObject* tuple = triton::bindings::python::xPyTuple_New(3);
+          PyTuple_SetItem(tuple, 0, sat);
+          PyTuple_SetItem(tuple, 1, PyLong_FromUint32(status));
+          PyTuple_SetItem(tuple, 2, PyLong_FromUint32(solvingTime));
+          return tuple;
+        }
+
+        return sat;
+      }
+
+
+      static PyObject* TritonContext_isSolverIndependenceEnabled(PyObject* self, PyObject* noarg) {
+        try {
+          if (PyTritonContext_AsTritonContext(self)->isSolverIndependenceEnabled() == true)
+            Py_RETURN_TRUE;
+          Py_RETURN_FALSE;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_isSymbolicExpressionExists(PyObject* self, PyObject* symExprId) {
         if (!PyInt_Check(symExprId) && !PyLong_Check(symExprId))
           return PyErr_Format(PyExc_TypeError, "TritonContext::isSymbolicExpressionExists(): Expects an integer as argument.");
@@ -2236,11 +3163,17 @@ namespace triton {
 
         try {
           std::ostringstream stream;
+          std::string cfname = PyStr_AsString(fname);
+          bool coptimize = PyLong_AsBool(optimize);
           if (PySymbolicExpression_Check(node)) {
-            PyTritonContext_AsTritonContext(self)->liftToLLVM(stream, PySymbolicExpression_AsSymbolicExpression(node), PyStr_AsString(fname), PyLong_AsBool(optimize));
+            triton::engines::symbolic::SharedSymbolicExpression expr = PySymbolicExpression_AsSymbolicExpression(node);
+            TritonContext_NoGil nogil(self);
+            PyTritonContext_AsTritonContext(self)->liftToLLVM(stream, expr, cfname.c_str(), coptimize);
           }
           else {
-            PyTritonContext_AsTritonContext(self)->liftToLLVM(stream, PyAstNode_AsAstNode(node), PyStr_AsString(fname), PyLong_AsBool(optimize));
+            triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+            TritonContext_NoGil nogil(self);
+            PyTritonContext_AsTritonContext(self)->liftToLLVM(stream, cnode, cfname.c_str(), coptimize);
           }
           return xPyString_FromString(stream.str().c_str());
         }
@@ -2346,6 +3279,63 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_mapConcreteMemoryFile(PyObject* self, PyObject* args, PyObject* kwargs) {
+        PyObject* path      = nullptr;
+        PyObject* offset    = nullptr;
+        PyObject* addr      = nullptr;
+        PyObject* size      = nullptr;
+        PyObject* writable  = nullptr;
+
+        static char* keywords[] = {
+          (char*)"path",
+          (char*)"offset",
+          (char*)"addr",
+          (char*)"size",
+          (char*)"writable",
+          nullptr
+        };
+
+        /* Extract keywords */
+        if (PyArg_ParseTupleAndKeywords(args, kwargs, "|OOOOO", keywords, &path, &offset, &addr, &size, &writable) == false) {
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Invalid number of arguments");
+        }
+
+        if (path == nullptr || !PyStr_Check(path))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Expects a string as path argument.");
+
+        if (offset == nullptr || (!PyLong_Check(offset) && !PyInt_Check(offset)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Expects an integer as offset argument.");
+
+        if (addr == nullptr || (!PyLong_Check(addr) && !PyInt_Check(addr)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Expects an integer as addr argument.");
+
+        if (size == nullptr || (!PyLong_Check(size) && !PyInt_Check(size)))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Expects an integer as size argument.");
+
+        if (writable != nullptr && !PyBool_Check(writable))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::mapConcreteMemoryFile(): Expects a boolean as writable argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->mapConcreteMemoryFile(
+            PyStr_AsString(path),
+            PyLong_AsUint64(offset),
+            PyLong_AsUint64(addr),
+            PyLong_AsUsize(size),
+            writable != nullptr ? PyLong_AsBool(writable) : false
+          );
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_newSymbolicExpression(PyObject* self, PyObject* args) {
         PyObject* node          = nullptr;
         PyObject* comment       = nullptr;
@@ -2408,6 +3398,32 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_parseSmt(PyObject* self, PyObject* script) {
+        PyObject* ret = nullptr;
+
+        if (!PyStr_Check(script))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::parseSmt(): Expects a string as argument.");
+
+        try {
+          std::istringstream stream(PyStr_AsString(script));
+          auto nodes = PyTritonContext_AsTritonContext(self)->parseSmt(stream);
+          ret = xPyList_New(nodes.size());
+
+          triton::uint32 index = 0;
+          for (auto&& node : nodes)
+            PyList_SetItem(ret, index++, PyAstNode(node));
+
+          return ret;
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_popPathConstraint(PyObject* self, PyObject* noarg) {
         try {
           PyTritonContext_AsTritonContext(self)->popPathConstraint();
@@ -2423,6 +3439,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_popSessionConstraint(PyObject* self, PyObject* noarg) {
+        try {
+          PyTritonContext_AsTritonContext(self)->popSessionConstraint();
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_processing(PyObject* self, PyObject* args) {
         PyObject* obj  = nullptr;
         PyObject* addr = nullptr;
@@ -2494,6 +3526,27 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_pushSessionConstraint(PyObject* self, PyObject* node) {
+        if (!PyAstNode_Check(node))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::pushSessionConstraint(): Expects an AstNode as argument.");
+
+        try {
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          TritonContext_NoGil nogil(self);
+          PyTritonContext_AsTritonContext(self)->pushSessionConstraint(cnode);
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_removeCallback(PyObject* self, PyObject* args) {
         PyObject* cb       = nullptr;
         PyObject* cb_self  = nullptr;
@@ -2522,6 +3575,9 @@ namespace triton {
 
         try {
           switch (static_cast<triton::callbacks::callback_e>(PyLong_AsUint32(mode))) {
+            case callbacks::GET_CONCRETE_MEMORY_AREA_VALUE:
+              PyTritonContext_AsTritonContext(self)->removeCallback(callbacks::GET_CONCRETE_MEMORY_AREA_VALUE, callbacks::getConcreteMemoryAreaValueCallback(nullptr, cb));
+              break;
             case callbacks::GET_CONCRETE_MEMORY_VALUE:
               PyTritonContext_AsTritonContext(self)->removeCallback(callbacks::GET_CONCRETE_MEMORY_VALUE, callbacks::getConcreteMemoryValueCallback(nullptr, cb));
               break;
@@ -2558,6 +3614,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_removeHook(PyObject* self, PyObject* addr) {
+        if (!PyLong_Check(addr) && !PyInt_Check(addr))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::removeHook(): Expects an integer as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->removeHook(PyLong_AsUint64(addr));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_reset(PyObject* self, PyObject* noarg) {
         try {
           PyTritonContext_AsTritonContext(self)->reset();
@@ -2574,6 +3646,51 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_restore(PyObject* self, PyObject* snap) {
+        if (!PySnapshot_Check(snap))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::restore(): Expects a Snapshot as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->restore(*PySnapshot_AsSnapshot(snap));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* TritonContext_restoreRegisterState(PyObject* self, PyObject* state) {
+        if (!PyRegisterState_Check(state))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::restoreRegisterState(): Expects a RegisterState as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->restoreRegisterState(*PyRegisterState_AsRegisterState(state));
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
+      static PyObject* TritonContext_saveRegisterState(PyObject* self, PyObject* noarg) {
+        try {
+          return PyRegisterState(PyTritonContext_AsTritonContext(self)->saveRegisterState());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_setArchitecture(PyObject* self, PyObject* arg) {
         if (!PyLong_Check(arg) && !PyInt_Check(arg))
           return PyErr_Format(PyExc_TypeError, "TritonContext::setArchitecture(): Expects an ARCH as argument.");
@@ -2614,10 +3731,30 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_setConcreteMemoryBackend(PyObject* self, PyObject* arg) {
+        if (!PyLong_Check(arg) && !PyInt_Check(arg))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::setConcreteMemoryBackend(): Expects a MEMORY_BACKEND as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->setConcreteMemoryBackend(static_cast<triton::arch::memory_backend_e>(PyLong_AsUint32(arg)));
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_setConcreteMemoryAreaValue(PyObject* self, PyObject* args) {
         std::vector<triton::uint8> vv;
         PyObject* baseAddr  = nullptr;
         PyObject* values    = nullptr;
+        Py_buffer view;
 
         /* Extract arguments */
         if (PyArg_ParseTuple(args, "|OO", &baseAddr, &values) == false) {
@@ -2632,6 +3769,7 @@ namespace triton {
 
         // Python object: List
         if (PyList_Check(values)) {
+          vv.reserve(PyList_Size(values));
           for (Py_ssize_t i = 0; i < PyList_Size(values); i++) {
             PyObject* item = PyList_GetItem(values, i);
 
@@ -2652,41 +3790,27 @@ namespace triton {
           }
         }
 
-        // Python object: Bytes
-        else if (PyBytes_Check(values)) {
-          triton::uint8* area = reinterpret_cast<triton::uint8*>(PyBytes_AsString(values));
-          triton::usize  size = static_cast<triton::usize>(PyBytes_Size(values));
-
+        // Python object: Any contiguous bytes-like object (bytes, bytearray, memoryview, array, ...)
+        else if (PyObject_CheckBuffer(values) && PyObject_GetBuffer(values, &view, PyBUF_C_CONTIGUOUS) == 0) {
           try {
-            PyTritonContext_AsTritonContext(self)->setConcreteMemoryAreaValue(PyLong_AsUint64(baseAddr), area, size);
-          }
-          catch (const triton::exceptions::PyCallbacks&) {
-            return nullptr;
-          }
-          catch (const triton::exceptions::Exception& e) {
-            return PyErr_Format(PyExc_TypeError, "%s", e.what());
-          }
-        }
-
-        // Python object: ByteArray
-        else if (PyByteArray_Check(values)) {
-          triton::uint8* area = reinterpret_cast<triton::uint8*>(PyByteArray_AsString(values));
-          triton::usize  size = static_cast<triton::usize>(PyByteArray_Size(values));
-
-          try {
-            PyTritonContext_AsTritonContext(self)->setConcreteMemoryAreaValue(PyLong_AsUint64(baseAddr), area, size);
+            PyTritonContext_AsTritonContext(self)->setConcreteMemoryAreaValue(PyLong_AsUint64(baseAddr), static_cast<const triton::uint8*>(view.buf), static_cast<triton::usize>(view.len));
           }
           catch (const triton::exceptions::PyCallbacks&) {
+            PyBuffer_Release(&view);
             return nullptr;
           }
           catch (const triton::exceptions::Exception& e) {
+            PyBuffer_Release(&view);
             return PyErr_Format(PyExc_TypeError, "%s", e.what());
           }
+          PyBuffer_Release(&view);
         }
 
         // Invalid Python object
-        else
+        else {
+          PyErr_Clear();
           return PyErr_Format(PyExc_TypeError, "TritonContext::setConcreteMemoryAreaValue(): Expects a list or bytes as second argument.");
+        }
 
         Py_INCREF(Py_None);
         return Py_None;
@@ -2811,6 +3935,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_setDisassemblyCacheSize(PyObject* self, PyObject* size) {
+        if (!PyLong_Check(size) && !PyInt_Check(size))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::setDisassemblyCacheSize(): Expects an integer as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->setDisassemblyCacheSize(PyLong_AsUsize(size));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_setMode(PyObject* self, PyObject* args) {
         PyObject* mode = nullptr;
         PyObject* flag = nullptr;
@@ -2857,6 +3997,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_setSolverIndependence(PyObject* self, PyObject* flag) {
+        if (flag == nullptr || !PyBool_Check(flag))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::setSolverIndependence(): Expects a boolean as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->setSolverIndependence(PyLong_AsBool(flag));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_setSolverMemoryLimit(PyObject* self, PyObject* megabytes) {
         if (megabytes == nullptr || (!PyLong_Check(megabytes) && !PyInt_Check(megabytes)))
           return PyErr_Format(PyExc_TypeError, "TritonContext::setSolverMemoryLimit(): Expects an integer as argument.");
@@ -2873,6 +4029,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_setSolverQueryCacheSize(PyObject* self, PyObject* size) {
+        if (!PyLong_Check(size) && !PyInt_Check(size))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::setSolverQueryCacheSize(): Expects an integer as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->setSolverQueryCacheSize(PyLong_AsUsize(size));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_setSolverTimeout(PyObject* self, PyObject* ms) {
         if (ms == nullptr || (!PyLong_Check(ms) && !PyInt_Check(ms)))
           return PyErr_Format(PyExc_TypeError, "TritonContext::setSolverTimeout(): Expects an integer as argument.");
@@ -2889,6 +4061,22 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_setSolverWorkers(PyObject* self, PyObject* workers) {
+        if (!PyLong_Check(workers) && !PyInt_Check(workers))
+          return PyErr_Format(PyExc_TypeError, "TritonContext::setSolverWorkers(): Expects an integer as argument.");
+
+        try {
+          PyTritonContext_AsTritonContext(self)->setSolverWorkers(PyLong_AsUint32(workers));
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_setTaintMemory(PyObject* self, PyObject* args) {
         PyObject* mem  = nullptr;
         PyObject* flag = nullptr;
@@ -3004,8 +4192,21 @@ namespace triton {
           padding = PyLong_FromUint32(false);
 
         try {
-          if (PyAstNode_Check(obj))
-            return PyAstNode(PyTritonContext_AsTritonContext(self)->simplify(PyAstNode_AsAstNode(obj), PyLong_AsBool(solver), PyLong_AsBool(llvm)));
+          if (PyAstNode_Check(obj)) {
+            triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(obj);
+            bool csolver = PyLong_AsBool(solver);
+            bool cllvm = PyLong_AsBool(llvm);
+
+            /* Only the simplifications via a solver or LLVM may take long */
+            if (csolver || cllvm) {
+              TritonContext_NoGil nogil(self);
+              cnode = PyTritonContext_AsTritonContext(self)->simplify(cnode, csolver, cllvm);
+            }
+            else {
+              cnode = PyTritonContext_AsTritonContext(self)->simplify(cnode, csolver, cllvm);
+            }
+            return PyAstNode(cnode);
+          }
 
           else if (PyBasicBlock_Check(obj))
             return PyBasicBlock(PyTritonContext_AsTritonContext(self)->simplify(*PyBasicBlock_AsBasicBlock(obj), PyLong_AsBool(padding)));
@@ -3046,6 +4247,16 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_snapshot(PyObject* self, PyObject* noarg) {
+        try {
+          return PySnapshot(PyTritonContext_AsTritonContext(self)->snapshot());
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+      }
+
+
       static PyObject* TritonContext_symbolizeExpression(PyObject* self, PyObject* args) {
         PyObject* exprId        = nullptr;
         PyObject* symVarSize    = nullptr;
@@ -3143,6 +4354,23 @@ namespace triton {
       }
 
 
+      static PyObject* TritonContext_syncSessionConstraints(PyObject* self, PyObject* noarg) {
+        try {
+          TritonContext_NoGil nogil(self);
+          PyTritonContext_AsTritonContext(self)->syncSessionConstraints();
+        }
+        catch (const triton::exceptions::PyCallbacks&) {
+          return nullptr;
+        }
+        catch (const triton::exceptions::Exception& e) {
+          return PyErr_Format(PyExc_TypeError, "%s", e.what());
+        }
+
+        Py_INCREF(Py_None);
+        return Py_None;
+      }
+
+
       static PyObject* TritonContext_synthesize(PyObject* self, PyObject* args, PyObject* kwargs) {
         PyObject* node     = nullptr;
         PyObject* constant = nullptr;
@@ -3184,7 +4412,15 @@ namespace triton {
           opaque = PyLong_FromUint32(false);
 
         try {
-          auto result = PyTritonContext_AsTritonContext(self)->synthesize(PyAstNode_AsAstNode(node), PyLong_AsBool(constant), PyLong_AsBool(subexpr), PyLong_AsBool(opaque));
+          triton::ast::SharedAbstractNode cnode = PyAstNode_AsAstNode(node);
+          bool cconstant = PyLong_AsBool(constant);
+          bool csubexpr = PyLong_AsBool(subexpr);
+          bool copaque = PyLong_AsBool(opaque);
+          triton::engines::synthesis::SynthesisResult result;
+          {
+            TritonContext_NoGil nogil(self);
+            result = PyTritonContext_AsTritonContext(self)->synthesize(cnode, cconstant, csubexpr, copaque);
+          }
           if (result.successful()) {
             return PyAstNode(result.getOutput());
           }
@@ -3426,108 +4662,143 @@ namespace triton {
 
       //! TritonContext methods.
       PyMethodDef TritonContext_callbacks[] = {
-        {"addCallback",                         (PyCFunction)TritonContext_addCallback,                                         METH_VARARGS,                  ""},
-        {"assignSymbolicExpressionToMemory",    (PyCFunction)TritonContext_assignSymbolicExpressionToMemory,                    METH_VARARGS,                  ""},
-        {"assignSymbolicExpressionToRegister",  (PyCFunction)TritonContext_assignSymbolicExpressionToRegister,                  METH_VARARGS,                  ""},
-        {"buildSemantics",                      (PyCFunction)TritonContext_buildSemantics,                                      METH_O,                        ""},
-        {"clearCallbacks",                      (PyCFunction)TritonContext_clearCallbacks,                                      METH_NOARGS,                   ""},
-        {"clearModes",                          (PyCFunction)TritonContext_clearModes,                                          METH_NOARGS,                   ""},
-        {"clearConcreteMemoryValue",            (PyCFunction)TritonContext_clearConcreteMemoryValue,                            METH_VARARGS,                  ""},
-        {"clearPathConstraints",                (PyCFunction)TritonContext_clearPathConstraints,                                METH_NOARGS,                   ""},
-        {"concretizeAllMemory",                 (PyCFunction)TritonContext_concretizeAllMemory,                                 METH_NOARGS,                   ""},
-        {"concretizeAllRegister",               (PyCFunction)TritonContext_concretizeAllRegister,                               METH_NOARGS,                   ""},
-        {"concretizeMemory",                    (PyCFunction)TritonContext_concretizeMemory,                                    METH_O,                        ""},
-        {"concretizeRegister",                  (PyCFunction)TritonContext_concretizeRegister,                                  METH_O,                        ""},
-        {"createSymbolicMemoryExpression",      (PyCFunction)TritonContext_createSymbolicMemoryExpression,                      METH_VARARGS,                  ""},
-        {"createSymbolicRegisterExpression",    (PyCFunction)TritonContext_createSymbolicRegisterExpression,                    METH_VARARGS,                  ""},
-        {"createSymbolicVolatileExpression",    (PyCFunction)TritonContext_createSymbolicVolatileExpression,                    METH_VARARGS,                  ""},
-        {"disassembly",                         (PyCFunction)TritonContext_disassembly,                                         METH_VARARGS,                  ""},
-        {"evaluateAstViaSolver",                (PyCFunction)TritonContext_evaluateAstViaSolver,                                METH_O,                        ""},
-        {"getAllRegisters",                     (PyCFunction)TritonContext_getAllRegisters,                                     METH_NOARGS,                   ""},
-        {"getArchitecture",                     (PyCFunction)TritonContext_getArchitecture,                                     METH_NOARGS,                   ""},
-        {"getAstContext",                       (PyCFunction)TritonContext_getAstContext,                                       METH_NOARGS,                   ""},
-        {"getAstRepresentationMode",            (PyCFunction)TritonContext_getAstRepresentationMode,                            METH_NOARGS,                   ""},
-        {"getConcreteMemoryAreaValue",          (PyCFunction)TritonContext_getConcreteMemoryAreaValue,                          METH_VARARGS,                  ""},
-        {"getConcreteMemoryValue",              (PyCFunction)TritonContext_getConcreteMemoryValue,                              METH_O,                        ""},
-        {"getConcreteRegisterValue",            (PyCFunction)TritonContext_getConcreteRegisterValue,                            METH_O,                        ""},
-        {"getConcreteVariableValue",            (PyCFunction)TritonContext_getConcreteVariableValue,                            METH_O,                        ""},
-        {"getGprBitSize",                       (PyCFunction)TritonContext_getGprBitSize,                                       METH_NOARGS,                   ""},
-        {"getGprSize",                          (PyCFunction)TritonContext_getGprSize,                                          METH_NOARGS,                   ""},
-        {"getImmediateAst",                     (PyCFunction)TritonContext_getImmediateAst,                                     METH_O,                        ""},
-        {"getMemoryAst",                        (PyCFunction)TritonContext_getMemoryAst,                                        METH_O,                        ""},
-        {"getModel",                            (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_getModel,            METH_VARARGS | METH_KEYWORDS,  ""},
-        {"getModels",                           (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_getModels,           METH_VARARGS | METH_KEYWORDS,  ""},
-        {"getParentRegister",                   (PyCFunction)TritonContext_getParentRegister,                                   METH_O,                        ""},
-        {"getParentRegisters",                  (PyCFunction)TritonContext_getParentRegisters,                                  METH_NOARGS,                   ""},
-        {"getPathConstraints",                  (PyCFunction)TritonContext_getPathConstraints,                                  METH_NOARGS,                   ""},
-        {"getPathPredicate",                    (PyCFunction)TritonContext_getPathPredicate,                                    METH_NOARGS,                   ""},
-        {"getPathPredicateSize",                (PyCFunction)TritonContext_getPathPredicateSize,                                METH_NOARGS,                   ""},
-        {"getPredicatesToReachAddress",         (PyCFunction)TritonContext_getPredicatesToReachAddress,                         METH_O,                        ""},
-        {"getRegister",                         (PyCFunction)TritonContext_getRegister,                                         METH_O,                        ""},
-        {"getRegisterAst",                      (PyCFunction)TritonContext_getRegisterAst,                                      METH_O,                        ""},
-        {"getSolver",                           (PyCFunction)TritonContext_getSolver,                                           METH_NOARGS,                   ""},
-        {"getSymbolicExpression",               (PyCFunction)TritonContext_getSymbolicExpression,                               METH_O,                        ""},
-        {"getSymbolicExpressions",              (PyCFunction)TritonContext_getSymbolicExpressions,                              METH_NOARGS,                   ""},
-        {"getSymbolicMemory",                   (PyCFunction)TritonContext_getSymbolicMemory,                                   METH_VARARGS,                  ""},
-        {"getSymbolicMemoryValue",              (PyCFunction)TritonContext_getSymbolicMemoryValue,                              METH_O,                        ""},
-        {"getSymbolicRegister",                 (PyCFunction)TritonContext_getSymbolicRegister,                                 METH_O,                        ""},
-        {"getSymbolicRegisterValue",            (PyCFunction)TritonContext_getSymbolicRegisterValue,                            METH_O,                        ""},
-        {"getSymbolicRegisters",                (PyCFunction)TritonContext_getSymbolicRegisters,                                METH_NOARGS,                   ""},
-        {"getSymbolicVariable",                 (PyCFunction)TritonContext_getSymbolicVariable,                                 METH_O,                        ""},
-        {"getSymbolicVariables",                (PyCFunction)TritonContext_getSymbolicVariables,                                METH_NOARGS,                   ""},
-        {"getTaintedMemory",                    (PyCFunction)TritonContext_getTaintedMemory,                                    METH_NOARGS,                   ""},
-        {"getTaintedRegisters",                 (PyCFunction)TritonContext_getTaintedRegisters,                                 METH_NOARGS,                   ""},
-        {"getTaintedSymbolicExpressions",       (PyCFunction)TritonContext_getTaintedSymbolicExpressions,                       METH_NOARGS,                   ""},
-        {"isArchitectureValid",                 (PyCFunction)TritonContext_isArchitectureValid,                                 METH_NOARGS,                   ""},
-        {"isConcreteMemoryValueDefined",        (PyCFunction)TritonContext_isConcreteMemoryValueDefined,                        METH_VARARGS,                  ""},
-        {"isFlag",                              (PyCFunction)TritonContext_isFlag,                                              METH_O,                        ""},
-        {"isMemorySymbolized",                  (PyCFunction)TritonContext_isMemorySymbolized,                                  METH_O,                        ""},
-        {"isMemoryTainted",                     (PyCFunction)TritonContext_isMemoryTainted,                                     METH_O,                        ""},
-        {"isModeEnabled",                       (PyCFunction)TritonContext_isModeEnabled,                                       METH_O,                        ""},
-        {"isRegister",                          (PyCFunction)TritonContext_isRegister,                                          METH_O,                        ""},
-        {"isRegisterSymbolized",                (PyCFunction)TritonContext_isRegisterSymbolized,                                METH_O,                        ""},
-        {"isRegisterTainted",                   (PyCFunction)TritonContext_isRegisterTainted,                                   METH_O,                        ""},
-        {"isRegisterValid",                     (PyCFunction)TritonContext_isRegisterValid,                                     METH_O,                        ""},
-        {"isSat",                               (PyCFunction)TritonContext_isSat,                                               METH_O,                        ""},
-        {"isSymbolicExpressionExists",          (PyCFunction)TritonContext_isSymbolicExpressionExists,                          METH_O,                        ""},
-        {"isThumb",                             (PyCFunction)TritonContext_isThumb,                                             METH_NOARGS,                   ""},
-        {"liftToDot",                           (PyCFunction)TritonContext_liftToDot,                                           METH_O,                        ""},
-        {"liftToLLVM",                          (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_liftToLLVM,          METH_VARARGS | METH_KEYWORDS,  ""},
-        {"liftToPython",                        (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_liftToPython,        METH_VARARGS | METH_KEYWORDS,  ""},
-        {"liftToSMT",                           (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_liftToSMT,           METH_VARARGS | METH_KEYWORDS,  ""},
-        {"newSymbolicExpression",               (PyCFunction)TritonContext_newSymbolicExpression,                               METH_VARARGS,                  ""},
-        {"newSymbolicVariable",                 (PyCFunction)TritonContext_newSymbolicVariable,                                 METH_VARARGS,                  ""},
-        {"popPathConstraint",                   (PyCFunction)TritonContext_popPathConstraint,                                   METH_NOARGS,                   ""},
-        {"processing",                          (PyCFunction)TritonContext_processing,                                          METH_VARARGS,                  ""},
-        {"pushPathConstraint",                  (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_pushPathConstraint,  METH_VARARGS | METH_KEYWORDS,  ""},
-        {"removeCallback",                      (PyCFunction)TritonContext_removeCallback,                                      METH_VARARGS,                  ""},
-        {"reset",                               (PyCFunction)TritonContext_reset,                                               METH_NOARGS,                   ""},
-        {"setArchitecture",                     (PyCFunction)TritonContext_setArchitecture,                                     METH_O,                        ""},
-        {"setAstRepresentationMode",            (PyCFunction)TritonContext_setAstRepresentationMode,                            METH_O,                        ""},
-        {"setConcreteMemoryAreaValue",          (PyCFunction)TritonContext_setConcreteMemoryAreaValue,                          METH_VARARGS,                  ""},
-        {"setConcreteMemoryValue",              (PyCFunction)TritonContext_setConcreteMemoryValue,                              METH_VARARGS,                  ""},
-        {"setConcreteRegisterValue",            (PyCFunction)TritonContext_setConcreteRegisterValue,                            METH_VARARGS,                  ""},
-        {"setConcreteVariableValue",            (PyCFunction)TritonContext_setConcreteVariableValue,                            METH_VARARGS,                  ""},
-        {"setMode",                             (PyCFunction)TritonContext_setMode,                                             METH_VARARGS,                  ""},
-        {"setSolver",                           (PyCFunction)TritonContext_setSolver,                                           METH_O,                        ""},
-        {"setSolverMemoryLimit",                (PyCFunction)TritonContext_setSolverMemoryLimit,                                METH_O,                        ""},
-        {"setSolverTimeout",                    (PyCFunction)TritonContext_setSolverTimeout,                                    METH_O,                        ""},
-        {"setTaintMemory",                      (PyCFunction)TritonContext_setTaintMemory,                                      METH_VARARGS,                  ""},
-        {"setTaintRegister",                    (PyCFunction)TritonContext_setTaintRegister,                                    METH_VARARGS,                  ""},
-        {"setThumb",                            (PyCFunction)TritonContext_setThumb,                                            METH_O,                        ""},
-        {"simplify",                            (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_simplify,            METH_VARARGS | METH_KEYWORDS,  ""},
-        {"sliceExpressions",                    (PyCFunction)TritonContext_sliceExpressions,                                    METH_O,                        ""},
-        {"symbolizeExpression",                 (PyCFunction)TritonContext_symbolizeExpression,                                 METH_VARARGS,                  ""},
-        {"symbolizeMemory",                     (PyCFunction)TritonContext_symbolizeMemory,                                     METH_VARARGS,                  ""},
-        {"symbolizeRegister",                   (PyCFunction)TritonContext_symbolizeRegister,                                   METH_VARARGS,                  ""},
-        {"synthesize",                          (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_synthesize,          METH_VARARGS | METH_KEYWORDS,  ""},
-        {"taintAssignment",                     (PyCFunction)TritonContext_taintAssignment,                                     METH_VARARGS,                  ""},
-        {"taintMemory",                         (PyCFunction)TritonContext_taintMemory,                                         METH_O,                        ""},
-        {"taintRegister",                       (PyCFunction)TritonContext_taintRegister,                                       METH_O,                        ""},
-        {"taintUnion",                          (PyCFunction)TritonContext_taintUnion,                                          METH_VARARGS,                  ""},
-        {"untaintMemory",                       (PyCFunction)TritonContext_untaintMemory,                                       METH_O,                        ""},
-        {"untaintRegister",                     (PyCFunction)TritonContext_untaintRegister,                                     METH_O,                        ""},
-        {nullptr,                               nullptr,                                                                        0,                             nullptr}
+        {"addCallback",                         (PyCFunction)TritonContext_locked<TritonContext_addCallback>,                                            METH_VARARGS,                  ""},
+        {"addHook",                             (PyCFunction)TritonContext_locked<TritonContext_addHook>,                                                METH_VARARGS,                  ""},
+        {"assignSymbolicExpressionToMemory",    (PyCFunction)TritonContext_locked<TritonContext_assignSymbolicExpressionToMemory>,                       METH_VARARGS,                  ""},
+        {"assignSymbolicExpressionToRegister",  (PyCFunction)TritonContext_locked<TritonContext_assignSymbolicExpressionToRegister>,                     METH_VARARGS,                  ""},
+        {"buildSemantics",                      (PyCFunction)TritonContext_locked<TritonContext_buildSemantics>,                                         METH_O,                        ""},
+        {"clearCallbacks",                      (PyCFunction)TritonContext_locked<TritonContext_clearCallbacks>,                                         METH_NOARGS,                   ""},
+        {"clearDisassemblyCache",               (PyCFunction)TritonContext_locked<TritonContext_clearDisassemblyCache>,                                  METH_NOARGS,                   ""},
+        {"clearHooks",                          (PyCFunction)TritonContext_locked<TritonContext_clearHooks>,                                             METH_NOARGS,                   ""},
+        {"clearModes",                          (PyCFunction)TritonContext_locked<TritonContext_clearModes>,                                             METH_NOARGS,                   ""},
+        {"clearConcreteMemoryValue",            (PyCFunction)TritonContext_locked<TritonContext_clearConcreteMemoryValue>,                               METH_VARARGS,                  ""},
+        {"clearPathConstraints",                (PyCFunction)TritonContext_locked<TritonContext_clearPathConstraints>,                                   METH_NOARGS,                   ""},
+        {"clearSessionConstraints",             (PyCFunction)TritonContext_locked<TritonContext_clearSessionConstraints>,                                METH_NOARGS,                   ""},
+        {"clearSolverQueryCache",               (PyCFunction)TritonContext_locked<TritonContext_clearSolverQueryCache>,                                  METH_NOARGS,                   ""},
+        {"concretizeAllMemory",                 (PyCFunction)TritonContext_locked<TritonContext_concretizeAllMemory>,                                    METH_NOARGS,                   ""},
+        {"concretizeAllRegister",               (PyCFunction)TritonContext_locked<TritonContext_concretizeAllRegister>,                                  METH_NOARGS,                   ""},
+        {"concretizeMemory",                    (PyCFunction)TritonContext_locked<TritonContext_concretizeMemory>,                                       METH_O,                        ""},
+        {"concretizeRegister",                  (PyCFunction)TritonContext_locked<TritonContext_concretizeRegister>,                                     METH_O,                        ""},
+        {"createSymbolicMemoryExpression",      (PyCFunction)TritonContext_locked<TritonContext_createSymbolicMemoryExpression>,                         METH_VARARGS,                  ""},
+        {"createSymbolicRegisterExpression",    (PyCFunction)TritonContext_locked<TritonContext_createSymbolicRegisterExpression>,                       METH_VARARGS,                  ""},
+        {"createSymbolicVolatileExpression",    (PyCFunction)TritonContext_locked<TritonContext_createSymbolicVolatileExpression>,                       METH_VARARGS,                  ""},
+        {"disassembly",                         (PyCFunction)TritonContext_locked<TritonContext_disassembly>,                                            METH_VARARGS,                  ""},
+        {"emulate",                             (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_emulate,                                      METH_VARARGS | METH_KEYWORDS,  ""},
+        {"evaluateAstBatch",                    (PyCFunction)TritonContext_evaluateAstBatch,                                                             METH_VARARGS,                  ""},
+        {"evaluateAstViaSolver",                (PyCFunction)TritonContext_evaluateAstViaSolver,                                                         METH_O,                        ""},
+        {"getAllRegisters",                     (PyCFunction)TritonContext_locked<TritonContext_getAllRegisters>,                                        METH_NOARGS,                   ""},
+        {"getArchitecture",                     (PyCFunction)TritonContext_locked<TritonContext_getArchitecture>,                                        METH_NOARGS,                   ""},
+        {"getAstContext",                       (PyCFunction)TritonContext_locked<TritonContext_getAstContext>,                                          METH_NOARGS,                   ""},
+        {"getAstRepresentationMode",            (PyCFunction)TritonContext_locked<TritonContext_getAstRepresentationMode>,                               METH_NOARGS,                   ""},
+        {"getConcreteMemoryAreaValue",          (PyCFunction)TritonContext_locked<TritonContext_getConcreteMemoryAreaValue>,                             METH_VARARGS,                  ""},
+        {"getConcreteMemoryAreaValueInto",      (PyCFunction)TritonContext_locked<TritonContext_getConcreteMemoryAreaValueInto>,                         METH_VARARGS,                  ""},
+        {"getConcreteMemoryBackend",            (PyCFunction)TritonContext_locked<TritonContext_getConcreteMemoryBackend>,                               METH_NOARGS,                   ""},
+        {"getConcreteMemoryValue",              (PyCFunction)TritonContext_locked<TritonContext_getConcreteMemoryValue>,                                 METH_O,                        ""},
+        {"getConcreteRegisterValue",            (PyCFunction)TritonContext_locked<TritonContext_getConcreteRegisterValue>,                               METH_O,                        ""},
+        {"getConcreteVariableValue",            (PyCFunction)TritonContext_locked<TritonContext_getConcreteVariableValue>,                               METH_O,                        ""},
+        {"getDisassemblyCacheSize",             (PyCFunction)TritonContext_locked<TritonContext_getDisassemblyCacheSize>,                                METH_NOARGS,                   ""},
+        {"getDisassemblyCacheStats",            (PyCFunction)TritonContext_locked<TritonContext_getDisassemblyCacheStats>,                               METH_NOARGS,                   ""},
+        {"getGprBitSize",                       (PyCFunction)TritonContext_locked<TritonContext_getGprBitSize>,                                          METH_NOARGS,                   ""},
+        {"getGprSize",                          (PyCFunction)TritonContext_locked<TritonContext_getGprSize>,                                             METH_NOARGS,                   ""},
+        {"getImmediateAst",                     (PyCFunction)TritonContext_locked<TritonContext_getImmediateAst>,                                        METH_O,                        ""},
+        {"getMemoryAst",                        (PyCFunction)TritonContext_locked<TritonContext_getMemoryAst>,                                           METH_O,                        ""},
+        {"getModel",                            (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_getModel,                                     METH_VARARGS | METH_KEYWORDS,  ""},
+        {"getModels",                           (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_getModels,                                    METH_VARARGS | METH_KEYWORDS,  ""},
+        {"getParentRegister",                   (PyCFunction)TritonContext_locked<TritonContext_getParentRegister>,                                      METH_O,                        ""},
+        {"getParentRegisters",                  (PyCFunction)TritonContext_locked<TritonContext_getParentRegisters>,                                     METH_NOARGS,                   ""},
+        {"getPathConstraints",                  (PyCFunction)TritonContext_locked<TritonContext_getPathConstraints>,                                     METH_NOARGS,                   ""},
+        {"getPathPredicate",                    (PyCFunction)TritonContext_locked<TritonContext_getPathPredicate>,                                       METH_NOARGS,                   ""},
+        {"getPathPredicateSize",                (PyCFunction)TritonContext_locked<TritonContext_getPathPredicateSize>,                                   METH_NOARGS,                   ""},
+        {"getPredicatesToReachAddress",         (PyCFunction)TritonContext_locked<TritonContext_getPredicatesToReachAddress>,                            METH_O,                        ""},
+        {"getRegister",                         (PyCFunction)TritonContext_locked<TritonContext_getRegister>,                                            METH_O,                        ""},
+        {"getRegisterAst",                      (PyCFunction)TritonContext_locked<TritonContext_getRegisterAst>,                                         METH_O,                        ""},
+        {"getSessionModel",                     (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_getSessionModel,                              METH_VARARGS | METH_KEYWORDS,  ""},
+        {"getSizeOfSessionConstraints",         (PyCFunction)TritonContext_locked<TritonContext_getSizeOfSessionConstraints>,                            METH_NOARGS,                   ""},
+        {"getSolver",                           (PyCFunction)TritonContext_locked<TritonContext_getSolver>,                                              METH_NOARGS,                   ""},
+        {"getSolverPortfolioStats",             (PyCFunction)TritonContext_locked<TritonContext_getSolverPortfolioStats>,                                METH_NOARGS,                   ""},
+        {"getSolverQueryCacheSize",             (PyCFunction)TritonContext_locked<TritonContext_getSolverQueryCacheSize>,                                METH_NOARGS,                   ""},
+        {"getSolverQueryCacheStats",            (PyCFunction)TritonContext_locked<TritonContext_getSolverQueryCacheStats>,                               METH_NOARGS,                   ""},
+        {"getSolverWorkers",                    (PyCFunction)TritonContext_locked<TritonContext_getSolverWorkers>,                                       METH_NOARGS,                   ""},
+        {"getSymbolicExpression",               (PyCFunction)TritonContext_locked<TritonContext_getSymbolicExpression>,                                  METH_O,                        ""},
+        {"getSymbolicExpressions",              (PyCFunction)TritonContext_locked<TritonContext_getSymbolicExpressions>,                                 METH_NOARGS,                   ""},
+        {"getSymbolicMemory",                   (PyCFunction)TritonContext_locked<TritonContext_getSymbolicMemory>,                                      METH_VARARGS,                  ""},
+        {"getSymbolicMemoryValue",              (PyCFunction)TritonContext_locked<TritonContext_getSymbolicMemoryValue>,                                 METH_O,                        ""},
+        {"getSymbolicRegister",                 (PyCFunction)TritonContext_locked<TritonContext_getSymbolicRegister>,                                    METH_O,                        ""},
+        {"getSymbolicRegisterValue",            (PyCFunction)TritonContext_locked<TritonContext_getSymbolicRegisterValue>,                               METH_O,                        ""},
+        {"getSymbolicRegisters",                (PyCFunction)TritonContext_locked<TritonContext_getSymbolicRegisters>,                                   METH_NOARGS,                   ""},
+        {"getSymbolicVariable",                 (PyCFunction)TritonContext_locked<TritonContext_getSymbolicVariable>,                                    METH_O,                        ""},
+        {"getSymbolicVariables",                (PyCFunction)TritonContext_locked<TritonContext_getSymbolicVariables>,                                   METH_NOARGS,                   ""},
+        {"getTaintedMemory",                    (PyCFunction)TritonContext_locked<TritonContext_getTaintedMemory>,                                       METH_NOARGS,                   ""},
+        {"getTaintedRegisters",                 (PyCFunction)TritonContext_locked<TritonContext_getTaintedRegisters>,                                    METH_NOARGS,                   ""},
+        {"getTaintedSymbolicExpressions",       (PyCFunction)TritonContext_locked<TritonContext_getTaintedSymbolicExpressions>,                          METH_NOARGS,                   ""},
+        {"isArchitectureValid",                 (PyCFunction)TritonContext_locked<TritonContext_isArchitectureValid>,                                    METH_NOARGS,                   ""},
+        {"isConcreteMemoryValueDefined",        (PyCFunction)TritonContext_locked<TritonContext_isConcreteMemoryValueDefined>,                           METH_VARARGS,                  ""},
+        {"isFlag",                              (PyCFunction)TritonContext_locked<TritonContext_isFlag>,                                                 METH_O,                        ""},
+        {"isHooked",                            (PyCFunction)TritonContext_locked<TritonContext_isHooked>,                                               METH_O,                        ""},
+        {"isMemorySymbolized",                  (PyCFunction)TritonContext_locked<TritonContext_isMemorySymbolized>,                                     METH_O,                        ""},
+        {"isMemoryTainted",                     (PyCFunction)TritonContext_locked<TritonContext_isMemoryTainted>,                                        METH_O,                        ""},
+        {"isModeEnabled",                       (PyCFunction)TritonContext_locked<TritonContext_isModeEnabled>,                                          METH_O,                        ""},
+        {"isRegister",                          (PyCFunction)TritonContext_locked<TritonContext_isRegister>,                                             METH_O,                        ""},
+        {"isRegisterSymbolized",                (PyCFunction)TritonContext_locked<TritonContext_isRegisterSymbolized>,                                   METH_O,                        ""},
+        {"isRegisterTainted",                   (PyCFunction)TritonContext_locked<TritonContext_isRegisterTainted>,                                      METH_O,                        ""},
+        {"isRegisterValid",                     (PyCFunction)TritonContext_locked<TritonContext_isRegisterValid>,                                        METH_O,                        ""},
+        {"isSat",                               (PyCFunction)TritonContext_isSat,                                                                        METH_O,                        ""},
+        {"isSessionSat",                        (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_isSessionSat,                                 METH_VARARGS | METH_KEYWORDS,  ""},
+        {"isSolverIndependenceEnabled",         (PyCFunction)TritonContext_locked<TritonContext_isSolverIndependenceEnabled>,                            METH_NOARGS,                   ""},
+        {"isSymbolicExpressionExists",          (PyCFunction)TritonContext_locked<TritonContext_isSymbolicExpressionExists>,                             METH_O,                        ""},
+        {"isThumb",                             (PyCFunction)TritonContext_locked<TritonContext_isThumb>,                                                METH_NOARGS,                   ""},
+        {"liftToDot",                           (PyCFunction)TritonContext_locked<TritonContext_liftToDot>,                                              METH_O,                        ""},
+        {"liftToLLVM",                          (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_liftToLLVM,                                   METH_VARARGS | METH_KEYWORDS,  ""},
+        {"liftToPython",                        (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_locked<TritonContext_liftToPython>,           METH_VARARGS | METH_KEYWORDS,  ""},
+        {"liftToSMT",                           (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_locked<TritonContext_liftToSMT>,              METH_VARARGS | METH_KEYWORDS,  ""},
+        {"mapConcreteMemoryFile",               (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_locked<TritonContext_mapConcreteMemoryFile>,  METH_VARARGS | METH_KEYWORDS,  ""},
+        {"newSymbolicExpression",               (PyCFunction)TritonContext_locked<TritonContext_newSymbolicExpression>,                                  METH_VARARGS,                  ""},
+        {"newSymbolicVariable",                 (PyCFunction)TritonContext_locked<TritonContext_newSymbolicVariable>,                                    METH_VARARGS,                  ""},
+        {"parseSmt",                            (PyCFunction)TritonContext_locked<TritonContext_parseSmt>,                                               METH_O,                        ""},
+        {"popPathConstraint",                   (PyCFunction)TritonContext_locked<TritonContext_popPathConstraint>,                                      METH_NOARGS,                   ""},
+        {"popSessionConstraint",                (PyCFunction)TritonContext_locked<TritonContext_popSessionConstraint>,                                   METH_NOARGS,                   ""},
+        {"processing",                          (PyCFunction)TritonContext_locked<TritonContext_processing>,                                             METH_VARARGS,                  ""},
+        {"pushPathConstraint",                  (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_locked<TritonContext_pushPathConstraint>,     METH_VARARGS | METH_KEYWORDS,  ""},
+        {"pushSessionConstraint",               (PyCFunction)TritonContext_pushSessionConstraint,                                                        METH_O,                        ""},
+        {"removeCallback",                      (PyCFunction)TritonContext_locked<TritonContext_removeCallback>,                                         METH_VARARGS,                  ""},
+        {"removeHook",                          (PyCFunction)TritonContext_locked<TritonContext_removeHook>,                                             METH_O,                        ""},
+        {"reset",                               (PyCFunction)TritonContext_locked<TritonContext_reset>,                                                  METH_NOARGS,                   ""},
+        {"restore",                             (PyCFunction)TritonContext_locked<TritonContext_restore>,                                                METH_O,                        ""},
+        {"restoreRegisterState",                (PyCFunction)TritonContext_locked<TritonContext_restoreRegisterState>,                                   METH_O,                        ""},
+        {"saveRegisterState",                   (PyCFunction)TritonContext_locked<TritonContext_saveRegisterState>,                                      METH_NOARGS,                   ""},
+        {"setArchitecture",                     (PyCFunction)TritonContext_locked<TritonContext_setArchitecture>,                                        METH_O,                        ""},
+        {"setAstRepresentationMode",            (PyCFunction)TritonContext_locked<TritonContext_setAstRepresentationMode>,                               METH_O,                        ""},
+        {"setConcreteMemoryAreaValue",          (PyCFunction)TritonContext_locked<TritonContext_setConcreteMemoryAreaValue>,                             METH_VARARGS,                  ""},
+        {"setConcreteMemoryBackend",            (PyCFunction)TritonContext_locked<TritonContext_setConcreteMemoryBackend>,                               METH_O,                        ""},
+        {"setConcreteMemoryValue",              (PyCFunction)TritonContext_locked<TritonContext_setConcreteMemoryValue>,                                 METH_VARARGS,                  ""},
+        {"setConcreteRegisterValue",            (PyCFunction)TritonContext_locked<TritonContext_setConcreteRegisterValue>,                               METH_VARARGS,                  ""},
+        {"setConcreteVariableValue",            (PyCFunction)TritonContext_locked<TritonContext_setConcreteVariableValue>,                               METH_VARARGS,                  ""},
+        {"setDisassemblyCacheSize",             (PyCFunction)TritonContext_locked<TritonContext_setDisassemblyCacheSize>,                                METH_O,                        ""},
+        {"setMode",                             (PyCFunction)TritonContext_locked<TritonContext_setMode>,                                                METH_VARARGS,                  ""},
+        {"setSolver",                           (PyCFunction)TritonContext_locked<TritonContext_setSolver>,                                              METH_O,                        ""},
+        {"setSolverIndependence",               (PyCFunction)TritonContext_locked<TritonContext_setSolverIndependence>,                                  METH_O,                        ""},
+        {"setSolverMemoryLimit",                (PyCFunction)TritonContext_locked<TritonContext_setSolverMemoryLimit>,                                   METH_O,                        ""},
+        {"setSolverQueryCacheSize",             (PyCFunction)TritonContext_locked<TritonContext_setSolverQueryCacheSize>,                                METH_O,                        ""},
+        {"setSolverTimeout",                    (PyCFunction)TritonContext_locked<TritonContext_setSolverTimeout>,                                       METH_O,                        ""},
+        {"setSolverWorkers",                    (PyCFunction)TritonContext_locked<TritonContext_setSolverWorkers>,                                       METH_O,                        ""},
+        {"setTaintMemory",                      (PyCFunction)TritonContext_locked<TritonContext_setTaintMemory>,                                         METH_VARARGS,                  ""},
+        {"setTaintRegister",                    (PyCFunction)TritonContext_locked<TritonContext_setTaintRegister>,                                       METH_VARARGS,                  ""},
+        {"setThumb",                            (PyCFunction)TritonContext_locked<TritonContext_setThumb>,                                               METH_O,                        ""},
+        {"simplify",                            (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_simplify,                                     METH_VARARGS | METH_KEYWORDS,  ""},
+        {"sliceExpressions",                    (PyCFunction)TritonContext_locked<TritonContext_sliceExpressions>,                                       METH_O,                        ""},
+        {"snapshot",                            (PyCFunction)TritonContext_locked<TritonContext_snapshot>,                                               METH_NOARGS,                   ""},
+        {"symbolizeExpression",                 (PyCFunction)TritonContext_locked<TritonContext_symbolizeExpression>,                                    METH_VARARGS,                  ""},
+        {"symbolizeMemory",                     (PyCFunction)TritonContext_locked<TritonContext_symbolizeMemory>,                                        METH_VARARGS,                  ""},
+        {"symbolizeRegister",                   (PyCFunction)TritonContext_locked<TritonContext_symbolizeRegister>,                                      METH_VARARGS,                  ""},
+        {"syncSessionConstraints",              (PyCFunction)TritonContext_syncSessionConstraints,                                                       METH_NOARGS,                   ""},
+        {"synthesize",                          (PyCFunction)(void*)(PyCFunctionWithKeywords)TritonContext_synthesize,                                   METH_VARARGS | METH_KEYWORDS,  ""},
+        {"taintAssignment",                     (PyCFunction)TritonContext_locked<TritonContext_taintAssignment>,                                        METH_VARARGS,                  ""},
+        {"taintMemory",                         (PyCFunction)TritonContext_locked<TritonContext_taintMemory>,                                            METH_O,                        ""},
+        {"taintRegister",                       (PyCFunction)TritonContext_locked<TritonContext_taintRegister>,                                          METH_O,                        ""},
+        {"taintUnion",                          (PyCFunction)TritonContext_locked<TritonContext_taintUnion>,                                             METH_VARARGS,                  ""},
+        {"untaintMemory",                       (PyCFunction)TritonContext_locked<TritonContext_untaintMemory>,                                          METH_O,                        ""},
+        {"untaintRegister",                     (PyCFunction)TritonContext_locked<TritonContext_untaintRegister>,                                        METH_O,                        ""},
+        {nullptr,                               nullptr,                                                                                                 0,                             nullptr}
       };
 
 
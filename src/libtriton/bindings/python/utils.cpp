@@ -12,6 +12,8 @@
 #include <triton/tritonTypes.hpp>
 
 #include <limits>
+#include <memory>
+#include <unordered_map>
 
 
 
@@ -438,6 +440,43 @@ namespace triton {
         return (PyObject*)v;
       }
 
+
+      /* The mutexes of the objects used by several threads. Only accessed with the GIL held. */
+      static std::unordered_map<const void*, std::unique_ptr<std::recursive_mutex>> PyObjectMutexes;
+
+
+      std::recursive_mutex& PyObjectMutex(const void* object) {
+        auto& mutex = PyObjectMutexes[object];
+        if (mutex == nullptr)
+          mutex.reset(new std::recursive_mutex());
+        return *mutex;
+      }
+
+
+      void PyObjectMutex_Erase(const void* object) {
+        PyObjectMutexes.erase(object);
+      }
+
+
+      PyReleaseGil::PyReleaseGil() {
+        this->state = PyEval_SaveThread();
+      }
+
+
+      PyReleaseGil::~PyReleaseGil() {
+        PyEval_RestoreThread(this->state);
+      }
+
+
+      PyAcquireGil::PyAcquireGil() {
+        this->state = PyGILState_Ensure();
+      }
+
+
+      PyAcquireGil::~PyAcquireGil() {
+        PyGILState_Release(this->state);
+      }
+
     }; /* python namespace */
   }; /* bindings namespace */
 }; /* triton namespace */
@@ -18,11 +18,25 @@ namespace triton {
       this->defined   = false;
       this->mget      = false;
       this->mload     = false;
+      this->mloadArea = false;
       this->mput      = false;
       this->mstore    = false;
     }
 
 
+    void Callbacks::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb) {
+      switch (kind) {
+        case triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE:
+          this->getConcreteMemoryAreaValueCallbacks.push_back(cb);
+          break;
+
+        default:
+          return;
+      }
+      this->defined = true;
+    }
+
+
     void Callbacks::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb) {
       switch (kind) {
         case triton::callbacks::GET_CONCRETE_MEMORY_VALUE:
@@ -89,6 +103,7 @@ namespace triton {
 
 
     void Callbacks::clearCallbacks(void) {
+      this->getConcreteMemoryAreaValueCallbacks.clear();
       this->getConcreteMemoryValueCallbacks.clear();
       this->getConcreteRegisterValueCallbacks.clear();
       this->setConcreteMemoryValueCallbacks.clear();
@@ -110,6 +125,22 @@ namespace triton {
     }
 
 
+    void Callbacks::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb) {
+      switch (kind) {
+        case triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE:
+          this->removeSingleCallback(this->getConcreteMemoryAreaValueCallbacks, cb);
+          break;
+
+        default:
+          throw triton::exceptions::Exception("Incorrect callback kind for removal");
+      }
+
+      if (this->countCallbacks() == 0) {
+        this->defined = false;
+      }
+    }
+
+
     void Callbacks::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb) {
       switch (kind) {
         case triton::callbacks::GET_CONCRETE_MEMORY_VALUE:
@@ -208,6 +239,35 @@ namespace triton {
     }
 
 
+    void Callbacks::processCallbacks(triton::callbacks::callback_e kind, triton::uint64 baseAddr, triton::usize size) {
+      switch (kind) {
+        case triton::callbacks::GET_CONCRETE_MEMORY_AREA_VALUE: {
+          /* Check if we are already in the callback to avoid infinite recursion */
+          if (this->mloadArea) {
+            break;
+          }
+
+          for (auto& function: this->getConcreteMemoryAreaValueCallbacks) {
+            this->mloadArea = true;
+            try {
+              function(this->ctx, baseAddr, size);
+            }
+            catch (...) {
+              this->mloadArea = false;
+              throw;
+            }
+            this->mloadArea = false;
+          }
+
+          break;
+        }
+
+        default:
+          throw triton::exceptions::Callbacks("Callbacks::processCallbacks(): Invalid kind of callback for this C++ polymorphism.");
+      };
+    }
+
+
     void Callbacks::processCallbacks(triton::callbacks::callback_e kind, const triton::arch::MemoryAccess& mem) {
       switch (kind) {
         case triton::callbacks::GET_CONCRETE_MEMORY_VALUE: {
@@ -306,6 +366,7 @@ namespace triton {
     triton::usize Callbacks::countCallbacks(void) const {
       triton::usize count = 0;
 
+      count += this->getConcreteMemoryAreaValueCallbacks.size();
       count += this->getConcreteMemoryValueCallbacks.size();
       count += this->getConcreteRegisterValueCallbacks.size();
       count += this->setConcreteMemoryValueCallbacks.size();
@@ -318,6 +379,7 @@ namespace triton {
 
     bool Callbacks::isDefined(triton::callbacks::callback_e kind) const {
       switch (kind) {
+        case GET_CONCRETE_MEMORY_AREA_VALUE: return !this->getConcreteMemoryAreaValueCallbacks.empty();
         case GET_CONCRETE_MEMORY_VALUE:   return !this->getConcreteMemoryValueCallbacks.empty();
         case GET_CONCRETE_REGISTER_VALUE: return !this->getConcreteRegisterValueCallbacks.empty();
         case SET_CONCRETE_MEMORY_VALUE:   return !this->setConcreteMemoryValueCallbacks.empty();
@@ -334,5 +396,42 @@ namespace triton {
       return this->defined;
     }
 
+
+    void Callbacks::addHook(triton::uint64 addr, const triton::callbacks::hookCallback& cb) {
+      auto it = this->hooks.find(addr);
+      if (it != this->hooks.end())
+        it->second = cb;
+      else
+        this->hooks.insert({addr, cb});
+    }
+
+
+    void Callbacks::removeHook(triton::uint64 addr) {
+      if (this->hooks.erase(addr) == 0)
+        throw triton::exceptions::Callbacks("Callbacks::removeHook(): No hook at this address.");
+    }
+
+
+    void Callbacks::clearHooks(void) {
+      this->hooks.clear();
+    }
+
+
+    bool Callbacks::isHooked(triton::uint64 addr) const {
+      return (this->hooks.find(addr) != this->hooks.end());
+    }
+
+
+    bool Callbacks::processHook(triton::uint64 addr) {
+      auto it = this->hooks.find(addr);
+
+      if (it == this->hooks.end())
+        throw triton::exceptions::Callbacks("Callbacks::processHook(): No hook at this address.");
+
+      /* The hook may replace or remove itself, thus it is called from a copy */
+      triton::callbacks::hookCallback cb = it->second;
+      return cb(this->ctx, addr);
+    }
+
   }; /* callbacks namespace */
 }; /* triton namespace */
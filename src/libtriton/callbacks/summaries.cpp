@@ -0,0 +1,288 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <triton/context.hpp>
+#include <triton/cpuSize.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/summaries.hpp>
+
+
+
+namespace triton {
+  namespace callbacks {
+    namespace summaries {
+
+      /* Returns the operand holding the i-th integer argument of a call */
+      static triton::arch::OperandWrapper getArgument(triton::Context& ctx, triton::uint32 index) {
+        static const triton::arch::register_e x8664[] = {
+          triton::arch::ID_REG_X86_RDI,
+          triton::arch::ID_REG_X86_RSI,
+          triton::arch::ID_REG_X86_RDX,
+        };
+
+        static const triton::arch::register_e aarch64[] = {
+          triton::arch::ID_REG_AARCH64_X0,
+          triton::arch::ID_REG_AARCH64_X1,
+          triton::arch::ID_REG_AARCH64_X2,
+        };
+
+        static const triton::arch::register_e arm32[] = {
+          triton::arch::ID_REG_ARM32_R0,
+          triton::arch::ID_REG_ARM32_R1,
+          triton::arch::ID_REG_ARM32_R2,
+        };
+
+        if (index >= sizeof(x8664) / sizeof(x8664[0]))
+          throw triton::exceptions::Callbacks("summaries::getArgument(): Invalid argument index.");
+
+        switch (ctx.getArchitecture()) {
+          case triton::arch::ARCH_X86_64:
+            return triton::arch::OperandWrapper(ctx.getRegister(x8664[index]));
+
+          case triton::arch::ARCH_AARCH64:
+            return triton::arch::OperandWrapper(ctx.getRegister(aarch64[index]));
+
+          case triton::arch::ARCH_ARM32:
+            return triton::arch::OperandWrapper(ctx.getRegister(arm32[index]));
+
+          case triton::arch::ARCH_X86: {
+            /* cdecl, the return address is on the top of the stack */
+            triton::uint64 sp = static_cast<triton::uint64>(ctx.getConcreteRegisterValue(ctx.getRegister(triton::arch::ID_REG_X86_ESP)));
+            return triton::arch::OperandWrapper(triton::arch::MemoryAccess(sp + (index + 1) * triton::size::dword, triton::size::dword));
+          }
+
+          default:
+            throw triton::exceptions::Callbacks("summaries::getArgument(): Invalid architecture.");
+        }
+      }
+
+
+      /* Returns the concrete value of the i-th integer argument of a call */
+      static triton::uint64 getConcreteArgument(triton::Context& ctx, triton::uint32 index) {
+        triton::arch::OperandWrapper arg = getArgument(ctx, index);
+
+        if (arg.getType() == triton::arch::OP_REG)
+          return static_cast<triton::uint64>(ctx.getConcreteRegisterValue(arg.getConstRegister()));
+
+        return static_cast<triton::uint64>(ctx.getConcreteMemoryValue(arg.getConstMemory()));
+      }
+
+
+      /* Returns the register holding the return value */
+      static const triton::arch::Register& getReturnRegister(triton::Context& ctx) {
+        switch (ctx.getArchitecture()) {
+          case triton::arch::ARCH_X86_64:   return ctx.getRegister(triton::arch::ID_REG_X86_RAX);
+          case triton::arch::ARCH_X86:      return ctx.getRegister(triton::arch::ID_REG_X86_EAX);
+          case triton::arch::ARCH_AARCH64:  return ctx.getRegister(triton::arch::ID_REG_AARCH64_X0);
+          case triton::arch::ARCH_ARM32:    return ctx.getRegister(triton::arch::ID_REG_ARM32_R0);
+          default:
+            throw triton::exceptions::Callbacks("summaries::getReturnRegister(): Invalid architecture.");
+        }
+      }
+
+
+      /* Sets the return value, zero-extended to the size of the return register */
+      static void setReturnValue(triton::Context& ctx, const triton::ast::SharedAbstractNode& node, const std::string& comment) {
+        const triton::arch::Register& reg = getReturnRegister(ctx);
+        triton::ast::SharedAbstractNode value = node;
+
+        if (value->getBitvectorSize() < reg.getBitSize())
+          value = ctx.getAstContext()->zx(reg.getBitSize() - value->getBitvectorSize(), value);
+
+        if (value->isSymbolized())
+          ctx.assignSymbolicExpressionToRegister(ctx.newSymbolicExpression(value, comment), reg);
+        else
+          ctx.setConcreteRegisterValue(reg, value->evaluate());
+      }
+
+
+      /* Returns to the caller */
+      static void doReturn(triton::Context& ctx) {
+        switch (ctx.getArchitecture()) {
+          case triton::arch::ARCH_X86_64:
+          case triton::arch::ARCH_X86: {
+            bool is64          = (ctx.getArchitecture() == triton::arch::ARCH_X86_64);
+            triton::uint32 sz  = (is64 ? triton::size::qword : triton::size::dword);
+            const auto& sp     = ctx.getRegister(is64 ? triton::arch::ID_REG_X86_RSP : triton::arch::ID_REG_X86_ESP);
+            const auto& pc     = ctx.getRegister(is64 ? triton::arch::ID_REG_X86_RIP : triton::arch::ID_REG_X86_EIP);
+            triton::uint64 top = static_cast<triton::uint64>(ctx.getConcreteRegisterValue(sp));
+            triton::uint512 ra = ctx.getConcreteMemoryValue(triton::arch::MemoryAccess(top, sz));
+            ctx.setConcreteRegisterValue(sp, top + sz);
+            ctx.setConcreteRegisterValue(pc, ra);
+            break;
+          }
+
+          case triton::arch::ARCH_AARCH64:
+            ctx.setConcreteRegisterValue(ctx.getRegister(triton::arch::ID_REG_AARCH64_PC), ctx.getConcreteRegisterValue(ctx.getRegister(triton::arch::ID_REG_AARCH64_X30)));
+            break;
+
+          case triton::arch::ARCH_ARM32: {
+            /* The lowest bit of the link register selects the Thumb mode */
+            triton::uint64 lr = static_cast<triton::uint64>(ctx.getConcreteRegisterValue(ctx.getRegister(triton::arch::ID_REG_ARM32_R14)));
+            ctx.setThumb((lr & 1) != 0);
+            ctx.setConcreteRegisterValue(ctx.getRegister(triton::arch::ID_REG_ARM32_PC), lr & ~static_cast<triton::uint64>(1));
+            break;
+          }
+
+          default:
+            throw triton::exceptions::Callbacks("summaries::doReturn(): Invalid architecture.");
+        }
+      }
+
+
+      triton::callbacks::hookCallback getSummary(triton::callbacks::summary_e kind) {
+        switch (kind) {
+          case triton::callbacks::SUMMARY_MEMCPY: return triton::callbacks::hookCallback(triton::callbacks::summaries::memcpy);
+          case triton::callbacks::SUMMARY_MEMSET: return triton::callbacks::hookCallback(triton::callbacks::summaries::memset);
+          case triton::callbacks::SUMMARY_STRCMP: return triton::callbacks::hookCallback(triton::callbacks::summaries::strcmp);
+          case triton::callbacks::SUMMARY_STRLEN: return triton::callbacks::hookCallback(triton::callbacks::summaries::strlen);
+          default:
+            throw triton::exceptions::Callbacks("summaries::getSummary(): Invalid kind of summary.");
+        }
+      }
+
+
+      bool memcpy(triton::Context& ctx, triton::uint64 addr) {
+        triton::uint64 dst = getConcreteArgument(ctx, 0);
+        triton::uint64 src = getConcreteArgument(ctx, 1);
+        triton::usize size = static_cast<triton::usize>(getConcreteArgument(ctx, 2));
+        bool taint         = !ctx.getTaintedMemory().empty();
+
+        /* The source is read entirely before writing, thus the areas may overlap */
+        std::vector<triton::uint8> area = ctx.getConcreteMemoryAreaValue(src, size);
+        std::vector<std::pair<triton::usize, triton::ast::SharedAbstractNode>> symbolic;
+        std::vector<bool> tainted;
+
+        for (triton::usize index = 0; index < size; index++) {
+          if (ctx.isMemorySymbolized(src + index))
+            symbolic.push_back({index, ctx.getMemoryAst(triton::arch::MemoryAccess(src + index, triton::size::byte))});
+          if (taint)
+            tainted.push_back(ctx.isMemoryTainted(src + index));
+        }
+
+        ctx.setConcreteMemoryAreaValue(dst, area);
+
+        for (const auto& byte : symbolic)
+          ctx.assignSymbolicExpressionToMemory(ctx.newSymbolicExpression(byte.second, "memcpy"), triton::arch::MemoryAccess(dst + byte.first, triton::size::byte));
+
+        for (triton::usize index = 0; index < tainted.size(); index++)
+          ctx.setTaintMemory(triton::arch::MemoryAccess(dst + index, triton::size::byte), tainted[index]);
+
+        setReturnValue(ctx, ctx.getAstContext()->bv(dst, getReturnRegister(ctx).getBitSize()), "memcpy");
+        doReturn(ctx);
+
+        return true;
+      }
+
+
+      bool memset(triton::Context& ctx, triton::uint64 addr) {
+        triton::uint64 dst                 = getConcreteArgument(ctx, 0);
+        triton::arch::OperandWrapper value = getArgument(ctx, 1);
+        triton::usize size                 = static_cast<triton::usize>(getConcreteArgument(ctx, 2));
+        triton::ast::SharedAbstractNode c  = ctx.getAstContext()->extract(7, 0, ctx.getOperandAst(value));
+        bool tainted                       = ctx.isTainted(value);
+
+        ctx.setConcreteMemoryAreaValue(dst, std::vector<triton::uint8>(size, static_cast<triton::uint8>(c->evaluate())));
+
+        if (c->isSymbolized()) {
+          triton::engines::symbolic::SharedSymbolicExpression expr = ctx.newSymbolicExpression(c, "memset");
+          for (triton::usize index = 0; index < size; index++)
+            ctx.assignSymbolicExpressionToMemory(expr, triton::arch::MemoryAccess(dst + index, triton::size::byte));
+        }
+
+        if (tainted || !ctx.getTaintedMemory().empty()) {
+          for (triton::usize index = 0; index < size; index++)
+            ctx.setTaintMemory(triton::arch::MemoryAccess(dst + index, triton::size::byte), tainted);
+        }
+
+        setReturnValue(ctx, ctx.getAstContext()->bv(dst, getReturnRegister(ctx).getBitSize()), "memset");
+        doReturn(ctx);
+
+        return true;
+      }
+
+
+      bool strcmp(triton::Context& ctx, triton::uint64 addr) {
+        triton::uint64 s1  = getConcreteArgument(ctx, 0);
+        triton::uint64 s2  = getConcreteArgument(ctx, 1);
+        triton::usize last = 0;
+        bool symbolized    = false;
+
+        /* Finds the first byte which differs or ends the strings */
+        while (true) {
+          symbolized |= (ctx.isMemorySymbolized(s1 + last) || ctx.isMemorySymbolized(s2 + last));
+          triton::uint8 c1 = ctx.getConcreteMemoryValue(s1 + last);
+          triton::uint8 c2 = ctx.getConcreteMemoryValue(s2 + last);
+          if (c1 != c2 || c1 == 0)
+            break;
+          last++;
+        }
+
+        auto actx = ctx.getAstContext();
+        auto diff = [&](triton::usize index) {
+          auto c1 = ctx.getMemoryAst(triton::arch::MemoryAccess(s1 + index, triton::size::byte));
+          auto c2 = ctx.getMemoryAst(triton::arch::MemoryAccess(s2 + index, triton::size::byte));
+          return std::make_pair(actx->bvsub(actx->zx(triton::bitsize::dword - triton::bitsize::byte, c1), actx->zx(triton::bitsize::dword - triton::bitsize::byte, c2)), actx->lor(actx->distinct(c1, c2), actx->equal(c1, actx->bv(0, triton::bitsize::byte))));
+        };
+
+        triton::ast::SharedAbstractNode node = nullptr;
+        if (symbolized) {
+          /* The first byte which differs or ends the strings decides, bounded by the concrete strings */
+          node = diff(last).first;
+          for (triton::usize index = last; index-- > 0;) {
+            auto d = diff(index);
+            node = actx->ite(d.second, d.first, node);
+          }
+        }
+        else {
+          triton::uint32 c1 = ctx.getConcreteMemoryValue(s1 + last, false);
+          triton::uint32 c2 = ctx.getConcreteMemoryValue(s2 + last, false);
+          node = actx->bv(static_cast<triton::uint32>(c1 - c2), triton::bitsize::dword);
+        }
+
+        setReturnValue(ctx, node, "strcmp");
+        doReturn(ctx);
+
+        return true;
+      }
+
+
+      bool strlen(triton::Context& ctx, triton::uint64 addr) {
+        triton::uint64 s    = getConcreteArgument(ctx, 0);
+        triton::usize size  = 0;
+        bool symbolized     = false;
+
+        while (ctx.getConcreteMemoryValue(s + size) != 0) {
+          symbolized |= ctx.isMemorySymbolized(s + size);
+          size++;
+        }
+
+        auto actx = ctx.getAstContext();
+        triton::uint32 bits = getReturnRegister(ctx).getBitSize();
+        triton::ast::SharedAbstractNode node = actx->bv(size, bits);
+
+        if (symbolized) {
+          /* The first null byte decides, bounded by the concrete string */
+          for (triton::usize index = size; index-- > 0;) {
+            auto c = ctx.getMemoryAst(triton::arch::MemoryAccess(s + index, triton::size::byte));
+            node = actx->ite(actx->equal(c, actx->bv(0, triton::bitsize::byte)), actx->bv(index, bits), node);
+          }
+        }
+
+        setReturnValue(ctx, node, "strlen");
+        doReturn(ctx);
+
+        return true;
+      }
+
+    }; /* summaries namespace */
+  }; /* callbacks namespace */
+}; /* triton namespace */
@@ -8,7 +8,10 @@
 #include <triton/context.hpp>
 #include <triton/config.hpp>
 #include <triton/exceptions.hpp>
+#include <triton/summaries.hpp>
 
+#include <atomic>
+#include <chrono>
 #include <list>
 #include <map>
 #include <memory>
@@ -164,6 +167,13 @@ automate reverse engineering, perform software verification or just emulate code
 
 namespace triton {
 
+  /* The last generation of engines (see Context::initEngines()) */
+  static std::atomic<triton::uint64> generations(0);
+
+  /* The number of steps between two polls of the interruption of an emulation (see Context::emulate()) */
+  static const triton::usize EMULATE_POLL_PERIOD = 4096;
+
+
   Context::Context() :
     callbacks(*this),
     arch(&this->callbacks) {
@@ -370,6 +380,12 @@ namespace triton {
   }
 
 
+  void Context::getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks) const {
+    this->checkArchitecture();
+    this->arch.getConcreteMemoryAreaValue(baseAddr, area, size, execCallbacks);
+  }
+
+
   triton::uint512 Context::getConcreteRegisterValue(const triton::arch::Register& reg, bool execCallbacks) const {
     this->checkArchitecture();
     return this->arch.getConcreteRegisterValue(reg, execCallbacks);
@@ -459,6 +475,33 @@ namespace triton {
   }
 
 
+  triton::arch::memory_backend_e Context::getConcreteMemoryBackend(void) const {
+    this->checkArchitecture();
+    return this->arch.getConcreteMemoryBackend();
+  }
+
+
+  void Context::setConcreteMemoryBackend(triton::arch::memory_backend_e backend) {
+    this->checkArchitecture();
+    this->arch.setConcreteMemoryBackend(backend);
+  }
+
+
+  void Context::mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable) {
+    this->checkArchitecture();
+    this->arch.mapConcreteMemoryFile(path, offset, baseAddr, size, writable);
+    /*
+     * In order to synchronize the concrete state with the symbolic
+     * one, the symbolic expression is concretized.
+     */
+    if (this->symbolic) {
+      for (triton::usize index = 0 ; index < size ; index++) {
+        this->concretizeMemory(baseAddr + index);
+      }
+    }
+  }
+
+
   void Context::disassembly(triton::arch::Instruction& inst) const {
     this->checkArchitecture();
     this->arch.disassembly(inst);
@@ -483,12 +526,35 @@ namespace triton {
   }
 
 
+  triton::usize Context::getDisassemblyCacheSize(void) const {
+    return this->arch.getDisassemblyCacheSize();
+  }
+
+
+  void Context::setDisassemblyCacheSize(triton::usize size) {
+    this->arch.setDisassemblyCacheSize(size);
+  }
+
+
+  triton::arch::DisassemblyCacheStats Context::getDisassemblyCacheStats(void) const {
+    return this->arch.getDisassemblyCacheStats();
+  }
+
+
+  void Context::clearDisassemblyCache(void) {
+    this->arch.clearDisassemblyCache();
+  }
+
+
 
   /* Processing Context ================================================================================ */
 
   void Context::initEngines(void) {
     this->checkArchitecture();
 
+    /* Identifies the engines, thus states saved by previous engines or by other contexts cannot be restored */
+    this->generation = ++generations;
+
     this->symbolic = new(std::nothrow) triton::engines::symbolic::SymbolicEngine(&this->arch, this->modes, this->astCtxt, &this->callbacks);
     if (this->symbolic == nullptr)
       throw triton::exceptions::Context("Context::initEngines(): Not enough memory.");
@@ -544,11 +610,72 @@ namespace triton {
       this->initEngines();
       this->clearArchitecture();
       this->clearCallbacks();
+      this->clearHooks();
       this->clearModes();
     }
   }
 
 
+  triton::Snapshot Context::snapshot(void) const {
+    triton::Snapshot snap;
+
+    this->checkArchitecture();
+    this->checkSymbolic();
+    this->checkTaint();
+
+    snap.generation = this->generation;
+    this->arch.snapshot(snap);
+    this->symbolic->snapshot(snap);
+    this->taint->snapshot(snap);
+
+    return snap;
+  }
+
+
+  void Context::restore(const triton::Snapshot& snap) {
+    this->checkArchitecture();
+    this->checkSymbolic();
+    this->checkTaint();
+
+    if (snap.generation != this->generation)
+      throw triton::exceptions::Context("Context::restore(): The snapshot has been taken by another context.");
+
+    this->arch.restore(snap);
+    this->symbolic->restore(snap);
+    this->taint->restore(snap);
+  }
+
+
+  triton::RegisterState Context::saveRegisterState(void) const {
+    triton::RegisterState state;
+
+    this->checkArchitecture();
+    this->checkSymbolic();
+    this->checkTaint();
+
+    state.generation = this->generation;
+    this->arch.snapshot(state);
+    this->symbolic->snapshot(state);
+    this->taint->snapshot(state);
+
+    return state;
+  }
+
+
+  void Context::restoreRegisterState(const triton::RegisterState& state) {
+    this->checkArchitecture();
+    this->checkSymbolic();
+    this->checkTaint();
+
+    if (state.generation != this->generation)
+      throw triton::exceptions::Context("Context::restoreRegisterState(): The register state has been saved by another context.");
+
+    this->arch.restore(state);
+    this->symbolic->restore(state);
+    this->taint->restore(state);
+  }
+
+
   triton::arch::exception_e Context::processing(triton::arch::Instruction& inst) {
     this->checkArchitecture();
     this->arch.disassembly(inst);
@@ -563,6 +690,87 @@ namespace triton {
   }
 
 
+  triton::arch::stop_e Context::emulate(triton::uint64 addr, const std::unordered_set<triton::uint64>& stops, triton::usize limit, triton::uint32 timeout, triton::usize* count, triton::arch::exception_e* fault, const std::function<bool(void)>& interrupted) {
+    auto start = std::chrono::steady_clock::now();
+    triton::arch::exception_e ret = triton::arch::NO_FAULT;
+    triton::arch::stop_e reason = triton::arch::STOP_ADDRESS;
+    triton::usize processed = 0;
+    triton::usize polls = 0;
+    triton::uint64 pc = addr;
+
+    this->checkArchitecture();
+
+    while (true) {
+      if (stops.find(pc) != stops.end()) {
+        reason = triton::arch::STOP_ADDRESS;
+        break;
+      }
+
+      /* The interruption may be costly to check (e.g. it takes the GIL), so it is only polled periodically */
+      if (interrupted && ++polls == EMULATE_POLL_PERIOD) {
+        polls = 0;
+        if (interrupted()) {
+          reason = triton::arch::STOP_INTERRUPTED;
+          break;
+        }
+      }
+
+      if (limit != 0 && processed >= limit) {
+        reason = triton::arch::STOP_COUNT;
+        break;
+      }
+
+      if (timeout != 0 && std::chrono::steady_clock::now() - start >= std::chrono::milliseconds(timeout)) {
+        reason = triton::arch::STOP_TIMEOUT;
+        break;
+      }
+
+      if (this->callbacks.isHooked(pc)) {
+        if (!this->callbacks.processHook(pc)) {
+          reason = triton::arch::STOP_HOOK;
+          break;
+        }
+        /* A hook counts as a step, thus a looping hook is still bounded by the limit */
+        processed++;
+        pc = static_cast<triton::uint64>(this->arch.getConcreteRegisterValue(this->arch.getProgramCounter(), false));
+        continue;
+      }
+
+      /* The code is fetched with callbacks, thus it may be lazily supplied by the user */
+      triton::uint8 opcode[16];
+      this->arch.getConcreteMemoryAreaValue(pc, opcode, sizeof(opcode), true);
+      if (!this->arch.isConcreteMemoryValueDefined(pc)) {
+        reason = triton::arch::STOP_NO_CODE;
+        break;
+      }
+      triton::arch::Instruction inst(pc, opcode, sizeof(opcode));
+
+      try {
+        ret = this->processing(inst);
+      }
+      catch (const triton::exceptions::Disassembly&) {
+        ret = triton::arch::FAULT_UD;
+      }
+
+      if (ret != triton::arch::NO_FAULT) {
+        reason = triton::arch::STOP_FAULT;
+        break;
+      }
+
+      processed++;
+      pc = static_cast<triton::uint64>(this->arch.getConcreteRegisterValue(this->arch.getProgramCounter(), false));
+    }
+
+    if (count)
+      *count = processed;
+
+    if (fault)
+      *fault = ret;
+
+    return reason;
+  }
+
+
 
   /* IR builder Context ================================================================================= */
 
@@ -599,12 +807,14 @@ namespace triton {
 
   /* Callbacks Context ================================================================================= */
 
+  template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb);
   template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb);
   template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::Register&)> cb);
   template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&, const triton::uint512& value)> cb);
   template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::Register&, const triton::uint512& value)> cb);
   template TRITON_EXPORT void Context::addCallback(triton::callbacks::callback_e kind, ComparableFunctor<triton::ast::SharedAbstractNode(triton::Context&, const triton::ast::SharedAbstractNode&)> cb);
 
+  template TRITON_EXPORT void Context::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb);
   template TRITON_EXPORT void Context::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb);
   template TRITON_EXPORT void Context::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::Register&)> cb);
   template TRITON_EXPORT void Context::removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&, const triton::uint512& value)> cb);
@@ -617,6 +827,31 @@ namespace triton {
   }
 
 
+  void Context::addHook(triton::uint64 addr, const triton::callbacks::hookCallback& cb) {
+    this->callbacks.addHook(addr, cb);
+  }
+
+
+  void Context::addHook(triton::uint64 addr, triton::callbacks::summary_e kind) {
+    this->callbacks.addHook(addr, triton::callbacks::summaries::getSummary(kind));
+  }
+
+
+  void Context::removeHook(triton::uint64 addr) {
+    this->callbacks.removeHook(addr);
+  }
+
+
+  void Context::clearHooks(void) {
+    this->callbacks.clearHooks();
+  }
+
+
+  bool Context::isHooked(triton::uint64 addr) const {
+    return this->callbacks.isHooked(addr);
+  }
+
+
   triton::ast::SharedAbstractNode Context::processCallbacks(triton::callbacks::callback_e kind, triton::ast::SharedAbstractNode node) {
     if (this->callbacks.isDefined()) {
       return this->callbacks.processCallbacks(kind, node);
@@ -804,7 +1039,7 @@ namespace triton {
   }
 
 
-  std::unordered_map<triton::uint64, triton::engines::symbolic::SharedSymbolicExpression> Context::getSymbolicMemory(void) const {
+  const std::unordered_map<triton::uint64, triton::engines::symbolic::SharedSymbolicExpression>& Context::getSymbolicMemory(void) const {
     this->checkSymbolic();
     return this->symbolic->getSymbolicMemory();
   }
@@ -854,6 +1089,11 @@ namespace triton {
   }
 
 
+  std::vector<triton::uint512> Context::evaluateAstBatch(const triton::ast::SharedAbstractNode& node, const std::unordered_map<triton::usize, std::vector<triton::uint512>>& inputs) const {
+    return triton::ast::BatchEvaluator(node).evaluate(inputs);
+  }
+
+
   triton::arch::BasicBlock Context::simplify(const triton::arch::BasicBlock& block, bool padding) const {
     this->checkSymbolic();
     return this->symbolic->simplify(block, padding);
@@ -1118,6 +1358,120 @@ namespace triton {
   }
 
 
+  triton::uint32 Context::getSolverWorkers(void) const {
+    this->checkSolver();
+    return this->solver->getWorkers();
+  }
+
+
+  void Context::setSolverWorkers(triton::uint32 workers) {
+    this->checkSolver();
+    this->solver->setWorkers(workers);
+  }
+
+
+  triton::usize Context::getSolverQueryCacheSize(void) const {
+    this->checkSolver();
+    return this->solver->getQueryCacheSize();
+  }
+
+
+  void Context::setSolverQueryCacheSize(triton::usize size) {
+    this->checkSolver();
+    this->solver->setQueryCacheSize(size);
+  }
+
+
+  triton::engines::solver::QueryCacheStats Context::getSolverQueryCacheStats(void) const {
+    this->checkSolver();
+    return this->solver->getQueryCacheStats();
+  }
+
+
+  void Context::clearSolverQueryCache(void) {
+    this->checkSolver();
+    this->solver->clearQueryCache();
+  }
+
+
+  std::map<triton::engines::solver::solver_e, triton::engines::solver::PortfolioStats> Context::getSolverPortfolioStats(void) const {
+    this->checkSolver();
+    return this->solver->getPortfolioStats();
+  }
+
+
+  bool Context::isSolverIndependenceEnabled(void) const {
+    this->checkSolver();
+    return this->solver->isConstraintIndependenceEnabled();
+  }
+
+
+  void Context::setSolverIndependence(bool flag) {
+    this->checkSolver();
+    this->solver->setConstraintIndependence(flag);
+  }
+
+
+  triton::engines::solver::SolverSession& Context::getSolverSession(void) {
+    this->checkSolver();
+    return this->solver->getSession();
+  }
+
+
+  void Context::pushSessionConstraint(const triton::ast::SharedAbstractNode& node) {
+    this->checkSolver();
+    this->solver->getSession().push(node);
+  }
+
+
+  void Context::popSessionConstraint(void) {
+    this->checkSolver();
+    this->solver->getSession().pop();
+  }
+
+
+  void Context::clearSessionConstraints(void) {
+    this->checkSolver();
+    if (this->solver->hasSession())
+      this->solver->getSession().reset();
+  }
+
+
+  void Context::syncSessionConstraints(void) {
+    std::vector<triton::ast::SharedAbstractNode> nodes;
+
+    this->checkSolver();
+    this->checkSymbolic();
+
+    const auto& pcs = this->symbolic->getPathConstraints();
+    nodes.reserve(pcs.size());
+    for (const auto& pc : pcs)
+      nodes.push_back(pc.getTakenPredicate());
+
+    this->solver->getSession().sync(nodes);
+  }
+
+
+  triton::usize Context::getSizeOfSessionConstraints(void) {
+    this->checkSolver();
+    if (!this->solver->hasSession())
+      return 0;
+    return this->solver->getSession().getSize();
+  }
+
+
+  bool Context::isSessionSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+    this->checkSolver();
+    return this->solver->getSession().isSat(node, status, timeout, solvingTime);
+  }
+
+
+  std::unordered_map<triton::usize, triton::engines::solver::SolverModel> Context::getSessionModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+    this->checkSolver();
+    return this->solver->getSession().getModel(node, status, timeout, solvingTime);
+  }
+
+
 
   /* Taint engine Context ============================================================================== */
 
@@ -1342,6 +1696,17 @@ namespace triton {
   }
 
 
+  std::vector<triton::ast::SharedAbstractNode> Context::parseSmt(std::istream& stream) {
+    this->checkSymbolic();
+    return this->astCtxt->parseSmt(stream, [this](const std::string& name, triton::uint32 size) {
+      auto symVar = this->symbolic->findSymbolicVariable(name);
+      if (symVar == nullptr && size != 0)
+        symVar = this->symbolic->newSymbolicVariable(triton::engines::symbolic::UNDEFINED_VARIABLE, 0, size, name);
+      return symVar;
+    });
+  }
+
+
   std::ostream& Context::liftToDot(std::ostream& stream, const triton::ast::SharedAbstractNode& node) {
     this->checkLifting();
     return this->lifting->liftToDot(stream, node);
@@ -0,0 +1,25 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/registerState.hpp>
+
+
+
+namespace triton {
+
+  RegisterState::RegisterState() {
+    this->arch       = triton::arch::ARCH_INVALID;
+    this->generation = 0;
+    this->thumb      = false;
+  }
+
+
+  triton::arch::architecture_e RegisterState::getArchitecture(void) const {
+    return this->arch;
+  }
+
+}; /* triton namespace */
@@ -0,0 +1,29 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/snapshot.hpp>
+
+
+
+namespace triton {
+
+  Snapshot::Snapshot() {
+    this->arch       = triton::arch::ARCH_INVALID;
+    this->generation = 0;
+  }
+
+
+  triton::arch::architecture_e Snapshot::getArchitecture(void) const {
+    return this->arch;
+  }
+
+
+  triton::usize Snapshot::getSizeOfPathConstraints(void) const {
+    return this->pathConstraints ? this->pathConstraints->size : 0;
+  }
+
+}; /* triton namespace */
@@ -0,0 +1,170 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <chrono>
+#include <string>
+
+#include <triton/bitwuzlaSession.hpp>
+#include <triton/bitwuzlaSolver.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/symbolicVariable.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace solver {
+
+      BitwuzlaSession::BitwuzlaSession() {
+        this->timeout = 0;
+        this->memoryLimit = 0;
+        this->bzla = nullptr;
+
+        // Set bitwuzla abort function.
+        bitwuzla_set_abort_callback(BitwuzlaSolver::abortCallback);
+
+        this->init();
+      }
+
+
+      BitwuzlaSession::~BitwuzlaSession() {
+        this->release();
+        this->constraints.clear();
+      }
+
+
+      void BitwuzlaSession::init(void) {
+        this->bzla = bitwuzla_new();
+        bitwuzla_set_option(this->bzla, BITWUZLA_OPT_PRODUCE_MODELS, 1);
+        bitwuzla_set_option(this->bzla, BITWUZLA_OPT_INCREMENTAL, 1);
+        this->converter.reset(new triton::ast::TritonToBitwuzla());
+      }
+
+
+      void BitwuzlaSession::release(void) {
+        /* The converter keeps terms and sorts of the Bitwuzla instance */
+        this->converter.reset();
+        if (this->bzla) {
+          bitwuzla_delete(this->bzla);
+          this->bzla = nullptr;
+        }
+      }
+
+
+      const BitwuzlaTerm* BitwuzlaSession::convert(const triton::ast::SharedAbstractNode& node) {
+        triton::ast::SharedAbstractNode onode = node;
+
+        if (onode == nullptr)
+          throw triton::exceptions::SolverEngine("BitwuzlaSession::convert(): node cannot be null.");
+
+        /* Bitwuzla does not need an assert() as root node */
+        if (onode->getType() == triton::ast::ASSERT_NODE)
+          onode = onode->getChildren()[0];
+
+        if (onode->isLogical() == false)
+          throw triton::exceptions::SolverEngine("BitwuzlaSession::convert(): Must be a logical node.");
+
+        return this->converter->convert(onode, this->bzla);
+      }
+
+
+      BitwuzlaResult BitwuzlaSession::check(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        /* The node is only assumed, so it is dropped after the check */
+        if (node != nullptr)
+          bitwuzla_assume(this->bzla, this->convert(node));
+
+        /* The callback is only called during bitwuzla_check_sat(), so the parameters can live on the stack */
+        BitwuzlaSolver::SolverParams p(timeout ? timeout : this->timeout, this->memoryLimit);
+        bitwuzla_set_termination_callback(this->bzla, BitwuzlaSolver::terminateCallback, reinterpret_cast<void*>(&p));
+
+        /* Get time of solving start */
+        auto start = std::chrono::system_clock::now();
+
+        auto res = bitwuzla_check_sat(this->bzla);
+
+        /* Get time of solving end */
+        auto end = std::chrono::system_clock::now();
+
+        if (solvingTime)
+          *solvingTime = std::chrono::duration_cast<std::chrono::milliseconds>(end - start).count();
+
+        if (status) {
+          switch (res) {
+            case BITWUZLA_SAT:
+              *status = triton::engines::solver::SAT;
+              break;
+            case BITWUZLA_UNSAT:
+              *status = triton::engines::solver::UNSAT;
+              break;
+            case BITWUZLA_UNKNOWN:
+              *status = p.status;
+              break;
+          }
+        }
+
+        return res;
+      }
+
+
+      void BitwuzlaSession::push(const triton::ast::SharedAbstractNode& node) {
+        auto term = this->convert(node);
+        bitwuzla_push(this->bzla, 1);
+        bitwuzla_assert(this->bzla, term);
+        this->constraints.push_back(node);
+      }
+
+
+      void BitwuzlaSession::pop(void) {
+        if (this->constraints.empty())
+          throw triton::exceptions::SolverEngine("BitwuzlaSession::pop(): The session is empty.");
+
+        bitwuzla_pop(this->bzla, 1);
+        this->constraints.pop_back();
+      }
+
+
+      void BitwuzlaSession::reset(void) {
+        this->release();
+        this->constraints.clear();
+        this->init();
+      }
+
+
+      bool BitwuzlaSession::isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        return this->check(node, status, timeout, solvingTime) == BITWUZLA_SAT;
+      }
+
+
+      std::unordered_map<triton::usize, SolverModel> BitwuzlaSession::getModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        std::unordered_map<triton::usize, SolverModel> ret;
+
+        if (this->check(node, status, timeout, solvingTime) != BITWUZLA_SAT)
+          return ret;
+
+        /* The model contains every symbolic variable translated by the session */
+        for (const auto& it : this->converter->getVariables()) {
+          auto value = BitwuzlaSolver::fromBvalueToUint512(bitwuzla_get_bv_value(this->bzla, it.first));
+          auto m = SolverModel(it.second, value);
+          ret[m.getId()] = m;
+        }
+
+        return ret;
+      }
+
+
+      void BitwuzlaSession::setTimeout(triton::uint32 ms) {
+        this->timeout = ms;
+      }
+
+
+      void BitwuzlaSession::setMemoryLimit(triton::uint32 limit) {
+        this->memoryLimit = limit;
+      }
+
+    };
+  };
+};
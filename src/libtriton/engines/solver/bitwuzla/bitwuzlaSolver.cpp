@@ -32,9 +32,42 @@ namespace triton {
       }
 
 
+      BitwuzlaSolver::RunningQuery::RunningQuery(const BitwuzlaSolver& solver, SolverParams* params)
+        : solver(solver), params(params) {
+        std::lock_guard<std::mutex> lock(this->solver.runningLock);
+        this->solver.running.insert({std::this_thread::get_id(), this->params});
+      }
+
+
+      BitwuzlaSolver::RunningQuery::~RunningQuery() {
+        std::lock_guard<std::mutex> lock(this->solver.runningLock);
+        auto range = this->solver.running.equal_range(std::this_thread::get_id());
+        for (auto it = range.first; it != range.second; it++) {
+          if (it->second == this->params) {
+            this->solver.running.erase(it);
+            break;
+          }
+        }
+      }
+
+
+      void BitwuzlaSolver::interrupt(std::thread::id thread) {
+        std::lock_guard<std::mutex> lock(this->runningLock);
+        auto range = this->running.equal_range(thread);
+        for (auto it = range.first; it != range.second; it++)
+          it->second->interrupted = true;
+      }
+
+
       int32_t BitwuzlaSolver::terminateCallback(void* state) {
         auto p = reinterpret_cast<SolverParams*>(state);
 
+        // Check interruption.
+        if (p->interrupted) {
+          p->status = triton::engines::solver::UNKNOWN;
+          return 1;
+        }
+
         // Count elapsed time.
         auto delta = std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::system_clock::now() - p->start).count();
 
@@ -109,11 +142,10 @@ namespace triton {
         auto bzlaAst = triton::ast::TritonToBitwuzla();
         bitwuzla_assert(bzla, bzlaAst.convert(node, bzla));
 
-        // Set solving params.
+        // Set solving params. The callback is always set, the query may be interrupted.
         SolverParams p(this->timeout, this->memoryLimit);
-        if (this->timeout || this->memoryLimit) {
-          bitwuzla_set_termination_callback(bzla, this->terminateCallback, reinterpret_cast<void*>(&p));
-        }
+        RunningQuery running(*this, &p);
+        bitwuzla_set_termination_callback(bzla, this->terminateCallback, reinterpret_cast<void*>(&p));
 
         // Get time of solving start.
         auto start = std::chrono::system_clock::now();
@@ -247,7 +279,7 @@ namespace triton {
       }
 
 
-      triton::uint512 BitwuzlaSolver::fromBvalueToUint512(const char* value) const {
+      triton::uint512 BitwuzlaSolver::fromBvalueToUint512(const char* value) {
         triton::usize   len = strlen(value);
         triton::usize   pos = 0;
         triton::uint512 res = 0;
@@ -0,0 +1,217 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <chrono>
+#include <condition_variable>
+#include <thread>
+
+#include <triton/exceptions.hpp>
+#include <triton/portfolioSolver.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace solver {
+
+      PortfolioSolver::PortfolioSolver() {
+      }
+
+
+      void PortfolioSolver::addSolver(triton::engines::solver::solver_e kind, triton::engines::solver::SolverInterface* solver) {
+        std::unique_ptr<triton::engines::solver::SolverInterface> owned(solver);
+
+        if (solver == nullptr)
+          throw triton::exceptions::SolverEngine("PortfolioSolver::addSolver(): solver cannot be null.");
+
+        if (this->getSolver(kind) != nullptr)
+          throw triton::exceptions::SolverEngine("PortfolioSolver::addSolver(): This kind of solver is already part of the portfolio.");
+
+        std::lock_guard<std::mutex> lock(this->mutex);
+        this->solvers.push_back({kind, std::move(owned)});
+        this->stats.push_back({0, 0});
+      }
+
+
+      triton::engines::solver::SolverInterface* PortfolioSolver::getSolver(triton::engines::solver::solver_e kind) const {
+        for (const auto& item : this->solvers) {
+          if (item.first == kind)
+            return item.second.get();
+        }
+        return nullptr;
+      }
+
+
+      std::map<triton::engines::solver::solver_e, PortfolioStats> PortfolioSolver::getStats(void) const {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        std::map<triton::engines::solver::solver_e, PortfolioStats> ret;
+
+        for (triton::usize i = 0; i < this->solvers.size(); i++)
+          ret[this->solvers[i].first] = this->stats[i];
+
+        return ret;
+      }
+
+
+      void PortfolioSolver::clearStats(void) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        for (auto& item : this->stats)
+          item = {0, 0};
+      }
+
+
+      template <typename T>
+      T PortfolioSolver::race(const std::function<T(const SolverInterface&, triton::engines::solver::status_e*, triton::uint32*)>& query, const char* where, triton::engines::solver::status_e* status, triton::uint32* solvingTime) const {
+        static const triton::usize none = static_cast<triton::usize>(-1);
+        triton::usize count = this->solvers.size();
+
+        if (count == 0)
+          throw triton::exceptions::SolverEngine(std::string(where) + ": The portfolio is empty.");
+
+        std::vector<T> results(count);
+        std::vector<triton::engines::solver::status_e> states(count, triton::engines::solver::UNKNOWN);
+        std::vector<triton::uint32> times(count, 0);
+        std::vector<std::string> errors(count);
+        std::vector<std::thread::id> ids(count);
+        std::condition_variable done;
+        std::mutex lock;
+        triton::usize finished = 0;
+        triton::usize winner   = none;
+
+        auto worker = [&](triton::usize index) {
+          triton::engines::solver::status_e st = triton::engines::solver::UNKNOWN;
+          triton::uint32 time = 0;
+          std::string error;
+          T result{};
+
+          try {
+            result = query(*this->solvers[index].second, &st, &time);
+          }
+          catch (const std::exception& e) {
+            st    = triton::engines::solver::UNKNOWN;
+            error = e.what();
+          }
+
+          std::lock_guard<std::mutex> guard(lock);
+          results[index] = std::move(result);
+          states[index]  = st;
+          times[index]   = time;
+          errors[index]  = std::move(error);
+          if (winner == none && (st == triton::engines::solver::SAT || st == triton::engines::solver::UNSAT))
+            winner = index;
+          finished++;
+          done.notify_all();
+        };
+
+        std::vector<std::thread> threads;
+        for (triton::usize i = 0; i < count; i++) {
+          threads.emplace_back(worker, i);
+          ids[i] = threads.back().get_id();
+        }
+
+        {
+          std::unique_lock<std::mutex> guard(lock);
+          done.wait(guard, [&]() { return winner != none || finished == count; });
+
+          /*
+           * Interrupt the losers until they return. The interruption is repeated because a solver
+           * may not have started its query yet when it is first interrupted.
+           */
+          while (finished != count) {
+            for (triton::usize i = 0; i < count; i++) {
+              if (i != winner)
+                this->solvers[i].second->interrupt(ids[i]);
+            }
+            done.wait_for(guard, std::chrono::milliseconds(10), [&]() { return finished == count; });
+          }
+        }
+
+        for (auto& thread : threads)
+          thread.join();
+
+        /* Without definitive answer, the first solver gives the result */
+        triton::usize index = winner;
+        if (index == none) {
+          if (!errors[0].empty())
+            throw triton::exceptions::SolverEngine(std::string(where) + ": " + errors[0]);
+          index = 0;
+        }
+        else {
+          std::lock_guard<std::mutex> guard(this->mutex);
+          this->stats[index].wins++;
+          this->stats[index].time += times[index];
+        }
+
+        if (status)
+          *status = states[index];
+
+        if (solvingTime)
+          *solvingTime = times[index];
+
+        return std::move(results[index]);
+      }
+
+
+      std::unordered_map<triton::usize, SolverModel> PortfolioSolver::getModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("PortfolioSolver::getModel(): node cannot be null.");
+
+        using Model = std::unordered_map<triton::usize, SolverModel>;
+        return this->race<Model>([&](const SolverInterface& solver, triton::engines::solver::status_e* st, triton::uint32* time) {
+          return solver.getModel(node, st, timeout, time);
+        }, "PortfolioSolver::getModel()", status, solvingTime);
+      }
+
+
+      std::vector<std::unordered_map<triton::usize, SolverModel>> PortfolioSolver::getModels(const triton::ast::SharedAbstractNode& node, triton::uint32 limit, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("PortfolioSolver::getModels(): node cannot be null.");
+
+        using Models = std::vector<std::unordered_map<triton::usize, SolverModel>>;
+        return this->race<Models>([&](const SolverInterface& solver, triton::engines::solver::status_e* st, triton::uint32* time) {
+          return solver.getModels(node, limit, st, timeout, time);
+        }, "PortfolioSolver::getModels()", status, solvingTime);
+      }
+
+
+      bool PortfolioSolver::isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("PortfolioSolver::isSat(): node cannot be null.");
+
+        return this->race<bool>([&](const SolverInterface& solver, triton::engines::solver::status_e* st, triton::uint32* time) {
+          return solver.isSat(node, st, timeout, time);
+        }, "PortfolioSolver::isSat()", status, solvingTime);
+      }
+
+
+      std::string PortfolioSolver::getName(void) const {
+        std::string name = "portfolio(";
+
+        for (triton::usize i = 0; i < this->solvers.size(); i++) {
+          if (i)
+            name += ", ";
+          name += this->solvers[i].second->getName();
+        }
+
+        return name + ")";
+      }
+
+
+      void PortfolioSolver::setTimeout(triton::uint32 ms) {
+        for (auto& item : this->solvers)
+          item.second->setTimeout(ms);
+      }
+
+
+      void PortfolioSolver::setMemoryLimit(triton::uint32 limit) {
+        for (auto& item : this->solvers)
+          item.second->setMemoryLimit(limit);
+      }
+
+    };
+  };
+};
@@ -0,0 +1,530 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <functional>
+#include <memory>
+#include <set>
+#include <stack>
+#include <string>
+#include <unordered_set>
+
+#include <triton/batchEvaluator.hpp>
+#include <triton/exceptions.hpp>
+#include <triton/queryCache.hpp>
+#include <triton/symbolicExpression.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace solver {
+
+      /* Combines a value into a hash */
+      static inline triton::uint64 mix(triton::uint64 hash, triton::uint64 value) {
+        return hash ^ (value + 0x9e3779b97f4a7c15ULL + (hash << 6) + (hash >> 2));
+      }
+
+
+      /* Returns the node pointed by a reference node, or the node itself */
+      static inline triton::ast::AbstractNode* resolve(triton::ast::AbstractNode* node) {
+        while (node->getType() == triton::ast::REFERENCE_NODE)
+          node = reinterpret_cast<triton::ast::ReferenceNode*>(node)->getSymbolicExpression()->getAst().get();
+        return node;
+      }
+
+
+      QueryCache::QueryCache() {
+        this->capacity = 0;
+        this->stats    = {0, 0, 0, 0, 0, 0};
+      }
+
+
+      bool QueryCache::isEnabled(void) const {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        return this->capacity != 0;
+      }
+
+
+      triton::usize QueryCache::getCapacity(void) const {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        return this->capacity;
+      }
+
+
+      void QueryCache::setCapacity(triton::usize capacity) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        this->capacity = capacity;
+        this->shrink();
+      }
+
+
+      QueryCacheStats QueryCache::getStats(void) const {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        QueryCacheStats ret = this->stats;
+        ret.entries = this->entries.size();
+        return ret;
+      }
+
+
+      void QueryCache::clear(void) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        this->entries.clear();
+        this->index.clear();
+        this->conjunctIndex.clear();
+        this->unsatConjuncts.clear();
+        this->stats = {0, 0, 0, 0, 0, 0};
+      }
+
+
+      void QueryCache::unindex(std::list<Entry>::iterator entry) {
+        auto range = this->index.equal_range(entry->key.hash);
+        for (auto it = range.first; it != range.second; it++) {
+          if (it->second == entry) {
+            this->index.erase(it);
+            break;
+          }
+        }
+
+        for (const auto& c : entry->key.conjuncts) {
+          auto range = this->conjunctIndex.equal_range(static_cast<triton::uint64>(c->getHash()));
+          for (auto it = range.first; it != range.second;) {
+            if (it->second == entry)
+              it = this->conjunctIndex.erase(it);
+            else
+              it++;
+          }
+        }
+      }
+
+
+      void QueryCache::shrink(void) {
+        while (this->entries.size() > this->capacity) {
+          this->unindex(std::prev(this->entries.end()));
+          this->entries.pop_back();
+          this->stats.evictions++;
+        }
+
+        while (this->unsatConjuncts.size() > this->capacity)
+          this->unsatConjuncts.pop_back();
+      }
+
+
+      QueryKey QueryCache::makeKey(const triton::ast::SharedAbstractNode& node) {
+        std::unordered_map<triton::ast::AbstractNode*, triton::uint64> hashes;
+        std::unordered_map<triton::usize, triton::usize> ordinals;
+        QueryKey key;
+
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("QueryCache::makeKey(): node cannot be null.");
+
+        key.node = node;
+        if (key.node->getType() == triton::ast::ASSERT_NODE)
+          key.node = key.node->getChildren()[0];
+
+        /* Children are hashed before their parents */
+        for (auto&& n : triton::ast::childrenExtraction(key.node, true /* unroll */, true /* revert */)) {
+          triton::uint64 hash = mix(n->getType(), n->getBitvectorSize());
+
+          switch (n->getType()) {
+            case triton::ast::INTEGER_NODE: {
+              triton::uint512 value = triton::ast::getInteger<triton::uint512>(n);
+              for (triton::uint32 i = 0; i < 8; i++) {
+                hash = mix(hash, static_cast<triton::uint64>(value));
+                value >>= 64;
+              }
+              break;
+            }
+
+            case triton::ast::REFERENCE_NODE:
+              /* References are transparent */
+              hash = hashes.at(resolve(n.get()));
+              break;
+
+            case triton::ast::STRING_NODE:
+              hash = mix(hash, std::hash<std::string>{}(reinterpret_cast<triton::ast::StringNode*>(n.get())->getString()));
+              break;
+
+            case triton::ast::VARIABLE_NODE: {
+              const auto& var = reinterpret_cast<triton::ast::VariableNode*>(n.get())->getSymbolicVariable();
+              auto it = ordinals.find(var->getId());
+              if (it == ordinals.end()) {
+                it = ordinals.insert({var->getId(), key.variables.size()}).first;
+                key.variables.push_back(var);
+              }
+              /* Variables are identified by their order of first occurrence, not by their name */
+              hash = mix(hash, it->second);
+              break;
+            }
+
+            default:
+              for (auto&& child : n->getChildren())
+                hash = mix(hash, hashes.at(child.get()));
+              break;
+          }
+
+          hashes[n.get()] = hash;
+        }
+
+        key.hash = hashes.at(key.node.get());
+
+        /* Flatten the conjunction */
+        std::stack<triton::ast::AbstractNode*> worklist;
+        worklist.push(key.node.get());
+        while (!worklist.empty()) {
+          triton::ast::AbstractNode* n = resolve(worklist.top());
+          worklist.pop();
+          if (n->getType() == triton::ast::LAND_NODE) {
+            const auto& children = n->getChildren();
+            for (auto it = children.rbegin(); it != children.rend(); it++)
+              worklist.push(it->get());
+          }
+          else {
+            key.conjuncts.push_back(n->shared_from_this());
+          }
+        }
+
+        return key;
+      }
+
+
+      bool QueryCache::isEquivalent(const triton::ast::SharedAbstractNode& a, const triton::ast::SharedAbstractNode& b, bool renaming) {
+        std::unordered_map<triton::usize, triton::usize> forward;
+        std::unordered_map<triton::usize, triton::usize> backward;
+        std::set<std::pair<triton::ast::AbstractNode*, triton::ast::AbstractNode*>> visited;
+        std::stack<std::pair<triton::ast::AbstractNode*, triton::ast::AbstractNode*>> worklist;
+
+        worklist.push({a.get(), b.get()});
+        while (!worklist.empty()) {
+          triton::ast::AbstractNode* x = resolve(worklist.top().first);
+          triton::ast::AbstractNode* y = resolve(worklist.top().second);
+          worklist.pop();
+
+          /* Without renaming, a shared sub-tree is equivalent to itself */
+          if (x == y && !renaming)
+            continue;
+
+          if (!visited.insert({x, y}).second)
+            continue;
+
+          if (x->getType() != y->getType() || x->getBitvectorSize() != y->getBitvectorSize() || x->getChildren().size() != y->getChildren().size())
+            return false;
+
+          switch (x->getType()) {
+            case triton::ast::INTEGER_NODE:
+              if (reinterpret_cast<triton::ast::IntegerNode*>(x)->getInteger() != reinterpret_cast<triton::ast::IntegerNode*>(y)->getInteger())
+                return false;
+              break;
+
+            case triton::ast::STRING_NODE:
+              if (reinterpret_cast<triton::ast::StringNode*>(x)->getString() != reinterpret_cast<triton::ast::StringNode*>(y)->getString())
+                return false;
+              break;
+
+            case triton::ast::VARIABLE_NODE: {
+              triton::usize idx = reinterpret_cast<triton::ast::VariableNode*>(x)->getSymbolicVariable()->getId();
+              triton::usize idy = reinterpret_cast<triton::ast::VariableNode*>(y)->getSymbolicVariable()->getId();
+              if (!renaming) {
+                if (idx != idy)
+                  return false;
+                break;
+              }
+              /* The renaming must be a bijection */
+              auto fw = forward.insert({idx, idy}).first;
+              auto bw = backward.insert({idy, idx}).first;
+              if (fw->second != idy || bw->second != idx)
+                return false;
+              break;
+            }
+
+            default: {
+              const auto& cx = x->getChildren();
+              const auto& cy = y->getChildren();
+              for (triton::usize i = 0; i < cx.size(); i++)
+                worklist.push({cx[i].get(), cy[i].get()});
+              break;
+            }
+          }
+        }
+
+        return true;
+      }
+
+
+      bool QueryCache::contains(const std::unordered_multimap<triton::uint64, const triton::ast::SharedAbstractNode*, IdentityHash<triton::uint64>>& conjuncts, const triton::ast::SharedAbstractNode& node) {
+        auto range = conjuncts.equal_range(static_cast<triton::uint64>(node->getHash()));
+        for (auto it = range.first; it != range.second; it++) {
+          if (QueryCache::isEquivalent(node, *it->second, false))
+            return true;
+        }
+        return false;
+      }
+
+
+      bool QueryCache::isSubsumed(const std::vector<triton::ast::SharedAbstractNode>& conjuncts) {
+        std::unordered_multimap<triton::uint64, const triton::ast::SharedAbstractNode*, IdentityHash<triton::uint64>> present;
+
+        if (this->unsatConjuncts.empty())
+          return false;
+
+        for (const auto& c : conjuncts)
+          present.insert({static_cast<triton::uint64>(c->getHash()), &c});
+
+        for (auto it = this->unsatConjuncts.begin(); it != this->unsatConjuncts.end(); it++) {
+          bool all = true;
+
+          if (it->size() > conjuncts.size())
+            continue;
+
+          for (const auto& u : *it) {
+            if (!QueryCache::contains(present, u)) {
+              all = false;
+              break;
+            }
+          }
+
+          if (all) {
+            this->unsatConjuncts.splice(this->unsatConjuncts.begin(), this->unsatConjuncts, it);
+            return true;
+          }
+        }
+
+        return false;
+      }
+
+
+      bool QueryCache::findCounterexample(const QueryKey& key, std::unordered_map<triton::usize, SolverModel>* model) {
+        std::unordered_multimap<triton::uint64, const triton::ast::SharedAbstractNode*, IdentityHash<triton::uint64>> present;
+        std::unordered_set<triton::usize> variables;
+        std::unordered_set<const Entry*> visited;
+        std::vector<std::list<Entry>::iterator> candidates;
+        std::unique_ptr<triton::ast::BatchEvaluator> evaluator;
+        bool evaluable = true;
+
+        for (const auto& c : key.conjuncts)
+          present.insert({static_cast<triton::uint64>(c->getHash()), &c});
+
+        for (const auto& var : key.variables)
+          variables.insert(var->getId());
+
+        /* Only the cached queries sharing a conjunct hash with the new one are candidates */
+        for (const auto& c : key.conjuncts) {
+          auto range = this->conjunctIndex.equal_range(static_cast<triton::uint64>(c->getHash()));
+          for (auto it = range.first; it != range.second; it++) {
+            if (visited.insert(&*it->second).second)
+              candidates.push_back(it->second);
+          }
+        }
+
+        for (auto entry : candidates) {
+          if (entry->status != triton::engines::solver::SAT || !entry->hasModel)
+            continue;
+
+          /* Count the conjuncts of the cached query which belong to the new one */
+          triton::usize found = 0;
+          for (const auto& c : entry->key.conjuncts) {
+            if (QueryCache::contains(present, c))
+              found++;
+          }
+          if (found == 0)
+            continue;
+
+          /* A superset of the conjuncts: the model holds without evaluation */
+          bool superset = true;
+          std::unordered_multimap<triton::uint64, const triton::ast::SharedAbstractNode*, IdentityHash<triton::uint64>> cached;
+          for (const auto& c : entry->key.conjuncts)
+            cached.insert({static_cast<triton::uint64>(c->getHash()), &c});
+          for (const auto& c : key.conjuncts) {
+            if (!QueryCache::contains(cached, c)) {
+              superset = false;
+              break;
+            }
+          }
+
+          /* A subset of the conjuncts: the model must satisfy the new query. Missing variables keep their concrete value */
+          std::unordered_map<triton::usize, triton::ast::BatchEvaluator::Column> inputs;
+          if (!superset) {
+            if (found != entry->key.conjuncts.size() || !evaluable)
+              continue;
+
+            if (evaluator == nullptr) {
+              try {
+                evaluator.reset(new triton::ast::BatchEvaluator(key.node));
+              }
+              catch (const triton::exceptions::Ast&) {
+                /* The query contains nodes which cannot be evaluated (arrays) */
+                evaluable = false;
+                continue;
+              }
+            }
+
+            for (const auto& item : entry->model)
+              inputs[entry->key.variables[item.first]->getId()] = {item.second};
+
+            if (evaluator->evaluate(inputs).front() == 0)
+              continue;
+          }
+
+          if (model != nullptr) {
+            model->clear();
+            for (const auto& item : entry->model) {
+              const auto& var = entry->key.variables[item.first];
+              if (variables.find(var->getId()) != variables.end())
+                (*model)[var->getId()] = SolverModel(var, item.second);
+            }
+
+            /* The model also holds the concrete values used for the missing variables */
+            if (!superset) {
+              const auto& vars   = evaluator->getVariables();
+              const auto& values = evaluator->getDefaultValues();
+              for (triton::usize i = 0; i < vars.size(); i++) {
+                if (inputs.find(vars[i]->getId()) == inputs.end())
+                  (*model)[vars[i]->getId()] = SolverModel(vars[i], values[i]);
+              }
+            }
+          }
+
+          this->entries.splice(this->entries.begin(), this->entries, entry);
+          this->stats.counterexamples++;
+          return true;
+        }
+
+        return false;
+      }
+
+
+      bool QueryCache::lookup(const QueryKey& key, triton::engines::solver::status_e& status, std::unordered_map<triton::usize, SolverModel>* model) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+
+        if (this->capacity == 0)
+          return false;
+
+        auto range = this->index.equal_range(key.hash);
+        for (auto it = range.first; it != range.second; it++) {
+          auto entry = it->second;
+
+          if (!QueryCache::isEquivalent(entry->key.node, key.node, true))
+            continue;
+
+          /* The query is known but its model is not */
+          if (model != nullptr && entry->status == triton::engines::solver::SAT && !entry->hasModel)
+            break;
+
+          status = entry->status;
+          if (model != nullptr) {
+            model->clear();
+            for (const auto& item : entry->model) {
+              const auto& var = key.variables[item.first];
+              (*model)[var->getId()] = SolverModel(var, item.second);
+            }
+          }
+
+          this->entries.splice(this->entries.begin(), this->entries, entry);
+          this->stats.hits++;
+          return true;
+        }
+
+        if (this->isSubsumed(key.conjuncts)) {
+          status = triton::engines::solver::UNSAT;
+          if (model != nullptr)
+            model->clear();
+          this->stats.subsumed++;
+          return true;
+        }
+
+        if (this->findCounterexample(key, model)) {
+          status = triton::engines::solver::SAT;
+          return true;
+        }
+
+        this->stats.misses++;
+        return false;
+      }
+
+
+      bool QueryCache::lookupUnsat(const QueryKey& key) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+
+        if (this->capacity == 0)
+          return false;
+
+        auto range = this->index.equal_range(key.hash);
+        for (auto it = range.first; it != range.second; it++) {
+          auto entry = it->second;
+
+          if (!QueryCache::isEquivalent(entry->key.node, key.node, true))
+            continue;
+
+          if (entry->status == triton::engines::solver::UNSAT) {
+            this->entries.splice(this->entries.begin(), this->entries, entry);
+            this->stats.hits++;
+            return true;
+          }
+          break;
+        }
+
+        if (this->isSubsumed(key.conjuncts)) {
+          this->stats.subsumed++;
+          return true;
+        }
+
+        this->stats.misses++;
+        return false;
+      }
+
+
+      void QueryCache::insert(const QueryKey& key, triton::engines::solver::status_e status, const std::unordered_map<triton::usize, SolverModel>* model) {
+        std::lock_guard<std::mutex> lock(this->mutex);
+        std::vector<std::pair<triton::usize, triton::uint512>> values;
+
+        if (this->capacity == 0)
+          return;
+
+        if (status != triton::engines::solver::SAT && status != triton::engines::solver::UNSAT)
+          return;
+
+        /* Record the model by index of variable */
+        if (model != nullptr) {
+          std::unordered_map<triton::usize, triton::usize> ordinals;
+          for (triton::usize i = 0; i < key.variables.size(); i++)
+            ordinals[key.variables[i]->getId()] = i;
+          for (const auto& item : *model) {
+            auto it = ordinals.find(item.first);
+            if (it != ordinals.end())
+              values.push_back({it->second, item.second.getValue()});
+          }
+        }
+
+        /* Update an existing entry */
+        auto range = this->index.equal_range(key.hash);
+        for (auto it = range.first; it != range.second; it++) {
+          auto entry = it->second;
+          if (QueryCache::isEquivalent(entry->key.node, key.node, true)) {
+            entry->status = status;
+            if (model != nullptr) {
+              /* Indexes of variables are the same in equivalent queries */
+              entry->hasModel = true;
+              entry->model    = std::move(values);
+            }
+            this->entries.splice(this->entries.begin(), this->entries, entry);
+            return;
+          }
+        }
+
+        this->entries.push_front(Entry{key, status, model != nullptr, std::move(values)});
+        this->index.insert({key.hash, this->entries.begin()});
+        for (const auto& c : key.conjuncts)
+          this->conjunctIndex.insert({static_cast<triton::uint64>(c->getHash()), this->entries.begin()});
+
+        if (status == triton::engines::solver::UNSAT)
+          this->unsatConjuncts.push_front(key.conjuncts);
+
+        this->shrink();
+      }
+
+    };
+  };
+};
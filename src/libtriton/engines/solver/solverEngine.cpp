@@ -5,9 +5,14 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
+#include <stack>
+
+#include <triton/astContext.hpp>
 #include <triton/config.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/solverEngine.hpp>
+#include <triton/symbolicExpression.hpp>
 
 
 
@@ -17,6 +22,10 @@ namespace triton {
 
       SolverEngine::SolverEngine() {
         this->kind = triton::engines::solver::SOLVER_INVALID;
+        this->timeout = 0;
+        this->memoryLimit = 0;
+        this->workers = 1;
+        this->independence = false;
         #if defined(TRITON_Z3_INTERFACE)
         /* By default we initialized the z3 solver */
         this->setSolver(triton::engines::solver::SOLVER_Z3);
@@ -47,6 +56,7 @@ namespace triton {
             this->solver.reset(new(std::nothrow) triton::engines::solver::Z3Solver());
             if (this->solver == nullptr)
               throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Not enough memory.");
+            static_cast<triton::engines::solver::Z3Solver*>(this->solver.get())->setWorkers(this->workers);
             break;
           #endif
           #ifdef TRITON_BITWUZLA_INTERFACE
@@ -57,14 +67,47 @@ namespace triton {
               throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Not enough memory.");
             break;
           #endif
+          #if defined(TRITON_Z3_INTERFACE) || defined(TRITON_BITWUZLA_INTERFACE)
+          case triton::engines::solver::SOLVER_PORTFOLIO: {
+            /* init the new instance with all the available solvers */
+            std::unique_ptr<triton::engines::solver::PortfolioSolver> portfolio(new(std::nothrow) triton::engines::solver::PortfolioSolver());
+            if (portfolio == nullptr)
+              throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Not enough memory.");
+            #ifdef TRITON_Z3_INTERFACE
+            {
+              auto* z3 = new(std::nothrow) triton::engines::solver::Z3Solver();
+              if (z3 == nullptr)
+                throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Not enough memory.");
+              z3->setWorkers(this->workers);
+              portfolio->addSolver(triton::engines::solver::SOLVER_Z3, z3);
+            }
+            #endif
+            #ifdef TRITON_BITWUZLA_INTERFACE
+            {
+              auto* bitwuzla = new(std::nothrow) triton::engines::solver::BitwuzlaSolver();
+              if (bitwuzla == nullptr)
+                throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Not enough memory.");
+              portfolio->addSolver(triton::engines::solver::SOLVER_BITWUZLA, bitwuzla);
+            }
+            #endif
+            this->solver = std::move(portfolio);
+            break;
+          }
+          #endif
 
           default:
             throw triton::exceptions::SolverEngine("SolverEngine::setSolver(): Solver not supported.");
             break;
         }
 
+        /* The session and the cached queries belong to the previous solver */
+        this->session.reset();
+        this->cache.clear();
+
         /* Setup global variables */
         this->kind = kind;
+        this->solver->setTimeout(this->timeout);
+        this->solver->setMemoryLimit(this->memoryLimit);
       }
 
 
@@ -74,6 +117,8 @@ namespace triton {
 
         /* Define the custom solver as current solver */
         this->solver.reset(customSolver);
+        this->session.reset();
+        this->cache.clear();
 
         /* Setup global variables */
         this->kind = triton::engines::solver::SOLVER_CUSTOM;
@@ -87,24 +132,152 @@ namespace triton {
       }
 
 
+      std::unordered_map<triton::usize, SolverModel> SolverEngine::getModelOfQuery(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        if (!this->cache.isEnabled())
+          return this->solver->getModel(node, status, timeout, solvingTime);
+
+        std::unordered_map<triton::usize, SolverModel> ret;
+        triton::engines::solver::status_e st = triton::engines::solver::UNKNOWN;
+        auto key = triton::engines::solver::QueryCache::makeKey(node);
+
+        if (this->cache.lookup(key, st, &ret)) {
+          if (status)
+            *status = st;
+          if (solvingTime)
+            *solvingTime = 0;
+          return ret;
+        }
+
+        ret = this->solver->getModel(node, &st, timeout, solvingTime);
+        this->cache.insert(key, st, &ret);
+        if (status)
+          *status = st;
+
+        return ret;
+      }
+
+
       std::unordered_map<triton::usize, SolverModel> SolverEngine::getModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
         if (!this->solver)
           return std::unordered_map<triton::usize, SolverModel>{};
-        return this->solver->getModel(node, status, timeout, solvingTime);
+
+        if (!this->independence)
+          return this->getModelOfQuery(node, status, timeout, solvingTime);
+
+        std::unordered_map<triton::usize, SolverModel> ret;
+        triton::engines::solver::status_e st = triton::engines::solver::SAT;
+        triton::uint32 total = 0;
+
+        /* The groups share no variable, thus the union of their models is a model of the query */
+        for (const auto& group : SolverEngine::partition(node)) {
+          triton::uint32 time = 0;
+          auto model = this->getModelOfQuery(group, &st, timeout, &time);
+          total += time;
+          if (st != triton::engines::solver::SAT) {
+            ret.clear();
+            break;
+          }
+          ret.insert(model.begin(), model.end());
+        }
+
+        if (status)
+          *status = st;
+        if (solvingTime)
+          *solvingTime = total;
+
+        return ret;
       }
 
 
       std::vector<std::unordered_map<triton::usize, SolverModel>> SolverEngine::getModels(const triton::ast::SharedAbstractNode& node, triton::uint32 limit, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
         if (!this->solver)
           return std::vector<std::unordered_map<triton::usize, SolverModel>>{};
-        return this->solver->getModels(node, limit, status, timeout, solvingTime);
+
+        if (!this->cache.isEnabled() || limit == 0)
+          return this->solver->getModels(node, limit, status, timeout, solvingTime);
+
+        std::vector<std::unordered_map<triton::usize, SolverModel>> ret;
+        triton::engines::solver::status_e st = triton::engines::solver::UNKNOWN;
+        auto key = triton::engines::solver::QueryCache::makeKey(node);
+
+        /* The cache records a single model, so several models are only served for unsat queries */
+        std::unordered_map<triton::usize, SolverModel> model;
+        bool hit = false;
+        if (limit == 1) {
+          hit = this->cache.lookup(key, st, &model);
+        }
+        else if (this->cache.lookupUnsat(key)) {
+          hit = true;
+          st  = triton::engines::solver::UNSAT;
+        }
+
+        if (hit) {
+          if (st == triton::engines::solver::SAT)
+            ret.push_back(std::move(model));
+          if (status)
+            *status = st;
+          if (solvingTime)
+            *solvingTime = 0;
+          return ret;
+        }
+
+        ret = this->solver->getModels(node, limit, &st, timeout, solvingTime);
+        this->cache.insert(key, st, ret.empty() ? nullptr : &ret.front());
+        if (status)
+          *status = st;
+
+        return ret;
+      }
+
+
+      bool SolverEngine::isSatOfQuery(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        if (!this->cache.isEnabled())
+          return this->solver->isSat(node, status, timeout, solvingTime);
+
+        triton::engines::solver::status_e st = triton::engines::solver::UNKNOWN;
+        auto key = triton::engines::solver::QueryCache::makeKey(node);
+
+        if (this->cache.lookup(key, st)) {
+          if (status)
+            *status = st;
+          if (solvingTime)
+            *solvingTime = 0;
+          return st == triton::engines::solver::SAT;
+        }
+
+        bool ret = this->solver->isSat(node, &st, timeout, solvingTime);
+        this->cache.insert(key, st);
+        if (status)
+          *status = st;
+
+        return ret;
       }
 
 
       bool SolverEngine::isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
         if (!this->solver)
           return false;
-        return this->solver->isSat(node, status, timeout, solvingTime);
+
+        if (!this->independence)
+          return this->isSatOfQuery(node, status, timeout, solvingTime);
+
+        triton::engines::solver::status_e st = triton::engines::solver::SAT;
+        triton::uint32 total = 0;
+
+        for (const auto& group : SolverEngine::partition(node)) {
+          triton::uint32 time = 0;
+          this->isSatOfQuery(group, &st, timeout, &time);
+          total += time;
+          if (st != triton::engines::solver::SAT)
+            break;
+        }
+
+        if (status)
+          *status = st;
+        if (solvingTime)
+          *solvingTime = total;
+
+        return st == triton::engines::solver::SAT;
       }
 
 
@@ -115,17 +288,267 @@ namespace triton {
       }
 
 
+      triton::usize SolverEngine::getQueryCacheSize(void) const {
+        return this->cache.getCapacity();
+      }
+
+
+      void SolverEngine::setQueryCacheSize(triton::usize size) {
+        this->cache.setCapacity(size);
+      }
+
+
+      triton::engines::solver::QueryCacheStats SolverEngine::getQueryCacheStats(void) const {
+        return this->cache.getStats();
+      }
+
+
+      void SolverEngine::clearQueryCache(void) {
+        this->cache.clear();
+      }
+
+
+      bool SolverEngine::isConstraintIndependenceEnabled(void) const {
+        return this->independence;
+      }
+
+
+      void SolverEngine::setConstraintIndependence(bool flag) {
+        this->independence = flag;
+      }
+
+
+      std::vector<triton::ast::SharedAbstractNode> SolverEngine::partition(const triton::ast::SharedAbstractNode& node) {
+        static const triton::usize none = static_cast<triton::usize>(-1);
+        std::vector<triton::ast::SharedAbstractNode> conjuncts;
+        std::vector<triton::usize> parents;
+
+        if (node == nullptr)
+          throw triton::exceptions::SolverEngine("SolverEngine::partition(): node cannot be null.");
+
+        triton::ast::SharedAbstractNode root = node;
+        if (root->getType() == triton::ast::ASSERT_NODE)
+          root = root->getChildren()[0];
+
+        /* Flatten the conjunction */
+        std::stack<triton::ast::SharedAbstractNode> worklist;
+        worklist.push(root);
+        while (!worklist.empty()) {
+          auto n = triton::ast::dereference(worklist.top());
+          worklist.pop();
+          if (n->getType() == triton::ast::LAND_NODE) {
+            const auto& children = n->getChildren();
+            for (auto it = children.rbegin(); it != children.rend(); it++)
+              worklist.push(*it);
+          }
+          else {
+            conjuncts.push_back(n);
+          }
+        }
+
+        /* Union-find over the conjuncts */
+        for (triton::usize i = 0; i < conjuncts.size(); i++)
+          parents.push_back(i);
+
+        auto find = [&parents](triton::usize i) {
+          while (parents[i] != i) {
+            parents[i] = parents[parents[i]];
+            i = parents[i];
+          }
+          return i;
+        };
+
+        auto merge = [&parents, &find](triton::usize a, triton::usize b) {
+          a = find(a);
+          b = find(b);
+          if (a != b)
+            parents[std::max(a, b)] = std::min(a, b);
+        };
+
+        /*
+         * Each node is visited once: `owners` maps a node to the first conjunct which reached it if the node
+         * contains a symbolic variable, or to `none` otherwise. Reaching a node again thus merges the current
+         * conjunct with the conjuncts sharing the variables of this node.
+         */
+        std::unordered_map<const triton::ast::AbstractNode*, triton::usize> owners;
+        std::unordered_map<triton::usize, triton::usize> variables;
+
+        for (triton::usize i = 0; i < conjuncts.size(); i++) {
+          std::stack<std::pair<triton::ast::AbstractNode*, bool>> stack;
+          stack.push({conjuncts[i].get(), false});
+
+          while (!stack.empty()) {
+            auto item = stack.top();
+            auto* n = item.first;
+            stack.pop();
+
+            /* All the children of the node have been visited */
+            if (item.second) {
+              triton::usize owner = none;
+              if (n->getType() == triton::ast::REFERENCE_NODE) {
+                owner = owners.at(reinterpret_cast<triton::ast::ReferenceNode*>(n)->getSymbolicExpression()->getAst().get());
+              }
+              else {
+                for (const auto& child : n->getChildren()) {
+                  if (owners.at(child.get()) != none) {
+                    owner = i;
+                    break;
+                  }
+                }
+              }
+              owners[n] = (owner != none) ? i : none;
+              continue;
+            }
+
+            auto it = owners.find(n);
+            if (it != owners.end()) {
+              if (it->second != none)
+                merge(i, it->second);
+              continue;
+            }
+
+            if (n->getType() == triton::ast::VARIABLE_NODE) {
+              triton::usize id = reinterpret_cast<triton::ast::VariableNode*>(n)->getSymbolicVariable()->getId();
+              auto var = variables.find(id);
+              if (var != variables.end())
+                merge(i, var->second);
+              else
+                variables[id] = i;
+              owners[n] = i;
+              continue;
+            }
+
+            stack.push({n, true});
+            if (n->getType() == triton::ast::REFERENCE_NODE) {
+              stack.push({reinterpret_cast<triton::ast::ReferenceNode*>(n)->getSymbolicExpression()->getAst().get(), false});
+            }
+            else {
+              for (const auto& child : n->getChildren())
+                stack.push({child.get(), false});
+            }
+          }
+        }
+
+        /* Gather the groups, the constant conjuncts are evaluated */
+        std::unordered_map<triton::usize, std::vector<triton::ast::SharedAbstractNode>> groups;
+        std::vector<triton::usize> order;
+
+        for (triton::usize i = conjuncts.size(); i-- > 0;) {
+          if (owners.at(conjuncts[i].get()) == none) {
+            if (conjuncts[i]->evaluate() == 0)
+              return {conjuncts[i]};
+            continue;
+          }
+          triton::usize group = find(i);
+          auto& list = groups[group];
+          if (list.empty())
+            order.push_back(group);
+          list.push_back(conjuncts[i]);
+        }
+
+        /* Nothing to split */
+        if (order.size() == 1 && groups[order[0]].size() == conjuncts.size())
+          return {root};
+
+        std::vector<triton::ast::SharedAbstractNode> ret;
+        for (triton::usize group : order) {
+          auto& list = groups[group];
+          if (list.size() == 1) {
+            ret.push_back(list.front());
+          }
+          else {
+            std::reverse(list.begin(), list.end());
+            ret.push_back(list.front()->getContext()->land(list));
+          }
+        }
+
+        return ret;
+      }
+
+
+      triton::engines::solver::SolverSession& SolverEngine::getSession(void) {
+        if (this->session)
+          return *this->session;
+
+        switch (this->kind) {
+          #ifdef TRITON_Z3_INTERFACE
+          case triton::engines::solver::SOLVER_Z3:
+            this->session.reset(new(std::nothrow) triton::engines::solver::Z3Session());
+            break;
+          #endif
+
+          #ifdef TRITON_BITWUZLA_INTERFACE
+          case triton::engines::solver::SOLVER_BITWUZLA:
+            this->session.reset(new(std::nothrow) triton::engines::solver::BitwuzlaSession());
+            break;
+          #endif
+
+          default:
+            throw triton::exceptions::SolverEngine("SolverEngine::getSession(): Incremental sessions are not supported by this solver.");
+        }
+
+        if (this->session == nullptr)
+          throw triton::exceptions::SolverEngine("SolverEngine::getSession(): Not enough memory.");
+
+        this->session->setTimeout(this->timeout);
+        this->session->setMemoryLimit(this->memoryLimit);
+
+        return *this->session;
+      }
+
+
+      bool SolverEngine::hasSession(void) const {
+        return this->session != nullptr;
+      }
+
+
       void SolverEngine::setTimeout(triton::uint32 ms) {
+        this->timeout = ms;
         if (this->solver) {
           this->solver->setTimeout(ms);
         }
+        if (this->session) {
+          this->session->setTimeout(ms);
+        }
       }
 
 
       void SolverEngine::setMemoryLimit(triton::uint32 limit) {
+        this->memoryLimit = limit;
         if (this->solver) {
           this->solver->setMemoryLimit(limit);
         }
+        if (this->session) {
+          this->session->setMemoryLimit(limit);
+        }
+      }
+
+
+      triton::uint32 SolverEngine::getWorkers(void) const {
+        return this->workers;
+      }
+
+
+      void SolverEngine::setWorkers(triton::uint32 workers) {
+        this->workers = (workers ? workers : 1);
+        #ifdef TRITON_Z3_INTERFACE
+        if (this->kind == triton::engines::solver::SOLVER_Z3) {
+          static_cast<triton::engines::solver::Z3Solver*>(this->solver.get())->setWorkers(this->workers);
+        }
+        if (this->kind == triton::engines::solver::SOLVER_PORTFOLIO) {
+          auto* portfolio = static_cast<triton::engines::solver::PortfolioSolver*>(this->solver.get());
+          static_cast<triton::engines::solver::Z3Solver*>(portfolio->getSolver(triton::engines::solver::SOLVER_Z3))->setWorkers(this->workers);
+        }
+        #endif
+      }
+
+
+      std::map<triton::engines::solver::solver_e, triton::engines::solver::PortfolioStats> SolverEngine::getPortfolioStats(void) const {
+        #if defined(TRITON_Z3_INTERFACE) || defined(TRITON_BITWUZLA_INTERFACE)
+        if (this->kind == triton::engines::solver::SOLVER_PORTFOLIO)
+          return static_cast<const triton::engines::solver::PortfolioSolver*>(this->solver.get())->getStats();
+        #endif
+        return {};
       }
 
     };
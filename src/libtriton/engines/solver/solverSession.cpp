@@ -0,0 +1,42 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <triton/solverSession.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace solver {
+
+      const std::vector<triton::ast::SharedAbstractNode>& SolverSession::getConstraints(void) const {
+        return this->constraints;
+      }
+
+
+      triton::usize SolverSession::getSize(void) const {
+        return this->constraints.size();
+      }
+
+
+      void SolverSession::sync(const std::vector<triton::ast::SharedAbstractNode>& nodes) {
+        triton::usize common = 0;
+
+        /* Keep the longest common prefix */
+        while (common < this->constraints.size() && common < nodes.size() && this->constraints[common] == nodes[common])
+          common++;
+
+        while (this->constraints.size() > common)
+          this->pop();
+
+        for (triton::usize i = common; i < nodes.size(); i++)
+          this->push(nodes[i]);
+      }
+
+    };
+  };
+};
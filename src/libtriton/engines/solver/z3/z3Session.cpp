@@ -0,0 +1,242 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#include <chrono>
+#include <climits>
+#include <cstring>
+#include <string>
+
+#include <triton/exceptions.hpp>
+#include <triton/symbolicVariable.hpp>
+#include <triton/z3Session.hpp>
+
+
+
+namespace triton {
+  namespace engines {
+    namespace solver {
+
+      Z3Session::Z3Session()
+        : converter(false),
+          solver(converter.getContext()) {
+        this->timeout = 0;
+        this->memoryLimit = 0;
+      }
+
+
+      Z3Session::~Z3Session() {
+        /* Release z3's expressions and nodes before the context */
+        this->cache.clear();
+        this->constraints.clear();
+      }
+
+
+      z3::expr Z3Session::convert(const triton::ast::SharedAbstractNode& node) {
+        triton::ast::SharedAbstractNode onode = node;
+
+        if (onode == nullptr)
+          throw triton::exceptions::SolverEngine("Z3Session::convert(): node cannot be null.");
+
+        /* Z3 does not need an assert() as root node */
+        if (onode->getType() == triton::ast::ASSERT_NODE)
+          onode = onode->getChildren()[0];
+
+        if (onode->isLogical() == false)
+          throw triton::exceptions::SolverEngine("Z3Session::convert(): Must be a logical node.");
+
+        return this->converter.convert(onode, this->cache);
+      }
+
+
+      z3::check_result Z3Session::check(triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        z3::params p(this->converter.getContext());
+
+        /* Define the timeout */
+        if (timeout) {
+          p.set(":timeout", timeout);
+        }
+        else {
+          p.set(":timeout", this->timeout ? this->timeout : UINT_MAX);
+        }
+
+        /* Define memory limit */
+        if (this->memoryLimit) {
+          p.set(":max_memory", this->memoryLimit);
+        }
+
+        this->solver.set(p);
+
+        /* Get time of solving start */
+        auto start = std::chrono::system_clock::now();
+
+        z3::check_result res = this->solver.check();
+
+        /* Get time of solving end */
+        auto end = std::chrono::system_clock::now();
+
+        if (solvingTime)
+          *solvingTime = std::chrono::duration_cast<std::chrono::milliseconds>(end - start).count();
+
+        if (status != nullptr) {
+          switch (res) {
+            case z3::sat:
+              *status = triton::engines::solver::SAT;
+              break;
+
+            case z3::unsat:
+              *status = triton::engines::solver::UNSAT;
+              break;
+
+            case z3::unknown:
+              if (this->solver.reason_unknown() == "timeout") {
+                *status = triton::engines::solver::TIMEOUT;
+              }
+              else if (this->solver.reason_unknown() == "max. memory exceeded") {
+                *status = triton::engines::solver::OUTOFMEM;
+              }
+              else {
+                *status = triton::engines::solver::UNKNOWN;
+              }
+              break;
+          }
+        }
+
+        return res;
+      }
+
+
+      void Z3Session::push(const triton::ast::SharedAbstractNode& node) {
+        try {
+          z3::expr expr = this->convert(node);
+          this->solver.push();
+          this->solver.add(expr);
+          this->constraints.push_back(node);
+        }
+        catch (const z3::exception& e) {
+          throw triton::exceptions::SolverEngine(std::string("Z3Session::push(): ") + e.msg());
+        }
+      }
+
+
+      void Z3Session::pop(void) {
+        if (this->constraints.empty())
+          throw triton::exceptions::SolverEngine("Z3Session::pop(): The session is empty.");
+
+        this->solver.pop();
+        this->constraints.pop_back();
+      }
+
+
+      void Z3Session::reset(void) {
+        this->solver.reset();
+        this->constraints.clear();
+        this->cache.clear();
+      }
+
+
+      bool Z3Session::isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        z3::check_result res = z3::unknown;
+
+        try {
+          if (node != nullptr) {
+            z3::expr expr = this->convert(node);
+            this->solver.push();
+            this->solver.add(expr);
+          }
+
+          try {
+            res = this->check(status, timeout, solvingTime);
+          }
+          catch (...) {
+            if (node != nullptr)
+              this->solver.pop();
+            throw;
+          }
+
+          if (node != nullptr)
+            this->solver.pop();
+        }
+        catch (const z3::exception& e) {
+          if (!strcmp(e.msg(), "max. memory exceeded")) {
+            if (status) {
+              *status = triton::engines::solver::OUTOFMEM;
+            }
+            return false;
+          }
+          throw triton::exceptions::SolverEngine(std::string("Z3Session::isSat(): ") + e.msg());
+        }
+
+        return res == z3::sat;
+      }
+
+
+      std::unordered_map<triton::usize, SolverModel> Z3Session::getModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) {
+        std::unordered_map<triton::usize, SolverModel> ret;
+
+        try {
+          if (node != nullptr) {
+            z3::expr expr = this->convert(node);
+            this->solver.push();
+            this->solver.add(expr);
+          }
+
+          try {
+            if (this->check(status, timeout, solvingTime) == z3::sat) {
+              z3::context& ctx = this->converter.getContext();
+              z3::model m = this->solver.get_model();
+
+              /* Traversing the model */
+              for (triton::uint32 i = 0; i < m.size(); i++) {
+                z3::func_decl z3Variable = m[i];
+                std::string varName = z3Variable.name().str();
+                z3::expr exp = m.get_const_interp(z3Variable);
+
+                /* Only symbolic variables are part of the model */
+                auto it = this->converter.variables.find(varName);
+                if (it == this->converter.variables.end() || !exp.get_sort().is_bv())
+                  continue;
+
+                SolverModel trionModel = SolverModel(it->second, triton::uint512(Z3_get_numeral_string(ctx, exp)));
+                ret[trionModel.getId()] = trionModel;
+              }
+            }
+          }
+          catch (...) {
+            if (node != nullptr)
+              this->solver.pop();
+            throw;
+          }
+
+          if (node != nullptr)
+            this->solver.pop();
+        }
+        catch (const z3::exception& e) {
+          if (!strcmp(e.msg(), "max. memory exceeded")) {
+            if (status) {
+              *status = triton::engines::solver::OUTOFMEM;
+            }
+            return {};
+          }
+          throw triton::exceptions::SolverEngine(std::string("Z3Session::getModel(): ") + e.msg());
+        }
+
+        return ret;
+      }
+
+
+      void Z3Session::setTimeout(triton::uint32 ms) {
+        this->timeout = ms;
+      }
+
+
+      void Z3Session::setMemoryLimit(triton::uint32 limit) {
+        this->memoryLimit = limit;
+      }
+
+    };
+  };
+};
@@ -5,8 +5,14 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
+#include <atomic>
 #include <chrono>
+#include <cstring>
+#include <memory>
+#include <mutex>
 #include <string>
+#include <thread>
 
 #include <triton/astContext.hpp>
 #include <triton/exceptions.hpp>
@@ -36,6 +42,35 @@ namespace triton {
       Z3Solver::Z3Solver() {
         this->timeout = 0;
         this->memoryLimit = 0;
+        this->workers = 1;
+      }
+
+
+      Z3Solver::RunningQuery::RunningQuery(const Z3Solver& solver, const std::vector<z3::context*>& contexts)
+        : solver(solver), contexts(contexts) {
+        std::lock_guard<std::mutex> lock(this->solver.runningLock);
+        for (auto* ctx : this->contexts)
+          this->solver.running.insert({std::this_thread::get_id(), ctx});
+      }
+
+
+      Z3Solver::RunningQuery::~RunningQuery() {
+        std::lock_guard<std::mutex> lock(this->solver.runningLock);
+        auto range = this->solver.running.equal_range(std::this_thread::get_id());
+        for (auto it = range.first; it != range.second;) {
+          if (std::find(this->contexts.begin(), this->contexts.end(), it->second) != this->contexts.end())
+            it = this->solver.running.erase(it);
+          else
+            it++;
+        }
+      }
+
+
+      void Z3Solver::interrupt(std::thread::id thread) {
+        std::lock_guard<std::mutex> lock(this->runningLock);
+        auto range = this->running.equal_range(thread);
+        for (auto it = range.first; it != range.second; it++)
+          it->second->interrupt();
       }
 
 
@@ -55,9 +90,14 @@ namespace triton {
           if (onode->isLogical() == false)
             throw triton::exceptions::SolverEngine("Z3Solver::getModels(): Must be a logical node.");
 
+          /* Enumerate the models with several threads */
+          if (this->workers > 1 && limit > 1)
+            return this->getParallelModels(onode, limit, status, timeout, solvingTime);
+
           z3::expr      expr = z3Ast.convert(onode);
           z3::context&  ctx  = expr.ctx();
           z3::solver    solver(ctx);
+          RunningQuery  running(*this, {&ctx});
 
           /* Create a solver and add the expression */
           solver.add(expr);
@@ -165,6 +205,213 @@ namespace triton {
       }
 
 
+      std::vector<std::unordered_map<triton::usize, SolverModel>> Z3Solver::getParallelModels(const triton::ast::SharedAbstractNode& node, triton::uint32 limit, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
+        std::vector<std::unordered_map<triton::usize, SolverModel>> ret;
+        triton::ast::TritonToZ3 z3Ast{false};
+
+        /* Get time of solving start */
+        auto start = std::chrono::system_clock::now();
+
+        z3::expr expr = z3Ast.convert(node);
+
+        /* The variables sorted by id, so the cubes do not depend on the hash map order */
+        std::vector<triton::engines::symbolic::SharedSymbolicVariable> variables;
+        for (const auto& item : z3Ast.variables)
+          variables.push_back(item.second);
+        std::sort(variables.begin(), variables.end(), [](const auto& a, const auto& b) { return a->getId() < b->getId(); });
+
+        /*
+         * Choose the bits which split the search space. The low bits of each variable are taken
+         * in turn, and there are about four cubes per thread to balance the load.
+         */
+        std::vector<std::pair<std::string, triton::uint32>> bits;
+        for (triton::uint32 bit = 0; (1ULL << bits.size()) < 4ULL * this->workers; bit++) {
+          triton::usize size = bits.size();
+          for (const auto& var : variables) {
+            if (bit < var->getSize() && (1ULL << bits.size()) < 4ULL * this->workers)
+              bits.push_back({var->getName(), bit});
+          }
+          if (bits.size() == size)
+            break;
+        }
+
+        triton::uint32 cubes    = (1 << bits.size());
+        triton::uint32 nthreads = std::min(this->workers, cubes);
+        triton::uint32 tout     = (timeout ? timeout : this->timeout);
+
+        /* Each thread has its own z3 context. The translation is done before starting the threads */
+        std::vector<std::unique_ptr<z3::context>> contexts;
+        std::vector<z3::expr> exprs;
+        for (triton::uint32 i = 0; i < nthreads; i++) {
+          contexts.emplace_back(new z3::context());
+          exprs.push_back(z3::expr(*contexts.back(), Z3_translate(expr.ctx(), expr, *contexts.back())));
+        }
+
+        std::vector<z3::context*> pointers;
+        for (auto& ctx : contexts)
+          pointers.push_back(ctx.get());
+        RunningQuery running(*this, pointers);
+
+        std::atomic<triton::uint32> nextCube{0};
+        std::atomic<bool> done{false};
+        std::mutex lock;
+        std::string error;
+        bool outOfMemory = false;
+        bool timedOut    = false;
+        bool unknown     = false;
+
+        /* Stops all threads. The lock must be held */
+        auto stop = [&]() {
+          done = true;
+          for (auto& ctx : contexts)
+            ctx->interrupt();
+        };
+
+        auto worker = [&](triton::uint32 index) {
+          z3::context& ctx = *contexts[index];
+
+          try {
+            z3::solver solver(ctx);
+            solver.add(exprs[index]);
+
+            while (!done) {
+              triton::uint32 cube = nextCube++;
+              if (cube >= cubes)
+                break;
+
+              /* Restrict the search to the cube */
+              solver.push();
+              for (triton::uint32 i = 0; i < bits.size(); i++) {
+                z3::expr var = ctx.bv_const(bits[i].first.c_str(), z3Ast.variables.at(bits[i].first)->getSize());
+                solver.add(var.extract(bits[i].second, bits[i].second) == ctx.bv_val((cube >> i) & 1, 1));
+              }
+
+              while (!done) {
+                z3::params p(ctx);
+
+                /* The timeout is global to the enumeration */
+                if (tout) {
+                  auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(std::chrono::system_clock::now() - start).count();
+                  if (elapsed >= tout) {
+                    std::lock_guard<std::mutex> guard(lock);
+                    timedOut = true;
+                    stop();
+                    break;
+                  }
+                  p.set(":timeout", static_cast<triton::uint32>(tout - elapsed));
+                }
+
+                /* Define memory limit */
+                if (this->memoryLimit) {
+                  p.set(":max_memory", this->memoryLimit);
+                }
+
+                solver.set(p);
+
+                z3::check_result res = solver.check();
+                if (res == z3::unsat)
+                  break;
+
+                if (res == z3::unknown) {
+                  std::lock_guard<std::mutex> guard(lock);
+                  if (!done) {
+                    triton::engines::solver::status_e st;
+                    this->writeBackStatus(solver, res, &st);
+                    timedOut    |= (st == triton::engines::solver::TIMEOUT);
+                    outOfMemory |= (st == triton::engines::solver::OUTOFMEM);
+                    unknown     |= (st == triton::engines::solver::UNKNOWN);
+                  }
+                  break;
+                }
+
+                /* Traversing the model */
+                z3::model m = solver.get_model();
+                std::unordered_map<triton::usize, SolverModel> smodel;
+                z3::expr_vector args(ctx);
+                for (triton::uint32 i = 0; i < m.size(); i++) {
+                  z3::func_decl z3Variable = m[i];
+                  std::string varName = z3Variable.name().str();
+                  z3::expr exp = m.get_const_interp(z3Variable);
+                  triton::uint32 bvSize = exp.get_sort().bv_size();
+                  std::string svalue = Z3_get_numeral_string(ctx, exp);
+                  SolverModel trionModel = SolverModel(z3Ast.variables.at(varName), triton::uint512(svalue.c_str()));
+                  smodel[trionModel.getId()] = trionModel;
+                  if (exp.get_sort().is_bv())
+                    args.push_back(ctx.bv_const(varName.c_str(), bvSize) != ctx.bv_val(svalue.c_str(), bvSize));
+                }
+
+                /* Check that model is available */
+                if (smodel.empty())
+                  break;
+
+                {
+                  std::lock_guard<std::mutex> guard(lock);
+                  if (done)
+                    break;
+                  ret.push_back(smodel);
+                  if (ret.size() >= limit) {
+                    stop();
+                    break;
+                  }
+                }
+
+                /* Escape last models */
+                if (!args.empty())
+                  solver.add(this->mk_or(args));
+              }
+
+              solver.pop();
+            }
+          }
+          catch (const z3::exception& e) {
+            std::lock_guard<std::mutex> guard(lock);
+            if (!strcmp(e.msg(), "max. memory exceeded"))
+              outOfMemory = true;
+            else if (!done)
+              error = e.msg();
+            stop();
+          }
+          /* An exception must not escape the thread, it is rethrown after the join */
+          catch (const std::exception& e) {
+            std::lock_guard<std::mutex> guard(lock);
+            if (error.empty())
+              error = e.what();
+            stop();
+          }
+        };
+
+        std::vector<std::thread> threads;
+        for (triton::uint32 i = 0; i < nthreads; i++)
+          threads.emplace_back(worker, i);
+        for (auto& thread : threads)
+          thread.join();
+
+        if (!error.empty())
+          throw triton::exceptions::SolverEngine(std::string("Z3Solver::getModels(): ") + error);
+
+        if (status) {
+          if (!ret.empty())
+            *status = triton::engines::solver::SAT;
+          else if (outOfMemory)
+            *status = triton::engines::solver::OUTOFMEM;
+          else if (timedOut)
+            *status = triton::engines::solver::TIMEOUT;
+          else if (unknown)
+            *status = triton::engines::solver::UNKNOWN;
+          else
+            *status = triton::engines::solver::UNSAT;
+        }
+
+        /* Get time of solving end */
+        auto end = std::chrono::system_clock::now();
+
+        if (solvingTime)
+          *solvingTime = std::chrono::duration_cast<std::chrono::milliseconds>(end - start).count();
+
+        return ret;
+      }
+
+
       bool Z3Solver::isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const {
         triton::ast::TritonToZ3 z3Ast{false};
 
@@ -178,6 +425,7 @@ namespace triton {
           z3::expr      expr = z3Ast.convert(node);
           z3::context&  ctx  = expr.ctx();
           z3::solver    solver(ctx);
+          RunningQuery  running(*this, {&ctx});
 
           /* Create a solver and add the expression */
           solver.add(expr);
@@ -327,6 +575,11 @@ namespace triton {
         this->memoryLimit = limit;
       }
 
+
+      void Z3Solver::setWorkers(triton::uint32 workers) {
+        this->workers = (workers ? workers : 1);
+      }
+
     };
   };
 };
@@ -5,9 +5,13 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
+#include <iterator>
+
 #include <triton/astContext.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/pathManager.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/symbolicEnums.hpp>
 
 
@@ -16,32 +20,159 @@ namespace triton {
   namespace engines {
     namespace symbolic {
 
+      PathConstraintNode::PathConstraintNode(const triton::engines::symbolic::PathConstraint& constraint, const std::shared_ptr<PathConstraintNode>& previous, const triton::ast::SharedAbstractNode& predicate)
+        : constraint(constraint), previous(previous), predicate(predicate) {
+        this->size = (previous ? previous->size : 0) + 1;
+      }
+
+
+      PathConstraintNode::~PathConstraintNode() {
+        /* A long list would overflow the stack if released recursively */
+        std::shared_ptr<PathConstraintNode> node = std::move(this->previous);
+        while (node && node.use_count() == 1) {
+          std::shared_ptr<PathConstraintNode> next = std::move(node->previous);
+          node = std::move(next);
+        }
+      }
+
+
       PathManager::PathManager(const triton::modes::SharedModes& modes, const triton::ast::SharedAstContext& astCtxt)
         : modes(modes), astCtxt(astCtxt) {
+        this->synchronized = true;
       }
 
 
       PathManager::PathManager(const PathManager& other)
         : modes(other.modes), astCtxt(other.astCtxt) {
-        this->pathConstraints = other.pathConstraints;
+        this->lastPathConstraint = other.lastPathConstraint;
+        this->pathConstraints    = other.pathConstraints;
+        this->pathPredicates     = other.pathPredicates;
+        this->addressIndex       = other.addressIndex;
+        this->indirectIndex      = other.indirectIndex;
+        this->synchronized       = other.synchronized;
       }
 
 
       PathManager& PathManager::operator=(const PathManager& other) {
-        this->astCtxt         = other.astCtxt;
-        this->modes           = other.modes;
-        this->pathConstraints = other.pathConstraints;
+        this->astCtxt            = other.astCtxt;
+        this->modes              = other.modes;
+        this->lastPathConstraint = other.lastPathConstraint;
+        this->pathConstraints    = other.pathConstraints;
+        this->pathPredicates     = other.pathPredicates;
+        this->addressIndex       = other.addressIndex;
+        this->indirectIndex      = other.indirectIndex;
+        this->synchronized       = other.synchronized;
         return *this;
       }
 
 
+      void PathManager::synchronize(void) const {
+        if (this->synchronized)
+          return;
+
+        triton::usize size = this->getSizeOfPathConstraints();
+        std::vector<const PathConstraintNode*> nodes(size);
+
+        for (auto node = this->lastPathConstraint.get(); node != nullptr; node = node->previous.get()) {
+          nodes[node->size - 1] = node;
+        }
+
+        this->pathConstraints.clear();
+        this->pathPredicates.clear();
+        this->addressIndex.clear();
+        this->indirectIndex.clear();
+        this->pathConstraints.reserve(size);
+        this->pathPredicates.reserve(size);
+
+        for (triton::usize i = 0; i < size; i++) {
+          this->pathConstraints.push_back(nodes[i]->constraint);
+          this->pathPredicates.push_back(i ? nodes[i - 1]->predicate : this->getTop());
+          this->indexPathConstraint();
+        }
+
+        this->synchronized = true;
+      }
+
+
+      triton::ast::SharedAbstractNode PathManager::getTop(void) const {
+        return this->astCtxt->equal(this->astCtxt->bvtrue(), this->astCtxt->bvtrue());
+      }
+
+
+      void PathManager::indexPathConstraint(void) const {
+        triton::usize index = this->pathConstraints.size() - 1;
+        const auto& branches = this->pathConstraints.back().getBranchConstraints();
+
+        for (const auto& branch : branches) {
+          for (triton::uint64 addr : {std::get<1>(branch), std::get<2>(branch)}) {
+            auto& indexes = this->addressIndex[addr];
+            if (indexes.empty() || indexes.back() != index)
+              indexes.push_back(index);
+          }
+        }
+
+        /* An indirect branch (call reg, jmp reg) may reach any address */
+        if (branches.size() == 1 && std::get<1>(branches[0]) != 0 && std::get<2>(branches[0]) != 0 && std::get<3>(branches[0])->getType() == triton::ast::EQUAL_NODE)
+          this->indirectIndex.push_back(index);
+      }
+
+
+      void PathManager::unindexPathConstraint(void) const {
+        triton::usize index = this->pathConstraints.size() - 1;
+
+        for (const auto& branch : this->pathConstraints.back().getBranchConstraints()) {
+          for (triton::uint64 addr : {std::get<1>(branch), std::get<2>(branch)}) {
+            auto it = this->addressIndex.find(addr);
+            if (it == this->addressIndex.end())
+              continue;
+            if (!it->second.empty() && it->second.back() == index)
+              it->second.pop_back();
+            if (it->second.empty())
+              this->addressIndex.erase(it);
+          }
+        }
+
+        if (!this->indirectIndex.empty() && this->indirectIndex.back() == index)
+          this->indirectIndex.pop_back();
+      }
+
+
+      void PathManager::appendPathConstraint(const triton::engines::symbolic::PathConstraint& pco) {
+        auto previous  = this->lastPathConstraint ? this->lastPathConstraint->predicate : this->getTop();
+        auto predicate = this->astCtxt->land(previous, pco.getTakenPredicate());
+
+        this->lastPathConstraint = std::make_shared<PathConstraintNode>(pco, this->lastPathConstraint, predicate);
+        if (this->synchronized) {
+          this->pathConstraints.push_back(pco);
+          this->pathPredicates.push_back(previous);
+          this->indexPathConstraint();
+        }
+      }
+
+
+      void PathManager::snapshot(triton::Snapshot& snap) const {
+        snap.pathConstraints = this->lastPathConstraint;
+      }
+
+
+      void PathManager::restore(const triton::Snapshot& snap) {
+        this->lastPathConstraint = snap.pathConstraints;
+        this->pathConstraints.clear();
+        this->pathPredicates.clear();
+        this->addressIndex.clear();
+        this->indirectIndex.clear();
+        this->synchronized = (this->lastPathConstraint == nullptr);
+      }
+
+
       triton::usize PathManager::getSizeOfPathConstraints(void) const {
-        return this->pathConstraints.size();
+        return this->lastPathConstraint ? this->lastPathConstraint->size : 0;
       }
 
 
       /* Returns the logical conjunction vector of path constraint */
       const std::vector<triton::engines::symbolic::PathConstraint>& PathManager::getPathConstraints(void) const {
+        this->synchronize();
         return this->pathConstraints;
       }
 
@@ -50,7 +181,7 @@ namespace triton {
       std::vector<triton::engines::symbolic::PathConstraint> PathManager::getPathConstraintsOfThread(triton::uint32 threadId) const {
         std::vector<triton::engines::symbolic::PathConstraint> ret;
 
-        for (auto& pc : this->pathConstraints) {
+        for (auto& pc : this->getPathConstraints()) {
           if (pc.getThreadId() == threadId) {
             ret.push_back(pc);
           }
@@ -64,6 +195,8 @@ namespace triton {
       std::vector<triton::engines::symbolic::PathConstraint> PathManager::getPathConstraints(triton::usize start, triton::usize end) const {
         triton::usize pcsize = this->getSizeOfPathConstraints();
 
+        this->synchronize();
+
         if (start > pcsize) {
           return {};
         }
@@ -86,37 +219,36 @@ namespace triton {
 
       /* Returns the current path predicate as an AST of logical conjunction of each taken branch. */
       triton::ast::SharedAbstractNode PathManager::getPathPredicate(void) const {
-        std::vector<triton::engines::symbolic::PathConstraint>::const_iterator it;
-
         /* by default PC is T (top) */
-        auto node = this->astCtxt->equal(
-                      this->astCtxt->bvtrue(),
-                      this->astCtxt->bvtrue()
-                    );
-
-        /* Then, we create a conjunction of path constraint */
-        for (it = this->pathConstraints.begin(); it != this->pathConstraints.end(); it++) {
-          node = this->astCtxt->land(node, it->getTakenPredicate());
-        }
+        if (this->lastPathConstraint == nullptr)
+          return this->getTop();
 
-        return node;
+        /* The conjunction of path constraints is built as they are pushed */
+        return this->lastPathConstraint->predicate;
       }
 
 
-
       std::vector<triton::ast::SharedAbstractNode> PathManager::getPredicatesToReachAddress(triton::uint64 addr) const {
         std::vector<triton::ast::SharedAbstractNode> predicates;
+        std::vector<triton::usize> indexes;
 
-        /* by default PC is T (top) */
-        auto node = this->astCtxt->equal(
-                      this->astCtxt->bvtrue(),
-                      this->astCtxt->bvtrue()
-                    );
+        this->synchronize();
 
-        /* Go through all path constraints */
-        for (auto pc = this->pathConstraints.begin(); pc != this->pathConstraints.end(); pc++) {
-          auto branches = pc->getBranchConstraints();
-          bool isMultib = (branches.size() >= 2);
+        /* The path constraints which may reach the targeted address, in order */
+        auto it = this->addressIndex.find(addr);
+        if (it != this->addressIndex.end()) {
+          std::merge(it->second.begin(), it->second.end(), this->indirectIndex.begin(), this->indirectIndex.end(), std::back_inserter(indexes));
+          indexes.erase(std::unique(indexes.begin(), indexes.end()), indexes.end());
+        }
+        else {
+          indexes = this->indirectIndex;
+        }
+
+        for (triton::usize index : indexes) {
+          const auto& pc       = this->pathConstraints[index];
+          const auto& node     = this->pathPredicates[index];
+          const auto& branches = pc.getBranchConstraints();
+          bool isMultib        = (branches.size() >= 2);
 
           /* Check if one of the branch constraint may reach the targeted address */
           for (auto branch = branches.begin(); branch != branches.end(); branch++) {
@@ -142,9 +274,6 @@ namespace triton {
               }
             }
           } /* branch constraints */
-
-          /* Continue to create the conjunction of the current path predicate */
-          node = this->astCtxt->land(node, pc->getTakenPredicate());
         } /* path constraint */
 
         return predicates;
@@ -213,7 +342,7 @@ namespace triton {
             bb2pc           /* expr which must be true to take the branch */
           );
 
-          this->pathConstraints.push_back(pco);
+          this->appendPathConstraint(pco);
         }
 
         /* Direct branch */
@@ -225,7 +354,7 @@ namespace triton {
             /* expr which must be true to take the branch */
             this->astCtxt->equal(pc, this->astCtxt->bv(dstAddr, size))
           );
-          this->pathConstraints.push_back(pco);
+          this->appendPathConstraint(pco);
         }
       }
 
@@ -250,26 +379,37 @@ namespace triton {
 
         pco.setComment(comment);
 
-        this->pathConstraints.push_back(pco);
+        this->appendPathConstraint(pco);
       }
 
 
       /* Pushes constraint to the current path predicate. */
       void PathManager::pushPathConstraint(const triton::engines::symbolic::PathConstraint& pco) {
-        this->pathConstraints.push_back(pco);
+        this->appendPathConstraint(pco);
       }
 
 
       /* Pops the last constraints added to the path predicate. */
       void PathManager::popPathConstraint(void) {
-        if (this->pathConstraints.size())
-          this->pathConstraints.pop_back();
+        if (this->lastPathConstraint) {
+          this->lastPathConstraint = this->lastPathConstraint->previous;
+          if (this->synchronized) {
+            this->unindexPathConstraint();
+            this->pathConstraints.pop_back();
+            this->pathPredicates.pop_back();
+          }
+        }
       }
 
 
       /* Clears the current path predicate. */
       void PathManager::clearPathConstraints(void) {
+        this->lastPathConstraint = nullptr;
         this->pathConstraints.clear();
+        this->pathPredicates.clear();
+        this->addressIndex.clear();
+        this->indirectIndex.clear();
+        this->synchronized = true;
       }
 
     }; /* symbolic namespace */
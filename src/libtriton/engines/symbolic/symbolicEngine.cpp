@@ -5,12 +5,15 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
 #include <cstring>
 #include <new>
 #include <set>
 
 #include <triton/exceptions.hpp>
 #include <triton/coreUtils.hpp>
+#include <triton/registerState.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/symbolicEngine.hpp>
 #include <triton/astContext.hpp>
 
@@ -38,7 +41,9 @@ namespace triton {
         this->numberOfRegisters = this->architecture->numberOfRegisters();
         this->uniqueSymExprId   = 0;
         this->uniqueSymVarId    = 0;
+        this->symbolicAliases   = std::make_shared<SymbolicAliasIndex>();
 
+        this->memoryReferenceViewValid = false;
         this->symbolicReg.resize(this->numberOfRegisters);
       }
 
@@ -54,17 +59,22 @@ namespace triton {
         this->callbacks              = other.callbacks;
         this->memoryReference        = other.memoryReference;
         this->numberOfRegisters      = other.numberOfRegisters;
+        this->symbolicAliases        = other.symbolicAliases;
         this->symbolicExpressions    = other.symbolicExpressions;
         this->symbolicReg            = other.symbolicReg;
         this->symbolicVariables      = other.symbolicVariables;
         this->uniqueSymExprId        = other.uniqueSymExprId;
         this->uniqueSymVarId         = other.uniqueSymVarId;
+
+        /* The view is rebuilt on demand */
+        this->memoryReferenceViewValid = false;
       }
 
 
       SymbolicEngine::~SymbolicEngine() {
         /* See #828: Release ownership before calling container destructor */
         this->memoryReference.clear();
+        this->memoryReferenceView.clear();
         this->symbolicReg.clear();
       }
 
@@ -80,16 +90,56 @@ namespace triton {
         this->memoryReference        = other.memoryReference;
         this->modes                  = other.modes;
         this->numberOfRegisters      = other.numberOfRegisters;
+        this->symbolicAliases        = other.symbolicAliases;
         this->symbolicExpressions    = other.symbolicExpressions;
         this->symbolicReg            = other.symbolicReg;
         this->symbolicVariables      = other.symbolicVariables;
         this->uniqueSymExprId        = other.uniqueSymExprId;
         this->uniqueSymVarId         = other.uniqueSymVarId;
 
+        /* The view is rebuilt on demand */
+        this->memoryReferenceView.clear();
+        this->memoryReferenceViewValid = false;
+
         return *this;
       }
 
 
+      void SymbolicEngine::snapshot(triton::Snapshot& snap) const {
+        snap.symbolicMemory    = this->memoryReference;
+        snap.symbolicRegisters = this->symbolicReg;
+        triton::engines::symbolic::PathManager::snapshot(snap);
+      }
+
+
+      void SymbolicEngine::restore(const triton::Snapshot& snap) {
+        if (snap.symbolicRegisters.size() != this->symbolicReg.size())
+          throw triton::exceptions::SymbolicEngine("SymbolicEngine::restore(): The snapshot does not match the architecture.");
+
+        this->memoryReference = snap.symbolicMemory;
+        this->symbolicReg     = snap.symbolicRegisters;
+        /* The view is rebuilt on demand */
+        this->memoryReferenceView.clear();
+        this->memoryReferenceViewValid = false;
+        /* The aligned references are a cache of the byte references */
+        this->alignedMemoryReference.clear();
+        triton::engines::symbolic::PathManager::restore(snap);
+      }
+
+
+      void SymbolicEngine::snapshot(triton::RegisterState& state) const {
+        state.symbolicRegisters = this->symbolicReg;
+      }
+
+
+      void SymbolicEngine::restore(const triton::RegisterState& state) {
+        if (state.symbolicRegisters.size() != this->symbolicReg.size())
+          throw triton::exceptions::SymbolicEngine("SymbolicEngine::restore(): The register state does not match the architecture.");
+
+        this->symbolicReg = state.symbolicRegisters;
+      }
+
+
       /*
        * Concretize a register. If the register is setup as nullptr, the next assignment
        * will be over the concretization. This method must be called before symbolic
@@ -134,6 +184,8 @@ namespace triton {
        */
       void SymbolicEngine::concretizeMemory(triton::uint64 addr) {
         this->memoryReference.erase(addr);
+        if (this->memoryReferenceViewValid)
+          this->memoryReferenceView.erase(addr);
         this->removeAlignedMemory(addr, triton::size::byte);
       }
 
@@ -141,6 +193,7 @@ namespace triton {
       /* Same as concretizeMemory but with all address memory */
       void SymbolicEngine::concretizeAllMemory(void) {
         this->memoryReference.clear();
+        this->memoryReferenceView.clear();
         this->alignedMemoryReference.clear();
       }
 
@@ -207,9 +260,9 @@ namespace triton {
 
       /* Returns the reference memory if it's referenced otherwise returns nullptr */
       SharedSymbolicExpression SymbolicEngine::getSymbolicMemory(triton::uint64 addr) const {
-        auto it = this->memoryReference.find(addr);
-        if (it != this->memoryReference.end()) {
-          return it->second;
+        const SharedSymbolicExpression* expr = this->memoryReference.find(addr);
+        if (expr != nullptr) {
+          return *expr;
         }
         return nullptr;
       }
@@ -230,23 +283,45 @@ namespace triton {
       }
 
 
-      /* Returns the symbolic variable otherwise returns nullptr */
+      /* Returns the symbolic variable otherwise raises an exception */
       SharedSymbolicVariable SymbolicEngine::getSymbolicVariable(const std::string& name) const {
-        /*
-         * FIXME: 1) When there is a ton of symvar, this loop takes a while to go through.
-         *           What about adding two maps {id:symvar} and {string:symvar}? See #648.
-         *
-         *        2) If we are looking for alias, we return the first occurrence. It's not
-         *           ideal if we have multiple same aliases.
-         */
-        for (auto& sv: this->symbolicVariables) {
-          if (auto symVar = sv.second.lock()) {
-            if (symVar->getName() == name || symVar->getAlias() == name) {
+        if (auto symVar = this->findSymbolicVariable(name))
+          return symVar;
+
+        throw triton::exceptions::SymbolicEngine("SymbolicEngine::getSymbolicVariable(): Unregistred or dead symbolic variable.");
+      }
+
+
+      /* Returns the symbolic variable otherwise nullptr */
+      SharedSymbolicVariable SymbolicEngine::findSymbolicVariable(const std::string& name) const {
+        const std::string prefix = TRITON_SYMVAR_NAME;
+
+        /* Names are built from the ids, so they do not need an index */
+        if (name.size() > prefix.size() && name.size() <= prefix.size() + 19 && name.compare(0, prefix.size(), prefix) == 0 &&
+            name.find_first_not_of("0123456789", prefix.size()) == std::string::npos) {
+          auto it = this->symbolicVariables.find(std::stoull(name.substr(prefix.size())));
+          if (it != this->symbolicVariables.end()) {
+            auto symVar = it->second.lock();
+            if (symVar && symVar->getName() == name)
               return symVar;
-            }
           }
         }
-        throw triton::exceptions::SymbolicEngine("SymbolicEngine::getSymbolicVariable(): Unregistred or dead symbolic variable.");
+
+        /* The index is kept exact by SymbolicVariable::setAlias(), so a miss is a single probe */
+        auto it = this->symbolicAliases->find(name);
+        if (it != this->symbolicAliases->end()) {
+          for (triton::usize id : it->second) {
+            /* The index is shared with the copies of this engine, which may own other variables */
+            auto sv = this->symbolicVariables.find(id);
+            if (sv == this->symbolicVariables.end())
+              continue;
+            auto symVar = sv->second.lock();
+            if (symVar && symVar->getAlias() == name)
+              return symVar;
+          }
+        }
+
+        return nullptr;
       }
 
 
@@ -518,7 +593,15 @@ namespace triton {
 
       /* Returns the map of symbolic memory defined */
       const std::unordered_map<triton::uint64, SharedSymbolicExpression>& SymbolicEngine::getSymbolicMemory(void) const {
-        return this->memoryReference;
+        if (!this->memoryReferenceViewValid) {
+          std::unordered_map<triton::uint64, SharedSymbolicExpression>& view = this->memoryReferenceView;
+          view.reserve(this->memoryReference.size());
+          this->memoryReference.forEach([&view](triton::uint64 addr, const SharedSymbolicExpression& expr) {
+            view[addr] = expr;
+          });
+          this->memoryReferenceViewValid = true;
+        }
+        return this->memoryReferenceView;
       }
 
 
@@ -634,6 +717,8 @@ namespace triton {
         }
 
         this->symbolicVariables[uniqueId] = symVar;
+        symVar->setAliasIndex(this->symbolicAliases);
+
         return symVar;
       }
 
@@ -1061,7 +1146,9 @@ namespace triton {
 
       /* Adds and assign a new memory reference */
       inline void SymbolicEngine::addMemoryReference(triton::uint64 mem, const SharedSymbolicExpression& expr) {
-        this->memoryReference[mem] = expr;
+        this->memoryReference.insert(mem, expr);
+        if (this->memoryReferenceViewValid)
+          this->memoryReferenceView[mem] = expr;
       }
 
 
@@ -5,6 +5,8 @@
 **  This program is under the terms of the Apache License 2.0.
 */
 
+#include <algorithm>
+
 #include <triton/exceptions.hpp>
 #include <triton/cpuSize.hpp>
 #include <triton/symbolicVariable.hpp>
@@ -47,7 +49,13 @@ namespace triton {
       }
 
 
+      SymbolicVariable::~SymbolicVariable() {
+        this->unindexAlias();
+      }
+
+
       SymbolicVariable& SymbolicVariable::operator=(const SymbolicVariable& other) {
+        this->unindexAlias();
         this->alias   = other.alias;
         this->comment = other.comment;
         this->id      = other.id;
@@ -55,6 +63,7 @@ namespace triton {
         this->origin  = other.origin;
         this->size    = other.size;
         this->type    = other.type;
+        this->indexAlias(this->alias);
         return *this;
       }
 
@@ -95,7 +104,46 @@ namespace triton {
 
 
       void SymbolicVariable::setAlias(const std::string& alias) {
+        this->unindexAlias();
         this->alias = alias;
+        this->indexAlias(alias);
+      }
+
+
+      void SymbolicVariable::setAliasIndex(const std::shared_ptr<SymbolicAliasIndex>& index) {
+        this->unindexAlias();
+        this->aliasIndex = index;
+        this->indexAlias(this->alias);
+      }
+
+
+      void SymbolicVariable::indexAlias(const std::string& alias) {
+        auto index = this->aliasIndex.lock();
+        if (!index || alias.empty())
+          return;
+
+        /* Ids are kept sorted so that the first created variable wins */
+        auto& ids = (*index)[alias];
+        ids.insert(std::lower_bound(ids.begin(), ids.end(), this->id), this->id);
+      }
+
+
+      void SymbolicVariable::unindexAlias(void) {
+        auto index = this->aliasIndex.lock();
+        if (!index || this->alias.empty())
+          return;
+
+        auto it = index->find(this->alias);
+        if (it == index->end())
+          return;
+
+        auto& ids = it->second;
+        auto id = std::lower_bound(ids.begin(), ids.end(), this->id);
+        if (id != ids.end() && *id == this->id)
+          ids.erase(id);
+
+        if (ids.empty())
+          index->erase(it);
       }
 
 
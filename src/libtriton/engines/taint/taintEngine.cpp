@@ -6,6 +6,8 @@
 */
 
 #include <triton/exceptions.hpp>
+#include <triton/registerState.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/taintEngine.hpp>
 
 
@@ -18,6 +20,8 @@ namespace triton {
         : modes(modes),
           symbolicEngine(symbolicEngine),
           cpu(cpu) {
+        this->taintedMemoryViewValid = false;
+
         if (this->symbolicEngine == nullptr)
           throw triton::exceptions::TaintEngine("TaintEngine::TaintEngine(): The symbolicEngine cannot be null.");
       }
@@ -29,6 +33,9 @@ namespace triton {
         this->symbolicEngine   = other.symbolicEngine;
         this->taintedMemory    = other.taintedMemory;
         this->taintedRegisters = other.taintedRegisters;
+
+        /* The view is rebuilt on demand */
+        this->taintedMemoryViewValid = false;
       }
 
 
@@ -38,13 +45,51 @@ namespace triton {
         this->symbolicEngine   = other.symbolicEngine;
         this->taintedMemory    = other.taintedMemory;
         this->taintedRegisters = other.taintedRegisters;
+
+        /* The view is rebuilt on demand */
+        this->taintedMemoryView.clear();
+        this->taintedMemoryViewValid = false;
+
         return *this;
       }
 
 
+      void TaintEngine::snapshot(triton::Snapshot& snap) const {
+        snap.taintedMemory    = this->taintedMemory;
+        snap.taintedRegisters = this->taintedRegisters;
+      }
+
+
+      void TaintEngine::restore(const triton::Snapshot& snap) {
+        this->taintedMemory    = snap.taintedMemory;
+        this->taintedRegisters = snap.taintedRegisters;
+        /* The view is rebuilt on demand */
+        this->taintedMemoryView.clear();
+        this->taintedMemoryViewValid = false;
+      }
+
+
+      void TaintEngine::snapshot(triton::RegisterState& state) const {
+        state.taintedRegisters = this->taintedRegisters;
+      }
+
+
+      void TaintEngine::restore(const triton::RegisterState& state) {
+        this->taintedRegisters = state.taintedRegisters;
+      }
+
+
       /* Returns the tainted addresses */
       const std::unordered_set<triton::uint64>& TaintEngine::getTaintedMemory(void) const {
-        return this->taintedMemory;
+        if (!this->taintedMemoryViewValid) {
+          std::unordered_set<triton::uint64>& view = this->taintedMemoryView;
+          view.reserve(this->taintedMemory.size());
+          this->taintedMemory.forEach([&view](triton::uint64 addr) {
+            view.insert(addr);
+          });
+          this->taintedMemoryViewValid = true;
+        }
+        return this->taintedMemoryView;
       }
 
 
@@ -65,7 +110,7 @@ namespace triton {
         triton::uint32 size = mem.getSize();
 
         for (triton::uint32 index = 0; index < size; index++) {
-          if (this->taintedMemory.find(addr+index) != this->taintedMemory.end())
+          if (this->taintedMemory.contains(addr+index))
             return TAINTED;
         }
 
@@ -86,7 +131,7 @@ namespace triton {
       /* Returns true of false if the address is currently tainted */
       bool TaintEngine::isMemoryTainted(triton::uint64 addr, triton::uint32 size) const {
         for (triton::uint32 index = 0; index < size; index++) {
-          if (this->taintedMemory.find(addr+index) != this->taintedMemory.end())
+          if (this->taintedMemory.contains(addr+index))
             return TAINTED;
         }
 
@@ -170,8 +215,11 @@ namespace triton {
         triton::uint64 addr = mem.getAddress();
         triton::uint32 size = mem.getSize();
 
-        for (triton::uint32 index = 0; index < size; index++)
+        for (triton::uint32 index = 0; index < size; index++) {
           this->taintedMemory.insert(addr+index);
+          if (this->taintedMemoryViewValid)
+            this->taintedMemoryView.insert(addr+index);
+        }
 
         return TAINTED;
       }
@@ -180,6 +228,8 @@ namespace triton {
       /* Taint the address */
       bool TaintEngine::taintMemory(triton::uint64 addr) {
         this->taintedMemory.insert(addr);
+        if (this->taintedMemoryViewValid)
+          this->taintedMemoryView.insert(addr);
         return TAINTED;
       }
 
@@ -189,8 +239,11 @@ namespace triton {
         triton::uint64 addr = mem.getAddress();
         triton::uint32 size = mem.getSize();
 
-        for (triton::uint32 index = 0; index < size; index++)
+        for (triton::uint32 index = 0; index < size; index++) {
           this->taintedMemory.erase(addr+index);
+          if (this->taintedMemoryViewValid)
+            this->taintedMemoryView.erase(addr+index);
+        }
 
         return !TAINTED;
       }
@@ -199,6 +252,8 @@ namespace triton {
       /* Untaint the address */
       bool TaintEngine::untaintMemory(triton::uint64 addr) {
         this->taintedMemory.erase(addr);
+        if (this->taintedMemoryViewValid)
+          this->taintedMemoryView.erase(addr);
         return !TAINTED;
       }
 
@@ -43,6 +43,23 @@ namespace triton {
       BE_ENDIANNESS,    /*!< Big endian.        */
     };
 
+    /*! Kinds of concrete memory backend */
+    enum memory_backend_e {
+      MEMORY_BACKEND_MAP = 0, /*!< One hash map entry per byte.                  */
+      MEMORY_BACKEND_PAGED,   /*!< Pages of 4 KiB with a bitmap of defined bytes. */
+    };
+
+    /*! Reasons why an emulation stops */
+    enum stop_e {
+      STOP_ADDRESS = 0, /*!< A stop address has been reached.          */
+      STOP_COUNT,       /*!< The maximum number of instructions ran.   */
+      STOP_FAULT,       /*!< An instruction raised a fault.            */
+      STOP_HOOK,        /*!< A hook stopped the emulation.             */
+      STOP_NO_CODE,     /*!< The program counter points to no code.    */
+      STOP_TIMEOUT,     /*!< The maximum time elapsed.                 */
+      STOP_INTERRUPTED, /*!< The emulation has been interrupted.       */
+    };
+
     /*! Types of operand */
     enum operand_e {
       OP_INVALID = 0,   /*!< Invalid operand    */
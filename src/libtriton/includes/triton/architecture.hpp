@@ -17,6 +17,7 @@
 #include <triton/basicBlock.hpp>
 #include <triton/callbacks.hpp>
 #include <triton/cpuInterface.hpp>
+#include <triton/disassemblyCache.hpp>
 #include <triton/dllexport.hpp>
 #include <triton/instruction.hpp>
 #include <triton/memoryAccess.hpp>
@@ -32,6 +33,9 @@ namespace triton {
  *  @{
  */
 
+  class RegisterState;
+  class Snapshot;
+
   //! The Architecture namespace
   namespace arch {
   /*!
@@ -54,6 +58,9 @@ namespace triton {
         //! Instance to the real CPU class.
         std::unique_ptr<triton::arch::CpuInterface> cpu;
 
+        //! The cache of decoded instructions.
+        mutable triton::arch::DisassemblyCache cache;
+
       public:
         //! Constructor.
         TRITON_EXPORT Architecture(triton::callbacks::Callbacks* callbacks=nullptr);
@@ -142,6 +149,18 @@ namespace triton {
         //! Returns a NOP instruction according to the architecture.
         TRITON_EXPORT const triton::arch::Instruction getNopInstruction(void) const;
 
+        //! Returns the maximum number of instructions kept in the disassembly cache (0 if disabled).
+        TRITON_EXPORT triton::usize getDisassemblyCacheSize(void) const;
+
+        //! Sets the maximum number of instructions kept in the disassembly cache. 0 disables and clears the cache.
+        TRITON_EXPORT void setDisassemblyCacheSize(triton::usize size);
+
+        //! Returns the statistics of the disassembly cache.
+        TRITON_EXPORT triton::arch::DisassemblyCacheStats getDisassemblyCacheStats(void) const;
+
+        //! Clears the disassembly cache and its statistics.
+        TRITON_EXPORT void clearDisassemblyCache(void);
+
         //! Disassembles the instruction according to the architecture.
         TRITON_EXPORT void disassembly(triton::arch::Instruction& inst) const;
 
@@ -163,6 +182,9 @@ namespace triton {
         //! Returns the concrete value of a memory area.
         TRITON_EXPORT std::vector<triton::uint8> getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::usize size, bool execCallbacks=true) const;
 
+        //! Copies the concrete value of a memory area into `area`.
+        TRITON_EXPORT void getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks=true) const;
+
         //! Returns the concrete value of a register.
         TRITON_EXPORT triton::uint512 getConcreteRegisterValue(const triton::arch::Register& reg, bool execCallbacks=true) const;
 
@@ -217,6 +239,27 @@ namespace triton {
 
         //! Clears concrete values assigned to the memory cells
         TRITON_EXPORT void clearConcreteMemoryValue(triton::uint64 baseAddr, triton::usize size=1);
+
+        //! Returns the kind of backend used to store the concrete memory
+        TRITON_EXPORT triton::arch::memory_backend_e getConcreteMemoryBackend(void) const;
+
+        //! Sets the kind of backend used to store the concrete memory. The current content is kept.
+        TRITON_EXPORT void setConcreteMemoryBackend(triton::arch::memory_backend_e backend);
+
+        //! Maps `size` bytes of a file from `offset` at `baseAddr`. Pages are copied on their first write and the SET_CONCRETE_MEMORY_VALUE callbacks are not called.
+        TRITON_EXPORT void mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable=false);
+
+        //! Saves the concrete registers and memory into a snapshot. The memory pages are shared until written.
+        TRITON_EXPORT void snapshot(triton::Snapshot& snap) const;
+
+        //! Restores the concrete registers and memory of a snapshot. The callbacks are not called.
+        TRITON_EXPORT void restore(const triton::Snapshot& snap);
+
+        //! Saves the concrete values of the parent registers into a register state.
+        TRITON_EXPORT void snapshot(triton::RegisterState& state) const;
+
+        //! Restores the concrete values of the parent registers of a register state. The SET_CONCRETE_REGISTER_VALUE callbacks are called.
+        TRITON_EXPORT void restore(const triton::RegisterState& state);
     };
 
   /*! @} End of arch namespace */
@@ -70,6 +70,12 @@ namespace triton {
         //! Hashes the tree.
         virtual void initHash(void) = 0;
 
+        //! Computes the concrete value of the node from the concrete values of its children.
+        virtual void initEval(void) = 0;
+
+        //! Evaluates the node and all its descendants which are not evaluated yet.
+        void evaluateDeferred(void);
+
       protected:
         //! Deep level for computing hash
         triton::uint32 level;
@@ -90,6 +96,9 @@ namespace triton {
         //! The value of the tree from this root node.
         triton::uint512 eval;
 
+        //! False if the evaluation of the node is deferred until evaluate() is called.
+        bool evaluated;
+
         //! The hash of the tree
         triton::uint512 hash;
 
@@ -105,6 +114,9 @@ namespace triton {
         //! Contect use to create this node
         SharedAstContext ctxt;
 
+        //! Computes the concrete value of the node, or defers it until evaluate() if the AST_LAZY_EVALUATION mode is enabled.
+        void updateEval(void);
+
       public:
         //! Constructor.
         TRITON_EXPORT AbstractNode(triton::ast::ast_e type, const SharedAstContext& ctxt);
@@ -202,6 +214,7 @@ namespace triton {
         triton::uint32 indexSize;
 
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT ArrayNode(triton::uint32 indexSize, const SharedAstContext& ctxt);
@@ -231,6 +244,7 @@ namespace triton {
     class AssertNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT AssertNode(const SharedAbstractNode& expr);
@@ -242,6 +256,7 @@ namespace triton {
     class BswapNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BswapNode(const SharedAbstractNode& expr);
@@ -253,6 +268,7 @@ namespace triton {
     class BvaddNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvaddNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -264,6 +280,7 @@ namespace triton {
     class BvandNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvandNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -275,6 +292,7 @@ namespace triton {
     class BvashrNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvashrNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -286,6 +304,7 @@ namespace triton {
     class BvlshrNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvlshrNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -297,6 +316,7 @@ namespace triton {
     class BvmulNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvmulNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -308,6 +328,7 @@ namespace triton {
     class BvnandNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvnandNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -319,6 +340,7 @@ namespace triton {
     class BvnegNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvnegNode(const SharedAbstractNode& expr);
@@ -330,6 +352,7 @@ namespace triton {
     class BvnorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvnorNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -341,6 +364,7 @@ namespace triton {
     class BvnotNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvnotNode(const SharedAbstractNode& expr1);
@@ -352,6 +376,7 @@ namespace triton {
     class BvorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvorNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -363,6 +388,7 @@ namespace triton {
     class BvrolNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvrolNode(const SharedAbstractNode& expr, triton::uint32 rot);
@@ -375,6 +401,7 @@ namespace triton {
     class BvrorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvrorNode(const SharedAbstractNode& expr, triton::uint32 rot);
@@ -387,6 +414,7 @@ namespace triton {
     class BvsdivNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsdivNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -398,6 +426,7 @@ namespace triton {
     class BvsgeNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsgeNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -409,6 +438,7 @@ namespace triton {
     class BvsgtNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsgtNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -420,6 +450,7 @@ namespace triton {
     class BvshlNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvshlNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -431,6 +462,7 @@ namespace triton {
     class BvsleNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsleNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -442,6 +474,7 @@ namespace triton {
     class BvsltNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsltNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -453,6 +486,7 @@ namespace triton {
     class BvsmodNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsmodNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -464,6 +498,7 @@ namespace triton {
     class BvsremNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsremNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -475,6 +510,7 @@ namespace triton {
     class BvsubNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvsubNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -486,6 +522,7 @@ namespace triton {
     class BvudivNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvudivNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -497,6 +534,7 @@ namespace triton {
     class BvugeNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvugeNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -508,6 +546,7 @@ namespace triton {
     class BvugtNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvugtNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -519,6 +558,7 @@ namespace triton {
     class BvuleNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvuleNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -530,6 +570,7 @@ namespace triton {
     class BvultNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvultNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -541,6 +582,7 @@ namespace triton {
     class BvuremNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvuremNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -552,6 +594,7 @@ namespace triton {
     class BvxnorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvxnorNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -563,6 +606,7 @@ namespace triton {
     class BvxorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvxorNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -574,6 +618,7 @@ namespace triton {
     class BvNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT BvNode(const triton::uint512& value, triton::uint32 size, const SharedAstContext& ctxt);
@@ -585,6 +630,7 @@ namespace triton {
     class CompoundNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> CompoundNode(const T& exprs, const SharedAstContext& ctxt)
@@ -601,6 +647,7 @@ namespace triton {
     class ConcatNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> ConcatNode(const T& exprs, const SharedAstContext& ctxt)
@@ -618,6 +665,7 @@ namespace triton {
     class DeclareNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT DeclareNode(const SharedAbstractNode& var);
@@ -629,6 +677,7 @@ namespace triton {
     class DistinctNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT DistinctNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -640,6 +689,7 @@ namespace triton {
     class EqualNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT EqualNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -651,6 +701,7 @@ namespace triton {
     class ExtractNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT ExtractNode(triton::uint32 high, triton::uint32 low, const SharedAbstractNode& expr);
@@ -662,6 +713,7 @@ namespace triton {
     class ForallNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> ForallNode(const T& vars, const SharedAbstractNode& body)
@@ -679,6 +731,7 @@ namespace triton {
     class IffNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT IffNode(const SharedAbstractNode& expr1, const SharedAbstractNode& expr2);
@@ -690,6 +743,7 @@ namespace triton {
     class IntegerNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       protected:
         triton::uint512 value;
@@ -705,6 +759,7 @@ namespace triton {
     class IteNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT IteNode(const SharedAbstractNode& ifExpr, const SharedAbstractNode& thenExpr, const SharedAbstractNode& elseExpr);
@@ -716,6 +771,7 @@ namespace triton {
     class LandNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> LandNode(const T& exprs, const SharedAstContext& ctxt)
@@ -733,6 +789,7 @@ namespace triton {
     class LetNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT LetNode(std::string alias, const SharedAbstractNode& expr2, const SharedAbstractNode& expr3);
@@ -744,6 +801,7 @@ namespace triton {
     class LnotNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT LnotNode(const SharedAbstractNode& expr);
@@ -755,6 +813,7 @@ namespace triton {
     class LorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> LorNode(const T& exprs, const SharedAstContext& ctxt)
@@ -772,6 +831,7 @@ namespace triton {
     class LxorNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         template <typename T> LxorNode(const T& exprs, const SharedAstContext& ctxt)
@@ -789,6 +849,7 @@ namespace triton {
     class ReferenceNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       protected:
         triton::engines::symbolic::SharedSymbolicExpression expr;
@@ -804,6 +865,7 @@ namespace triton {
     class SelectNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT SelectNode(const SharedAbstractNode& array, triton::usize index);
@@ -825,6 +887,7 @@ namespace triton {
         triton::uint32 indexSize;
 
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT StoreNode(const SharedAbstractNode& array, triton::usize index, const SharedAbstractNode& expr);
@@ -852,6 +915,7 @@ namespace triton {
     class StringNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       protected:
         std::string value;
@@ -867,6 +931,7 @@ namespace triton {
     class SxNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         TRITON_EXPORT SxNode(triton::uint32 sizeExt, const SharedAbstractNode& expr);
@@ -878,6 +943,7 @@ namespace triton {
     class VariableNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       protected:
         triton::engines::symbolic::SharedSymbolicVariable symVar;
@@ -893,6 +959,7 @@ namespace triton {
     class ZxNode : public AbstractNode {
       private:
         TRITON_EXPORT void initHash(void);
+        TRITON_EXPORT void initEval(void);
 
       public:
         //! Create a zero extend of expr to sizeExt bits
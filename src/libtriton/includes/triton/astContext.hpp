@@ -9,6 +9,7 @@
 #define TRITON_AST_CONTEXT_H
 
 #include <deque>
+#include <istream>
 #include <list>
 #include <memory>
 #include <unordered_map>
@@ -19,6 +20,7 @@
 #include <triton/dllexport.hpp>
 #include <triton/exceptions.hpp>
 #include <triton/modes.hpp>
+#include <triton/smtToTriton.hpp>
 
 
 
@@ -48,6 +50,22 @@ namespace triton {
    *  @{
    */
 
+    //! Counters of the AST garbage collector.
+    struct GarbageCollectorStats {
+      //! The number of nodes currently held by the collector.
+      triton::usize kept;
+
+      //! The number of nodes released since the creation of the context.
+      triton::usize freed;
+
+      //! The number of sweeps performed since the creation of the context.
+      triton::usize sweeps;
+
+      //! The cumulated time spent in sweeps (in microseconds).
+      triton::uint64 time;
+    };
+
+
     //! \class AstContext
     /*! \brief AST Context - Used as AST builder. */
     class AstContext : public std::enable_shared_from_this<AstContext> {
@@ -61,9 +79,45 @@ namespace triton {
         //! Maps a concrete value and ast node for a variable name.
         std::unordered_map<std::string, std::pair<triton::ast::WeakAbstractNode, triton::uint512>> valueMapping;
 
-        //! The list of nodes
+        //! The list of nodes (young generation of the garbage collector)
         std::deque<SharedAbstractNode> nodes;
 
+        //! The list of nodes which survived a sweep (old generation of the garbage collector)
+        std::vector<SharedAbstractNode> tenuredNodes;
+
+        //! The position of the next node to examine in the old generation
+        triton::usize tenuredCursor;
+
+        //! The maximum number of nodes examined per sweep, split between the generations (0 means a default slice)
+        triton::usize gcBudget;
+
+        //! A sweep is performed every `gcPeriod` calls to garbage()
+        triton::usize gcPeriod;
+
+        //! The number of calls to garbage()
+        triton::usize gcCalls;
+
+        //! Counters of the garbage collector
+        GarbageCollectorStats gcStats;
+
+        //! Unique table of nodes used by the hash-consing mode. Maps a node's hash to the nodes which have this hash.
+        std::unordered_multimap<triton::usize, WeakAbstractNode> uniqueTable;
+
+        //! Size of the unique table from which expired entries are purged.
+        triton::usize uniqueTableThreshold;
+
+        //! Returns a node structurally identical to `node` if it already exists, otherwise records `node` and returns it.
+        SharedAbstractNode hashCons(const SharedAbstractNode& node);
+
+        //! Purges expired entries of the unique table.
+        void purgeUniqueTable(void);
+
+        //! Sweeps at most `youngBudget` young nodes, then at most `tenuredBudget` old nodes plus the young budget left.
+        void sweep(triton::usize youngBudget, triton::usize tenuredBudget);
+
+        //! Releases all collected nodes from the deepest to the shallowest.
+        void releaseNodes(void);
+
         //! Returns simplified concatenation.
         SharedAbstractNode simplify_concat(std::vector<SharedAbstractNode> exprs);
 
@@ -80,12 +134,27 @@ namespace triton {
         //! Operator
         TRITON_EXPORT AstContext& operator=(const AstContext& other);
 
-        //! Collect new nodes
-        TRITON_EXPORT SharedAbstractNode collect(const SharedAbstractNode& node);
+        //! Collect new nodes. If `share` is false, the node is not hash-consed (e.g. a copy which may be mutated).
+        TRITON_EXPORT SharedAbstractNode collect(const SharedAbstractNode& node, bool share=true);
+
+        //! Removes a node from the unique table of the hash-consing mode. Must be called before the node is mutated.
+        TRITON_EXPORT void unshare(AbstractNode* node);
 
-        //! Garbage unused nodes.
+        //! Garbage unused nodes. The sweep is incremental according to the budget and the period of the collector.
         TRITON_EXPORT void garbage(void);
 
+        //! Garbage all unused nodes regardless of the budget and the period of the collector.
+        TRITON_EXPORT void fullGarbage(void);
+
+        //! Sets the maximum number of nodes examined per sweep (0 means a default slice of 1024 nodes).
+        TRITON_EXPORT void setGarbageCollectorBudget(triton::usize budget);
+
+        //! Sets the number of calls to garbage() between two sweeps (1 means a sweep at each call).
+        TRITON_EXPORT void setGarbageCollectorPeriod(triton::usize period);
+
+        //! Returns the counters of the garbage collector.
+        TRITON_EXPORT GarbageCollectorStats getGarbageCollectorStats(void) const;
+
         //! AST C++ API - array node builder
         TRITON_EXPORT SharedAbstractNode array(triton::uint32 addrSize);
 
@@ -341,9 +410,15 @@ namespace triton {
         //! Gets a variable node from its name.
         SharedAbstractNode getVariableNode(const std::string& name);
 
+        //! Parses a SMT-LIB2 script and returns the asserted nodes and the top-level terms (see SmtToTriton). Symbolic variables are found by name, by alias or by the resolver.
+        TRITON_EXPORT std::vector<SharedAbstractNode> parseSmt(std::istream& stream, const triton::ast::SmtResolver& resolver=nullptr);
+
         //! Returns the address space used for the ABV logic.
         TRITON_EXPORT triton::uint16 getArraySize(void) const;
 
+        //! Returns true if the evaluation of new nodes is deferred until their value is requested (see triton::modes::AST_LAZY_EVALUATION).
+        TRITON_EXPORT bool isEvaluationDeferred(void) const;
+
         //! Gets a variable value from its name.
         TRITON_EXPORT const triton::uint512& getVariableValue(const std::string& name) const;
 
@@ -355,6 +430,9 @@ namespace triton {
 
         //! Prints the node according to the current representation mode.
         TRITON_EXPORT std::ostream& print(std::ostream& stream, AbstractNode* node);
+
+        //! Prints the node according to the current representation mode, binding each shared sub-expression once (see AstRepresentation::printShared).
+        TRITON_EXPORT std::ostream& printShared(std::ostream& stream, AbstractNode* node);
     };
 
     //! Shared AST context
@@ -10,6 +10,8 @@
 
 #include <iostream>
 #include <memory>
+#include <string>
+#include <unordered_map>
 
 #include <triton/ast.hpp>
 #include <triton/astEnums.hpp>
@@ -52,6 +54,12 @@ namespace triton {
           //! AstRepresentation interface.
           std::unique_ptr<triton::ast::representations::AstRepresentationInterface> representations[triton::ast::representations::LAST_REPRESENTATION];
 
+          //! The names of the shared nodes while printShared() is running. print() prints them instead of the nodes.
+          std::unordered_map<const AbstractNode*, std::string> names;
+
+          //! The maximum height of a node printed inline by printShared(). Higher nodes are named to limit the recursion.
+          static const triton::uint32 MAX_INLINE_HEIGHT = 256;
+
         public:
           //! Constructor.
           TRITON_EXPORT AstRepresentation();
@@ -70,6 +78,14 @@ namespace triton {
 
           //! Prints the node according to the current representation mode.
           TRITON_EXPORT std::ostream& print(std::ostream& stream, AbstractNode* node);
+
+          //! Prints the node according to the current representation mode, binding each shared sub-expression once.
+          /*!
+           * \details The nodes which are used several times (by identity or by structure) are printed once
+           * and then referred to by name: with a `let` in the SMT representation and with a temporary variable
+           * in the Python one. The DAG is walked without recursion and the output size is linear in its size.
+           */
+          TRITON_EXPORT std::ostream& printShared(std::ostream& stream, AbstractNode* node);
       };
 
     /*! @} End of representations namespace */
@@ -0,0 +1,113 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_BATCHEVALUATOR_H
+#define TRITON_BATCHEVALUATOR_H
+
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/astEnums.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/symbolicVariable.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    //! \class BatchEvaluator
+    /*! \brief Evaluates an AST under many assignments of its symbolic variables.
+     *
+     * \details The AST is compiled once into a linear tape of instructions (one per distinct node, in topological
+     * order). Sub-trees which do not depend on a symbolic variable are folded into constants. The tape is then
+     * run on a batch of assignments, one instruction at a time over all the lanes of the batch. If every node of
+     * the tape holds at most 64 bits, the lanes are native 64-bit integers, otherwise they are 512-bit integers.
+     */
+    class BatchEvaluator {
+      public:
+        //! An input column, one value per lane of the batch.
+        using Column = std::vector<triton::uint512>;
+
+      private:
+        //! An instruction of the tape.
+        struct Instruction {
+          //! The kind of node. `INVALID_NODE` means a constant, `VARIABLE_NODE` an input.
+          triton::ast::ast_e type;
+
+          //! The size of the result.
+          triton::uint32 size;
+
+          //! The size of the first operand.
+          triton::uint32 opSize;
+
+          //! The immediate of the node (extract low bit, rotation, input index).
+          triton::uint32 imm;
+
+          //! The constant value (constants only).
+          triton::uint512 value;
+
+          //! The slots of the operands.
+          std::vector<triton::usize> operands;
+        };
+
+        //! The tape, in topological order. The result of the instruction `i` is stored into the slot `i`.
+        std::vector<Instruction> tape;
+
+        //! The symbolic variables used as inputs, in order of first occurrence.
+        std::vector<triton::engines::symbolic::SharedSymbolicVariable> variables;
+
+        //! The current concrete values of the variables, used when an input column is missing.
+        std::vector<triton::uint512> defaults;
+
+        //! True if every instruction of the tape fits into 64 bits.
+        bool narrow;
+
+        //! Compiles the AST into the tape.
+        void compile(const triton::ast::SharedAbstractNode& node);
+
+        //! Runs the tape on a batch of lanes.
+        template <typename T>
+        void run(const std::vector<const Column*>& columns, std::vector<triton::uint512>& results) const;
+
+      public:
+        //! Constructor. Compiles `node`.
+        TRITON_EXPORT BatchEvaluator(const triton::ast::SharedAbstractNode& node);
+
+        //! Returns the symbolic variables used by the AST.
+        TRITON_EXPORT const std::vector<triton::engines::symbolic::SharedSymbolicVariable>& getVariables(void) const;
+
+        //! Returns the concrete values of the variables (in the order of getVariables()), used for the variables without column.
+        TRITON_EXPORT const std::vector<triton::uint512>& getDefaultValues(void) const;
+
+        //! Returns the number of instructions of the tape.
+        TRITON_EXPORT triton::usize getTapeSize(void) const;
+
+        //! Evaluates the AST for each lane of `inputs`, a map of symbolic variable id to column. All columns must have the same size. Variables without column keep their current concrete value.
+        TRITON_EXPORT std::vector<triton::uint512> evaluate(const std::unordered_map<triton::usize, Column>& inputs) const;
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_BATCHEVALUATOR_H */
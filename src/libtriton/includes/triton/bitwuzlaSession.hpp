@@ -0,0 +1,123 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_BITWUZLASESSION_H
+#define TRITON_BITWUZLASESSION_H
+
+#include <memory>
+#include <unordered_map>
+#include <vector>
+
+#include <bitwuzla/bitwuzla.h>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/solverEnums.hpp>
+#include <triton/solverModel.hpp>
+#include <triton/solverSession.hpp>
+#include <triton/tritonToBitwuzla.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+    //! The Solver namespace
+    namespace solver {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup solver
+     *  @{
+     */
+
+      //! \class BitwuzlaSession
+      /*! \brief Incremental solver session using Bitwuzla.
+       *
+       * \details The session keeps one Bitwuzla instance alive, and the Bitwuzla terms of the translated nodes
+       * across calls. The `node` given to isSat() and getModel() is checked as an assumption, so it does not
+       * need a solver scope and Bitwuzla keeps what it learned from the constraints.
+       */
+      class BitwuzlaSession : public SolverSession {
+        private:
+          //! The SMT solver timeout. By default, unlimited.
+          triton::uint32 timeout;
+
+          //! The SMT solver memory limit. By default, unlimited.
+          triton::uint32 memoryLimit;
+
+          //! The Bitwuzla instance.
+          Bitwuzla* bzla;
+
+          //! The converter, which keeps the Bitwuzla term of each node already translated.
+          std::unique_ptr<triton::ast::TritonToBitwuzla> converter;
+
+          //! Creates the Bitwuzla instance and the converter.
+          void init(void);
+
+          //! Deletes the Bitwuzla instance and the converter.
+          void release(void);
+
+          //! Returns the Bitwuzla term of a logical node.
+          const BitwuzlaTerm* convert(const triton::ast::SharedAbstractNode& node);
+
+          //! Checks the constraints (and `node` as an assumption if not null) and writes back the status and the solving time.
+          BitwuzlaResult check(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime);
+
+        public:
+          //! Constructor.
+          TRITON_EXPORT BitwuzlaSession();
+
+          //! Destructor.
+          TRITON_EXPORT ~BitwuzlaSession();
+
+          //! Pushes a new solver scope and asserts the constraint in it.
+          TRITON_EXPORT void push(const triton::ast::SharedAbstractNode& node);
+
+          //! Pops the last solver scope and its constraint.
+          TRITON_EXPORT void pop(void);
+
+          //! Pops all scopes and clears the translation cache.
+          TRITON_EXPORT void reset(void);
+
+          //! Returns true if the conjunction of the constraints (and `node` if not null) is satisfiable.
+          TRITON_EXPORT bool isSat(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
+          //! Computes and returns a model of the conjunction of the constraints (and `node` if not null).
+          /*! \brief map of symbolic variable id -> model
+           *
+           * \details
+           * **item1**: symbolic variable id<br>
+           * **item2**: model
+           */
+          TRITON_EXPORT std::unordered_map<triton::usize, SolverModel> getModel(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
+          //! Defines a solver timeout (in milliseconds).
+          TRITON_EXPORT void setTimeout(triton::uint32 ms);
+
+          //! Defines a solver memory consumption limit (in megabytes).
+          TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
+      };
+
+    /*! @} End of solver namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_BITWUZLASESSION_H */
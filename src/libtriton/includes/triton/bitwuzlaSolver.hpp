@@ -8,8 +8,11 @@
 #ifndef TRITON_BITWUZLASOLVER_H
 #define TRITON_BITWUZLASOLVER_H
 
+#include <atomic>
 #include <chrono>
+#include <mutex>
 #include <string>
+#include <thread>
 #include <unordered_map>
 #include <vector>
 
@@ -50,8 +53,11 @@ namespace triton {
       /*! \brief Solver engine using Bitwuzla. */
       class BitwuzlaSolver : public SolverInterface {
         private:
+          //! The incremental session shares the termination parameters and the value conversion.
+          friend class BitwuzlaSession;
+
           //! Converts binary bitvector value from string to uint512.
-          triton::uint512 fromBvalueToUint512(const char* value) const;
+          static triton::uint512 fromBvalueToUint512(const char* value);
 
           /*! Struct used to provide information for Bitwuzla termination callback */
           struct SolverParams {
@@ -63,6 +69,30 @@ namespace triton {
             int64_t timeout;                                                                                /*!< Timeout (ms) for solver instance running. */
             size_t  memory_limit;                                                                           /*!< Memory limit for the whole symbolic process. */
             int64_t last_mem_check = -1;                                                                    /*!< Time when the last memory usage check was performed. */
+            std::atomic<bool> interrupted{false};                                                           /*!< Set by interrupt() to stop the solver. */
+          };
+
+          //! The parameters of the running queries, by calling thread.
+          mutable std::unordered_multimap<std::thread::id, SolverParams*> running;
+
+          //! Protects `running`.
+          mutable std::mutex runningLock;
+
+          //! Registers the parameters of a query while it runs, so it can be interrupted.
+          class RunningQuery {
+            private:
+              //! The solver running the query.
+              const BitwuzlaSolver& solver;
+
+              //! The parameters of the query.
+              SolverParams* params;
+
+            public:
+              //! Constructor. Registers the parameters for the calling thread.
+              RunningQuery(const BitwuzlaSolver& solver, SolverParams* params);
+
+              //! Destructor. Unregisters the parameters.
+              ~RunningQuery();
           };
 
           //! The SMT solver timeout. By default, unlimited. This global timeout may be changed for a specific query (isSat/getModel/getModels) via argument `timeout`.
@@ -108,7 +138,10 @@ namespace triton {
           //! Defines a solver memory consumption limit (in megabytes).
           TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
 
-          //! Callback function that implements termination of Bitwuzla solver on timeout and memory limit.
+          //! Interrupts the query running on the given thread, if any.
+          TRITON_EXPORT void interrupt(std::thread::id thread);
+
+          //! Callback function that implements termination of Bitwuzla solver on timeout, memory limit and interruption.
           static int32_t terminateCallback(void* state);
 
           //! Callback function that implements aborting of Bitwuzla solver with throwing exception.
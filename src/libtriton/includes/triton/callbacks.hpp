@@ -10,6 +10,7 @@
 
 #include <atomic>
 #include <list>
+#include <unordered_map>
 
 #include <triton/ast.hpp>
 #include <triton/callbacksEnums.hpp>
@@ -38,6 +39,14 @@ namespace triton {
    *  @{
    */
 
+    /*! \brief The prototype of a GET_CONCRETE_MEMORY_AREA_VALUE callback.
+     *
+     * \details The callback takes an Context context as first argument, a base address as second argument and a size as third.
+     * Callbacks will be called once per contiguous area of undefined concrete memory that the Triton library will need to LOAD.
+     * Areas which have been defined (by the callback or not) are not reported again.
+     */
+    using getConcreteMemoryAreaValueCallback = ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)>;
+
     /*! \brief The prototype of a GET_CONCRETE_MEMORY_VALUE callback.
      *
      * \details The callback takes an Context context as first argument and a memory access as second argument.
@@ -74,6 +83,14 @@ namespace triton {
      */
     using symbolicSimplificationCallback = ComparableFunctor<triton::ast::SharedAbstractNode(triton::Context&, const triton::ast::SharedAbstractNode&)>;
 
+    /*! \brief The prototype of a hook.
+     *
+     * \details The callback takes an Context context as first argument and the hooked address as second argument.
+     * Hooks are called by the emulation (see triton::Context::emulate()) instead of processing the instruction at the hooked
+     * address, they must thus update the program counter. The emulation stops if the hook returns false.
+     */
+    using hookCallback = ComparableFunctor<bool(triton::Context&, triton::uint64)>;
+
     //! \class Callbacks
     /*! \brief The callbacks class */
     class Callbacks {
@@ -87,6 +104,9 @@ namespace triton {
         //! Mutex for the getConcreteMemoryValue callback
         std::atomic<bool> mload;
 
+        //! Mutex for the getConcreteMemoryAreaValue callback
+        std::atomic<bool> mloadArea;
+
         //! Mutex for the setConcreteRegisterValue callback
         std::atomic<bool> mput;
 
@@ -97,6 +117,9 @@ namespace triton {
         std::atomic<bool> defined;
 
       protected:
+        //! [c++] Callbacks for all undefined concrete memory areas needs (LOAD).
+        std::list<triton::callbacks::getConcreteMemoryAreaValueCallback> getConcreteMemoryAreaValueCallbacks;
+
         //! [c++] Callbacks for all concrete memory needs (LOAD).
         std::list<triton::callbacks::getConcreteMemoryValueCallback> getConcreteMemoryValueCallbacks;
 
@@ -112,6 +135,9 @@ namespace triton {
         //! [c++] Callbacks for all symbolic simplifications.
         std::list<triton::callbacks::symbolicSimplificationCallback> symbolicSimplificationCallbacks;
 
+        //! [c++] Hooks by address.
+        std::unordered_map<triton::uint64, triton::callbacks::hookCallback> hooks;
+
         //! Returns the number of callbacks recorded.
         triton::usize countCallbacks(void) const;
 
@@ -122,6 +148,9 @@ namespace triton {
         //! Constructor.
         TRITON_EXPORT Callbacks(triton::Context& ctx);
 
+        //! Adds a GET_CONCRETE_MEMORY_AREA_VALUE callback.
+        TRITON_EXPORT void addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb);
+
         //! Adds a GET_CONCRETE_MEMORY_VALUE callback.
         TRITON_EXPORT void addCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb);
 
@@ -140,6 +169,9 @@ namespace triton {
         //! Clears recorded callbacks.
         TRITON_EXPORT void clearCallbacks(void);
 
+        //! Deletes a GET_CONCRETE_MEMORY_AREA_VALUE callback.
+        TRITON_EXPORT void removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, triton::uint64, triton::usize)> cb);
+
         //! Deletes a GET_CONCRETE_MEMORY_VALUE callback.
         TRITON_EXPORT void removeCallback(triton::callbacks::callback_e kind, ComparableFunctor<void(triton::Context&, const triton::arch::MemoryAccess&)> cb);
 
@@ -158,6 +190,9 @@ namespace triton {
         //! Processes callbacks according to the kind and the C++ polymorphism.
         TRITON_EXPORT triton::ast::SharedAbstractNode processCallbacks(triton::callbacks::callback_e kind, triton::ast::SharedAbstractNode node);
 
+        //! Processes callbacks according to the kind and the C++ polymorphism.
+        TRITON_EXPORT void processCallbacks(triton::callbacks::callback_e kind, triton::uint64 baseAddr, triton::usize size);
+
         //! Processes callbacks according to the kind and the C++ polymorphism.
         TRITON_EXPORT void processCallbacks(triton::callbacks::callback_e kind, const triton::arch::MemoryAccess& mem);
 
@@ -175,6 +210,21 @@ namespace triton {
 
         //! Returns true if at least one callback is defined.
         TRITON_EXPORT bool isDefined(void) const;
+
+        //! Hooks an address. Replaces the previous hook of this address.
+        TRITON_EXPORT void addHook(triton::uint64 addr, const triton::callbacks::hookCallback& cb);
+
+        //! Removes the hook of an address.
+        TRITON_EXPORT void removeHook(triton::uint64 addr);
+
+        //! Clears recorded hooks.
+        TRITON_EXPORT void clearHooks(void);
+
+        //! Returns true if the address is hooked.
+        TRITON_EXPORT bool isHooked(triton::uint64 addr) const;
+
+        //! Calls the hook of an address and returns its result.
+        TRITON_EXPORT bool processHook(triton::uint64 addr);
     };
 
   /*! @} End of callbacks namespace */
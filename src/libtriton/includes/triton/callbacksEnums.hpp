@@ -27,6 +27,7 @@ namespace triton {
 
     /*! Enumerates all kinds callbacks. */
     enum callback_e {
+      GET_CONCRETE_MEMORY_AREA_VALUE, /*!< LOAD undefined concrete memory area callback */
       GET_CONCRETE_MEMORY_VALUE,    /*!< LOAD concrete memory value callback */
       GET_CONCRETE_REGISTER_VALUE,  /*!< GET concrete register value callback */
       SET_CONCRETE_MEMORY_VALUE,    /*!< STORE concrete memory value callback */
@@ -34,6 +35,14 @@ namespace triton {
       SYMBOLIC_SIMPLIFICATION,      /*!< Symbolic simplification callback */
     };
 
+    /*! Enumerates all built-in function summaries. */
+    enum summary_e {
+      SUMMARY_MEMCPY,               /*!< void* memcpy(void* dst, const void* src, size_t n) */
+      SUMMARY_MEMSET,               /*!< void* memset(void* dst, int c, size_t n) */
+      SUMMARY_STRCMP,               /*!< int strcmp(const char* s1, const char* s2) */
+      SUMMARY_STRLEN,               /*!< size_t strlen(const char* s) */
+    };
+
   /*! @} End of callbacks namespace */
   };
 /*! @} End of triton namespace */
@@ -0,0 +1,201 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_CONCRETEMEMORY_HPP
+#define TRITON_CONCRETEMEMORY_HPP
+
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <triton/archEnums.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Architecture namespace
+  namespace arch {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup arch
+   *  @{
+   */
+
+    //! The size of a page of the paged memory backend.
+    const triton::usize MEMORY_PAGE_SIZE = 0x1000;
+
+    /*! \class MappedFile
+     *  \brief A region of a file mapped in memory.
+     *
+     *  \details The region is mapped privately, so writes are never propagated to the file. On platforms without
+     *  `mmap` the region is read into memory.
+     */
+    class MappedFile {
+      private:
+        //! The base address of the mapping.
+        triton::uint8* base;
+
+        //! The size of the mapping.
+        triton::usize length;
+
+        //! The offset of the requested region in the mapping.
+        triton::usize delta;
+
+        //! True if the mapping may be written in place.
+        bool writable;
+
+      public:
+        //! Constructor. Maps `size` bytes of the file `path` from `offset`.
+        TRITON_EXPORT MappedFile(const std::string& path, triton::uint64 offset, triton::usize size, bool writable);
+
+        //! Destructor.
+        TRITON_EXPORT ~MappedFile();
+
+        //! Returns the address of the requested region.
+        TRITON_EXPORT triton::uint8* getData(void) const;
+
+        //! Returns true if the mapping may be written in place.
+        TRITON_EXPORT bool isWritable(void) const;
+    };
+
+    //! Shared mapped file.
+    using SharedMappedFile = std::shared_ptr<triton::arch::MappedFile>;
+
+    //! \struct MemoryPage
+    /*! \brief A page of the paged memory backend. */
+    struct MemoryPage {
+      //! The concrete values of the page. Points either to `storage` or into a mapped file.
+      triton::uint8* data;
+
+      //! The storage owned by the page (nullptr if the page is backed by a mapped file).
+      std::unique_ptr<triton::uint8[]> storage;
+
+      //! The mapped file which backs the page (nullptr if the page owns its storage).
+      triton::arch::SharedMappedFile file;
+
+      //! Bitmap of the bytes which have a defined concrete value.
+      triton::uint64 defined[MEMORY_PAGE_SIZE / 64];
+
+      //! The number of bytes which have a defined concrete value.
+      triton::usize count;
+
+      //! Constructor. The page is empty and owns its storage.
+      TRITON_EXPORT MemoryPage();
+
+      //! Constructor by copy. The new page always owns its storage.
+      TRITON_EXPORT MemoryPage(const MemoryPage& other);
+
+      //! Constructor. The page is fully defined and backed by a mapped file.
+      TRITON_EXPORT MemoryPage(const triton::arch::SharedMappedFile& file, triton::uint8* data);
+    };
+
+    //! Shared memory page.
+    using SharedMemoryPage = std::shared_ptr<triton::arch::MemoryPage>;
+
+    /*! \class ConcreteMemory
+     *  \brief The concrete memory of a CPU.
+     *
+     *  \details The memory is either stored as one hash map entry per byte (MEMORY_BACKEND_MAP), or as a table of
+     *  pages of `MEMORY_PAGE_SIZE` bytes with a bitmap of defined bytes (MEMORY_BACKEND_PAGED). Pages are shared
+     *  between copies of a ConcreteMemory and duplicated on the first write. Pages may also be backed by a mapped
+     *  file, see mapFile().
+     */
+    class ConcreteMemory {
+      private:
+        //! The kind of backend.
+        triton::arch::memory_backend_e backend;
+
+        //! The memory of the map backend.
+        std::unordered_map<triton::uint64, triton::uint8, IdentityHash<triton::uint64>> map;
+
+        //! The pages of the paged backend (page number -> page).
+        std::unordered_map<triton::uint64, SharedMemoryPage, IdentityHash<triton::uint64>> pages;
+
+        //! The page number of the last accessed page.
+        mutable triton::uint64 lastPageNumber;
+
+        //! The last accessed page (nullptr if none).
+        mutable triton::arch::MemoryPage* lastPage;
+
+        //! Returns the page which contains the address or nullptr if there is no page.
+        triton::arch::MemoryPage* findPage(triton::uint64 addr) const;
+
+        //! Returns a writable page which contains the address. The page is created or duplicated if needed.
+        triton::arch::MemoryPage* getWritablePage(triton::uint64 addr);
+
+        //! Copies a ConcreteMemory.
+        void copy(const ConcreteMemory& other);
+
+      public:
+        //! Constructor.
+        TRITON_EXPORT ConcreteMemory(triton::arch::memory_backend_e backend=triton::arch::MEMORY_BACKEND_PAGED);
+
+        //! Constructor by copy.
+        TRITON_EXPORT ConcreteMemory(const ConcreteMemory& other);
+
+        //! Copies a ConcreteMemory.
+        TRITON_EXPORT ConcreteMemory& operator=(const ConcreteMemory& other);
+
+        //! Returns the kind of backend.
+        TRITON_EXPORT triton::arch::memory_backend_e getBackend(void) const;
+
+        //! Sets the kind of backend. The current content is moved into the new backend.
+        TRITON_EXPORT void setBackend(triton::arch::memory_backend_e backend);
+
+        //! Returns true if all bytes of the area have a defined concrete value.
+        TRITON_EXPORT bool isDefined(triton::uint64 addr, triton::usize size=1) const;
+
+        //! Returns the contiguous areas (address, size) of `[addr, addr+size)` which have no defined concrete value.
+        TRITON_EXPORT std::vector<std::pair<triton::uint64, triton::usize>> getUndefinedAreas(triton::uint64 addr, triton::usize size) const;
+
+        //! Returns the concrete value of a byte (0 if undefined).
+        TRITON_EXPORT triton::uint8 read(triton::uint64 addr) const;
+
+        //! Reads the concrete value of an area into `out`. Undefined bytes are read as 0.
+        TRITON_EXPORT void read(triton::uint64 addr, triton::uint8* out, triton::usize size) const;
+
+        //! Sets the concrete value of a byte.
+        TRITON_EXPORT void write(triton::uint64 addr, triton::uint8 value);
+
+        //! Sets the concrete value of an area.
+        TRITON_EXPORT void write(triton::uint64 addr, const triton::uint8* in, triton::usize size);
+
+        /*!
+         * \brief Maps `size` bytes of the file `path` from `offset` at the address `addr`.
+         *
+         * \details With the paged backend, the pages fully covered by the area are backed by the file and are only
+         * copied on their first write, or written in place in a private mapping if `writable` is true. Other bytes
+         * are copied.
+         */
+        TRITON_EXPORT void mapFile(const std::string& path, triton::uint64 offset, triton::uint64 addr, triton::usize size, bool writable=false);
+
+        //! Clears the concrete value of an area.
+        TRITON_EXPORT void clear(triton::uint64 addr, triton::usize size);
+
+        //! Clears the whole memory.
+        TRITON_EXPORT void clear(void);
+
+        //! Returns the number of bytes which have a defined concrete value.
+        TRITON_EXPORT triton::usize size(void) const;
+    };
+
+  /*! @} End of arch namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_CONCRETEMEMORY_HPP */
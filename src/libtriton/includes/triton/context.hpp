@@ -8,12 +8,16 @@
 #ifndef TRITON_CONTEXT_H
 #define TRITON_CONTEXT_H
 
+#include <functional>
+
 #include <triton/architecture.hpp>
 #include <triton/ast.hpp>
 #include <triton/astContext.hpp>
 #include <triton/astRepresentation.hpp>
 #include <triton/basicBlock.hpp>
+#include <triton/batchEvaluator.hpp>
 #include <triton/callbacks.hpp>
+#include <triton/callbacksEnums.hpp>
 #include <triton/dllexport.hpp>
 #include <triton/immediate.hpp>
 #include <triton/instruction.hpp>
@@ -23,7 +27,9 @@
 #include <triton/modes.hpp>
 #include <triton/operandWrapper.hpp>
 #include <triton/register.hpp>
+#include <triton/registerState.hpp>
 #include <triton/shortcutRegister.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/solverEngine.hpp>
 #include <triton/solverEnums.hpp>
 #include <triton/symbolicEngine.hpp>
@@ -91,6 +97,9 @@ namespace triton {
         //! The IR builder.
         triton::arch::IrBuilder* irBuilder = nullptr;
 
+        //! The generation of the engines, unique among all the contexts.
+        triton::uint64 generation = 0;
+
 
       public:
         //! A shortcut to access to a Register class from a register name.
@@ -190,6 +199,9 @@ namespace triton {
         //! [**architecture api**] - Returns the concrete value of a memory area.
         TRITON_EXPORT std::vector<triton::uint8> getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::usize size, bool execCallbacks=true) const;
 
+        //! [**architecture api**] - Copies the concrete value of a memory area into `area`.
+        TRITON_EXPORT void getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks=true) const;
+
         //! [**architecture api**] - Returns the concrete value of a register.
         TRITON_EXPORT triton::uint512 getConcreteRegisterValue(const triton::arch::Register& reg, bool execCallbacks=true) const;
 
@@ -245,6 +257,15 @@ namespace triton {
         //! Clears concrete values assigned to the memory cells
         TRITON_EXPORT void clearConcreteMemoryValue(triton::uint64 baseAddr, triton::usize size=1);
 
+        //! Returns the kind of backend used to store the concrete memory
+        TRITON_EXPORT triton::arch::memory_backend_e getConcreteMemoryBackend(void) const;
+
+        //! Sets the kind of backend used to store the concrete memory. The current content is kept.
+        TRITON_EXPORT void setConcreteMemoryBackend(triton::arch::memory_backend_e backend);
+
+        //! Maps `size` bytes of a file from `offset` at `baseAddr`. Pages are copied on their first write and the SET_CONCRETE_MEMORY_VALUE callbacks are not called.
+        TRITON_EXPORT void mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable=false);
+
         //! [**architecture api**] - Disassembles the instruction and setup operands.
         TRITON_EXPORT void disassembly(triton::arch::Instruction& inst) const;
 
@@ -257,6 +278,18 @@ namespace triton {
         //! [**architecture api**] - Disassembles a concrete memory area from `addr` to control flow instruction and returns a `BasicBlock`.
         TRITON_EXPORT triton::arch::BasicBlock disassembly(triton::uint64 addr) const;
 
+        //! [**architecture api**] - Returns the maximum number of instructions kept in the disassembly cache (0 if disabled).
+        TRITON_EXPORT triton::usize getDisassemblyCacheSize(void) const;
+
+        //! [**architecture api**] - Sets the maximum number of decoded instructions kept in a LRU cache, keyed by address and opcode. 0 disables and clears the cache (the default).
+        TRITON_EXPORT void setDisassemblyCacheSize(triton::usize size);
+
+        //! [**architecture api**] - Returns the statistics of the disassembly cache.
+        TRITON_EXPORT triton::arch::DisassemblyCacheStats getDisassemblyCacheStats(void) const;
+
+        //! [**architecture api**] - Clears the disassembly cache and its statistics.
+        TRITON_EXPORT void clearDisassemblyCache(void);
+
 
 
         /* Processing API ================================================================================ */
@@ -267,6 +300,9 @@ namespace triton {
         //! [**proccesing api**] - Processes a block of instructions and updates engines according to instructions semantics. Returns `triton::arch::NO_FAULT` if succeed.
         TRITON_EXPORT triton::arch::exception_e processing(triton::arch::BasicBlock& block, triton::uint64 addr=0);
 
+        //! [**proccesing api**] - Emulates the code from `addr`, fetching the opcodes from the concrete memory (callbacks included), until the program counter reaches one of `stops`, `limit` instructions ran or `timeout` milliseconds elapsed (0 means no limit). Also stops on a fault, when a hook returns false or when the program counter points to an undefined memory. Hooked addresses call their hook instead of being processed, each hook call counts as an instruction. The number of processed instructions and the fault are written into `count` and `fault`. `interrupted` is polled periodically, the emulation stops if it returns true.
+        TRITON_EXPORT triton::arch::stop_e emulate(triton::uint64 addr, const std::unordered_set<triton::uint64>& stops, triton::usize limit=0, triton::uint32 timeout=0, triton::usize* count=nullptr, triton::arch::exception_e* fault=nullptr, const std::function<bool(void)>& interrupted=nullptr);
+
         //! [**proccesing api**] - Initializes everything.
         TRITON_EXPORT void initEngines(void);
 
@@ -276,6 +312,18 @@ namespace triton {
         //! [**proccesing api**] - Resets everything.
         TRITON_EXPORT void reset(void);
 
+        //! [**proccesing api**] - Returns a snapshot of the registers, the memory, the symbolic and taint states and the path constraints. The states are shared with the context and copied on write, see triton::Snapshot.
+        TRITON_EXPORT triton::Snapshot snapshot(void) const;
+
+        //! [**proccesing api**] - Restores a snapshot taken by this context.
+        TRITON_EXPORT void restore(const triton::Snapshot& snap);
+
+        //! [**proccesing api**] - Returns the concrete, symbolic and taint states of the registers, see triton::RegisterState.
+        TRITON_EXPORT triton::RegisterState saveRegisterState(void) const;
+
+        //! [**proccesing api**] - Restores a register state saved by this context. The memory and the path constraints are left untouched.
+        TRITON_EXPORT void restoreRegisterState(const triton::RegisterState& state);
+
 
 
         /* IR API ======================================================================================== */
@@ -325,6 +373,21 @@ namespace triton {
         //! [**callbacks api**] - Processes callbacks according to the kind and the C++ polymorphism.
         TRITON_EXPORT void processCallbacks(triton::callbacks::callback_e kind, const triton::arch::Register& reg);
 
+        //! [**callbacks api**] - Hooks an address. The emulation calls the hook instead of processing the instruction at this address.
+        TRITON_EXPORT void addHook(triton::uint64 addr, const triton::callbacks::hookCallback& cb);
+
+        //! [**callbacks api**] - Hooks an address with a built-in function summary.
+        TRITON_EXPORT void addHook(triton::uint64 addr, triton::callbacks::summary_e kind);
+
+        //! [**callbacks api**] - Removes the hook of an address.
+        TRITON_EXPORT void removeHook(triton::uint64 addr);
+
+        //! [**callbacks api**] - Clears recorded hooks.
+        TRITON_EXPORT void clearHooks(void);
+
+        //! [**callbacks api**] - Returns true if the address is hooked.
+        TRITON_EXPORT bool isHooked(triton::uint64 addr) const;
+
 
 
         /* Modes API====================================================================================== */
@@ -349,7 +412,7 @@ namespace triton {
         TRITON_EXPORT std::unordered_map<triton::arch::register_e, triton::engines::symbolic::SharedSymbolicExpression> getSymbolicRegisters(void) const;
 
         //! [**symbolic api**] - Returns the map (<Addr : SymExpr>) of symbolic memory defined.
-        TRITON_EXPORT std::unordered_map<triton::uint64, triton::engines::symbolic::SharedSymbolicExpression> getSymbolicMemory(void) const;
+        TRITON_EXPORT const std::unordered_map<triton::uint64, triton::engines::symbolic::SharedSymbolicExpression>& getSymbolicMemory(void) const;
 
         //! [**symbolic api**] - Returns the shared symbolic expression corresponding to the memory address.
         TRITON_EXPORT triton::engines::symbolic::SharedSymbolicExpression getSymbolicMemory(triton::uint64 addr) const;
@@ -423,6 +486,9 @@ namespace triton {
         //! [**symbolic api**] - Processes all recorded AST simplifications, uses solver's simplifications if `usingSolver` is true or LLVM is `usingLLVM` is true. Returns the simplified AST.
         TRITON_EXPORT triton::ast::SharedAbstractNode simplify(const triton::ast::SharedAbstractNode& node, bool usingSolver=false, bool usingLLVM=false) const;
 
+        //! [**symbolic api**] - Evaluates an AST under many assignments in a single pass. `inputs` maps symbolic variable ids to columns of values of the same size, returns one result per lane. Variables without column keep their current concrete value.
+        TRITON_EXPORT std::vector<triton::uint512> evaluateAstBatch(const triton::ast::SharedAbstractNode& node, const std::unordered_map<triton::usize, std::vector<triton::uint512>>& inputs) const;
+
         //! [**symbolic api**] - Processes a dead store elimination simplification on a given basic block. If `padding` is true, keep addresses aligned and padds with NOP instructions.
         TRITON_EXPORT triton::arch::BasicBlock simplify(const triton::arch::BasicBlock& block, bool padding=false) const;
 
@@ -432,7 +498,7 @@ namespace triton {
         //! [**symbolic api**] - Returns the symbolic variable corresponding to the symbolic variable id.
         TRITON_EXPORT triton::engines::symbolic::SharedSymbolicVariable getSymbolicVariable(triton::usize symVarId) const;
 
-        //! [**symbolic api**] - Returns the symbolic variable corresponding to the symbolic variable name.
+        //! [**symbolic api**] - Returns the symbolic variable corresponding to the symbolic variable name or alias.
         TRITON_EXPORT triton::engines::symbolic::SharedSymbolicVariable getSymbolicVariable(const std::string& symVarName) const;
 
         //! [**symbolic api**] - Returns the logical conjunction vector of path constraints.
@@ -574,6 +640,63 @@ namespace triton {
         //! [**solver api**] - Defines a solver memory consumption limit (in megabytes).
         TRITON_EXPORT void setSolverMemoryLimit(triton::uint32 limit);
 
+        //! [**solver api**] - Returns the number of threads used to enumerate models with getModels().
+        TRITON_EXPORT triton::uint32 getSolverWorkers(void) const;
+
+        //! [**solver api**] - Defines the number of threads used to enumerate models with getModels() (only supported by z3).
+        TRITON_EXPORT void setSolverWorkers(triton::uint32 workers);
+
+        //! [**solver api**] - Returns the maximum number of queries kept in the solver query cache (0 if the cache is disabled).
+        TRITON_EXPORT triton::usize getSolverQueryCacheSize(void) const;
+
+        //! [**solver api**] - Sets the maximum number of queries kept in the solver query cache. 0 disables the cache (default).
+        TRITON_EXPORT void setSolverQueryCacheSize(triton::usize size);
+
+        //! [**solver api**] - Returns the statistics of the solver query cache.
+        TRITON_EXPORT triton::engines::solver::QueryCacheStats getSolverQueryCacheStats(void) const;
+
+        //! [**solver api**] - Clears the solver query cache and its statistics.
+        TRITON_EXPORT void clearSolverQueryCache(void);
+
+        //! [**solver api**] - Returns the statistics of each solver of the portfolio (empty if the current solver is not SOLVER_PORTFOLIO).
+        TRITON_EXPORT std::map<triton::engines::solver::solver_e, triton::engines::solver::PortfolioStats> getSolverPortfolioStats(void) const;
+
+        //! [**solver api**] - Returns true if the solver queries are split into independent groups of constraints.
+        TRITON_EXPORT bool isSolverIndependenceEnabled(void) const;
+
+        //! [**solver api**] - Enables or disables the splitting of the solver queries into independent groups of constraints (disabled by default).
+        TRITON_EXPORT void setSolverIndependence(bool flag);
+
+        //! [**solver api**] - Returns the incremental solver session. The session is created on first use.
+        TRITON_EXPORT triton::engines::solver::SolverSession& getSolverSession(void);
+
+        //! [**solver api**] - Pushes a new scope in the solver session and asserts the constraint in it.
+        TRITON_EXPORT void pushSessionConstraint(const triton::ast::SharedAbstractNode& node);
+
+        //! [**solver api**] - Pops the last scope of the solver session.
+        TRITON_EXPORT void popSessionConstraint(void);
+
+        //! [**solver api**] - Clears the solver session and its translation cache.
+        TRITON_EXPORT void clearSessionConstraints(void);
+
+        //! [**solver api**] - Makes the constraints of the solver session equal to the taken predicates of the path constraints. Only the diverging suffix is popped and pushed.
+        TRITON_EXPORT void syncSessionConstraints(void);
+
+        //! [**solver api**] - Returns the number of constraints of the solver session.
+        TRITON_EXPORT triton::usize getSizeOfSessionConstraints(void);
+
+        //! [**solver api**] - Returns true if the constraints of the solver session (and `node` if not null) are satisfiable.
+        TRITON_EXPORT bool isSessionSat(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
+        /*!
+         * \brief [**solver api**] - Computes and returns a model of the constraints of the solver session (and `node` if not null). State is returned in the `status` pointer as well as the solving time. A `timeout` can also be defined.
+         *
+         * \details
+         * **item1**: symbolic variable id<br>
+         * **item2**: model
+         */
+        TRITON_EXPORT std::unordered_map<triton::usize, triton::engines::solver::SolverModel> getSessionModel(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
 
 
         /* Taint engine API ============================================================================== */
@@ -691,6 +814,9 @@ namespace triton {
         //! [**lifting api**] - Lifts a symbolic expression and all its references to SMT format. If `assert_` is true, then (assert <expr>). If `icomment` is true, then print instructions assembly in expression comments.
         TRITON_EXPORT std::ostream& liftToSMT(std::ostream& stream, const triton::engines::symbolic::SharedSymbolicExpression& expr, bool assert_=false, bool icomment=false);
 
+        //! [**lifting api**] - Parses a SMT-LIB2 script and returns the asserted nodes and the top-level terms. Symbolic variables are found by name or by alias, the declared bit-vectors which do not exist are created.
+        TRITON_EXPORT std::vector<triton::ast::SharedAbstractNode> parseSmt(std::istream& stream);
+
         //! [**lifting api**] - Lifts an AST and all its references to Dot format.
         TRITON_EXPORT std::ostream& liftToDot(std::ostream& stream, const triton::ast::SharedAbstractNode& node);
 
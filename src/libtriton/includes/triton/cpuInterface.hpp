@@ -116,6 +116,9 @@ namespace triton {
         //! Returns the concrete value of a memory area.
         TRITON_EXPORT virtual std::vector<triton::uint8> getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::usize size, bool execCallbacks=true) const = 0;
 
+        //! Copies the concrete value of a memory area into `area`.
+        TRITON_EXPORT virtual void getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks=true) const = 0;
+
         //! Returns the concrete value of a register.
         TRITON_EXPORT virtual triton::uint512 getConcreteRegisterValue(const triton::arch::Register& reg, bool execCallbacks=true) const = 0;
 
@@ -170,6 +173,15 @@ namespace triton {
 
         //! Clears concrete values assigned to the memory cells
         TRITON_EXPORT virtual void clearConcreteMemoryValue(triton::uint64 baseAddr, triton::usize size=1) = 0;
+
+        //! Returns the kind of backend used to store the concrete memory
+        TRITON_EXPORT virtual triton::arch::memory_backend_e getConcreteMemoryBackend(void) const = 0;
+
+        //! Sets the kind of backend used to store the concrete memory. The current content is kept.
+        TRITON_EXPORT virtual void setConcreteMemoryBackend(triton::arch::memory_backend_e backend) = 0;
+
+        //! Maps `size` bytes of a file from `offset` at `baseAddr`. Pages are copied on their first write and the SET_CONCRETE_MEMORY_VALUE callbacks are not called.
+        TRITON_EXPORT virtual void mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable=false) = 0;
     };
 
   /*! @} End of arch namespace */
@@ -0,0 +1,159 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_DISASSEMBLYCACHE_HPP
+#define TRITON_DISASSEMBLYCACHE_HPP
+
+#include <list>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/archEnums.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/instruction.hpp>
+#include <triton/operandWrapper.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The Architecture namespace
+  namespace arch {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup arch
+   *  @{
+   */
+
+    //! Statistics of the disassembly cache.
+    struct DisassemblyCacheStats {
+      //! The number of instructions decoded from the cache.
+      triton::usize hits;
+
+      //! The number of instructions decoded by the disassembler.
+      triton::usize misses;
+
+      //! The number of entries dropped because the opcode at their address changed (self-modifying code).
+      triton::usize invalidations;
+
+      //! The number of instructions currently cached.
+      triton::usize entries;
+
+      //! The number of instructions evicted from the cache.
+      triton::usize evictions;
+    };
+
+
+    /*! \class DisassemblyCache
+     *  \brief A LRU cache of decoded instructions.
+     *
+     *  \details Instructions are keyed by address. An entry records the bytes consumed by the decoding and only
+     *  matches an instruction whose opcode starts with those bytes, so a code rewritten at runtime is decoded again
+     *  and replaces the stale entry. On hit, the disassembly-level fields (size, type, operands, ...) are copied into
+     *  the instruction without calling the disassembler. The cache is disabled while its capacity is 0 (the default).
+     */
+    class DisassemblyCache {
+      private:
+        //! A decoded instruction.
+        struct Entry {
+          //! The address of the instruction.
+          triton::uint64 address;
+
+          //! The bytes consumed by the decoding.
+          triton::uint8 opcode[16];
+
+          //! The size of the instruction.
+          triton::uint32 size;
+
+          //! The architecture of the instruction.
+          triton::arch::architecture_e arch;
+
+          //! The type of the instruction.
+          triton::uint32 type;
+
+          //! The prefix of the instruction.
+          triton::arch::x86::prefix_e prefix;
+
+          //! The code condition of the instruction.
+          triton::arch::arm::condition_e codeCondition;
+
+          //! The disassembly of the instruction.
+          std::string disassembly;
+
+          //! The operands of the instruction.
+          std::vector<triton::arch::OperandWrapper> operands;
+
+          //! True if the instruction is a branch.
+          bool branch;
+
+          //! True if the instruction changes the control flow.
+          bool controlFlow;
+
+          //! True if the instruction performs a write back.
+          bool writeBack;
+
+          //! True if the instruction updates flags.
+          bool updateFlag;
+
+          //! True if the instruction is a Thumb instruction.
+          bool thumb;
+        };
+
+        //! The maximum number of cached instructions.
+        triton::usize capacity;
+
+        //! The cached instructions, most recently used first.
+        std::list<Entry> entries;
+
+        //! The index of the cached instructions by address.
+        std::unordered_map<triton::uint64, std::list<Entry>::iterator> index;
+
+        //! The statistics.
+        DisassemblyCacheStats stats;
+
+        //! Evicts the least recently used entries above the capacity.
+        void shrink(void);
+
+      public:
+        //! Constructor.
+        TRITON_EXPORT DisassemblyCache();
+
+        //! Returns true if the cache is enabled.
+        TRITON_EXPORT bool isEnabled(void) const;
+
+        //! Returns the maximum number of cached instructions.
+        TRITON_EXPORT triton::usize getCapacity(void) const;
+
+        //! Sets the maximum number of cached instructions. 0 disables and clears the cache.
+        TRITON_EXPORT void setCapacity(triton::usize capacity);
+
+        //! Returns the statistics of the cache.
+        TRITON_EXPORT DisassemblyCacheStats getStats(void) const;
+
+        //! Clears the cached instructions and the statistics.
+        TRITON_EXPORT void clear(void);
+
+        //! Looks up an instruction by address and opcode. Returns true and fills its disassembly-level fields on hit.
+        TRITON_EXPORT bool lookup(triton::arch::Instruction& inst);
+
+        //! Records a decoded instruction.
+        TRITON_EXPORT void insert(const triton::arch::Instruction& inst);
+    };
+
+  /*! @} End of arch namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_DISASSEMBLYCACHE_HPP */
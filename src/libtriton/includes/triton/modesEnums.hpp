@@ -28,6 +28,8 @@ namespace triton {
     //! Enumerates all kinds of mode.
     enum mode_e {
       ALIGNED_MEMORY,                 //!< [symbolic] Keep a map of aligned memory.
+      AST_HASH_CONSING,               //!< [AST] Share structurally identical nodes instead of allocating duplicates (hash-consing).
+      AST_LAZY_EVALUATION,            //!< [AST] Defer the concrete evaluation of nodes until their value is requested.
       AST_OPTIMIZATIONS,              //!< [AST] Classical arithmetic optimisations to reduce the depth of the trees.
       CONCRETIZE_UNDEFINED_REGISTERS, //!< [symbolic] Concretize every registers tagged as undefined (see #750).
       CONSTANT_FOLDING,               //!< [symbolic] Perform a constant folding optimization of sub ASTs which do not contain symbolic variables.
@@ -8,6 +8,8 @@
 #ifndef TRITON_PATHMANAGER_H
 #define TRITON_PATHMANAGER_H
 
+#include <memory>
+#include <unordered_map>
 #include <vector>
 
 #include <triton/dllexport.hpp>
@@ -26,6 +28,8 @@ namespace triton {
  *  @{
  */
 
+  class Snapshot;
+
   //! The Engines namespace
   namespace engines {
   /*!
@@ -42,6 +46,33 @@ namespace triton {
      *  @{
      */
 
+      /*! \class PathConstraintNode
+          \brief A node of the persistent list of path constraints, shared between a context and its snapshots. */
+      class PathConstraintNode {
+        public:
+          //! The path constraint.
+          triton::engines::symbolic::PathConstraint constraint;
+
+          //! The previous path constraints.
+          std::shared_ptr<PathConstraintNode> previous;
+
+          //! The number of path constraints up to this one.
+          triton::usize size;
+
+          //! The path predicate up to this constraint (the conjunction of the taken predicates).
+          triton::ast::SharedAbstractNode predicate;
+
+          //! Constructor.
+          TRITON_EXPORT PathConstraintNode(const triton::engines::symbolic::PathConstraint& constraint, const std::shared_ptr<PathConstraintNode>& previous, const triton::ast::SharedAbstractNode& predicate);
+
+          //! Destructor. Releases the unshared previous nodes iteratively.
+          TRITON_EXPORT ~PathConstraintNode();
+      };
+
+      //! Shared path constraint node.
+      using SharedPathConstraintNode = std::shared_ptr<PathConstraintNode>;
+
+
       /*! \class PathManager
           \brief The path manager class. */
       class PathManager {
@@ -52,9 +83,45 @@ namespace triton {
           //! AstContext API
           triton::ast::SharedAstContext astCtxt;
 
+          //! The last path constraint of the persistent list of path constraints.
+          triton::engines::symbolic::SharedPathConstraintNode lastPathConstraint;
+
+          //! True if `pathConstraints`, `pathPredicates` and the address index hold the content of the persistent list.
+          mutable bool synchronized;
+
+          //! The path predicate before each path constraint (built from the persistent list).
+          mutable std::vector<triton::ast::SharedAbstractNode> pathPredicates;
+
+          //! The indexes of the path constraints by source and destination address of their branches (built from the persistent list).
+          mutable std::unordered_map<triton::uint64, std::vector<triton::usize>> addressIndex;
+
+          //! The indexes of the indirect branches, which may reach any address (built from the persistent list).
+          mutable std::vector<triton::usize> indirectIndex;
+
+          //! Rebuilds `pathConstraints`, `pathPredicates` and the address index from the persistent list if needed.
+          void synchronize(void) const;
+
+          //! Returns the predicate `true == true`, the path predicate of an empty path.
+          triton::ast::SharedAbstractNode getTop(void) const;
+
+          //! Adds the path constraint at the end of `pathConstraints` to the address index.
+          void indexPathConstraint(void) const;
+
+          //! Removes the path constraint at the end of `pathConstraints` from the address index.
+          void unindexPathConstraint(void) const;
+
+          //! Appends a path constraint.
+          void appendPathConstraint(const triton::engines::symbolic::PathConstraint& pco);
+
         protected:
-          //! \brief The logical conjunction vector of path constraints.
-          std::vector<triton::engines::symbolic::PathConstraint> pathConstraints;
+          //! \brief The logical conjunction vector of path constraints (built from the persistent list).
+          mutable std::vector<triton::engines::symbolic::PathConstraint> pathConstraints;
+
+          //! Saves the path constraints into a snapshot.
+          void snapshot(triton::Snapshot& snap) const;
+
+          //! Restores the path constraints of a snapshot.
+          void restore(const triton::Snapshot& snap);
 
         public:
           //! Constructor.
@@ -78,7 +145,7 @@ namespace triton {
           //! Returns the logical conjunction vector of path constraint of a given thread.
           TRITON_EXPORT std::vector<triton::engines::symbolic::PathConstraint> getPathConstraintsOfThread(triton::uint32 threadId) const;
 
-          //! Returns the current path predicate as an AST of logical conjunction of each taken branch.
+          //! Returns the current path predicate as an AST of logical conjunction of each taken branch. The predicate is built as the constraints are pushed.
           TRITON_EXPORT triton::ast::SharedAbstractNode getPathPredicate(void) const;
 
           //! Returns path predicates which may reach the targeted address.
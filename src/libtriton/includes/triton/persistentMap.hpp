@@ -0,0 +1,289 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_PERSISTENTMAP_HPP
+#define TRITON_PERSISTENTMAP_HPP
+
+#include <bitset>
+#include <memory>
+#include <utility>
+#include <vector>
+
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  /*! \class PersistentMap
+   *  \brief A map of 64-bit keys with structural sharing.
+   *
+   *  \details The map is a hash array mapped trie of 64-way nodes indexed by the bits of a bijective hash of the
+   *  key. Copying a map only copies its root: nodes are shared between the copies and a shared node is duplicated
+   *  on its first write (copy-on-write). Thus, a copy costs a constant time and a write duplicates at most the nodes
+   *  on the path from the root to the modified entry.
+   */
+  template <typename T>
+  class PersistentMap {
+    private:
+      struct Node;
+
+      //! A shared node.
+      using SharedNode = std::shared_ptr<Node>;
+
+      //! A slot of a node, either an entry or a child node.
+      struct Slot {
+        //! The key of the entry.
+        triton::uint64 key;
+
+        //! The value of the entry.
+        T value;
+
+        //! The child node (null for an entry).
+        SharedNode child;
+      };
+
+      //! A node of the trie.
+      struct Node {
+        //! The bitmap of the used slots.
+        triton::uint64 bitmap;
+
+        //! The used slots, ordered by index.
+        std::vector<Slot> slots;
+      };
+
+      //! The root of the trie.
+      SharedNode root;
+
+      //! The number of entries.
+      triton::usize count;
+
+      //! Returns the hash of a key (a bijection, so two keys never collide).
+      static inline triton::uint64 hash(triton::uint64 key) {
+        key ^= key >> 33;
+        key *= 0xff51afd7ed558ccdULL;
+        key ^= key >> 33;
+        key *= 0xc4ceb9fe1a85ec53ULL;
+        key ^= key >> 33;
+        return key;
+      }
+
+      //! Returns the index of a hash at a given level of the trie.
+      static inline triton::uint32 index(triton::uint64 hash, triton::uint32 level) {
+        return static_cast<triton::uint32>((hash >> (level * 6)) & 63);
+      }
+
+      //! Returns the position of the slot of an index in a node.
+      static inline triton::usize position(triton::uint64 bitmap, triton::uint32 index) {
+        return std::bitset<64>(bitmap & ((1ULL << index) - 1)).count();
+      }
+
+      //! Returns a node which can be written, duplicating it if it is shared.
+      static inline Node* mutableNode(SharedNode& node) {
+        if (node.use_count() > 1)
+          node = std::make_shared<Node>(*node);
+        return node.get();
+      }
+
+      //! Removes a key which is in the subtrie of a node.
+      static void erase(SharedNode& ref, triton::uint64 key, triton::uint64 hash, triton::uint32 level) {
+        Node* node         = PersistentMap::mutableNode(ref);
+        triton::uint32 idx = PersistentMap::index(hash, level);
+        triton::usize pos  = PersistentMap::position(node->bitmap, idx);
+        Slot& slot         = node->slots[pos];
+
+        if (slot.child) {
+          PersistentMap::erase(slot.child, key, hash, level + 1);
+          /* Pull up the last entry of a child */
+          if (slot.child->slots.size() == 1 && !slot.child->slots[0].child) {
+            Slot last = slot.child->slots[0];
+            slot = std::move(last);
+          }
+          return;
+        }
+
+        node->bitmap &= ~(1ULL << idx);
+        node->slots.erase(node->slots.begin() + pos);
+      }
+
+      //! Visits the entries of the subtrie of a node.
+      template <typename F>
+      static void visit(const Node* node, F& callback) {
+        for (const Slot& slot : node->slots) {
+          if (slot.child)
+            PersistentMap::visit(slot.child.get(), callback);
+          else
+            callback(slot.key, slot.value);
+        }
+      }
+
+    public:
+      //! Constructor.
+      PersistentMap() {
+        this->count = 0;
+      }
+
+      //! Returns the number of entries.
+      triton::usize size(void) const {
+        return this->count;
+      }
+
+      //! Returns true if the map is empty.
+      bool empty(void) const {
+        return this->count == 0;
+      }
+
+      //! Returns the value of a key, or null if the key is not in the map.
+      const T* find(triton::uint64 key) const {
+        const Node* node = this->root.get();
+        triton::uint64 h = PersistentMap::hash(key);
+
+        for (triton::uint32 level = 0; node != nullptr; level++) {
+          triton::uint32 idx = PersistentMap::index(h, level);
+          if (!((node->bitmap >> idx) & 1))
+            return nullptr;
+
+          const Slot& slot = node->slots[PersistentMap::position(node->bitmap, idx)];
+          if (!slot.child)
+            return (slot.key == key) ? &slot.value : nullptr;
+
+          node = slot.child.get();
+        }
+
+        return nullptr;
+      }
+
+      //! Returns true if the key is in the map.
+      bool contains(triton::uint64 key) const {
+        return this->find(key) != nullptr;
+      }
+
+      //! Inserts or replaces the value of a key.
+      void insert(triton::uint64 key, const T& value) {
+        triton::uint64 h = PersistentMap::hash(key);
+
+        if (!this->root) {
+          this->root = std::make_shared<Node>();
+          this->root->bitmap = 0;
+        }
+
+        Node* node = PersistentMap::mutableNode(this->root);
+        for (triton::uint32 level = 0;; level++) {
+          triton::uint32 idx = PersistentMap::index(h, level);
+          triton::usize pos  = PersistentMap::position(node->bitmap, idx);
+
+          /* Free slot */
+          if (!((node->bitmap >> idx) & 1)) {
+            node->bitmap |= (1ULL << idx);
+            node->slots.insert(node->slots.begin() + pos, Slot{key, value, nullptr});
+            this->count++;
+            return;
+          }
+
+          Slot& slot = node->slots[pos];
+          if (slot.child) {
+            node = PersistentMap::mutableNode(slot.child);
+            continue;
+          }
+
+          if (slot.key == key) {
+            slot.value = value;
+            return;
+          }
+
+          /* Two keys share this slot, push the current entry down */
+          auto child = std::make_shared<Node>();
+          child->bitmap = (1ULL << PersistentMap::index(PersistentMap::hash(slot.key), level + 1));
+          child->slots.push_back(Slot{slot.key, std::move(slot.value), nullptr});
+          slot.value = T();
+          slot.child = child;
+          node = child.get();
+        }
+      }
+
+      //! Removes a key. Returns false if the key was not in the map.
+      bool erase(triton::uint64 key) {
+        if (!this->contains(key))
+          return false;
+
+        PersistentMap::erase(this->root, key, PersistentMap::hash(key), 0);
+        this->count--;
+
+        return true;
+      }
+
+      //! Removes all entries.
+      void clear(void) {
+        this->root.reset();
+        this->count = 0;
+      }
+
+      //! Calls `callback(key, value)` on each entry, in an unspecified order.
+      template <typename F>
+      void forEach(F callback) const {
+        if (this->root)
+          PersistentMap::visit(this->root.get(), callback);
+      }
+  };
+
+
+  /*! \class PersistentSet
+   *  \brief A set of 64-bit keys with structural sharing (see triton::PersistentMap).
+   */
+  class PersistentSet {
+    private:
+      //! The keys.
+      PersistentMap<bool> map;
+
+    public:
+      //! Returns the number of keys.
+      triton::usize size(void) const {
+        return this->map.size();
+      }
+
+      //! Returns true if the set is empty.
+      bool empty(void) const {
+        return this->map.empty();
+      }
+
+      //! Returns true if the key is in the set.
+      bool contains(triton::uint64 key) const {
+        return this->map.contains(key);
+      }
+
+      //! Inserts a key.
+      void insert(triton::uint64 key) {
+        if (!this->map.contains(key))
+          this->map.insert(key, true);
+      }
+
+      //! Removes a key. Returns false if the key was not in the set.
+      bool erase(triton::uint64 key) {
+        return this->map.erase(key);
+      }
+
+      //! Removes all keys.
+      void clear(void) {
+        this->map.clear();
+      }
+
+      //! Calls `callback(key)` on each key, in an unspecified order.
+      template <typename F>
+      void forEach(F callback) const {
+        this->map.forEach([&callback](triton::uint64 key, bool) { callback(key); });
+      }
+  };
+
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_PERSISTENTMAP_HPP */
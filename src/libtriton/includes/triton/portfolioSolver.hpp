@@ -0,0 +1,136 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_PORTFOLIOSOLVER_H
+#define TRITON_PORTFOLIOSOLVER_H
+
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/solverEnums.hpp>
+#include <triton/solverInterface.hpp>
+#include <triton/solverModel.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+    //! The Solver namespace
+    namespace solver {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup solver
+     *  @{
+     */
+
+      //! Statistics of a solver of a portfolio.
+      struct PortfolioStats {
+        //! The number of queries answered first by the solver.
+        triton::usize wins;
+
+        //! The total solving time of the queries answered first by the solver (in milliseconds).
+        triton::usize time;
+      };
+
+
+      //! \class PortfolioSolver
+      /*! \brief Solver engine racing several solvers.
+       *
+       * \details Each query is sent to all the solvers of the portfolio, each one on its own thread. The first
+       * definitive answer (SAT or UNSAT) is returned and the other solvers are interrupted (see SolverInterface::interrupt).
+       * If no solver gives a definitive answer, the result of the first solver is returned.
+       */
+      class PortfolioSolver : public SolverInterface {
+        private:
+          //! The solvers of the portfolio.
+          std::vector<std::pair<triton::engines::solver::solver_e, std::unique_ptr<triton::engines::solver::SolverInterface>>> solvers;
+
+          //! The statistics of each solver, in the order of `solvers`.
+          mutable std::vector<PortfolioStats> stats;
+
+          //! Protects the statistics.
+          mutable std::mutex mutex;
+
+          //! Runs a query on all the solvers and returns the result of the first definitive answer.
+          template <typename T>
+          T race(const std::function<T(const SolverInterface&, triton::engines::solver::status_e*, triton::uint32*)>& query, const char* where, triton::engines::solver::status_e* status, triton::uint32* solvingTime) const;
+
+        public:
+          //! Constructor.
+          TRITON_EXPORT PortfolioSolver();
+
+          //! Adds a solver to the portfolio. The portfolio takes the ownership of the solver.
+          TRITON_EXPORT void addSolver(triton::engines::solver::solver_e kind, triton::engines::solver::SolverInterface* solver);
+
+          //! Returns the solver of a given kind, or nullptr if it is not part of the portfolio.
+          TRITON_EXPORT triton::engines::solver::SolverInterface* getSolver(triton::engines::solver::solver_e kind) const;
+
+          //! Returns the statistics of each solver of the portfolio.
+          TRITON_EXPORT std::map<triton::engines::solver::solver_e, PortfolioStats> getStats(void) const;
+
+          //! Clears the statistics.
+          TRITON_EXPORT void clearStats(void);
+
+          //! Computes and returns a model from a symbolic constraint. State is returned in the `status` pointer as well as the solving time. A `timeout` can also be defined.
+          /*! \brief map of symbolic variable id -> model
+           *
+           * \details
+           * **item1**: symbolic variable id<br>
+           * **item2**: model
+           */
+          TRITON_EXPORT std::unordered_map<triton::usize, SolverModel> getModel(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr) const;
+
+          //! Computes and returns several models from a symbolic constraint. The `limit` is the number of models returned. State is returned in the `status` pointer as well as the solving time. A `timeout` can also be defined.
+          /*! \brief vector of map of symbolic variable id -> model
+           *
+           * \details
+           * **item1**: symbolic variable id<br>
+           * **item2**: model
+           */
+          TRITON_EXPORT std::vector<std::unordered_map<triton::usize, SolverModel>> getModels(const triton::ast::SharedAbstractNode& node, triton::uint32 limit, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr) const;
+
+          //! Returns true if an expression is satisfiable.
+          TRITON_EXPORT bool isSat(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr) const;
+
+          //! Returns the name of this solver.
+          TRITON_EXPORT std::string getName(void) const;
+
+          //! Defines a solver timeout (in milliseconds).
+          TRITON_EXPORT void setTimeout(triton::uint32 ms);
+
+          //! Defines a solver memory consumption limit (in megabytes).
+          TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
+      };
+
+    /*! @} End of solver namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_PORTFOLIOSOLVER_H */
@@ -92,6 +92,9 @@ namespace triton {
       //! Initializes the EXTEND python namespace.
       void initExtendNamespace(PyObject* extendDict);
 
+      //! Initializes the MEMORY_BACKEND python namespace.
+      void initMemoryBackendNamespace(PyObject* memoryBackendDict);
+
       //! Initializes the REG python namespace.
       void initRegNamespace(PyObject* regDict);
 
@@ -104,6 +107,12 @@ namespace triton {
       //! Initializes the SOLVER_STATE python namespace.
       void initSolverStateNamespace(PyObject* solverStateDict);
 
+      //! Initializes the STOP python namespace.
+      void initStopNamespace(PyObject* stopDict);
+
+      //! Initializes the SUMMARY python namespace.
+      void initSummaryNamespace(PyObject* summaryDict);
+
       //! Initializes the SYMBOLIC python namespace.
       void initSymbolicNamespace(PyObject* symbolicDict);
 
@@ -20,6 +20,8 @@
 #include <triton/memoryAccess.hpp>
 #include <triton/pathConstraint.hpp>
 #include <triton/register.hpp>
+#include <triton/registerState.hpp>
+#include <triton/snapshot.hpp>
 #include <triton/solverModel.hpp>
 #include <triton/symbolicExpression.hpp>
 #include <triton/symbolicVariable.hpp>
@@ -102,6 +104,12 @@ namespace triton {
       //! Creates the Register python class.
       PyObject* PyRegister(const triton::arch::Register& reg);
 
+      //! Creates the RegisterState python class.
+      PyObject* PyRegisterState(const triton::RegisterState& state);
+
+      //! Creates the Snapshot python class.
+      PyObject* PySnapshot(const triton::Snapshot& snap);
+
       //! Creates the SolverModel python class.
       PyObject* PySolverModel(const triton::engines::solver::SolverModel& model);
 
@@ -223,6 +231,28 @@ namespace triton {
       //! pyRegister type.
       extern PyTypeObject AstContextObject_Type;
 
+      /* RegisterState ================================================== */
+
+      //! pyRegisterState object.
+      typedef struct {
+        PyObject_HEAD
+        triton::RegisterState* state; //! Pointer to the cpp register state
+      } RegisterState_Object;
+
+      //! pyRegisterState type.
+      extern PyTypeObject RegisterState_Type;
+
+      /* Snapshot ======================================================= */
+
+      //! pySnapshot object.
+      typedef struct {
+        PyObject_HEAD
+        triton::Snapshot* snapshot; //! Pointer to the cpp snapshot
+      } Snapshot_Object;
+
+      //! pySnapshot type.
+      extern PyTypeObject Snapshot_Type;
+
       /* SolverModel ==================================================== */
 
       //! pySolverModel object.
@@ -321,6 +351,18 @@ namespace triton {
 /*! Returns the triton::arch::Register. */
 #define PyRegister_AsRegister(v) (((triton::bindings::python::Register_Object*)(v))->reg)
 
+/*! Checks if the pyObject is a triton::RegisterState. */
+#define PyRegisterState_Check(v) ((v)->ob_type == &triton::bindings::python::RegisterState_Type)
+
+/*! Returns the triton::RegisterState. */
+#define PyRegisterState_AsRegisterState(v) (((triton::bindings::python::RegisterState_Object*)(v))->state)
+
+/*! Checks if the pyObject is a triton::Snapshot. */
+#define PySnapshot_Check(v) ((v)->ob_type == &triton::bindings::python::Snapshot_Type)
+
+/*! Returns the triton::Snapshot. */
+#define PySnapshot_AsSnapshot(v) (((triton::bindings::python::Snapshot_Object*)(v))->snapshot)
+
 /*! Checks if the pyObject is a triton::engines::solver::SolverModel. */
 #define PySolverModel_Check(v) ((v)->ob_type == &triton::bindings::python::SolverModel_Type)
 
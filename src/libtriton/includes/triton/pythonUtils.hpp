@@ -8,6 +8,8 @@
 #ifndef TRITON_PYTHONUTILS_H
 #define TRITON PYTHONUTILS_H
 
+#include <mutex>
+
 #include <triton/pythonBindings.hpp>
 #include <triton/tritonTypes.hpp>
 
@@ -81,6 +83,50 @@ namespace triton {
       //! Returns a pyObject from a triton::uint512.
       PyObject* PyLong_FromUint512(triton::uint512 value);
 
+      /*!
+       * \brief Returns the mutex which serializes the uses of an object (a context or an AST context) by several threads.
+       *
+       * \details The mutex is created on first use. The GIL must be held.
+       */
+      std::recursive_mutex& PyObjectMutex(const void* object);
+
+      //! Forgets the mutex of an object which is destroyed. The mutex must not be locked and the GIL must be held.
+      void PyObjectMutex_Erase(const void* object);
+
+      /*! \class PyReleaseGil
+       *  \brief Releases the GIL for its lifetime. No Python object must be used while it is alive.
+       */
+      class PyReleaseGil {
+        private:
+          //! The state of the thread which released the GIL.
+          PyThreadState* state;
+
+        public:
+          //! Constructor. Releases the GIL.
+          PyReleaseGil();
+
+          //! Destructor. Acquires the GIL back.
+          ~PyReleaseGil();
+      };
+
+      /*! \class PyAcquireGil
+       *  \brief Acquires the GIL for its lifetime, whether the calling thread holds it or not.
+       *
+       *  \details Used by the Python callbacks, which may be called while a binding released the GIL.
+       */
+      class PyAcquireGil {
+        private:
+          //! The state of the GIL before its acquisition.
+          PyGILState_STATE state;
+
+        public:
+          //! Constructor. Acquires the GIL.
+          PyAcquireGil();
+
+          //! Destructor. Restores the previous state of the GIL.
+          ~PyAcquireGil();
+      };
+
     /*! @} End of python namespace */
     };
   /*! @} End of bindings namespace */
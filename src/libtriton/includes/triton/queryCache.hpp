@@ -0,0 +1,196 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_QUERYCACHE_HPP
+#define TRITON_QUERYCACHE_HPP
+
+#include <list>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/solverEnums.hpp>
+#include <triton/solverModel.hpp>
+#include <triton/symbolicVariable.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+    //! The Solver namespace
+    namespace solver {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup solver
+     *  @{
+     */
+
+      //! Statistics of the query cache.
+      struct QueryCacheStats {
+        //! The number of queries answered by a cached query.
+        triton::usize hits;
+
+        //! The number of queries which reached the solver.
+        triton::usize misses;
+
+        //! The number of queries answered unsat because they contain the constraints of a cached unsat query.
+        triton::usize subsumed;
+
+        //! The number of queries answered sat by the model of a cached query sharing some of their constraints.
+        triton::usize counterexamples;
+
+        //! The number of queries currently cached.
+        triton::usize entries;
+
+        //! The number of queries evicted from the cache.
+        triton::usize evictions;
+      };
+
+
+      //! \struct QueryKey
+      /*! \brief The normalized form of a query, used to look up and record it in the QueryCache. */
+      struct QueryKey {
+        //! The root of the query (without its assert node).
+        triton::ast::SharedAbstractNode node;
+
+        //! The structural hash of the query, independent of the names of the symbolic variables.
+        triton::uint64 hash;
+
+        //! The symbolic variables of the query, in order of first occurrence.
+        std::vector<triton::engines::symbolic::SharedSymbolicVariable> variables;
+
+        //! The conjuncts of the query.
+        std::vector<triton::ast::SharedAbstractNode> conjuncts;
+      };
+
+
+      /*! \class QueryCache
+       *  \brief A LRU cache of solver queries.
+       *
+       *  \details Queries are keyed by a structural hash in which symbolic variables are numbered by order of
+       *  first occurrence, so queries which only differ by the names of their variables share the same entry,
+       *  and cached models are renamed accordingly. The conjuncts of unsat queries are also recorded, so a query
+       *  which contains all the conjuncts of an unsat query is answered unsat without calling the solver.
+       *  Likewise, the model of a sat query whose conjuncts are a superset of the conjuncts of a new query is
+       *  a model of this query, and the model of a sat query whose conjuncts are a subset of them is reused if
+       *  the new query holds under this model (checked by concrete evaluation).
+       *  The cache is disabled while its capacity is 0 (the default).
+       */
+      class QueryCache {
+        private:
+          //! A cached query.
+          struct Entry {
+            //! The normalized query.
+            QueryKey key;
+
+            //! The status of the query (SAT or UNSAT).
+            triton::engines::solver::status_e status;
+
+            //! True if a model has been recorded.
+            bool hasModel;
+
+            //! The model as a list of (variable index in `key.variables`, value).
+            std::vector<std::pair<triton::usize, triton::uint512>> model;
+          };
+
+          //! The maximum number of cached queries.
+          triton::usize capacity;
+
+          //! The cached queries, most recently used first.
+          std::list<Entry> entries;
+
+          //! The index of the cached queries by hash.
+          std::unordered_multimap<triton::uint64, std::list<Entry>::iterator, IdentityHash<triton::uint64>> index;
+
+          //! The index of the cached queries by hash of their conjuncts.
+          std::unordered_multimap<triton::uint64, std::list<Entry>::iterator, IdentityHash<triton::uint64>> conjunctIndex;
+
+          //! The conjuncts of unsat queries, most recently used first.
+          std::list<std::vector<triton::ast::SharedAbstractNode>> unsatConjuncts;
+
+          //! The statistics.
+          QueryCacheStats stats;
+
+          //! Protects the cache.
+          mutable std::mutex mutex;
+
+          //! Returns true if both nodes are structurally identical, up to a renaming of variables if `renaming` is true.
+          static bool isEquivalent(const triton::ast::SharedAbstractNode& a, const triton::ast::SharedAbstractNode& b, bool renaming);
+
+          //! Returns true if `conjuncts` contains all the conjuncts of a cached unsat query.
+          bool isSubsumed(const std::vector<triton::ast::SharedAbstractNode>& conjuncts);
+
+          //! Returns true if `conjuncts` contains `node`, up to a structural equivalence without renaming.
+          static bool contains(const std::unordered_multimap<triton::uint64, const triton::ast::SharedAbstractNode*, IdentityHash<triton::uint64>>& conjuncts, const triton::ast::SharedAbstractNode& node);
+
+          //! Returns true and writes back a model of the query if the model of a cached sat query sharing some of its conjuncts satisfies it.
+          bool findCounterexample(const QueryKey& key, std::unordered_map<triton::usize, SolverModel>* model);
+
+          //! Removes an entry from the indexes.
+          void unindex(std::list<Entry>::iterator entry);
+
+          //! Evicts the least recently used entries above the capacity.
+          void shrink(void);
+
+        public:
+          //! Constructor.
+          TRITON_EXPORT QueryCache();
+
+          //! Returns true if the cache is enabled.
+          TRITON_EXPORT bool isEnabled(void) const;
+
+          //! Returns the maximum number of cached queries.
+          TRITON_EXPORT triton::usize getCapacity(void) const;
+
+          //! Sets the maximum number of cached queries. 0 disables and clears the cache.
+          TRITON_EXPORT void setCapacity(triton::usize capacity);
+
+          //! Returns the statistics of the cache.
+          TRITON_EXPORT QueryCacheStats getStats(void) const;
+
+          //! Clears the cached queries and the statistics.
+          TRITON_EXPORT void clear(void);
+
+          //! Returns the normalized form of a query.
+          TRITON_EXPORT static QueryKey makeKey(const triton::ast::SharedAbstractNode& node);
+
+          /*!
+           * \brief Looks up a query. Returns true and writes back its status (and its model if `model` is not null) on hit.
+           *
+           * \details A SAT query without a recorded model is a miss if `model` is not null.
+           */
+          TRITON_EXPORT bool lookup(const QueryKey& key, triton::engines::solver::status_e& status, std::unordered_map<triton::usize, SolverModel>* model = nullptr);
+
+          //! Looks up a query known to be unsat (by itself or because it contains a cached unsat query). Any other query is a miss.
+          TRITON_EXPORT bool lookupUnsat(const QueryKey& key);
+
+          //! Records the result of a query. Only SAT and UNSAT results are recorded.
+          TRITON_EXPORT void insert(const QueryKey& key, triton::engines::solver::status_e status, const std::unordered_map<triton::usize, SolverModel>* model = nullptr);
+      };
+
+    /*! @} End of solver namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_QUERYCACHE_HPP */
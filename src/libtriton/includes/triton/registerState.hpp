@@ -0,0 +1,88 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_REGISTERSTATE_HPP
+#define TRITON_REGISTERSTATE_HPP
+
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
+#include <triton/archEnums.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/symbolicExpression.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  class Context;
+
+  namespace arch {
+    class Architecture;
+  };
+
+  namespace engines {
+    namespace taint {
+      class TaintEngine;
+    };
+    namespace symbolic {
+      class SymbolicEngine;
+    };
+  };
+
+  /*! \class RegisterState
+   *  \brief The register file of a context at a given time.
+   *
+   *  \details A register state holds the concrete values of the parent registers (and the Thumb mode), the symbolic
+   *  registers and the tainted registers of a context. It is meant to switch between the threads of a guest: the
+   *  memory and the path constraints are not part of it (see triton::Snapshot to save them). It is immutable and
+   *  may be restored any number of times in the context which saved it.
+   */
+  class RegisterState {
+    friend class triton::Context;
+    friend class triton::arch::Architecture;
+    friend class triton::engines::symbolic::SymbolicEngine;
+    friend class triton::engines::taint::TaintEngine;
+
+    private:
+      //! The generation of the engines of the context which saved the registers, unique among all the contexts.
+      triton::uint64 generation;
+
+      //! The architecture of the context.
+      triton::arch::architecture_e arch;
+
+      //! The concrete values of the parent registers.
+      std::vector<std::pair<triton::arch::register_e, triton::uint512>> concreteRegisters;
+
+      //! The Thumb mode (Arm32 only).
+      bool thumb;
+
+      //! The symbolic registers.
+      std::vector<triton::engines::symbolic::SharedSymbolicExpression> symbolicRegisters;
+
+      //! The tainted registers.
+      std::unordered_set<triton::arch::register_e> taintedRegisters;
+
+    public:
+      //! Constructor.
+      TRITON_EXPORT RegisterState();
+
+      //! Returns the architecture of the register state.
+      TRITON_EXPORT triton::arch::architecture_e getArchitecture(void) const;
+  };
+
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_REGISTERSTATE_HPP */
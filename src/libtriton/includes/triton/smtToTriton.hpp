@@ -0,0 +1,191 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_SMTTOTRITONAST_H
+#define TRITON_SMTTOTRITONAST_H
+
+#include <functional>
+#include <istream>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/symbolicVariable.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  //! The AST namespace
+  namespace ast {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup ast
+   *  @{
+   */
+
+    /*! \brief Resolves a symbol of a script to a symbolic variable.
+     *
+     * \details `size` is zero when an undeclared symbol is used, the resolver returns the variable with this name or
+     * alias, otherwise nullptr. It is the size of the sort when a bit-vector is declared, the resolver may then create
+     * the variable.
+     */
+    using SmtResolver = std::function<triton::engines::symbolic::SharedSymbolicVariable(const std::string& name, triton::uint32 size)>;
+
+    //! \class SmtToTriton
+    /*! \brief Converts a SMT-LIB2 script to Triton's ASTs.
+     *
+     * \details The parser reads the QF_ABV subset emitted by the SMT representation (see AstSmtRepresentation
+     * and LiftingToSMT) from a stream and builds the nodes with the AST context, so they are hash-consed
+     * if the context does it. It does not recurse, so the depth of the terms is not limited by the stack.
+     * `let` and `define-fun` bindings are shared rather than expanded, so the size of the result is linear
+     * in the size of the script, while functions with parameters are expanded at each application. Symbolic
+     * variables are found by name, by alias if they have been declared with declare(), or by the resolver.
+     */
+    class SmtToTriton {
+      private:
+        //! The kind of a parenthesized list.
+        enum frame_e {
+          COMMAND_FRAME,  /*!< A top-level command (assert, declare-fun, ...) */
+          TERM_FRAME,     /*!< An application, e.g. (bvadd x y) */
+          LET_FRAME,      /*!< A let term */
+          BINDINGS_FRAME, /*!< The list of bindings of a let */
+          BINDING_FRAME,  /*!< A binding of a let */
+          RAW_FRAME,      /*!< Any other list (sorts, indexes, parameters, ...) */
+        };
+
+        //! An element of a list: an atom, a node or a sub-list.
+        struct Item {
+          //! The atom (symbol, numeral, keyword, ...), if the item is neither a node nor a list.
+          std::string atom;
+
+          //! The node, if the item is a term.
+          SharedAbstractNode node;
+
+          //! The elements, if the item is a list.
+          std::vector<Item> list;
+
+          //! True if the item is a list.
+          bool isList = false;
+        };
+
+        //! A list which is being parsed.
+        struct Frame {
+          //! The kind of the list.
+          frame_e kind;
+
+          //! The elements read so far.
+          std::vector<Item> items;
+
+          //! The names bound by a let frame, to unbind when it is closed.
+          std::vector<std::string> bound;
+        };
+
+        //! A function with parameters, bound by define-fun.
+        struct Function {
+          //! The parameters, as (name sort) lists.
+          std::vector<Item> params;
+
+          //! The sort of the result.
+          Item sort;
+
+          //! The body, which is parsed at each application.
+          Item body;
+        };
+
+        //! The Triton's AST context
+        triton::ast::SharedAstContext astCtxt;
+
+        //! The symbols bound by declare-fun, declare-const, define-fun and declare().
+        std::unordered_map<std::string, SharedAbstractNode> symbols;
+
+        //! The symbols bound by the enclosing lets. The last binding of a name shadows the others.
+        std::unordered_map<std::string, std::vector<SharedAbstractNode>> scopes;
+
+        //! The functions with parameters bound by define-fun.
+        std::unordered_map<std::string, Function> functions;
+
+        //! The functions which are being expanded, to reject recursive definitions.
+        std::unordered_set<std::string> expanding;
+
+        //! Resolves the symbols which are neither bound nor variable nodes of the context.
+        SmtResolver resolver;
+
+        //! Processes a token with the stack of open lists. Returns true if a top-level item (written in `item`) is complete.
+        bool step(std::vector<Frame>& stack, frame_e top, char token, const std::string& atom, Item& item);
+
+        //! Reads the next token. Returns '(', ')', 'a' for an atom (written in `atom`) or 0 at the end of the stream.
+        char nextToken(std::istream& stream, std::string& atom);
+
+        //! Returns the kind of the next list of a frame.
+        frame_e childKind(Frame& frame);
+
+        //! Appends an item to a frame.
+        void append(Frame& frame, Item&& item);
+
+        //! Closes a frame and returns its value.
+        Item reduce(Frame& frame);
+
+        //! Executes a command and returns the asserted node, if any.
+        Item command(const std::vector<Item>& items);
+
+        //! Builds the node of an application.
+        SharedAbstractNode application(const std::vector<Item>& items);
+
+        //! Builds the node of the application of a function with parameters.
+        SharedAbstractNode expand(const std::string& name, const std::vector<SharedAbstractNode>& args);
+
+        //! Builds the node of an indexed operator, e.g. ((_ extract 7 0) x).
+        SharedAbstractNode indexed(const std::vector<Item>& head, const std::vector<SharedAbstractNode>& args);
+
+        //! Returns the node of an item in a term position.
+        SharedAbstractNode term(const Item& item);
+
+        //! Returns the node of a symbol or of a literal.
+        SharedAbstractNode resolve(const std::string& name);
+
+        //! Returns the variable node of a symbol found by the resolver, otherwise nullptr. `size` is given to the resolver.
+        SharedAbstractNode resolveVariable(const std::string& name, triton::uint32 size);
+
+        //! Returns a numeral.
+        triton::uint32 numeral(const Item& item);
+
+        //! Binds a declared symbol to its symbolic variable (or to a new array).
+        void declareSymbol(const std::string& name, const Item& sort);
+
+        //! Throws if a node does not have the given sort.
+        void checkSort(const std::string& name, const SharedAbstractNode& node, const Item& sort);
+
+        //! Returns the index size of an array sort, e.g. (Array (_ BitVec 64) (_ BitVec 8)).
+        triton::uint32 arraySort(const Item& sort);
+
+      public:
+        //! Constructor.
+        TRITON_EXPORT SmtToTriton(const triton::ast::SharedAstContext& ctxt, const SmtResolver& resolver=nullptr);
+
+        //! Binds a symbol to a node, e.g. the alias of a symbolic variable to its variable node.
+        TRITON_EXPORT void declare(const std::string& name, const SharedAbstractNode& node);
+
+        //! Converts a SMT-LIB2 script and returns the asserted nodes and the top-level terms, in order.
+        TRITON_EXPORT std::vector<SharedAbstractNode> convert(std::istream& stream);
+    };
+
+  /*! @} End of ast namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_SMTTOTRITONAST_H */
@@ -0,0 +1,103 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_SNAPSHOT_HPP
+#define TRITON_SNAPSHOT_HPP
+
+#include <memory>
+#include <unordered_set>
+#include <vector>
+
+#include <triton/archEnums.hpp>
+#include <triton/cpuInterface.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/pathManager.hpp>
+#include <triton/persistentMap.hpp>
+#include <triton/symbolicExpression.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  class Context;
+
+  namespace arch {
+    class Architecture;
+  };
+
+  namespace engines {
+    namespace taint {
+      class TaintEngine;
+    };
+    namespace symbolic {
+      class SymbolicEngine;
+    };
+  };
+
+  /*! \class Snapshot
+   *  \brief The state of a context at a given time.
+   *
+   *  \details A snapshot holds the concrete registers and memory, the symbolic registers and memory, the path
+   *  constraints and the taint of a context. It is immutable and may be restored any number of times in the context
+   *  which took it. The concrete memory pages, the symbolic memory, the tainted memory and the path constraints are
+   *  shared between the context and its snapshots and copied on write, so taking a snapshot does not copy them and
+   *  the cost of a fork is proportional to what the paths write afterwards. The symbolic expressions and variables
+   *  (and the concrete values of the variables) are not part of a snapshot, they are shared by all the states.
+   */
+  class Snapshot {
+    friend class triton::Context;
+    friend class triton::arch::Architecture;
+    friend class triton::engines::symbolic::PathManager;
+    friend class triton::engines::symbolic::SymbolicEngine;
+    friend class triton::engines::taint::TaintEngine;
+
+    private:
+      //! The generation of the engines of the context which took the snapshot, unique among all the contexts.
+      triton::uint64 generation;
+
+      //! The architecture of the context.
+      triton::arch::architecture_e arch;
+
+      //! The CPU (registers and concrete memory).
+      std::shared_ptr<triton::arch::CpuInterface> cpu;
+
+      //! The symbolic memory (address -> symbolic expression).
+      triton::PersistentMap<triton::engines::symbolic::SharedSymbolicExpression> symbolicMemory;
+
+      //! The symbolic registers.
+      std::vector<triton::engines::symbolic::SharedSymbolicExpression> symbolicRegisters;
+
+      //! The path constraints.
+      triton::engines::symbolic::SharedPathConstraintNode pathConstraints;
+
+      //! The tainted addresses.
+      triton::PersistentSet taintedMemory;
+
+      //! The tainted registers.
+      std::unordered_set<triton::arch::register_e> taintedRegisters;
+
+    public:
+      //! Constructor.
+      TRITON_EXPORT Snapshot();
+
+      //! Returns the architecture of the snapshot.
+      TRITON_EXPORT triton::arch::architecture_e getArchitecture(void) const;
+
+      //! Returns the number of path constraints of the snapshot.
+      TRITON_EXPORT triton::usize getSizeOfPathConstraints(void) const;
+  };
+
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_SNAPSHOT_HPP */
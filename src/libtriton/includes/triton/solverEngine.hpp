@@ -9,6 +9,7 @@
 #define TRITON_SOLVERENGINE_HPP
 
 #include <iostream>
+#include <map>
 #include <memory>
 #include <unordered_map>
 #include <vector>
@@ -16,14 +17,19 @@
 #include <triton/ast.hpp>
 #include <triton/config.hpp>
 #include <triton/dllexport.hpp>
+#include <triton/portfolioSolver.hpp>
+#include <triton/queryCache.hpp>
 #include <triton/solverEnums.hpp>
 #include <triton/solverInterface.hpp>
 #include <triton/solverModel.hpp>
+#include <triton/solverSession.hpp>
 #include <triton/tritonTypes.hpp>
 #ifdef TRITON_Z3_INTERFACE
+  #include <triton/z3Session.hpp>
   #include <triton/z3Solver.hpp>
 #endif
 #ifdef TRITON_BITWUZLA_INTERFACE
+  #include <triton/bitwuzlaSession.hpp>
   #include <triton/bitwuzlaSolver.hpp>
 #endif
 
@@ -53,6 +59,13 @@ namespace triton {
       /*! \interface SolverEngine
           \brief This class is used to interface with solvers */
       class SolverEngine {
+        private:
+          //! Computes a model of a query through the query cache.
+          std::unordered_map<triton::usize, SolverModel> getModelOfQuery(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const;
+
+          //! Returns true if a query is satisfiable, through the query cache.
+          bool isSatOfQuery(const triton::ast::SharedAbstractNode& node, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const;
+
         protected:
           //! The kind of the current solver used.
           triton::engines::solver::solver_e kind;
@@ -60,6 +73,24 @@ namespace triton {
           //! Instance to the real solver class.
           std::unique_ptr<triton::engines::solver::SolverInterface> solver;
 
+          //! Instance to the incremental session of the solver (nullptr until first used).
+          std::unique_ptr<triton::engines::solver::SolverSession> session;
+
+          //! The solver timeout, also applied to the session.
+          triton::uint32 timeout;
+
+          //! The solver memory limit, also applied to the session.
+          triton::uint32 memoryLimit;
+
+          //! The number of threads used to enumerate models (only supported by z3).
+          triton::uint32 workers;
+
+          //! The cache of queries (disabled by default).
+          mutable triton::engines::solver::QueryCache cache;
+
+          //! True if the queries are split into independent groups of constraints before solving.
+          bool independence;
+
         public:
           //! Constructor.
           TRITON_EXPORT SolverEngine();
@@ -103,11 +134,60 @@ namespace triton {
           //! Returns the name of the solver.
           TRITON_EXPORT std::string getName(void) const;
 
+          //! Returns the maximum number of queries kept in the query cache (0 if the cache is disabled).
+          TRITON_EXPORT triton::usize getQueryCacheSize(void) const;
+
+          //! Sets the maximum number of queries kept in the query cache. 0 disables the cache (default).
+          TRITON_EXPORT void setQueryCacheSize(triton::usize size);
+
+          //! Returns the statistics of the query cache.
+          TRITON_EXPORT triton::engines::solver::QueryCacheStats getQueryCacheStats(void) const;
+
+          //! Clears the query cache and its statistics.
+          TRITON_EXPORT void clearQueryCache(void);
+
+          //! Returns true if the queries are split into independent groups of constraints before solving.
+          TRITON_EXPORT bool isConstraintIndependenceEnabled(void) const;
+
+          /*!
+           * \brief Enables or disables the constraint independence optimization (disabled by default).
+           *
+           * \details The conjuncts of a query are partitioned into groups which share no symbolic variable, and each
+           * group is solved on its own by getModel() and isSat(). With the query cache enabled, the groups which did not
+           * change since a previous query are answered from the cache, so only the group of the new constraint reaches
+           * the solver.
+           */
+          TRITON_EXPORT void setConstraintIndependence(bool flag);
+
+          /*!
+           * \brief Partitions the conjuncts of a query into groups which share no symbolic variable.
+           *
+           * \details Conjuncts without symbolic variable are evaluated and dropped if true. If one of them is false,
+           * the only group returned is this conjunct. Groups are ordered by decreasing position of their last
+           * conjunct, thus the group of the most recent path constraint comes first.
+           */
+          TRITON_EXPORT static std::vector<triton::ast::SharedAbstractNode> partition(const triton::ast::SharedAbstractNode& node);
+
+          //! Returns the incremental session of the solver. The session is created on first use.
+          TRITON_EXPORT triton::engines::solver::SolverSession& getSession(void);
+
+          //! Returns true if the incremental session has been created.
+          TRITON_EXPORT bool hasSession(void) const;
+
           //! Defines a solver timeout (in milliseconds).
           TRITON_EXPORT void setTimeout(triton::uint32 ms);
 
           //! Defines a solver memory consumption limit (in megabytes).
           TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
+
+          //! Returns the number of threads used by getModels().
+          TRITON_EXPORT triton::uint32 getWorkers(void) const;
+
+          //! Defines the number of threads used by getModels(). Only z3 enumerates models with several threads.
+          TRITON_EXPORT void setWorkers(triton::uint32 workers);
+
+          //! Returns the statistics of each solver of the portfolio. Empty if the current solver is not SOLVER_PORTFOLIO.
+          TRITON_EXPORT std::map<triton::engines::solver::solver_e, triton::engines::solver::PortfolioStats> getPortfolioStats(void) const;
       };
 
     /*! @} End of solver namespace */
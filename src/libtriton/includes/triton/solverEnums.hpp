@@ -45,6 +45,9 @@ namespace triton {
         #ifdef TRITON_BITWUZLA_INTERFACE
         SOLVER_BITWUZLA,    /*!< bitwuzla solver. */
         #endif
+        #if defined(TRITON_Z3_INTERFACE) || defined(TRITON_BITWUZLA_INTERFACE)
+        SOLVER_PORTFOLIO,   /*!< portfolio of all the available solvers. */
+        #endif
       };
 
       /*! The different kind of status */
@@ -8,6 +8,7 @@
 #ifndef TRITON_SOLVERINTERFACE_HPP
 #define TRITON_SOLVERINTERFACE_HPP
 
+#include <thread>
 #include <unordered_map>
 #include <vector>
 
@@ -76,6 +77,9 @@ namespace triton {
 
           //! Defines a solver memory consumption limit (in megabytes).
           TRITON_EXPORT virtual void setMemoryLimit(triton::uint32 mem) = 0;
+
+          //! Interrupts the query running on the given thread, if any. The interrupted query returns with an UNKNOWN status. Does nothing by default.
+          TRITON_EXPORT virtual void interrupt(std::thread::id thread) {};
       };
 
     /*! @} End of solver namespace */
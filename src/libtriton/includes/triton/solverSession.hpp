@@ -0,0 +1,104 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_SOLVERSESSION_HPP
+#define TRITON_SOLVERSESSION_HPP
+
+#include <unordered_map>
+#include <vector>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/solverEnums.hpp>
+#include <triton/solverModel.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+    //! The Solver namespace
+    namespace solver {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup solver
+     *  @{
+     */
+
+      /*! \interface SolverSession
+          \brief This interface is used to interface with incremental solvers.
+
+          \details A session keeps a stack of constraints asserted in a persistent solver. Each constraint is
+          asserted in its own solver scope, so popping a constraint only discards the last scope and the solver
+          keeps what it learned from the previous ones. The translation of AST nodes is cached by node identity,
+          so only nodes which have not been seen yet are translated when a constraint is pushed.
+      */
+      class SolverSession {
+        protected:
+          //! The stack of constraints (one per solver scope).
+          std::vector<triton::ast::SharedAbstractNode> constraints;
+
+        public:
+          //! Destructor.
+          TRITON_EXPORT virtual ~SolverSession(){};
+
+          //! Pushes a new solver scope and asserts the constraint in it.
+          TRITON_EXPORT virtual void push(const triton::ast::SharedAbstractNode& node) = 0;
+
+          //! Pops the last solver scope and its constraint.
+          TRITON_EXPORT virtual void pop(void) = 0;
+
+          //! Pops all scopes and clears the translation cache.
+          TRITON_EXPORT virtual void reset(void) = 0;
+
+          //! Returns true if the conjunction of the constraints (and `node` if not null) is satisfiable.
+          TRITON_EXPORT virtual bool isSat(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr) = 0;
+
+          //! Computes and returns a model of the conjunction of the constraints (and `node` if not null).
+          /*! \brief map of symbolic variable id -> model
+           *
+           * \details
+           * **item1**: symbolic variable id<br>
+           * **item2**: model
+           */
+          TRITON_EXPORT virtual std::unordered_map<triton::usize, SolverModel> getModel(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr) = 0;
+
+          //! Defines a solver timeout (in milliseconds).
+          TRITON_EXPORT virtual void setTimeout(triton::uint32 ms) = 0;
+
+          //! Defines a solver memory consumption limit (in megabytes).
+          TRITON_EXPORT virtual void setMemoryLimit(triton::uint32 mem) = 0;
+
+          //! Returns the stack of constraints.
+          TRITON_EXPORT const std::vector<triton::ast::SharedAbstractNode>& getConstraints(void) const;
+
+          //! Returns the number of constraints (and so of scopes).
+          TRITON_EXPORT triton::usize getSize(void) const;
+
+          //! Pops the constraints which differ from `nodes` and pushes the new ones, so that the stack is equal to `nodes`.
+          TRITON_EXPORT void sync(const std::vector<triton::ast::SharedAbstractNode>& nodes);
+      };
+
+    /*! @} End of solver namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_SOLVERSESSION_HPP */
@@ -0,0 +1,73 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_SUMMARIES_HPP
+#define TRITON_SUMMARIES_HPP
+
+#include <triton/callbacks.hpp>
+#include <triton/callbacksEnums.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+
+  class Context;
+
+  //! The Callbacks namespace
+  namespace callbacks {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup callbacks
+   *  @{
+   */
+
+    /*! \brief The Summaries namespace
+     *
+     * \details Built-in summaries of common libc routines, used as hooks (see triton::callbacks::hookCallback). A summary
+     * reads its arguments according to the calling convention of the architecture (System V for x86-64, cdecl for x86,
+     * AAPCS for AArch64 and ARM32), applies the routine to the concrete memory and copies the symbolic expressions and the
+     * taint of the bytes involved, sets the return value and returns to the caller. Pointers and sizes are concretized.
+     * The results of `strcmp` and `strlen` are symbolic if the bytes they read are symbolic, bounded by the concrete length
+     * of the strings.
+     */
+    namespace summaries {
+    /*!
+     *  \ingroup callbacks
+     *  \addtogroup summaries
+     *  @{
+     */
+
+      //! Returns the hook of a built-in summary.
+      TRITON_EXPORT triton::callbacks::hookCallback getSummary(triton::callbacks::summary_e kind);
+
+      //! Summary of `void* memcpy(void* dst, const void* src, size_t n)`. Overlapping areas are supported.
+      TRITON_EXPORT bool memcpy(triton::Context& ctx, triton::uint64 addr);
+
+      //! Summary of `void* memset(void* dst, int c, size_t n)`.
+      TRITON_EXPORT bool memset(triton::Context& ctx, triton::uint64 addr);
+
+      //! Summary of `int strcmp(const char* s1, const char* s2)`.
+      TRITON_EXPORT bool strcmp(triton::Context& ctx, triton::uint64 addr);
+
+      //! Summary of `size_t strlen(const char* s)`.
+      TRITON_EXPORT bool strlen(triton::Context& ctx, triton::uint64 addr);
+
+    /*! @} End of summaries namespace */
+    };
+  /*! @} End of callbacks namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_SUMMARIES_HPP */
@@ -23,6 +23,7 @@
 #include <triton/memoryAccess.hpp>
 #include <triton/modes.hpp>
 #include <triton/pathManager.hpp>
+#include <triton/persistentMap.hpp>
 #include <triton/register.hpp>
 #include <triton/symbolicEnums.hpp>
 #include <triton/symbolicExpression.hpp>
@@ -79,6 +80,16 @@ namespace triton {
            */
           mutable std::unordered_map<triton::usize, WeakSymbolicVariable> symbolicVariables;
 
+          /*! \brief The index of the symbolic variables by alias
+           *
+           * \details
+           * **item1**: alias<br>
+           * **item2**: ids of the variables with this alias, in creation order
+           *
+           * Variables update the index when they are renamed or destroyed. The index is shared with the copies of the engine.
+           */
+          std::shared_ptr<triton::engines::symbolic::SymbolicAliasIndex> symbolicAliases;
+
           /*! \brief The map of symbolic expressions
            *
            * \details
@@ -101,7 +112,13 @@ namespace triton {
            * **item1**: memory address<br>
            * **item2**: shared symbolic expression
            */
-          std::unordered_map<triton::uint64, SharedSymbolicExpression> memoryReference;
+          triton::PersistentMap<SharedSymbolicExpression> memoryReference;
+
+          //! The map returned by getSymbolicMemory(), built on demand and then kept up to date until a restore.
+          mutable std::unordered_map<triton::uint64, SharedSymbolicExpression> memoryReferenceView;
+
+          //! True if `memoryReferenceView` matches `memoryReference`.
+          mutable bool memoryReferenceViewValid;
 
           //! Symbolic register state.
           std::vector<SharedSymbolicExpression> symbolicReg;
@@ -168,6 +185,18 @@ namespace triton {
           //! Copies a SymbolicEngine.
           TRITON_EXPORT SymbolicEngine& operator=(const SymbolicEngine& other);
 
+          //! Saves the symbolic registers, the symbolic memory and the path constraints into a snapshot.
+          TRITON_EXPORT void snapshot(triton::Snapshot& snap) const;
+
+          //! Restores the symbolic registers, the symbolic memory and the path constraints of a snapshot.
+          TRITON_EXPORT void restore(const triton::Snapshot& snap);
+
+          //! Saves the symbolic registers into a register state.
+          TRITON_EXPORT void snapshot(triton::RegisterState& state) const;
+
+          //! Restores the symbolic registers of a register state.
+          TRITON_EXPORT void restore(const triton::RegisterState& state);
+
           //! Creates a new shared symbolic expression.
           TRITON_EXPORT SharedSymbolicExpression newSymbolicExpression(const triton::ast::SharedAbstractNode& node, triton::engines::symbolic::expression_e type, const std::string& comment="");
 
@@ -180,9 +209,12 @@ namespace triton {
           //! Returns the symbolic variable corresponding to the symbolic variable id.
           TRITON_EXPORT SharedSymbolicVariable getSymbolicVariable(triton::usize symVarId) const;
 
-          //! Returns the symbolic variable corresponding to the symbolic variable name.
+          //! Returns the symbolic variable corresponding to the symbolic variable name or alias. If several variables have the same alias, the first created is returned.
           TRITON_EXPORT SharedSymbolicVariable getSymbolicVariable(const std::string& name) const;
 
+          //! Same as getSymbolicVariable() but returns nullptr if the variable does not exist.
+          TRITON_EXPORT SharedSymbolicVariable findSymbolicVariable(const std::string& name) const;
+
           //! Returns the symbolic expression corresponding to an id.
           TRITON_EXPORT SharedSymbolicExpression getSymbolicExpression(triton::usize symExprId) const;
 
@@ -10,6 +10,8 @@
 
 #include <memory>
 #include <string>
+#include <unordered_map>
+#include <vector>
 
 #include <triton/dllexport.hpp>
 #include <triton/symbolicEnums.hpp>
@@ -48,6 +50,9 @@ namespace triton {
       //! Weak Symbolic variable
       using WeakSymbolicVariable = std::weak_ptr<triton::engines::symbolic::SymbolicVariable>;
 
+      //! The ids of symbolic variables by alias, in creation order. This index is shared by a symbolic engine and its variables.
+      using SymbolicAliasIndex = std::unordered_map<std::string, std::vector<triton::usize>>;
+
       /*! \class SymbolicVariable
           \brief The symbolic variable class. */
       class SymbolicVariable {
@@ -78,6 +83,15 @@ namespace triton {
           //! The size (in bits) of the symbolic variable.
           triton::uint32 size;
 
+          //! The alias index of the symbolic engine which owns the variable, kept up to date by setAlias().
+          std::weak_ptr<triton::engines::symbolic::SymbolicAliasIndex> aliasIndex;
+
+          //! Adds the variable to the alias index under `alias`.
+          void indexAlias(const std::string& alias);
+
+          //! Removes the variable from the alias index.
+          void unindexAlias(void);
+
         public:
           //! Constructor.
           TRITON_EXPORT SymbolicVariable(triton::engines::symbolic::variable_e type,
@@ -89,6 +103,9 @@ namespace triton {
           //! Constructor by copy.
           TRITON_EXPORT SymbolicVariable(const SymbolicVariable& other);
 
+          //! Destructor.
+          TRITON_EXPORT ~SymbolicVariable();
+
           //! Operator.
           TRITON_EXPORT SymbolicVariable& operator=(const SymbolicVariable& other);
 
@@ -116,6 +133,9 @@ namespace triton {
           //! Sets the alias of the symbolic variable.
           TRITON_EXPORT void setAlias(const std::string& alias);
 
+          //! Attaches the variable to the alias index of its symbolic engine. Copies of the variable are not attached.
+          TRITON_EXPORT void setAliasIndex(const std::shared_ptr<triton::engines::symbolic::SymbolicAliasIndex>& index);
+
           //! Sets the comment of the symbolic variable.
           TRITON_EXPORT void setComment(const std::string& comment);
       };
@@ -13,6 +13,7 @@
 #include <triton/dllexport.hpp>
 #include <triton/memoryAccess.hpp>
 #include <triton/modes.hpp>
+#include <triton/persistentMap.hpp>
 #include <triton/register.hpp>
 #include <triton/symbolicEngine.hpp>
 #include <triton/tritonTypes.hpp>
@@ -63,7 +64,13 @@ namespace triton {
 
         protected:
           //! The set of tainted addresses.
-          std::unordered_set<triton::uint64> taintedMemory;
+          triton::PersistentSet taintedMemory;
+
+          //! The tainted addresses returned by getTaintedMemory(), built on demand and then kept up to date until a restore.
+          mutable std::unordered_set<triton::uint64> taintedMemoryView;
+
+          //! True if `taintedMemoryView` matches `taintedMemory`.
+          mutable bool taintedMemoryViewValid;
 
           //! The set of tainted registers. Currently it is an over approximation of the taint.
           std::unordered_set<triton::arch::register_e> taintedRegisters;
@@ -78,6 +85,18 @@ namespace triton {
           //! Copies a TaintEngine.
           TRITON_EXPORT TaintEngine& operator=(const TaintEngine& other);
 
+          //! Saves the tainted memory and registers into a snapshot.
+          TRITON_EXPORT void snapshot(triton::Snapshot& snap) const;
+
+          //! Restores the tainted memory and registers of a snapshot.
+          TRITON_EXPORT void restore(const triton::Snapshot& snap);
+
+          //! Saves the tainted registers into a register state.
+          TRITON_EXPORT void snapshot(triton::RegisterState& state) const;
+
+          //! Restores the tainted registers of a register state.
+          TRITON_EXPORT void restore(const triton::RegisterState& state);
+
           //! Returns the tainted addresses.
           TRITON_EXPORT const std::unordered_set<triton::uint64>& getTaintedMemory(void) const;
 
@@ -44,7 +44,7 @@ namespace triton {
         //! Destructor.
         TRITON_EXPORT ~TritonToBitwuzla();
 
-        //! Converts to Bitwuzla's AST
+        //! Converts to Bitwuzla's AST. The nodes already translated by this converter are not translated again.
         TRITON_EXPORT const BitwuzlaTerm* convert(const SharedAbstractNode& node, Bitwuzla* bzla);
 
         //! Returns symbolic variables and its assosiated Bitwuzla terms to process the solver model.
@@ -57,6 +57,9 @@ namespace triton {
         //! The map of Triton's AST nodes translated to the Bitwuzla terms.
         std::unordered_map<SharedAbstractNode, const BitwuzlaTerm*> translatedNodes;
 
+        //! The Bitwuzla constant of each symbolic variable (by id).
+        std::unordered_map<triton::usize, const BitwuzlaTerm*> constants;
+
         //! The set of symbolic variables contained in the expression.
         std::unordered_map<const BitwuzlaTerm*, triton::engines::symbolic::SharedSymbolicVariable> variables;
 
@@ -64,6 +64,12 @@ namespace triton {
 
         //! Converts to Z3's AST
         TRITON_EXPORT z3::expr convert(const triton::ast::SharedAbstractNode& node);
+
+        //! Converts to Z3's AST. Nodes already in `cache` are not converted again and new nodes are added to it.
+        TRITON_EXPORT z3::expr convert(const triton::ast::SharedAbstractNode& node, std::unordered_map<triton::ast::SharedAbstractNode, z3::expr>& cache);
+
+        //! Returns the z3's context.
+        TRITON_EXPORT z3::context& getContext(void);
     };
 
   /*! @} End of ast namespace */
@@ -15,6 +15,7 @@
 
 #include <triton/archEnums.hpp>
 #include <triton/callbacks.hpp>
+#include <triton/concreteMemory.hpp>
 #include <triton/cpuInterface.hpp>
 #include <triton/dllexport.hpp>
 #include <triton/instruction.hpp>
@@ -69,14 +70,11 @@ namespace triton {
           void disassInit(void);
 
         protected:
-          /*! \brief map of address -> concrete value
-           *
-           * \details
-           *
-           * **item1**: memory address<br>
-           * **item2**: concrete value
-           */
-          std::unordered_map<triton::uint64, triton::uint8, IdentityHash<triton::uint64>> memory;
+          //! The concrete memory.
+          triton::arch::ConcreteMemory memory;
+
+          //! Processes the GET_CONCRETE_MEMORY_AREA_VALUE callbacks on the undefined parts of an area.
+          void processAreaCallbacks(triton::uint64 baseAddr, triton::usize size) const;
 
           //! Concrete value of eax
           triton::uint8 eax[triton::size::dword];
@@ -267,6 +265,7 @@ namespace triton {
           TRITON_EXPORT const triton::arch::Register& getStackPointer(void) const;
           TRITON_EXPORT std::set<const triton::arch::Register*> getParentRegisters(void) const;
           TRITON_EXPORT std::vector<triton::uint8> getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::usize size, bool execCallbacks=true) const;
+          TRITON_EXPORT void getConcreteMemoryAreaValue(triton::uint64 baseAddr, triton::uint8* area, triton::usize size, bool execCallbacks=true) const;
           TRITON_EXPORT triton::arch::endianness_e getEndianness(void) const;
           TRITON_EXPORT triton::uint32 numberOfRegisters(void) const;
           TRITON_EXPORT triton::uint32 gprBitSize(void) const;
@@ -287,6 +286,9 @@ namespace triton {
           TRITON_EXPORT bool isConcreteMemoryValueDefined(triton::uint64 baseAddr, triton::usize size=1) const;
           TRITON_EXPORT void clearConcreteMemoryValue(const triton::arch::MemoryAccess& mem);
           TRITON_EXPORT void clearConcreteMemoryValue(triton::uint64 baseAddr, triton::usize size=1);
+          TRITON_EXPORT triton::arch::memory_backend_e getConcreteMemoryBackend(void) const;
+          TRITON_EXPORT void setConcreteMemoryBackend(triton::arch::memory_backend_e backend);
+          TRITON_EXPORT void mapConcreteMemoryFile(const std::string& path, triton::uint64 offset, triton::uint64 baseAddr, triton::usize size, bool writable=false);
           /* End of virtual pure inheritance ========================================== */
       };
 
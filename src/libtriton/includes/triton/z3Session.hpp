@@ -0,0 +1,114 @@
+//! \file
+/*
+**  Copyright (C) - Triton
+**
+**  This program is under the terms of the Apache License 2.0.
+*/
+
+#ifndef TRITON_Z3SESSION_H
+#define TRITON_Z3SESSION_H
+
+#include <unordered_map>
+#include <vector>
+#include <z3++.h>
+#include <z3_api.h>
+
+#include <triton/ast.hpp>
+#include <triton/dllexport.hpp>
+#include <triton/solverEnums.hpp>
+#include <triton/solverModel.hpp>
+#include <triton/solverSession.hpp>
+#include <triton/tritonToZ3.hpp>
+#include <triton/tritonTypes.hpp>
+
+
+
+//! The Triton namespace
+namespace triton {
+/*!
+ *  \addtogroup triton
+ *  @{
+ */
+  //! The Engines namespace
+  namespace engines {
+  /*!
+   *  \ingroup triton
+   *  \addtogroup engines
+   *  @{
+   */
+    //! The Solver namespace
+    namespace solver {
+    /*!
+     *  \ingroup engines
+     *  \addtogroup solver
+     *  @{
+     */
+
+      //! \class Z3Session
+      /*! \brief Incremental solver session using z3. */
+      class Z3Session : public SolverSession {
+        private:
+          //! The SMT solver timeout. By default, unlimited.
+          triton::uint32 timeout;
+
+          //! The SMT solver memory limit. By default, unlimited.
+          triton::uint32 memoryLimit;
+
+          //! The converter which owns the z3's context.
+          triton::ast::TritonToZ3 converter;
+
+          //! The z3's AST of each node already converted.
+          std::unordered_map<triton::ast::SharedAbstractNode, z3::expr> cache;
+
+          //! The persistent z3's solver.
+          z3::solver solver;
+
+          //! Returns the z3's AST of a logical node.
+          z3::expr convert(const triton::ast::SharedAbstractNode& node);
+
+          //! Checks the solver and writes back the status and the solving time.
+          z3::check_result check(triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime);
+
+        public:
+          //! Constructor.
+          TRITON_EXPORT Z3Session();
+
+          //! Destructor.
+          TRITON_EXPORT ~Z3Session();
+
+          //! Pushes a new solver scope and asserts the constraint in it.
+          TRITON_EXPORT void push(const triton::ast::SharedAbstractNode& node);
+
+          //! Pops the last solver scope and its constraint.
+          TRITON_EXPORT void pop(void);
+
+          //! Pops all scopes and clears the translation cache.
+          TRITON_EXPORT void reset(void);
+
+          //! Returns true if the conjunction of the constraints (and `node` if not null) is satisfiable.
+          TRITON_EXPORT bool isSat(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
+          //! Computes and returns a model of the conjunction of the constraints (and `node` if not null).
+          /*! \brief map of symbolic variable id -> model
+           *
+           * \details
+           * **item1**: symbolic variable id<br>
+           * **item2**: model
+           */
+          TRITON_EXPORT std::unordered_map<triton::usize, SolverModel> getModel(const triton::ast::SharedAbstractNode& node = nullptr, triton::engines::solver::status_e* status = nullptr, triton::uint32 timeout = 0, triton::uint32* solvingTime = nullptr);
+
+          //! Defines a solver timeout (in milliseconds).
+          TRITON_EXPORT void setTimeout(triton::uint32 ms);
+
+          //! Defines a solver memory consumption limit (in megabytes).
+          TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
+      };
+
+    /*! @} End of solver namespace */
+    };
+  /*! @} End of engines namespace */
+  };
+/*! @} End of triton namespace */
+};
+
+#endif /* TRITON_Z3SESSION_H */
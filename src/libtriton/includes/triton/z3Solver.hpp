@@ -8,7 +8,9 @@
 #ifndef TRITON_Z3SOLVER_H
 #define TRITON_Z3SOLVER_H
 
+#include <mutex>
 #include <string>
+#include <thread>
 #include <unordered_map>
 #include <vector>
 #include <z3++.h>
@@ -57,9 +59,38 @@ namespace triton {
           //! The SMT solver memory limit. By default, unlimited.
           triton::uint32 memoryLimit;
 
+          //! The number of threads used by getModels(). By default, one.
+          triton::uint32 workers;
+
+          //! The z3 contexts of the running queries, by calling thread.
+          mutable std::unordered_multimap<std::thread::id, z3::context*> running;
+
+          //! Protects `running`.
+          mutable std::mutex runningLock;
+
+          //! Registers the z3 contexts of a query while it runs, so it can be interrupted.
+          class RunningQuery {
+            private:
+              //! The solver running the query.
+              const Z3Solver& solver;
+
+              //! The contexts of the query.
+              std::vector<z3::context*> contexts;
+
+            public:
+              //! Constructor. Registers the contexts for the calling thread.
+              RunningQuery(const Z3Solver& solver, const std::vector<z3::context*>& contexts);
+
+              //! Destructor. Unregisters the contexts.
+              ~RunningQuery();
+          };
+
           //! Writes back the status code of the solver into the pointer pointed by status.
           void writeBackStatus(z3::solver& solver, z3::check_result res, triton::engines::solver::status_e* status) const;
 
+          //! Enumerates the models of a logical node with several threads. The search space is split into cubes over some bits of the variables. The `timeout` applies to the whole enumeration.
+          std::vector<std::unordered_map<triton::usize, SolverModel>> getParallelModels(const triton::ast::SharedAbstractNode& node, triton::uint32 limit, triton::engines::solver::status_e* status, triton::uint32 timeout, triton::uint32* solvingTime) const;
+
         public:
           //! Constructor.
           TRITON_EXPORT Z3Solver();
@@ -99,6 +130,12 @@ namespace triton {
 
           //! Defines a solver memory consumption limit (in megabytes).
           TRITON_EXPORT void setMemoryLimit(triton::uint32 mem);
+
+          //! Interrupts the query running on the given thread, if any.
+          TRITON_EXPORT void interrupt(std::thread::id thread);
+
+          //! Defines the number of threads used by getModels(). With more than one thread, the order of the models is not deterministic.
+          TRITON_EXPORT void setWorkers(triton::uint32 workers);
       };
 
     /*! @} End of solver namespace */
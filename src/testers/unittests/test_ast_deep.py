@@ -53,3 +53,66 @@ class TestDeep(unittest.TestCase):
     def test_symbolic_variable_update(self):
         self.triton.setConcreteVariableValue(self.sym_var.getSymbolicVariable(), 0xdeadbeaf)
         self.assertEqual(self.complex_ast_tree.evaluate(), 0xdeadbeaf)
+
+
+class TestGarbageCollector(unittest.TestCase):
+
+    """Test the AST garbage collector."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.triton = TritonContext(ARCH.X86_64)
+        self.ctx = self.triton.getAstContext()
+        self.nop = Instruction(b"\x90")
+
+    def build_deep_tree(self):
+        node = self.ctx.variable(self.triton.newSymbolicVariable(64))
+        for _ in range(20010):
+            node = node + self.ctx.bv(1, 64)
+        return node
+
+    def test_sweep(self):
+        node = self.build_deep_tree()
+        self.assertEqual(self.ctx.getGarbageCollectorStats()['kept'], 2)
+
+        del node
+        for _ in range(10):
+            self.triton.processing(self.nop)
+
+        stats = self.ctx.getGarbageCollectorStats()
+        self.assertEqual(stats['kept'], 0)
+        self.assertEqual(stats['freed'], 2)
+        self.assertEqual(stats['sweeps'], 10)
+
+    def test_period(self):
+        self.ctx.setGarbageCollectorPeriod(5)
+        for _ in range(10):
+            self.triton.processing(self.nop)
+        self.assertEqual(self.ctx.getGarbageCollectorStats()['sweeps'], 2)
+
+        with self.assertRaises(TypeError):
+            self.ctx.setGarbageCollectorPeriod(0)
+
+    def test_budget(self):
+        self.ctx.setGarbageCollectorBudget(1)
+        node = self.build_deep_tree()
+        del node
+
+        self.triton.processing(self.nop)
+        self.assertEqual(self.ctx.getGarbageCollectorStats()['freed'], 0)
+
+        self.ctx.setGarbageCollectorBudget(0)
+        for _ in range(10):
+            self.triton.processing(self.nop)
+        self.assertEqual(self.ctx.getGarbageCollectorStats()['freed'], 2)
+
+    def test_budget_generations(self):
+        # The budget is shared, so old nodes are released while young nodes keep coming
+        self.ctx.setGarbageCollectorBudget(4)
+        for _ in range(20):
+            self.build_deep_tree()
+            self.triton.processing(self.nop)
+
+        stats = self.ctx.getGarbageCollectorStats()
+        self.assertEqual(stats['kept'], 0)
+        self.assertEqual(stats['freed'], 40)
@@ -4,6 +4,8 @@
 
 import unittest
 
+from array import array
+
 from triton import ARCH, TritonContext, MODE, SOLVER
 
 
@@ -883,3 +885,100 @@ class TestAstEval(unittest.TestCase):
         self.ctx.setConcreteVariableValue(self.sv1, 10)
         trv = final_node.evaluate()
         self.assertEqual(trv, 12)
+
+
+class TestAstLazyEval(TestAstEval):
+
+    """Testing the AST interpreter with a deferred evaluation."""
+
+    def setUp(self):
+        """Define the arch and defer the evaluation."""
+        self.ctx = TritonContext()
+        self.ctx.setArchitecture(ARCH.X86_64)
+        self.ctx.setMode(MODE.AST_LAZY_EVALUATION, True)
+        self.astCtxt = self.ctx.getAstContext()
+
+    def test_variable_update(self):
+        """Check that the deferred values follow the updates of variables."""
+        sv = self.ctx.newSymbolicVariable(64)
+        v = self.astCtxt.variable(sv)
+        node = self.astCtxt.extract(7, 0, self.astCtxt.bvmul(v, self.astCtxt.bv(3, 64)))
+        self.ctx.setConcreteVariableValue(sv, 5)
+        self.assertEqual(node.evaluate(), 15)
+        self.ctx.setConcreteVariableValue(sv, 0x100)
+        self.assertEqual(node.evaluate(), 0)
+
+    def test_deep(self):
+        """Check the evaluation of a deep AST."""
+        sv = self.ctx.newSymbolicVariable(32)
+        node = self.astCtxt.variable(sv)
+        for i in range(100000):
+            node = self.astCtxt.bvadd(node, self.astCtxt.bv(1, 32))
+        self.assertEqual(node.evaluate(), 100000)
+
+
+class TestAstBatchEval(unittest.TestCase):
+
+    """Testing the evaluation of an AST under many assignments."""
+
+    def setUp(self):
+        """Define the arch and the symbolic variables."""
+        self.ctx = TritonContext()
+        self.ctx.setArchitecture(ARCH.X86_64)
+        self.astCtxt = self.ctx.getAstContext()
+        self.sx = self.ctx.newSymbolicVariable(64)
+        self.sy = self.ctx.newSymbolicVariable(64)
+        self.x = self.astCtxt.variable(self.sx)
+        self.y = self.astCtxt.variable(self.sy)
+        self.xs = [0, 1, 2, 7, 0x7fffffffffffffff, 0x8000000000000000, 0xffffffffffffffff, 0x123456789abcdef0]
+        self.ys = [0xffffffffffffffff, 0, 3, 1, 2, 0x8000000000000000, 5, 0xfedcba9876543210]
+
+    def check_batch(self, node):
+        """Check the batch evaluation is the same as one evaluation per assignment."""
+        results = self.ctx.evaluateAstBatch(node, {self.sx: self.xs, self.sy: self.ys})
+        self.assertEqual(len(results), len(self.xs))
+        for x, y, r in zip(self.xs, self.ys, results):
+            self.ctx.setConcreteVariableValue(self.sx, x)
+            self.ctx.setConcreteVariableValue(self.sy, y)
+            self.assertEqual(r, node.evaluate())
+
+    def test_narrow(self):
+        """Check nodes of at most 64 bits."""
+        ast = self.astCtxt
+        x, y = self.x, self.y
+        for op in [ast.bvadd, ast.bvsub, ast.bvmul, ast.bvudiv, ast.bvurem, ast.bvsdiv, ast.bvsrem, ast.bvsmod,
+                   ast.bvshl, ast.bvlshr, ast.bvashr, ast.bvand, ast.bvor, ast.bvxor, ast.bvnand, ast.bvnor,
+                   ast.bvxnor, ast.bvsge, ast.bvsgt, ast.bvsle, ast.bvslt, ast.bvuge, ast.bvugt, ast.bvule,
+                   ast.bvult, ast.equal, ast.distinct]:
+            self.check_batch(op(x, y))
+            self.check_batch(op(ast.extract(15, 0, x), ast.extract(15, 0, y)))
+        self.check_batch(ast.ite(ast.land([ast.bvult(x, y), ast.lnot(ast.equal(x, ast.bv(0, 64)))]), ast.bvneg(x), ast.bvnot(y)))
+        self.check_batch(ast.concat([ast.extract(31, 24, x), ast.bvrol(ast.extract(23, 0, y), ast.bv(5, 24))]))
+        self.check_batch(ast.bswap(ast.bvror(x, ast.bv(13, 64))))
+        self.check_batch(ast.sx(32, ast.extract(31, 0, x)))
+
+    def test_wide(self):
+        """Check nodes of more than 64 bits."""
+        ast = self.astCtxt
+        wide = ast.bvmul(ast.zx(64, self.x), ast.sx(64, self.y))
+        self.check_batch(wide)
+        self.check_batch(ast.bvsdiv(wide, ast.concat([self.y, self.x])))
+        self.check_batch(ast.extract(127, 64, wide))
+
+    def test_reference(self):
+        """Check references are followed."""
+        expr = self.ctx.newSymbolicExpression(self.astCtxt.bvadd(self.x, self.x))
+        self.check_batch(self.astCtxt.bvxor(self.astCtxt.reference(expr), self.y))
+
+    def test_inputs(self):
+        """Check the kinds of inputs."""
+        node = self.astCtxt.bvadd(self.x, self.y)
+        self.ctx.setConcreteVariableValue(self.sy, 10)
+        self.assertEqual(self.ctx.evaluateAstBatch(node, {self.sx: array('Q', [1, 2, 3])}), [11, 12, 13])
+        self.assertEqual(self.ctx.evaluateAstBatch(node, {self.sx.getId(): (1, -1)}), [11, 9])
+        self.assertEqual(self.ctx.evaluateAstBatch(node, {}), [10])
+        self.assertEqual(self.ctx.evaluateAstBatch(node, {self.sx: []}), [])
+        with self.assertRaises(TypeError):
+            self.ctx.evaluateAstBatch(node, {self.sx: [1, 2], self.sy: [1]})
+        with self.assertRaises(TypeError):
+            self.ctx.evaluateAstBatch(node, {self.sx: [1.5]})
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Testing the AST hash-consing mode."""
+
+import unittest
+
+from triton import *
+
+
+class TestAstHashConsing(unittest.TestCase):
+
+    """Testing the AST hash-consing mode."""
+
+    def setUp(self):
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ctx.setMode(MODE.AST_HASH_CONSING, True)
+        self.ast = self.ctx.getAstContext()
+        self.x = self.ast.variable(self.ctx.newSymbolicVariable(8))
+        self.y = self.ast.variable(self.ctx.newSymbolicVariable(8))
+
+    def test_sharing(self):
+        n1 = self.ast.bvadd(self.x, self.ast.bv(1, 8))
+        n2 = self.ast.bvadd(self.x, self.ast.bv(1, 8))
+        self.assertTrue(n1.equalTo(n2))
+        # Both builds return the same node, so x has only one parent
+        self.assertEqual(len(self.x.getParents()), 1)
+        self.assertEqual(len(n1.getChildren()[1].getParents()), 1)
+
+    def test_no_sharing(self):
+        self.ctx.setMode(MODE.AST_HASH_CONSING, False)
+        n1 = self.ast.bvadd(self.x, self.ast.bv(1, 8))
+        n2 = self.ast.bvadd(self.x, self.ast.bv(1, 8))
+        self.assertTrue(n1.equalTo(n2))
+        self.assertEqual(len(self.x.getParents()), 2)
+
+    def test_different_nodes(self):
+        n1 = self.ast.bvsub(self.x, self.y)
+        n2 = self.ast.bvsub(self.y, self.x)
+        n3 = self.ast.extract(7, 4, self.x)
+        n4 = self.ast.extract(3, 0, self.x)
+        self.assertFalse(n1.equalTo(n2))
+        self.assertFalse(n3.equalTo(n4))
+        self.assertEqual(len(self.x.getParents()), 4)
+
+    def test_evaluation(self):
+        n = self.ast.bvxor(self.x, self.y)
+        m = self.ast.bvxor(self.x, self.y)
+        self.ctx.setConcreteVariableValue(self.x.getSymbolicVariable(), 0x12)
+        self.ctx.setConcreteVariableValue(self.y.getSymbolicVariable(), 0x34)
+        self.assertEqual(n.evaluate(), 0x26)
+        self.assertEqual(m.evaluate(), 0x26)
+
+    def test_processing(self):
+        self.ctx.symbolizeRegister(self.ctx.registers.rax, "rax")
+        for _ in range(10):
+            inst = Instruction(b"\x48\x83\xc0\x01") # add rax, 1
+            self.ctx.processing(inst)
+        ast = self.ctx.getSymbolicRegister(self.ctx.registers.rax).getAst()
+        self.assertEqual(self.ast.unroll(ast).evaluate(), 10)
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 10)
+
+    def test_mutation(self):
+        # A copy is not shared, so mutating it does not change the original
+        n = self.x + 1
+        copy = self.ast.duplicate(n)
+        copy.setChild(1, self.ast.bv(5, 8))
+        self.assertEqual(str(n), "(bvadd SymVar_0 (_ bv1 8))")
+        self.assertEqual(str(copy), "(bvadd SymVar_0 (_ bv5 8))")
+
+        # A mutated node is not returned for its old structure anymore
+        m = self.x + 2
+        m.setChild(1, self.ast.bv(7, 8))
+        self.assertEqual(str(self.x + 2), "(bvadd SymVar_0 (_ bv2 8))")
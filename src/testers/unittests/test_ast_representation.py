@@ -280,3 +280,37 @@ class TestAstRepresentation(unittest.TestCase):
                 self.assertNotEqual(len(self.ctx.liftToLLVM(n, fname="test", optimize=True)), 0)
             # Dot
             self.assertNotEqual(len(self.ctx.liftToDot(n)), 0)
+
+    def test_shared_representation(self):
+        # Shared nodes are bound once, by identity or by structure
+        a = self.v1 + self.v2
+        b = self.v1 + self.v2
+        node = (a * b) ^ a
+        self.assertEqual(self.ast.printShared(node), "(let ((tmp!0 (bvadd SymVar_0 SymVar_1))) (bvxor (bvmul tmp!0 tmp!0) tmp!0))")
+        self.assertEqual(self.ast.printShared(self.v1 + 1), str(self.v1 + 1))
+
+        self.ctx.setAstRepresentationMode(AST_REPRESENTATION.PYTHON)
+        self.assertEqual(self.ast.printShared(node).lower(), "tmp_0 = ((symvar_0 + symvar_1) & 0xff)\n(((tmp_0 * tmp_0) & 0xff) ^ tmp_0)")
+        self.ctx.setAstRepresentationMode(AST_REPRESENTATION.SMT)
+
+        # The output is linear in the size of the DAG, not of the tree
+        node = self.v1
+        value = 3
+        for _ in range(200):
+            node = (node + node) + 1
+            value = (value * 2 + 1) & 0xff
+        smt = self.ast.printShared(node)
+        self.assertLess(len(smt), 200 * 80)
+        self.assertTrue(self.ast.parseSmt(smt)[0].equalTo(node))
+
+        self.ctx.setAstRepresentationMode(AST_REPRESENTATION.PYTHON)
+        lines = self.ast.printShared(node).split("\n")
+        scope = {"SymVar_0": 3}
+        exec("\n".join(lines[:-1]), scope)
+        self.assertEqual(eval(lines[-1], scope), value)
+
+    def test_shared_representation_deep(self):
+        node = self.v1
+        for _ in range(100000):
+            node = ~node
+        self.assertTrue(self.ast.parseSmt(self.ast.printShared(node))[0].equalTo(node))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Testing the SMT-LIB2 parser."""
+
+import glob
+import os
+import unittest
+
+from triton import *
+
+
+class TestAstSmtParser(unittest.TestCase):
+
+    """Testing the SMT-LIB2 parser."""
+
+    def setUp(self):
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ctx.setAstRepresentationMode(AST_REPRESENTATION.SMT)
+        self.ast = self.ctx.getAstContext()
+        self.x = self.ast.variable(self.ctx.newSymbolicVariable(8))
+        self.y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+
+    def test_representation(self):
+        nodes = [
+            self.x + self.y,
+            (self.x * 3) ^ ~self.y,
+            self.ast.bvrol(self.x, self.ast.bv(3, 8)),
+            self.ast.bvror(self.x, self.ast.bv(3, 8)),
+            self.ast.concat([self.x, self.y, self.ast.bv(1, 8)]),
+            self.ast.extract(3, 1, self.x),
+            self.ast.sx(8, self.x),
+            self.ast.zx(8, self.y),
+            self.ast.bswap(self.ast.concat([self.x, self.y])),
+            self.ast.ite(self.x > self.y, self.x, -self.y),
+            self.ast.land([self.x == 1, self.y != 2, self.ast.lnot(self.x <= self.y)]),
+            self.ast.lor([self.ast.bvslt(self.x, self.y), self.ast.bvsge(self.x, self.y)]),
+            self.ast.iff(self.x == 1, self.ast.distinct(self.y, self.ast.bv(2, 8))),
+        ]
+        for node in nodes:
+            parsed = self.ast.parseSmt(str(node))
+            self.assertEqual(len(parsed), 1)
+            self.assertEqual(str(parsed[0]), str(node))
+            self.assertTrue(parsed[0].equalTo(node))
+
+        # Arrays are defined by their declaration
+        array = self.ast.array(8)
+        node = self.ast.select(self.ast.store(array, self.x, self.y), self.y)
+        parsed = self.ast.parseSmt(str(self.ast.declare(array)) + str(node))
+        self.assertEqual(str(parsed[0]), str(node))
+        self.assertTrue(parsed[0].equalTo(node))
+
+    def test_script(self):
+        script = """
+            (set-logic QF_ABV)
+            (declare-fun SymVar_0 () (_ BitVec 8))
+            (declare-fun y () (_ BitVec 8))
+            (define-fun ref!0 () (_ BitVec 8) (bvadd SymVar_0 #x01))
+            (define-fun ref!1 () (_ BitVec 8) (bvmul ref!0 y)) ; comment
+            (assert (= ref!1 (_ bv10 8)))
+            (assert (bvult y #b00000100))
+            (check-sat)
+            (get-model)
+        """
+        nodes = self.ast.parseSmt(script)
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(str(nodes[0]), "(= (bvmul (bvadd SymVar_0 (_ bv1 8)) y) (_ bv10 8))")
+        self.assertEqual(str(nodes[1]), "(bvult y (_ bv4 8))")
+
+        model = self.ctx.getModel(self.ast.land(nodes))
+        x, y = model[0].getValue(), model[1].getValue()
+        self.assertEqual(((x + 1) * y) & 0xff, 10)
+        self.assertLess(y, 4)
+
+    def test_let(self):
+        # Bindings are parallel and shadow the outer ones
+        nodes = self.ast.parseSmt("(let ((a (bvadd SymVar_0 y))) (let ((a (bvmul a a)) (b a)) (= a b)))")
+        self.assertEqual(str(nodes[0]), "(= (bvmul (bvadd SymVar_0 y) (bvadd SymVar_0 y)) (bvadd SymVar_0 y))")
+
+        # Bindings are shared, not expanded
+        n = 2000
+        script = "(let ((a0 y)) " + "".join("(let ((a%d (bvadd a%d a%d))) " % (i, i - 1, i - 1) for i in range(1, n)) + "a%d" % (n - 1) + ")" * n
+        node = self.ast.parseSmt(script)[0]
+        self.ctx.setConcreteVariableValue(self.y.getSymbolicVariable(), 1)
+        self.assertEqual(node.evaluate(), (1 << (n - 1)) & 0xff)
+
+    def test_deep(self):
+        n = 100000
+        node = self.ast.parseSmt("(bvnot " * n + "SymVar_0" + ")" * n)[0]
+        self.assertEqual(node.getType(), AST_NODE.BVNOT)
+
+    def test_hash_consing(self):
+        self.ctx.setMode(MODE.AST_HASH_CONSING, True)
+        nodes = self.ast.parseSmt("(bvadd SymVar_0 (_ bv1 8)) (bvadd SymVar_0 (_ bv1 8))")
+        self.assertEqual(nodes[0], nodes[1])
+        self.assertEqual(len(self.x.getParents()), 1)
+
+    def test_lifting(self):
+        ctx = TritonContext(ARCH.X86_64)
+        ctx.symbolizeRegister(ctx.registers.rax, "a")
+        ctx.symbolizeRegister(ctx.registers.rbx)
+        ctx.setConcreteRegisterValue(ctx.registers.rsp, 0x1000)
+        for opcode in [b"\x48\x01\xd8", b"\x48\x0f\xc8", b"\x48\xd1\xc0", b"\x48\x89\x04\x24", b"\x48\x8b\x0c\x24"]:
+            ctx.processing(Instruction(opcode))
+
+        expr = ctx.getSymbolicRegister(ctx.registers.rcx)
+        actx = ctx.getAstContext()
+        node = actx.parseSmt(ctx.liftToSMT(expr) + "ref!%d" % expr.getId())[0]
+        self.assertFalse(ctx.isSat(node != actx.unroll(expr.getAst())))
+
+    def test_functions(self):
+        script = """
+            (define-fun f ((a (_ BitVec 8)) (b Bool)) (_ BitVec 8) (let ((c (bvadd a a))) (ite b c a)))
+            (define-fun g ((a (_ BitVec 8))) (_ BitVec 8) ((_ extract 7 0) ((_ zero_extend 8) (f a true))))
+            (let ((a y)) (f (g a) (= a SymVar_0)))
+        """
+        node = self.ast.parseSmt(script)[0]
+        for x, y in [(1, 2), (3, 3)]:
+            self.ctx.setConcreteVariableValue(self.x.getSymbolicVariable(), x)
+            self.ctx.setConcreteVariableValue(self.y.getSymbolicVariable(), y)
+            self.assertEqual(node.evaluate(), (y * 4 if x == y else y * 2) & 0xff)
+
+    def test_bool(self):
+        self.assertEqual(self.ast.parseSmt("(= true false)")[0].getType(), AST_NODE.IFF)
+        self.assertEqual(self.ast.parseSmt("(= true false)")[0].evaluate(), 0)
+        self.assertEqual(self.ast.parseSmt("(= (= SymVar_0 y) true (bvult y y))")[0].getType(), AST_NODE.LAND)
+        self.assertEqual(self.ast.parseSmt("(distinct true false)")[0].evaluate(), 1)
+
+    def test_resolver(self):
+        ctx = TritonContext(ARCH.X86_64)
+        zf = ctx.newSymbolicVariable(8, "zf")
+
+        # No variable node has been built for zf
+        for name in ["zf", zf.getName()]:
+            node = ctx.parseSmt("(bvadd %s (_ bv1 8))" % name)[0]
+            self.assertEqual(node.getChildren()[0].getSymbolicVariable().getId(), zf.getId())
+
+        # Unknown bit-vectors are created when they are declared
+        node = ctx.parseSmt("(declare-fun cf () (_ BitVec 1)) (declare-fun zf () (_ BitVec 8)) (concat cf zf)")[0]
+        self.assertEqual(ctx.getSymbolicVariable("cf").getBitSize(), 1)
+        self.assertEqual(node.getChildren()[1].getSymbolicVariable().getId(), zf.getId())
+        with self.assertRaises(TypeError):
+            ctx.parseSmt("(bvadd of (_ bv1 8))")
+
+        # The resolver of the AST context
+        names = []
+        def resolver(name, size):
+            names.append((name, size))
+            return zf if name == "flag" else None
+        node = ctx.getAstContext().parseSmt("(declare-fun flag () (_ BitVec 8)) (bvadd flag flag)", resolver)[0]
+        self.assertEqual(names, [("flag", 8)])
+        self.assertEqual(node.getChildren()[0].getSymbolicVariable().getId(), zf.getId())
+        with self.assertRaises(TypeError):
+            ctx.getAstContext().parseSmt("(bvadd other zf)", resolver)
+
+    def test_corpus(self):
+        scripts = glob.glob(os.path.join(os.path.dirname(__file__), "..", "..", "misc", "smt", "*.smt2"))
+        self.assertTrue(scripts)
+        for path in scripts:
+            ctx = TritonContext(ARCH.X86_64)
+            with open(path) as f:
+                nodes = ctx.parseSmt(f.read())
+            self.assertEqual(len(nodes), 1)
+            self.assertTrue(nodes[0].isLogical())
+            self.assertTrue(ctx.isSat(nodes[0]))
+
+    def test_errors(self):
+        for script in ["(bvadd SymVar_0", "(bvadd SymVar_0 z)", "(bvfoo SymVar_0 y)", "(declare-fun z () (_ BitVec 8))",
+                       "(declare-fun y () (_ BitVec 16))", "(assert SymVar_0)", "(bvnot SymVar_0 y)", "(_ bv1 x)", ")",
+                       "(define-fun f ((v (_ BitVec 8))) (_ BitVec 8) v) (f y y)",
+                       "(define-fun f ((v (_ BitVec 8))) (_ BitVec 8) v) (f true)",
+                       "(define-fun f ((v (_ BitVec 8))) Bool v) (f y)",
+                       "(define-fun f ((v (_ BitVec 8))) (_ BitVec 8) (f v)) (f y)"]:
+            with self.assertRaises(TypeError):
+                self.ast.parseSmt(script)
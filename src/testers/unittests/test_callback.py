@@ -28,6 +28,37 @@ class TestCallback(unittest.TestCase):
         self.Triton.processing(Instruction(b"\x48\xa1\x00\x10\x00\x00\x00\x00\x00\x00"))
         self.assertFalse(flag)
 
+    def test_get_concrete_memory_area_value(self):
+        self.Triton = TritonContext()
+        self.Triton.setArchitecture(ARCH.X86_64)
+
+        areas = []
+        def cb_area(ctx, addr, size):
+            areas.append((addr, size))
+            ctx.setConcreteMemoryAreaValue(addr, bytes([(addr + i) & 0xff for i in range(size)]))
+
+        self.Triton.setConcreteMemoryValue(0x1004, 0x41)
+        self.Triton.addCallback(CALLBACK.GET_CONCRETE_MEMORY_AREA_VALUE, cb_area)
+
+        # One call per undefined contiguous area
+        self.Triton.getConcreteMemoryAreaValue(0x1000, 0x2000)
+        self.assertEqual(areas, [(0x1000, 4), (0x1005, 0x1ffb)])
+
+        # Defined areas are not reported again
+        self.Triton.getConcreteMemoryAreaValue(0x1000, 0x2000)
+        # movabs rax, qword ptr [0x1000]
+        self.Triton.processing(Instruction(b"\x48\xa1\x00\x10\x00\x00\x00\x00\x00\x00"))
+        self.assertEqual(len(areas), 2)
+        self.assertEqual(self.Triton.getConcreteRegisterValue(self.Triton.registers.rax), 0x0706054103020100)
+
+        # movabs rax, qword ptr [0x5000]
+        self.Triton.processing(Instruction(b"\x48\xa1\x00\x50\x00\x00\x00\x00\x00\x00"))
+        self.assertEqual(areas[-1], (0x5000, 8))
+
+        self.Triton.removeCallback(CALLBACK.GET_CONCRETE_MEMORY_AREA_VALUE, cb_area)
+        self.Triton.getConcreteMemoryAreaValue(0x8000, 0x10)
+        self.assertEqual(len(areas), 3)
+
     def test_get_concrete_register_value(self):
         global flag
         self.Triton = TritonContext()
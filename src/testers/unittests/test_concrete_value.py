@@ -2,9 +2,12 @@
 # coding: utf-8
 """Test architectures."""
 
+import array
+import os
+import tempfile
 import unittest
 
-from triton import ARCH, TritonContext
+from triton import ARCH, MEMORY_BACKEND, MemoryAccess, TritonContext
 from random import randrange
 
 
@@ -207,3 +210,99 @@ class TestX8664ConcreteMemoryValue(unittest.TestCase):
         self.Triton.setConcreteMemoryAreaValue(0x1000, b"\x11\x22\x33\x44\x55\x66")
         self.Triton.setConcreteMemoryAreaValue(0x1006, [0x77, 0x88, 0x99, 0xaa, 0xbb, 0xcc])
         self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1000, 12), b"\x11\x22\x33\x44\x55\x66\x77\x88\x99\xaa\xbb\xcc")
+
+    def test_bytes_like_area(self):
+        self.Triton.setConcreteMemoryAreaValue(0x1000, memoryview(b"\x00\x11\x22\x33")[1:])
+        self.Triton.setConcreteMemoryAreaValue(0x1003, array.array("H", [0x5544]))
+        self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1000, 5), b"\x11\x22\x33\x44\x55")
+
+        area = bytearray(6)
+        self.Triton.getConcreteMemoryAreaValueInto(0x1000, area)
+        self.assertEqual(area, b"\x11\x22\x33\x44\x55\x00")
+        self.Triton.getConcreteMemoryAreaValueInto(0x1003, memoryview(area)[4:])
+        self.assertEqual(area, b"\x11\x22\x33\x44\x44\x55")
+
+        with self.assertRaises(TypeError):
+            self.Triton.getConcreteMemoryAreaValueInto(0x1000, b"\x00\x00")
+        with self.assertRaises(TypeError):
+            self.Triton.setConcreteMemoryAreaValue(0x1000, memoryview(b"\x00\x11\x22\x33")[::2])
+
+
+class TestConcreteMemoryBackend(unittest.TestCase):
+
+    """Testing the concrete memory backends."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.Triton = TritonContext()
+        self.Triton.setArchitecture(ARCH.X86_64)
+
+    def test_default_backend(self):
+        self.assertEqual(self.Triton.getConcreteMemoryBackend(), MEMORY_BACKEND.PAGED)
+
+    def test_page_boundary(self):
+        for backend in [MEMORY_BACKEND.PAGED, MEMORY_BACKEND.MAP]:
+            self.Triton.reset()
+            self.Triton.setConcreteMemoryBackend(backend)
+            data = bytes(range(1, 33))
+            self.Triton.setConcreteMemoryAreaValue(0x1ff0, data)
+            self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1ff0, 32), data)
+            self.assertEqual(self.Triton.getConcreteMemoryValue(MemoryAccess(0x1ffc, 8)), 0x14131211100f0e0d)
+            self.assertTrue(self.Triton.isConcreteMemoryValueDefined(0x1ff0, 32))
+            self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0x1ff0, 33))
+            self.Triton.clearConcreteMemoryValue(0x1ffe, 4)
+            self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0x1fff, 1))
+            self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0x2001, 1))
+            self.assertTrue(self.Triton.isConcreteMemoryValueDefined(0x2002, 14))
+            self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1ffd, 6), b"\x0e\x00\x00\x00\x00\x13")
+
+    def test_switch_backend(self):
+        self.Triton.setConcreteMemoryAreaValue(0x1000, b"\x11\x22\x33\x44")
+        self.Triton.setConcreteMemoryValue(0xfffffffffffffffe, 0x55)
+        self.Triton.setConcreteMemoryBackend(MEMORY_BACKEND.MAP)
+        self.assertEqual(self.Triton.getConcreteMemoryBackend(), MEMORY_BACKEND.MAP)
+        self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1000, 4), b"\x11\x22\x33\x44")
+        self.assertEqual(self.Triton.getConcreteMemoryValue(0xfffffffffffffffe), 0x55)
+        self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0x1004, 1))
+        self.Triton.setConcreteMemoryBackend(MEMORY_BACKEND.PAGED)
+        self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x1000, 4), b"\x11\x22\x33\x44")
+        self.assertEqual(self.Triton.getConcreteMemoryValue(0xfffffffffffffffe), 0x55)
+        self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0xffffffffffffffff, 1))
+
+    def test_map_file(self):
+        data = bytes([x & 0xff for x in range(0x3000)])
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+        try:
+            for backend in [MEMORY_BACKEND.PAGED, MEMORY_BACKEND.MAP]:
+                self.Triton.reset()
+                self.Triton.setConcreteMemoryBackend(backend)
+                # Not aligned on pages, neither in the file nor in memory
+                self.Triton.mapConcreteMemoryFile(f.name, 0x10, 0x400800, 0x2800)
+                self.assertTrue(self.Triton.isConcreteMemoryValueDefined(0x400800, 0x2800))
+                self.assertFalse(self.Triton.isConcreteMemoryValueDefined(0x4007ff, 1))
+                self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x400800, 0x2800), data[0x10:0x2810])
+                # Copy on write
+                self.Triton.setConcreteMemoryValue(MemoryAccess(0x401000, 4), 0xdeadbeef)
+                self.assertEqual(self.Triton.getConcreteMemoryValue(MemoryAccess(0x401000, 4)), 0xdeadbeef)
+                self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x401004, 4), data[0x814:0x818])
+            # Writable private mapping
+            self.Triton.setConcreteMemoryBackend(MEMORY_BACKEND.PAGED)
+            self.Triton.mapConcreteMemoryFile(f.name, 0, 0x600000, 0x3000, True)
+            self.Triton.clearConcreteMemoryValue(0x601000, 0x10)
+            self.Triton.setConcreteMemoryAreaValue(0x602000, b"\x41\x42")
+            self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x601000, 0x11), b"\x00" * 0x10 + data[0x1010:0x1011])
+            self.assertEqual(self.Triton.getConcreteMemoryAreaValue(0x602000, 3), b"\x41\x42\x02")
+            with open(f.name, "rb") as fd:
+                self.assertEqual(fd.read(), data)
+            # The symbolic bytes of the mapped range are concretized
+            self.Triton.symbolizeMemory(MemoryAccess(0x800000, 1))
+            self.Triton.symbolizeMemory(MemoryAccess(0x801000, 1))
+            self.Triton.mapConcreteMemoryFile(f.name, 0x41, 0x800000, 0x1000)
+            self.assertFalse(self.Triton.isMemorySymbolized(MemoryAccess(0x800000, 1)))
+            self.assertTrue(self.Triton.isMemorySymbolized(MemoryAccess(0x801000, 1)))
+            self.assertEqual(self.Triton.getConcreteMemoryValue(0x800000), 0x41)
+            with self.assertRaises(TypeError):
+                self.Triton.mapConcreteMemoryFile(f.name, 0x2000, 0x700000, 0x2000)
+        finally:
+            os.remove(f.name)
@@ -368,3 +368,69 @@ class TestX64Disass(unittest.TestCase):
 
         self.ctx.processing(block, 0x112233)
         self.assertEqual(block.getInstructions()[0].getAddress(), 0x112233)
+
+
+class TestDisassemblyCache(unittest.TestCase):
+
+    """Testing the cache of decoded instructions."""
+
+    def setUp(self):
+        """Define the arch and enable the cache."""
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ctx.setDisassemblyCacheSize(2)
+
+    def test_default(self):
+        ctx = TritonContext(ARCH.X86_64)
+        self.assertEqual(ctx.getDisassemblyCacheSize(), 0)
+        ctx.disassembly(Instruction(0x1000, b"\x48\x01\xd8"))
+        self.assertEqual(ctx.getDisassemblyCacheStats()["entries"], 0)
+
+    def test_hit(self):
+        for _ in range(3):
+            inst = Instruction(0x1000, b"\x48\x8b\x44\x24\x08\x90\x90") # mov rax, qword ptr [rsp + 8]
+            self.ctx.disassembly(inst)
+            self.assertEqual(inst.getDisassembly(), "mov rax, qword ptr [rsp + 8]")
+            self.assertEqual(inst.getSize(), 5)
+            self.assertEqual(inst.getType(), OPCODE.X86.MOV)
+            self.assertEqual(len(inst.getOperands()), 2)
+            self.assertEqual(inst.getOperands()[1].getBaseRegister().getName(), "rsp")
+        stats = self.ctx.getDisassemblyCacheStats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+
+    def test_self_modifying_code(self):
+        self.ctx.disassembly(Instruction(0x1000, b"\x48\x01\xd8")) # add rax, rbx
+        inst = Instruction(0x1000, b"\x48\x29\xd8")                # sub rax, rbx
+        self.ctx.disassembly(inst)
+        self.assertEqual(inst.getType(), OPCODE.X86.SUB)
+        self.assertEqual(self.ctx.getDisassemblyCacheStats()["invalidations"], 1)
+
+    def test_eviction(self):
+        for addr in [0x1000, 0x2000, 0x3000, 0x1000]:
+            self.ctx.disassembly(Instruction(addr, b"\x90"))
+        stats = self.ctx.getDisassemblyCacheStats()
+        self.assertEqual((stats["hits"], stats["evictions"], stats["entries"]), (0, 2, 2))
+        self.ctx.clearDisassemblyCache()
+        self.assertEqual(self.ctx.getDisassemblyCacheStats()["entries"], 0)
+
+    def test_emulation(self):
+        """Check a loop gives the same result with and without the cache."""
+        code = [
+            (0x1000, b"\x48\x01\xd8"),     # add rax, rbx
+            (0x1003, b"\x48\xff\xc9"),     # dec rcx
+            (0x1006, b"\x75\xf8"),         # jne 0x1000
+        ]
+        results = []
+        for size in [0, 64]:
+            ctx = TritonContext(ARCH.X86_64)
+            ctx.setDisassemblyCacheSize(size)
+            ctx.setConcreteRegisterValue(ctx.registers.rbx, 3)
+            ctx.setConcreteRegisterValue(ctx.registers.rcx, 10)
+            for addr, opcode in code:
+                ctx.setConcreteMemoryAreaValue(addr, opcode)
+            pc = 0x1000
+            while pc != 0x1008:
+                inst = Instruction(pc, ctx.getConcreteMemoryAreaValue(pc, 16))
+                ctx.processing(inst)
+                pc = ctx.getConcreteRegisterValue(ctx.registers.rip)
+            results.append(ctx.getConcreteRegisterValue(ctx.registers.rax))
+        self.assertEqual(results, [30, 30])
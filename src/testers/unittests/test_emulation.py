@@ -4,6 +4,8 @@
 
 import unittest
 import os
+import signal
+import sys
 
 from triton import *
 
@@ -147,6 +149,297 @@ class TestEmulationX64(unittest.TestCase):
         self.ctx.setMode(MODE.TAINT_THROUGH_POINTERS, True)
         self.start()
 
+    def test_12(self):
+        self.ctx.setMode(MODE.ALIGNED_MEMORY, True)
+        self.emulate = lambda pc: self.ctx.emulate(pc, stops=[0])
+        self.start()
+
+
+class TestNativeEmulation(unittest.TestCase):
+
+    """Testing the native emulation loop."""
+
+    def setUp(self):
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ctx.setConcreteMemoryAreaValue(0x1000, bytes.fromhex(
+            "48c7c000000000"    # 0x1000: mov rax, 0
+            "48ffc0"            # 0x1007: inc rax
+            "4883f80a"          # 0x100a: cmp rax, 10
+            "75f7"              # 0x100e: jne 0x1007
+            "06"                # 0x1010: invalid
+        ))
+
+    def test_stop_address(self):
+        ret = self.ctx.emulate(0x1000, stops=[0x1010])
+        self.assertEqual(ret, (STOP.ADDRESS, 31, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 10)
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x1010)
+
+        # The start address is also checked
+        self.assertEqual(self.ctx.emulate(0x1010, stops=[0x1010]), (STOP.ADDRESS, 0, EXCEPTION.NO_FAULT))
+
+    def test_stop_count(self):
+        ret = self.ctx.emulate(0x1000, count=4)
+        self.assertEqual(ret, (STOP.COUNT, 4, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 1)
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x1007)
+
+        # Resume
+        ret = self.ctx.emulate(0x1007, stops=[0x1010])
+        self.assertEqual(ret, (STOP.ADDRESS, 27, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 10)
+
+    def test_stop_fault(self):
+        ret = self.ctx.emulate(0x1000)
+        self.assertEqual(ret, (STOP.FAULT, 31, EXCEPTION.FAULT_UD))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x1010)
+
+    def test_stop_no_code(self):
+        self.ctx.setConcreteMemoryValue(0x1010, 0x90) # nop
+        ret = self.ctx.emulate(0x1000)
+        self.assertEqual(ret, (STOP.NO_CODE, 32, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x1011)
+
+    def test_stop_timeout(self):
+        # jmp $
+        self.ctx.setConcreteMemoryAreaValue(0x2000, b"\xeb\xfe")
+        reason, count, fault = self.ctx.emulate(0x2000, timeout=10)
+        self.assertEqual(reason, STOP.TIMEOUT)
+        self.assertGreater(count, 0)
+        self.assertEqual(fault, EXCEPTION.NO_FAULT)
+
+    def test_self_loop(self):
+        # jmp $, the interruption is polled while it spins
+        self.ctx.setConcreteMemoryAreaValue(0x2000, b"\xeb\xfe")
+        ret = self.ctx.emulate(0x2000, count=10000)
+        self.assertEqual(ret, (STOP.COUNT, 10000, EXCEPTION.NO_FAULT))
+
+    @unittest.skipUnless(hasattr(signal, "setitimer"), "requires signal.setitimer")
+    def test_interrupt(self):
+        # A signal interrupts an emulation without limit and its exception is raised
+        def handler(signum, frame):
+            raise KeyboardInterrupt()
+        previous = signal.signal(signal.SIGALRM, handler)
+        self.ctx.setConcreteMemoryAreaValue(0x2000, b"\xeb\xfe")
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.05)
+            with self.assertRaises(KeyboardInterrupt):
+                self.ctx.emulate(0x2000)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+        # The context is released
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x2000)
+
+    def test_callbacks(self):
+        reads = list()
+        self.ctx.addCallback(CALLBACK.GET_CONCRETE_REGISTER_VALUE, lambda ctx, reg: reads.append(reg.getName()))
+        self.ctx.emulate(0x1000, stops=[0x1010])
+        # The program counter is read without callback
+        self.assertEqual(reads.count("rax"), 20)
+        self.assertNotIn("rip", reads)
+
+    def test_lazy_code(self):
+        # The code is supplied by the callback when it is fetched
+        code = {0x3000: bytes.fromhex("48ffc0" "48ffc0")}  # inc rax; inc rax
+        areas = list()
+        def cb_area(ctx, addr, size):
+            areas.append(addr)
+            if addr in code:
+                ctx.setConcreteMemoryAreaValue(addr, code.pop(addr))
+        self.ctx.addCallback(CALLBACK.GET_CONCRETE_MEMORY_AREA_VALUE, cb_area)
+        ret = self.ctx.emulate(0x3000)
+        self.assertEqual(ret, (STOP.NO_CODE, 2, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 2)
+        self.assertEqual(areas[0], 0x3000)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            self.ctx.emulate("0x1000")
+        with self.assertRaises(TypeError):
+            self.ctx.emulate(0x1000, stops=["0x1010"])
+        with self.assertRaises(TypeError):
+            self.ctx.emulate(0x1000, count="1")
+
+
+class TestEmulationHooks(unittest.TestCase):
+
+    """Testing hooks and built-in summaries during the native emulation."""
+
+    def setUp(self):
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ctx.setConcreteMemoryAreaValue(0x1000, bytes.fromhex(
+            "48c7c700300000"    # 0x1000: mov rdi, 0x3000
+            "e8f40f0000"        # 0x1007: call 0x2000
+            "90"                # 0x100c: nop
+        ))
+        self.ctx.setConcreteRegisterValue(self.ctx.registers.rsp, 0x8000)
+        self.ctx.setConcreteMemoryAreaValue(0x3000, b"hello\x00")
+
+    def call(self, addr, *args):
+        # Calls a function at addr, which returns to 0x1234
+        for reg, arg in zip([self.ctx.registers.rdi, self.ctx.registers.rsi, self.ctx.registers.rdx], args):
+            if arg is not None:
+                self.ctx.setConcreteRegisterValue(reg, arg)
+        self.ctx.setConcreteRegisterValue(self.ctx.registers.rsp, 0x7ff8)
+        self.ctx.setConcreteMemoryValue(MemoryAccess(0x7ff8, CPUSIZE.QWORD), 0x1234)
+        ret = self.ctx.emulate(addr, stops=[0x1234])
+        self.assertEqual(ret, (STOP.ADDRESS, 1, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rsp), 0x8000)
+        return self.ctx.getConcreteRegisterValue(self.ctx.registers.rax)
+
+    def test_python_hook(self):
+        calls = list()
+
+        def hook(ctx, addr):
+            calls.append(addr)
+            ctx.setConcreteRegisterValue(ctx.registers.rax, 42)
+            rsp = ctx.getConcreteRegisterValue(ctx.registers.rsp)
+            ctx.setConcreteRegisterValue(ctx.registers.rip, ctx.getConcreteMemoryValue(MemoryAccess(rsp, CPUSIZE.QWORD)))
+            ctx.setConcreteRegisterValue(ctx.registers.rsp, rsp + 8)
+
+        self.ctx.addHook(0x2000, hook)
+        self.assertTrue(self.ctx.isHooked(0x2000))
+        self.assertFalse(self.ctx.isHooked(0x1000))
+
+        # The hook is counted as an instruction
+        ret = self.ctx.emulate(0x1000, stops=[0x100c])
+        self.assertEqual(ret, (STOP.ADDRESS, 3, EXCEPTION.NO_FAULT))
+        self.assertEqual(calls, [0x2000])
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 42)
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rsp), 0x8000)
+
+        self.ctx.removeHook(0x2000)
+        self.assertFalse(self.ctx.isHooked(0x2000))
+        with self.assertRaises(TypeError):
+            self.ctx.removeHook(0x2000)
+
+    def test_hook_stop(self):
+        self.ctx.addHook(0x2000, lambda ctx, addr: False)
+        ret = self.ctx.emulate(0x1000)
+        self.assertEqual(ret, (STOP.HOOK, 2, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rip), 0x2000)
+
+    def test_hook_limit(self):
+        # A hook which loops on its own address is bounded by the count
+        self.ctx.addHook(0x2000, lambda ctx, addr: ctx.setConcreteRegisterValue(ctx.registers.rip, addr))
+        ret = self.ctx.emulate(0x2000, count=5)
+        self.assertEqual(ret, (STOP.COUNT, 5, EXCEPTION.NO_FAULT))
+
+    def test_hook_references(self):
+        hook = lambda ctx, addr: True
+        refs = sys.getrefcount(hook)
+        self.ctx.addHook(0x2000, hook)
+        self.ctx.addHook(0x2010, hook)
+        self.assertEqual(sys.getrefcount(hook), refs + 2)
+
+        # Removed, replaced and cleared hooks release their function
+        self.ctx.removeHook(0x2000)
+        self.assertEqual(sys.getrefcount(hook), refs + 1)
+        self.ctx.addHook(0x2010, SUMMARY.STRLEN)
+        self.assertEqual(sys.getrefcount(hook), refs)
+        self.ctx.addHook(0x2000, hook)
+        self.ctx.clearHooks()
+        self.assertEqual(sys.getrefcount(hook), refs)
+
+    def test_hook_error(self):
+        def hook(ctx, addr):
+            raise ValueError("hook")
+        self.ctx.addHook(0x2000, hook)
+        with self.assertRaises(ValueError):
+            self.ctx.emulate(0x1000)
+
+    def test_clear_hooks(self):
+        self.ctx.addHook(0x2000, SUMMARY.STRLEN)
+        self.ctx.addHook(0x2010, SUMMARY.STRCMP)
+        self.ctx.clearHooks()
+        self.assertFalse(self.ctx.isHooked(0x2000))
+        self.assertFalse(self.ctx.isHooked(0x2010))
+
+    def test_strlen(self):
+        self.ctx.addHook(0x2000, SUMMARY.STRLEN)
+        ret = self.ctx.emulate(0x1000, stops=[0x100c])
+        self.assertEqual(ret, (STOP.ADDRESS, 3, EXCEPTION.NO_FAULT))
+        self.assertEqual(self.ctx.getConcreteRegisterValue(self.ctx.registers.rax), 5)
+        self.assertFalse(self.ctx.isRegisterSymbolized(self.ctx.registers.rax))
+
+        # The length depends on the symbolic bytes
+        var = self.ctx.symbolizeMemory(MemoryAccess(0x3002, CPUSIZE.BYTE))
+        self.assertEqual(self.call(0x2000, 0x3000), 5)
+        rax = self.ctx.getRegisterAst(self.ctx.registers.rax)
+        model = self.ctx.getModel(rax == 2)
+        self.assertEqual(model[var.getId()].getValue(), 0)
+
+    def test_strcmp(self):
+        self.ctx.addHook(0x2000, SUMMARY.STRCMP)
+        self.ctx.setConcreteMemoryAreaValue(0x4000, b"abc\x00")
+        self.ctx.setConcreteMemoryAreaValue(0x5000, b"abd\x00")
+        self.ctx.setConcreteMemoryAreaValue(0x6000, b"abc\x00")
+        self.assertEqual(self.call(0x2000, 0x4000, 0x5000), 0xffffffff)
+        self.assertEqual(self.call(0x2000, 0x5000, 0x4000), 1)
+        self.assertEqual(self.call(0x2000, 0x4000, 0x6000), 0)
+        self.assertEqual(self.call(0x2000, 0x3000, 0x4000), ord("h") - ord("a"))
+
+        # Solve the symbolic string equal to "abd"
+        vars = [self.ctx.symbolizeMemory(MemoryAccess(0x4000 + i, CPUSIZE.BYTE)) for i in range(3)]
+        self.assertEqual(self.call(0x2000, 0x4000, 0x5000), 0xffffffff)
+        rax = self.ctx.getRegisterAst(self.ctx.registers.rax)
+        model = self.ctx.getModel(rax == 0)
+        self.assertEqual(bytes(model[v.getId()].getValue() for v in vars), b"abd")
+
+    def test_memcpy(self):
+        self.ctx.addHook(0x2000, SUMMARY.MEMCPY)
+        self.ctx.setConcreteMemoryAreaValue(0x4000, b"0123456789")
+        self.ctx.symbolizeMemory(MemoryAccess(0x4001, CPUSIZE.BYTE))
+        self.ctx.taintMemory(0x4002)
+
+        self.assertEqual(self.call(0x2000, 0x5000, 0x4000, 10), 0x5000)
+        self.assertEqual(self.ctx.getConcreteMemoryAreaValue(0x5000, 10), b"0123456789")
+        self.assertEqual([self.ctx.isMemorySymbolized(0x5000 + i) for i in range(4)], [False, True, False, False])
+        self.assertEqual([self.ctx.isMemoryTainted(0x5000 + i) for i in range(4)], [False, False, True, False])
+        self.assertEqual(self.ctx.getMemoryAst(MemoryAccess(0x5001, CPUSIZE.BYTE)).evaluate(), ord("1"))
+
+        # Overlapping areas
+        self.assertEqual(self.call(0x2000, 0x5002, 0x5000, 4), 0x5002)
+        self.assertEqual(self.ctx.getConcreteMemoryAreaValue(0x5000, 10), b"0101236789")
+        self.assertEqual([self.ctx.isMemorySymbolized(0x5000 + i) for i in range(6)], [False, True, False, True, False, False])
+
+    def test_memset(self):
+        self.ctx.addHook(0x2000, SUMMARY.MEMSET)
+        self.ctx.setConcreteMemoryAreaValue(0x4000, b"0123456789")
+        self.ctx.symbolizeMemory(MemoryAccess(0x4000, CPUSIZE.BYTE))
+
+        self.assertEqual(self.call(0x2000, 0x4000, 0x141, 4), 0x4000)
+        self.assertEqual(self.ctx.getConcreteMemoryAreaValue(0x4000, 10), b"AAAA456789")
+        self.assertFalse(self.ctx.isMemorySymbolized(MemoryAccess(0x4000, 10)))
+
+        # The value is symbolic
+        self.ctx.setConcreteRegisterValue(self.ctx.registers.rsi, 0x42)
+        self.ctx.symbolizeRegister(self.ctx.registers.rsi)
+        self.ctx.taintRegister(self.ctx.registers.rsi)
+        self.call(0x2000, 0x4000, None, 2)
+        self.assertEqual(self.ctx.getConcreteMemoryAreaValue(0x4000, 4), b"BBAA")
+        self.assertEqual([self.ctx.isMemorySymbolized(0x4000 + i) for i in range(3)], [True, True, False])
+        self.assertEqual([self.ctx.isMemoryTainted(0x4000 + i) for i in range(3)], [True, True, False])
+
+    def test_aarch64(self):
+        ctx = TritonContext(ARCH.AARCH64)
+        ctx.setConcreteMemoryAreaValue(0x3000, b"hello\x00")
+        ctx.setConcreteRegisterValue(ctx.registers.x0, 0x3000)
+        ctx.setConcreteRegisterValue(ctx.registers.x30, 0x1234)
+        ctx.addHook(0x2000, SUMMARY.STRLEN)
+        self.assertEqual(ctx.emulate(0x2000, stops=[0x1234]), (STOP.ADDRESS, 1, EXCEPTION.NO_FAULT))
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.x0), 5)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            self.ctx.addHook(0x2000, "strlen")
+        with self.assertRaises(TypeError):
+            self.ctx.addHook(0x2000, 1000)
+        with self.assertRaises(TypeError):
+            self.ctx.addHook("0x2000", SUMMARY.STRLEN)
+
 
 class TestEmulationX86(unittest.TestCase):
     def setUp(self):
@@ -104,6 +104,37 @@ class TestPathConstraint(unittest.TestCase):
 
         self.assertEqual(ctx.getModel(ctx.getPredicatesToReachAddress(0x1337)[0])[0].getValue(), 0x1336)
 
+    def test_reachingBBIndex(self):
+        ctx = TritonContext(ARCH.X86)
+        ctx.setConcreteRegisterValue(ctx.registers.eax, 5)
+        ctx.symbolizeRegister(ctx.registers.eax)
+
+        # Three `cmp eax, i; je +0x100` at 0x1000, 0x1010 and 0x1020
+        for i in range(3):
+            ctx.processing(Instruction(0x1000 + i * 0x10, b"\x83\xf8" + bytes([i])))
+            ctx.processing(Instruction(0x1003 + i * 0x10, b"\x0f\x84\x00\x01\x00\x00"))
+
+        predicate = ctx.getPathPredicate()
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1109)), 1)
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1129)), 1)
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1023)), 2)
+        model = ctx.getModel(ctx.getPredicatesToReachAddress(0x1119)[0])
+        self.assertEqual(model[0].getValue(), 1)
+
+        snap = ctx.snapshot()
+        ctx.popPathConstraint()
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1129)), 0)
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1023)), 0)
+        self.assertEqual(str(ctx.getPathPredicate()), str(predicate.getChildren()[0]))
+
+        ctx.restore(snap)
+        self.assertEqual(str(ctx.getPathPredicate()), str(predicate))
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1129)), 1)
+
+        ctx.clearPathConstraints()
+        self.assertEqual(str(ctx.getPathPredicate()), "(= (_ bv1 1) (_ bv1 1))")
+        self.assertEqual(len(ctx.getPredicatesToReachAddress(0x1109)), 0)
+
     def test_pushPathConstraintComment(self):
         ast = self.ctx.getAstContext()
 
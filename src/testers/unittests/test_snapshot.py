@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""Test snapshots and register states."""
+
+import unittest
+
+from triton import *
+
+
+class TestSnapshot(unittest.TestCase):
+
+    """Testing the snapshots of a context."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+
+    def test_concrete(self):
+        """Check that the registers and the memory are restored."""
+        ctx = self.ctx
+        ctx.setConcreteRegisterValue(ctx.registers.rax, 0x1122)
+        ctx.setConcreteRegisterValue(ctx.registers.zf, 1)
+        ctx.setConcreteMemoryAreaValue(0x1000, b"abcd")
+        snap = ctx.snapshot()
+        self.assertEqual(snap.getArchitecture(), ARCH.X86_64)
+
+        ctx.setConcreteRegisterValue(ctx.registers.rax, 0x3344)
+        ctx.setConcreteRegisterValue(ctx.registers.zf, 0)
+        ctx.setConcreteMemoryAreaValue(0x1000, b"wxyz")
+        ctx.setConcreteMemoryValue(0x200000, 0x41)
+
+        ctx.restore(snap)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.rax), 0x1122)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.zf), 1)
+        self.assertEqual(ctx.getConcreteMemoryAreaValue(0x1000, 4), b"abcd")
+        self.assertFalse(ctx.isConcreteMemoryValueDefined(0x200000, 1))
+
+    def test_restore_twice(self):
+        """Check that a snapshot is not modified by the context after a restore."""
+        ctx = self.ctx
+        ctx.setConcreteMemoryValue(0x1000, 1)
+        snap = ctx.snapshot()
+        for value in range(2, 5):
+            ctx.restore(snap)
+            self.assertEqual(ctx.getConcreteMemoryValue(0x1000), 1)
+            ctx.setConcreteMemoryValue(0x1000, value)
+        ctx.restore(snap)
+        self.assertEqual(ctx.getConcreteMemoryValue(0x1000), 1)
+
+    def test_symbolic(self):
+        """Check that the symbolic registers and memory are restored."""
+        ctx = self.ctx
+        var = ctx.symbolizeRegister(ctx.registers.rax)
+        ctx.processing(Instruction(b"\x48\x89\x03"))  # mov [rbx], rax
+        expr = ctx.getSymbolicMemory(0)
+        snap = ctx.snapshot()
+
+        ctx.concretizeRegister(ctx.registers.rax)
+        ctx.processing(Instruction(b"\x48\x89\x03"))  # mov [rbx], rax
+        ctx.concretizeMemory(4)
+        self.assertFalse(ctx.isRegisterSymbolized(ctx.registers.rax))
+        self.assertFalse(ctx.isMemorySymbolized(MemoryAccess(0, CPUSIZE.QWORD)))
+
+        ctx.restore(snap)
+        self.assertTrue(ctx.isRegisterSymbolized(ctx.registers.rax))
+        self.assertEqual(ctx.getSymbolicMemory(0).getId(), expr.getId())
+        self.assertEqual(sorted(ctx.getSymbolicMemory().keys()), list(range(8)))
+        ast = ctx.getMemoryAst(MemoryAccess(0, CPUSIZE.QWORD))
+        self.assertEqual(ctx.getModel(ast == 0x1234)[var.getId()].getValue(), 0x1234)
+
+    def test_aligned_memory(self):
+        """Check that the aligned memory references are not restored stale."""
+        ctx = self.ctx
+        ctx.setMode(MODE.ALIGNED_MEMORY, True)
+        ctx.symbolizeRegister(ctx.registers.rax)
+        snap = ctx.snapshot()
+        ctx.processing(Instruction(b"\x48\x89\x03"))  # mov [rbx], rax
+        self.assertTrue(ctx.isMemorySymbolized(MemoryAccess(0, CPUSIZE.QWORD)))
+        ctx.restore(snap)
+        self.assertFalse(ctx.isMemorySymbolized(MemoryAccess(0, CPUSIZE.QWORD)))
+        ctx.processing(Instruction(b"\x48\x8b\x0b"))  # mov rcx, [rbx]
+        self.assertFalse(ctx.isRegisterSymbolized(ctx.registers.rcx))
+
+    def test_many_addresses(self):
+        """Check the symbolic and tainted memory with many addresses."""
+        ctx = self.ctx
+        ctx.symbolizeMemory(MemoryAccess(0x10000, 4), "a")
+        for addr in range(0x10000, 0x12000, 4):
+            ctx.assignSymbolicExpressionToMemory(ctx.newSymbolicExpression(ctx.getMemoryAst(MemoryAccess(0x10000, 4))), MemoryAccess(addr, 4))
+            ctx.taintMemory(MemoryAccess(addr, 2))
+        snap = ctx.snapshot()
+
+        for addr in range(0x10000, 0x12000, 8):
+            ctx.concretizeMemory(MemoryAccess(addr, 4))
+            ctx.untaintMemory(MemoryAccess(addr, 2))
+        self.assertEqual(len(ctx.getSymbolicMemory()), 0x1000)
+        self.assertEqual(len(ctx.getTaintedMemory()), 0x800)
+
+        ctx.restore(snap)
+        self.assertEqual(sorted(ctx.getSymbolicMemory().keys()), list(range(0x10000, 0x12000)))
+        self.assertEqual(sorted(ctx.getTaintedMemory()), [a for a in range(0x10000, 0x12000) if a % 4 < 2])
+        self.assertTrue(ctx.isMemoryTainted(0x10000))
+        self.assertFalse(ctx.isMemoryTainted(0x10002))
+
+    def test_taint(self):
+        """Check that the taint is restored."""
+        ctx = self.ctx
+        ctx.taintRegister(ctx.registers.rax)
+        ctx.taintMemory(0x1000)
+        snap = ctx.snapshot()
+
+        ctx.untaintRegister(ctx.registers.rax)
+        ctx.untaintMemory(0x1000)
+        ctx.taintRegister(ctx.registers.rbx)
+        ctx.taintMemory(0x2000)
+
+        ctx.restore(snap)
+        self.assertTrue(ctx.isRegisterTainted(ctx.registers.rax))
+        self.assertFalse(ctx.isRegisterTainted(ctx.registers.rbx))
+        self.assertEqual(ctx.getTaintedMemory(), [0x1000])
+
+    def test_path_constraints(self):
+        """Check that the path constraints are restored."""
+        ctx = self.ctx
+        astCtxt = ctx.getAstContext()
+        x = astCtxt.variable(ctx.newSymbolicVariable(8, "x"))
+        ctx.pushPathConstraint(x > 10)
+        snap = ctx.snapshot()
+        self.assertEqual(snap.getSizeOfPathConstraints(), 1)
+
+        ctx.pushPathConstraint(x < 20)
+        ctx.pushPathConstraint(x != 15)
+        self.assertEqual(len(ctx.getPathConstraints()), 3)
+
+        ctx.restore(snap)
+        self.assertEqual(len(ctx.getPathConstraints()), 1)
+        self.assertEqual(str(ctx.getPathConstraints()[0].getTakenPredicate()), str(x > 10))
+        ctx.pushPathConstraint(x > 200)
+        self.assertEqual(len(ctx.getPathConstraints()), 2)
+        self.assertGreater(ctx.getModel(ctx.getPathPredicate())[0].getValue(), 200)
+
+        ctx.popPathConstraint()
+        ctx.popPathConstraint()
+        self.assertEqual(ctx.getPathConstraints(), [])
+        ctx.restore(snap)
+        self.assertEqual(len(ctx.getPathConstraints()), 1)
+
+    def test_long_path(self):
+        """Check that a long list of path constraints is released."""
+        ctx = self.ctx
+        node = ctx.getAstContext().variable(ctx.newSymbolicVariable(8)) != 0
+        for _ in range(100000):
+            ctx.pushPathConstraint(node)
+        snap = ctx.snapshot()
+        ctx.clearPathConstraints()
+        ctx.restore(snap)
+        self.assertEqual(len(ctx.getPathConstraints()), 100000)
+        del snap
+        ctx.clearPathConstraints()
+
+    def test_explore(self):
+        """Explore both sides of a branch from a snapshot."""
+        ctx = self.ctx
+        var = ctx.symbolizeRegister(ctx.registers.al, "c")
+        snap = ctx.snapshot()
+
+        targets = set()
+        for value in (0x41, 0x42):
+            ctx.restore(snap)
+            ctx.setConcreteVariableValue(var, value)
+            ctx.processing(Instruction(0x1000, b"\x3c\x41"))  # cmp al, 0x41
+            ctx.processing(Instruction(0x1002, b"\x74\x05"))  # je 0x1009
+            targets.add(ctx.getConcreteRegisterValue(ctx.registers.rip))
+            self.assertEqual(len(ctx.getPathConstraints()), 1)
+        self.assertEqual(targets, {0x1004, 0x1009})
+
+    def test_arm32(self):
+        """Check that the Thumb state is restored."""
+        ctx = TritonContext(ARCH.ARM32)
+        ctx.setThumb(True)
+        ctx.setConcreteRegisterValue(ctx.registers.r0, 7)
+        snap = ctx.snapshot()
+        ctx.setThumb(False)
+        ctx.setConcreteRegisterValue(ctx.registers.r0, 8)
+        ctx.restore(snap)
+        self.assertTrue(ctx.isThumb())
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.r0), 7)
+
+    def test_invalid(self):
+        """Check the errors."""
+        with self.assertRaises(TypeError):
+            TritonContext().snapshot()
+        with self.assertRaises(TypeError):
+            self.ctx.restore(None)
+        with self.assertRaises(TypeError):
+            self.ctx.restore(TritonContext(ARCH.X86_64).snapshot())
+
+        # The engines of a reset context are new ones
+        snap = self.ctx.snapshot()
+        self.ctx.reset()
+        with self.assertRaises(TypeError):
+            self.ctx.restore(snap)
+
+    def test_views(self):
+        """Check that the symbolic and tainted memory getters follow writes and restores."""
+        ctx = self.ctx
+        ctx.taintMemory(MemoryAccess(0x1000, CPUSIZE.WORD))
+        ctx.symbolizeMemory(MemoryAccess(0x2000, CPUSIZE.BYTE))
+        snap = ctx.snapshot()
+        self.assertEqual(sorted(ctx.getTaintedMemory()), [0x1000, 0x1001])
+        self.assertEqual(list(ctx.getSymbolicMemory().keys()), [0x2000])
+
+        ctx.untaintMemory(0x1000)
+        ctx.taintMemory(0x3000)
+        ctx.concretizeMemory(0x2000)
+        ctx.symbolizeMemory(MemoryAccess(0x4000, CPUSIZE.BYTE))
+        self.assertEqual(sorted(ctx.getTaintedMemory()), [0x1001, 0x3000])
+        self.assertEqual(list(ctx.getSymbolicMemory().keys()), [0x4000])
+
+        ctx.restore(snap)
+        self.assertEqual(sorted(ctx.getTaintedMemory()), [0x1000, 0x1001])
+        self.assertEqual(list(ctx.getSymbolicMemory().keys()), [0x2000])
+
+
+class TestRegisterState(unittest.TestCase):
+
+    """Testing the register states of a context."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+
+    def test_threads(self):
+        """Switch between two threads."""
+        ctx = self.ctx
+        th0 = ctx.saveRegisterState()
+        self.assertEqual(th0.getArchitecture(), ARCH.X86_64)
+
+        ctx.setConcreteRegisterValue(ctx.registers.rax, 3)
+        var = ctx.symbolizeRegister(ctx.registers.rax, "a")
+        ctx.processing(Instruction(b"\x48\x89\xc3"))  # mov rbx, rax
+        ctx.taintRegister(ctx.registers.rcx)
+        ctx.setConcreteMemoryValue(0x1000, 0x41)
+        th1 = ctx.saveRegisterState()
+
+        ctx.restoreRegisterState(th0)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.rbx), 0)
+        self.assertFalse(ctx.isRegisterSymbolized(ctx.registers.rbx))
+        self.assertFalse(ctx.isRegisterTainted(ctx.registers.rcx))
+        self.assertEqual(ctx.getConcreteMemoryValue(0x1000), 0x41)
+
+        ctx.restoreRegisterState(th1)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.rbx), 3)
+        self.assertTrue(ctx.isRegisterTainted(ctx.registers.rcx))
+        ast = ctx.getRegisterAst(ctx.registers.rbx)
+        self.assertEqual(ctx.getModel(ast == 7)[var.getId()].getValue(), 7)
+
+    def test_flags_and_vectors(self):
+        """Check that the flags and the vector registers are saved."""
+        ctx = self.ctx
+        ctx.setConcreteRegisterValue(ctx.registers.zf, 1)
+        ctx.setConcreteRegisterValue(ctx.registers.ymm3, (1 << 255) | 5)
+        state = ctx.saveRegisterState()
+        ctx.setConcreteRegisterValue(ctx.registers.zf, 0)
+        ctx.setConcreteRegisterValue(ctx.registers.ymm3, 0)
+        ctx.restoreRegisterState(state)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.zf), 1)
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.ymm3), (1 << 255) | 5)
+
+    def test_arm32(self):
+        """Check that the Thumb mode is saved."""
+        ctx = TritonContext(ARCH.ARM32)
+        ctx.setThumb(True)
+        state = ctx.saveRegisterState()
+        ctx.setThumb(False)
+        ctx.restoreRegisterState(state)
+        self.assertTrue(ctx.isThumb())
+
+    def test_invalid(self):
+        """Check the errors."""
+        with self.assertRaises(TypeError):
+            TritonContext().saveRegisterState()
+        with self.assertRaises(TypeError):
+            self.ctx.restoreRegisterState(None)
+        with self.assertRaises(TypeError):
+            self.ctx.restoreRegisterState(TritonContext(ARCH.X86_64).saveRegisterState())
+
+        # The engines of a reset context are new ones
+        state = self.ctx.saveRegisterState()
+        self.ctx.reset()
+        with self.assertRaises(TypeError):
+            self.ctx.restoreRegisterState(state)
@@ -2,6 +2,7 @@
 # coding: utf-8
 """Test Solvers."""
 
+import threading
 import unittest
 
 from triton import *
@@ -60,3 +61,401 @@ class TestSolvers(unittest.TestCase):
         if 'BITWUZLA' in dir(SOLVER):
             self.solve_a_query(SOLVER.BITWUZLA)
             self.solve_bswap(SOLVER.BITWUZLA)
+
+        # Test if PORTFOLIO has been enabled
+        if 'PORTFOLIO' in dir(SOLVER):
+            self.solve_a_query(SOLVER.PORTFOLIO)
+            self.solve_bswap(SOLVER.PORTFOLIO)
+
+    def test_portfolio_stats(self):
+        if 'PORTFOLIO' not in dir(SOLVER):
+            return
+
+        self.assertEqual(self.ctx.getSolverPortfolioStats(), {})
+        self.ctx.setSolver(SOLVER.PORTFOLIO)
+        self.assertTrue(self.ctx.getSolver() == SOLVER.PORTFOLIO)
+
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        self.assertTrue(self.ctx.isSat(x == 1))
+        self.assertFalse(self.ctx.isSat(self.ast.land([x == 1, x == 2])))
+
+        # Every query has a winner
+        stats = self.ctx.getSolverPortfolioStats()
+        self.assertEqual(sum(s["wins"] for s in stats.values()), 2)
+        if 'Z3' in dir(SOLVER):
+            self.assertIn(SOLVER.Z3, stats)
+        if 'BITWUZLA' in dir(SOLVER):
+            self.assertIn(SOLVER.BITWUZLA, stats)
+
+
+class TestSolverSession(unittest.TestCase):
+
+    """Testing the incremental solver session."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ast = self.ctx.getAstContext()
+        if 'Z3' not in dir(SOLVER):
+            self.skipTest("Incremental sessions need Z3")
+        self.ctx.setSolver(SOLVER.Z3)
+
+    def test_push_pop(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(32, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(32, "y"))
+
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 0)
+        self.assertTrue(self.ctx.isSessionSat())
+
+        self.ctx.pushSessionConstraint(x + y == 10)
+        self.ctx.pushSessionConstraint(x == 3)
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 2)
+
+        model, status, _ = self.ctx.getSessionModel(status=True)
+        self.assertEqual(status, SOLVER_STATE.SAT)
+        self.assertEqual(model[0].getValue(), 3)
+        self.assertEqual(model[1].getValue(), 7)
+
+        # An extra node is only checked, not kept in the session
+        self.assertFalse(self.ctx.isSessionSat(y == 8))
+        sat, status, _ = self.ctx.isSessionSat(y == 8, status=True)
+        self.assertFalse(sat)
+        self.assertEqual(status, SOLVER_STATE.UNSAT)
+        self.assertTrue(self.ctx.isSessionSat())
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 2)
+
+        self.ctx.popSessionConstraint()
+        model = self.ctx.getSessionModel(y == 8)
+        self.assertEqual(model[0].getValue(), 2)
+
+        self.ctx.clearSessionConstraints()
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 0)
+        with self.assertRaises(TypeError):
+            self.ctx.popSessionConstraint()
+
+    def test_sync_with_path_constraints(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+
+        self.ctx.pushPathConstraint(x > 10)
+        self.ctx.pushPathConstraint(x < 20)
+        self.ctx.syncSessionConstraints()
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 2)
+        self.assertFalse(self.ctx.isSessionSat(x == 30))
+
+        # Only the last constraint diverges
+        self.ctx.popPathConstraint()
+        self.ctx.pushPathConstraint(x > 25)
+        self.ctx.syncSessionConstraints()
+        self.assertEqual(self.ctx.getSizeOfSessionConstraints(), 2)
+        self.assertTrue(self.ctx.isSessionSat(x == 30))
+        self.assertGreater(self.ctx.getSessionModel()[0].getValue(), 25)
+
+
+class TestBitwuzlaSolverSession(TestSolverSession):
+
+    """Testing the incremental solver session with Bitwuzla."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ast = self.ctx.getAstContext()
+        if 'BITWUZLA' not in dir(SOLVER):
+            self.skipTest("Bitwuzla is not available")
+        self.ctx.setSolver(SOLVER.BITWUZLA)
+
+
+class TestSolverQueryCache(unittest.TestCase):
+
+    """Testing the solver query cache."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ast = self.ctx.getAstContext()
+        self.ctx.setSolverQueryCacheSize(16)
+
+    def test_disabled_by_default(self):
+        ctx = TritonContext(ARCH.X86_64)
+        x = ctx.getAstContext().variable(ctx.newSymbolicVariable(8))
+        self.assertEqual(ctx.getSolverQueryCacheSize(), 0)
+        ctx.isSat(x == 1)
+        self.assertEqual(ctx.getSolverQueryCacheStats()["misses"], 0)
+
+    def test_hits_and_renaming(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(32, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(32, "y"))
+
+        model = self.ctx.getModel(x * 3 == 0x30)
+        self.assertEqual(model[0].getValue() * 3 & 0xffffffff, 0x30)
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["misses"], 1)
+
+        # Same query
+        self.assertTrue(self.ctx.isSat(x * 3 == 0x30))
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["hits"], 1)
+
+        # Same query over another variable: the model is renamed
+        model, status, _ = self.ctx.getModel(y * 3 == 0x30, status=True)
+        self.assertEqual(status, SOLVER_STATE.SAT)
+        self.assertEqual(list(model.keys()), [1])
+        self.assertEqual(model[1].getVariable().getAlias(), "y")
+        self.assertEqual(model[1].getValue() * 3 & 0xffffffff, 0x30)
+
+        # A different constant is a different query
+        self.ctx.isSat(y * 3 == 0x31)
+        stats = self.ctx.getSolverQueryCacheStats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["entries"], 2)
+
+    def test_unsat_subset(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+
+        self.assertFalse(self.ctx.isSat(self.ast.land([x > 10, x < 5])))
+        query = self.ast.land([y == 1, x > 10, self.ast.bvtrue() == self.ast.bvtrue(), x < 5])
+        model, status, _ = self.ctx.getModel(query, status=True)
+        self.assertEqual(status, SOLVER_STATE.UNSAT)
+        self.assertEqual(model, {})
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["subsumed"], 1)
+
+        # The variables of the subset must be the same
+        self.assertTrue(self.ctx.isSat(self.ast.land([y > 10, x < 5])))
+
+    def test_counterexamples(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+
+        model = self.ctx.getModel(self.ast.land([x > 10, x < 20, y == 3]))
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["misses"], 1)
+
+        # A superset of the constraints was sat: its model is reused
+        self.assertEqual(self.ctx.getModel(self.ast.land([x < 20, x > 10]))[0].getValue(), model[0].getValue())
+        self.assertEqual(list(self.ctx.getModel(x > 10).keys()), [0])
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["counterexamples"], 2)
+
+        # A subset of the constraints was sat and its model satisfies the new ones
+        self.assertTrue(self.ctx.isSat(self.ast.land([x > 10, x < 20, y == 3, y != 4])))
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["counterexamples"], 3)
+
+        # The model does not satisfy the new constraint
+        value = model[0].getValue()
+        self.assertTrue(self.ctx.isSat(self.ast.land([x > 10, x < 20, y == 3, x != value])))
+        stats = self.ctx.getSolverQueryCacheStats()
+        self.assertEqual(stats["counterexamples"], 3)
+        self.assertEqual(stats["misses"], 2)
+
+        # The variables missing from the cached model keep their concrete value, which is part of the model
+        var = self.ctx.newSymbolicVariable(8, "z")
+        z = self.ast.variable(var)
+        self.ctx.setConcreteVariableValue(var, 7)
+        model = self.ctx.getModel(self.ast.land([x > 10, x < 20, y == 3, z == 7]))
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["counterexamples"], 4)
+        self.assertEqual(sorted(model.keys()), [0, 1, var.getId()])
+        self.assertEqual(model[var.getId()].getValue(), 7)
+
+    def test_get_models(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        self.ctx.getModel(x > 10)
+
+        # A single model is served from the cache
+        models = self.ctx.getModels(x > 10, 1)
+        self.assertEqual(len(models), 1)
+        self.assertGreater(models[0][0].getValue(), 10)
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["hits"], 1)
+
+        # Several models of a sat query need the solver
+        self.assertEqual(len(self.ctx.getModels(x > 10, 3)), 3)
+        stats = self.ctx.getSolverQueryCacheStats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+
+        # An unsat query is served from the cache
+        self.assertFalse(self.ctx.isSat(self.ast.land([x > 10, x < 5])))
+        self.assertEqual(self.ctx.getModels(self.ast.land([x > 10, x < 5]), 3), [])
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["hits"], 2)
+
+    def test_eviction(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        self.ctx.setSolverQueryCacheSize(2)
+        for i in range(4):
+            self.ctx.isSat(x == i)
+        stats = self.ctx.getSolverQueryCacheStats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 2)
+        self.ctx.clearSolverQueryCache()
+        self.assertEqual(self.ctx.getSolverQueryCacheStats()["entries"], 0)
+
+
+class TestSolverThreads(unittest.TestCase):
+
+    """Testing solver queries from several threads."""
+
+    def solve(self, results, index):
+        ctx = TritonContext(ARCH.X86_64)
+        ast = ctx.getAstContext()
+        x = ast.variable(ctx.newSymbolicVariable(32))
+        y = ast.variable(ctx.newSymbolicVariable(32))
+        model = ctx.getModel(ast.land([x * y == 0x1234 + index, x > 1, y > 1]))
+        results[index] = (model[0].getValue() * model[1].getValue()) & 0xffffffff
+
+    def test_contexts(self):
+        results = [None] * 4
+        threads = [threading.Thread(target=self.solve, args=(results, i)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, [0x1234 + i for i in range(4)])
+
+    def test_same_context(self):
+        ctx = TritonContext(ARCH.X86_64)
+        ast = ctx.getAstContext()
+        x = ast.variable(ctx.newSymbolicVariable(8))
+        queries = [x == i for i in range(8)]
+        results = [None] * 8
+
+        def worker(index):
+            results[index] = ctx.getModel(queries[index])[0].getValue()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, list(range(8)))
+
+    def test_context_busy(self):
+        ctx = TritonContext(ARCH.X86_64)
+        ast = ctx.getAstContext()
+        ctx.setConcreteMemoryAreaValue(0x1000, b"\x90\x90")
+        started = threading.Event()
+        release = threading.Event()
+
+        def hook(ctx, addr):
+            started.set()
+            release.wait()
+            return False
+
+        ctx.addHook(0x1001, hook)
+        emulation = threading.Thread(target=ctx.emulate, args=(0x1000,))
+        emulation.start()
+        started.wait()
+        try:
+            # The context and its AstContext are used by the emulation
+            with self.assertRaises(RuntimeError):
+                ctx.getConcreteRegisterValue(ctx.registers.rax)
+            with self.assertRaises(RuntimeError):
+                ast.bv(1, 8)
+        finally:
+            release.set()
+            emulation.join()
+        self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.rip), 0x1001)
+
+
+class TestSolverWorkers(unittest.TestCase):
+
+    """Testing the enumeration of models with several threads."""
+
+    def setUp(self):
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ast = self.ctx.getAstContext()
+        self.ctx.setSolverWorkers(4)
+
+    def test_workers(self):
+        self.assertEqual(self.ctx.getSolverWorkers(), 4)
+        self.ctx.setSolverWorkers(0)
+        self.assertEqual(self.ctx.getSolverWorkers(), 1)
+
+    def test_all_models(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8))
+        models = self.ctx.getModels(self.ast.land([x < 20, y < 5]), 1000)
+        values = set((m[0].getValue(), m[1].getValue()) for m in models)
+        self.assertEqual(len(models), 100)
+        self.assertEqual(values, set((a, b) for a in range(20) for b in range(5)))
+
+    def test_limit(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(16))
+        models, status, _ = self.ctx.getModels(x > 10, 50, status=True)
+        self.assertEqual(status, SOLVER_STATE.SAT)
+        self.assertEqual(len(models), 50)
+        self.assertEqual(len(set(m[0].getValue() for m in models)), 50)
+        self.assertTrue(all(m[0].getValue() > 10 for m in models))
+
+    def test_unsat(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8))
+        models, status, _ = self.ctx.getModels(self.ast.land([x > 10, x < 5]), 10, status=True)
+        self.assertEqual(status, SOLVER_STATE.UNSAT)
+        self.assertEqual(models, [])
+
+
+class TestSolverIndependence(unittest.TestCase):
+
+    """Testing the constraint independence optimization."""
+
+    def setUp(self):
+        """Define the arch."""
+        self.ctx = TritonContext(ARCH.X86_64)
+        self.ast = self.ctx.getAstContext()
+        self.ctx.setSolverIndependence(True)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(TritonContext(ARCH.X86_64).isSolverIndependenceEnabled())
+        self.assertTrue(self.ctx.isSolverIndependenceEnabled())
+
+    def test_groups(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+        z = self.ast.variable(self.ctx.newSymbolicVariable(8, "z"))
+        query = self.ast.land([x > 10, y == 3, x < 20, z == y + 1, self.ast.bvtrue() == self.ast.bvtrue()])
+        model, status, _ = self.ctx.getModel(query, status=True)
+        self.assertEqual(status, SOLVER_STATE.SAT)
+        self.assertEqual(sorted(model.keys()), [0, 1, 2])
+        self.assertTrue(10 < model[0].getValue() < 20)
+        self.assertEqual(model[1].getValue(), 3)
+        self.assertEqual(model[2].getValue(), 4)
+        self.assertTrue(self.ctx.isSat(query))
+
+    def test_unsat(self):
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+        query = self.ast.land([y == 1, x > 10, x < 5])
+        model, status, _ = self.ctx.getModel(query, status=True)
+        self.assertEqual(status, SOLVER_STATE.UNSAT)
+        self.assertEqual(model, {})
+        self.assertFalse(self.ctx.isSat(query))
+        self.assertFalse(self.ctx.isSat(self.ast.land([y == 1, self.ast.bvfalse() == self.ast.bvtrue()])))
+
+    def test_cached_groups(self):
+        self.ctx.setSolverQueryCacheSize(16)
+        x = self.ast.variable(self.ctx.newSymbolicVariable(8, "x"))
+        y = self.ast.variable(self.ctx.newSymbolicVariable(8, "y"))
+        self.ctx.pushPathConstraint(x > 10)
+        self.ctx.pushPathConstraint(x < 20)
+        self.assertEqual(len(self.ctx.getModel(self.ctx.getPathPredicate())), 1)
+        misses = self.ctx.getSolverQueryCacheStats()["misses"]
+
+        # Only the group of the new constraint reaches the solver
+        self.ctx.pushPathConstraint(y == 5)
+        model = self.ctx.getModel(self.ctx.getPathPredicate())
+        self.assertEqual(model[1].getValue(), 5)
+        self.assertTrue(10 < model[0].getValue() < 20)
+        stats = self.ctx.getSolverQueryCacheStats()
+        self.assertEqual(stats["misses"], misses + 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_path_constraints(self):
+        ctx = self.ctx
+        ctx.setConcreteRegisterValue(ctx.registers.al, 0x41)
+        ctx.setConcreteRegisterValue(ctx.registers.bl, 0x10)
+        ctx.symbolizeRegister(ctx.registers.al, "a")
+        ctx.symbolizeRegister(ctx.registers.bl, "b")
+        ctx.processing(Instruction(0x1000, b"\x3c\x41"))  # cmp al, 0x41
+        ctx.processing(Instruction(0x1002, b"\x74\x05"))  # je 0x1009
+        ctx.processing(Instruction(0x1009, b"\x80\xfb\x20"))  # cmp bl, 0x20
+        ctx.processing(Instruction(0x100c, b"\x72\x05"))  # jb 0x1013
+        pcs = ctx.getPathConstraints()
+        query = self.ast.land([pcs[0].getTakenPredicate(), self.ast.lnot(pcs[1].getTakenPredicate())])
+        model = ctx.getModel(query)
+        self.assertEqual(model[0].getValue(), 0x41)
+        self.assertGreaterEqual(model[1].getValue(), 0x20)
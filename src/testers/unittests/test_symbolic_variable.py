@@ -139,3 +139,28 @@ class TestSymbolicVariable(unittest.TestCase):
         ctx.symbolizeRegister(ctx.registers.xmm0)
         self.assertEqual(ctx.getConcreteRegisterValue(ctx.registers.xmm0), 0x11223344556677888877665544332211)
         self.assertEqual(ctx.getSymbolicRegisterValue(ctx.registers.xmm0), 0x11223344556677888877665544332211)
+
+    def test_lookup(self):
+        """Test lookup by name and by alias"""
+        self.assertEqual(self.ctx.getSymbolicVariable("SymVar_1").getId(), 1)
+        self.assertEqual(self.ctx.getSymbolicVariable("v2").getId(), 2)
+        self.assertEqual(self.ctx.getSymbolicVariable("v3").getId(), 3)
+
+        # The first variable created with an alias is returned
+        v4 = self.ctx.newSymbolicVariable(8, "v2")
+        self.assertEqual(self.ctx.getSymbolicVariable("v2").getId(), 2)
+        self.v2.setAlias("x")
+        self.assertEqual(self.ctx.getSymbolicVariable("v2").getId(), 4)
+        self.assertEqual(self.ctx.getSymbolicVariable("x").getId(), 2)
+
+        # Renaming updates the index in both directions
+        self.v2.setAlias("v2")
+        self.assertEqual(self.ctx.getSymbolicVariable("v2").getId(), 2)
+        with self.assertRaises(TypeError):
+            self.ctx.getSymbolicVariable("x")
+
+        # Dead variables are not returned
+        self.ctx.newSymbolicVariable(8, "dead")
+        for name in ["dead", "SymVar_5", "SymVar_01", "SymVar_", "SymVar_99999999999999999999", "unknown"]:
+            with self.assertRaises(TypeError):
+                self.ctx.getSymbolicVariable(name)